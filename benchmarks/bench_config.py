@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la configuration: chargement du fichier et lectures de clés
+
+Chargement: yaml.safe_load pur Python, chargeur libyaml (CSafeLoader), cache compilé
+(mémoire et disque). Lectures: parcours à chaque appel, cache des chemins, vue figée.
+
+Usage:
+    python benchmarks/bench_config.py --lookups 1000000 --loads 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.config_loader as cl
+from core.config_loader import ConfigLoader
+
+
+KEYS = [
+    'rules.profit_threshold_percent',
+    'rules.loss_threshold_percent',
+    'rules.cooldown_hours',
+    'exchange.name',
+    'database.sqlite.path',
+    'price_feed.max_age_seconds',
+    'rules.missing_key',
+]
+
+
+def uncached_get(config, key, default=None):
+    """Lecture de référence: split et parcours des dicts à chaque appel"""
+    value = config
+    try:
+        for k in key.split('.'):
+            value = value[k]
+        return value
+    except (KeyError, TypeError):
+        return default
+
+
+def rate(func, keys, lookups):
+    """Lectures par seconde de func sur la liste de clés"""
+    rounds = max(1, lookups // len(keys))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for key in keys:
+            func(key)
+    return rounds * len(keys) / (time.perf_counter() - start)
+
+
+def per_call(func, runs):
+    """Durée moyenne d'un appel (secondes)"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def bench_loads(path: str, runs: int) -> None:
+    """Compare les modes de chargement du fichier de configuration"""
+    from loguru import logger
+    logger.remove()  # Mesurer le chargement, pas l'affichage des messages
+    text = Path(path).read_text(encoding='utf-8')
+    # Fichier ancien: le cache compilé se fie au mtime
+    os.utime(path, (1_000_000_000, 1_000_000_000))
+    sys.dont_write_bytecode = False
+    
+    def cold():
+        cl._compiled.clear()
+        ConfigLoader(path, use_cache=False)
+    
+    def disk_hit():
+        cl._compiled.clear()
+        ConfigLoader(path)
+    
+    ConfigLoader(path)
+    results = [
+        ('yaml.safe_load (Python)', per_call(lambda: yaml.load(text, Loader=yaml.SafeLoader), runs)),
+    ]
+    if hasattr(yaml, 'CSafeLoader'):
+        results.append(('yaml CSafeLoader', per_call(lambda: yaml.load(text, Loader=yaml.CSafeLoader), runs)))
+    results += [
+        ('ConfigLoader sans cache', per_call(cold, runs)),
+        ('ConfigLoader cache disque', per_call(disk_hit, runs)),
+        ('ConfigLoader cache mémoire', per_call(lambda: ConfigLoader(path), runs)),
+    ]
+    
+    print(f"chargement de la configuration ({len(text)} octets, {runs} chargements)")
+    for label, seconds in results:
+        print(f"  {label:<26}: {seconds * 1e6:10.1f} µs")
+    os.unlink(cl.compiled_cache_path(Path(path)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lookups', type=int, default=1_000_000)
+    parser.add_argument('--loads', type=int, default=200)
+    args = parser.parse_args()
+    
+    config_path = Path(__file__).resolve().parent.parent / 'config' / 'settings.yaml'
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump(yaml.safe_load(config_path.read_text(encoding='utf-8')), f)
+        temp_path = f.name
+    try:
+        bench_loads(temp_path, args.loads)
+        config = ConfigLoader(temp_path)
+    finally:
+        os.unlink(temp_path)
+    snapshot = config.snapshot()
+    
+    results = [
+        ('parcours à chaque appel', rate(lambda k: uncached_get(config.config, k), KEYS, args.lookups)),
+        ('ConfigLoader.get (cache)', rate(config.get, KEYS, args.lookups)),
+        ('ConfigSnapshot.get', rate(snapshot.get, KEYS, args.lookups)),
+    ]
+    
+    print(f"lectures de configuration ({len(KEYS)} clés, {args.lookups} lectures)")
+    for label, per_second in results:
+        print(f"  {label:<26}: {per_second / 1e6:8.2f} M lectures/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark de ExchangeManager.fetch_tickers: temps de cycle selon le nombre de symboles
+
+Compare la boucle séquentielle historique, le repli concurrent borné et
+l'endpoint multi-symboles sur un faux exchange avec latence injectée.
+
+Usage:
+    python benchmarks/bench_fetch_tickers.py --latency 0.05 --counts 10 50 150
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.config_loader as cl
+import core.exchange as ex
+import core.logger as lg
+from benchmarks.fake_exchange import make_fake_ccxt
+
+
+def _write_config(max_concurrent: int) -> str:
+    """Écrit une configuration minimale sans sortie de logs"""
+    config_data = {
+        'exchange': {'name': 'binance', 'sandbox': False, 'testnet': False,
+                     'max_concurrent_requests': max_concurrent},
+        'database': {},
+        'portfolio': {},
+        'logging': {'level': 'WARNING', 'console': False, 'file': False},
+    }
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump(config_data, f)
+        return f.name
+
+
+def _build_manager(config_path: str, latency: float, bulk: bool) -> ex.ExchangeManager:
+    """Construit un ExchangeManager branché sur le faux exchange"""
+    ex._exchange_instance = None
+    cl._config_instance = None
+    lg._logger_instance = None
+    with patch.object(ex, 'ccxt', make_fake_ccxt(latency=latency, bulk_supported=bulk)):
+        return ex.ExchangeManager(config_path)
+
+
+def _sequential(manager: ex.ExchangeManager, symbols):
+    """Reproduit l'ancienne boucle symbole par symbole"""
+    return {symbol: manager.fetch_ticker(symbol) for symbol in symbols}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.05, help="Latence simulée par requête (s)")
+    parser.add_argument('--counts', type=int, nargs='+', default=[10, 50, 150])
+    parser.add_argument('--max-concurrent', type=int, default=8)
+    args = parser.parse_args()
+    
+    config_path = _write_config(args.max_concurrent)
+    try:
+        print(f"latence={args.latency * 1000:.0f}ms max_concurrent={args.max_concurrent}")
+        print(f"{'symboles':>9} | {'séquentiel':>11} | {'concurrent':>11} | {'groupé':>9}")
+        for count in args.counts:
+            symbols = [f"C{i}/USDT" for i in range(count)]
+            
+            manager = _build_manager(config_path, args.latency, bulk=False)
+            start = time.perf_counter()
+            _sequential(manager, symbols)
+            sequential = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            manager.fetch_tickers(symbols)
+            concurrent = time.perf_counter() - start
+            
+            manager = _build_manager(config_path, args.latency, bulk=True)
+            start = time.perf_counter()
+            manager.fetch_tickers(symbols)
+            bulk = time.perf_counter() - start
+            
+            print(f"{count:>9} | {sequential:>10.3f}s | {concurrent:>10.3f}s | {bulk:>8.3f}s")
+    finally:
+        os.unlink(config_path)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
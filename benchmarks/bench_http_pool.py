@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark des sessions HTTP partagées: session neuve par requête vs pool keep-alive
+
+Un serveur HTTPS local (certificat auto-signé) tient lieu d'exchange: chaque
+session neuve paie le chargement des certificats, la connexion TCP et la
+poignée de main TLS, qu'une connexion réutilisée évite. Mesuré en séquentiel
+puis en concurrent (un thread par requête en vol).
+
+Usage:
+    python benchmarks/bench_http_pool.py --requests 200 --concurrency 8
+"""
+
+import argparse
+import datetime
+import os
+import socket
+import ssl
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+import urllib3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.http_pool as hp
+
+
+class _TickerHandler(BaseHTTPRequestHandler):
+    """Répond un ticker JSON en HTTP/1.1 (connexion gardée ouverte)"""
+    
+    protocol_version = 'HTTP/1.1'
+    # En-têtes et corps partent en deux écritures: sans TCP_NODELAY, Nagle + ACK retardé ajoutent ~40 ms
+    disable_nagle_algorithm = True
+    body = b'{"symbol": "BTCUSDT", "lastPrice": "65000.00", "volume": "1234.5"}'
+    
+    def setup(self):
+        # Poignée de main TLS dans le thread de la connexion, socket déjà en TCP_NODELAY
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+        self.request = self.server.ssl_context.wrap_socket(self.request, server_side=True)
+        super().setup()
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+    
+    def log_message(self, *args):
+        pass
+
+
+def _self_signed(directory: str):
+    """Génère un certificat auto-signé pour 127.0.0.1 (cryptography)"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+    import ipaddress
+    
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, '127.0.0.1')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]), False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, 'cert.pem')
+    key_path = os.path.join(directory, 'key.pem')
+    with open(cert_path, 'wb') as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, 'wb') as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ))
+    return cert_path, key_path
+
+
+def _start_server(cert_path: str, key_path: str) -> ThreadingHTTPServer:
+    """Démarre le serveur HTTPS local dans un thread"""
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _TickerHandler)
+    httpd.daemon_threads = True
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    httpd.ssl_context = context
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def _run(get, count: int, concurrency: int) -> float:
+    """Exécute count requêtes (séquentielles si concurrency == 1) et retourne la durée"""
+    start = time.perf_counter()
+    if concurrency == 1:
+        for _ in range(count):
+            get()
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [executor.submit(get) for _ in range(count)]:
+                future.result()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=200, help="Requêtes par mesure")
+    parser.add_argument('--concurrency', type=int, default=8, help="Requêtes en vol (mesure concurrente)")
+    parser.add_argument('--pool-size', type=int, default=32)
+    args = parser.parse_args()
+    
+    urllib3.disable_warnings()
+    with tempfile.TemporaryDirectory() as directory:
+        httpd = _start_server(*_self_signed(directory))
+        url = f"https://127.0.0.1:{httpd.server_address[1]}/api/v3/ticker/24hr"
+        
+        def fresh_session():
+            # Comportement sans pool partagé: une connexion (et une poignée de main TLS) par requête
+            with requests.Session() as session:
+                session.get(url, verify=False).content
+        
+        config = {'name': 'bench', 'http': {'pool_size': args.pool_size}}
+        shared = hp.get_session(config)
+        
+        def pooled():
+            shared.get(url, verify=False).content
+        
+        try:
+            print(f"{args.requests} requêtes HTTPS locales, pool_size={args.pool_size}")
+            print(f"{'mode':>24} | {'durée':>8} | {'ms/requête':>10} | {'gain/requête':>12}")
+            for label, concurrency in (('séquentiel', 1), (f"concurrent x{args.concurrency}", args.concurrency)):
+                fresh = _run(fresh_session, args.requests, concurrency)
+                reused = _run(pooled, args.requests, concurrency)
+                per_fresh = fresh / args.requests * 1000
+                per_reused = reused / args.requests * 1000
+                print(f"{label + ' / neuve':>24} | {fresh:>7.3f}s | {per_fresh:>10.3f} |")
+                print(f"{label + ' / partagée':>24} | {reused:>7.3f}s | {per_reused:>10.3f} | "
+                      f"{per_fresh - per_reused:>9.3f} ms")
+            stats = hp.connection_stats()['bench']
+            print(f"session partagée: {stats['opened']} connexions ouvertes, {stats['reused']} réutilisées "
+                  f"({stats['reuse_ratio']:.1%})")
+        finally:
+            hp.close_sessions()
+            httpd.shutdown()
+            httpd.server_close()
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
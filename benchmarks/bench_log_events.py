@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark du sink base de données des événements: débit et latence côté appelant
+
+Usage:
+    python benchmarks/bench_log_events.py --events 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+from loguru import logger as loguru_logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.config_loader as cl
+from core.logger import PortfolioLogger
+from storage.events import get_events
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = str(Path(directory) / 'portfolio.db')
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({'exchange': {}, 'portfolio': {},
+                       'database': {'sqlite': {'path': db_path}},
+                       'logging': {'console': False, 'file': False,
+                                   'database': {'enabled': True, 'batch_size': args.batch_size,
+                                                'max_queue': args.events}}}, f)
+            config_path = f.name
+        cl._config_instance = None
+        try:
+            log = PortfolioLogger(config_path)
+        finally:
+            os.unlink(config_path)
+        
+        latencies = []
+        start = time.perf_counter()
+        for i in range(args.events):
+            t0 = time.perf_counter()
+            log.log_execution('exchange', 'fetch_ticker', {'symbol': f"C{i % 100}/USDT"})
+            latencies.append(time.perf_counter() - t0)
+        submitted = time.perf_counter() - start
+        log.flush()
+        total = time.perf_counter() - start
+        stats = dict(log.event_sink.stats)
+        stored = len(get_events(db_path))
+        loguru_logger.remove()
+    
+    latencies.sort()
+    print(f"événements ({args.events}, lots de {args.batch_size})")
+    print(f"  appelant : {args.events / submitted:12,.0f} événements/s "
+          f"(p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f} µs)")
+    print(f"  persistés: {args.events / total:12,.0f} événements/s ({stored} lignes, {stats['batches']} lots, "
+          f"{stats['dropped']} ignorés)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
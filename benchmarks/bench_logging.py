@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de PortfolioLogger: appels par seconde, niveau actif et inactif
+
+Mesure les appels des chemins chauds (log_debug avec arguments, log_execution
+avec détails) avec un sink nul, quand leur niveau est inactif (INFO/WARNING)
+puis actif (DEBUG), et les compare au formatage f-string d'origine.
+
+Usage:
+    python benchmarks/bench_logging.py --calls 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+from loguru import logger as loguru_logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.config_loader as cl
+from core.logger import PortfolioLogger
+
+
+def make_logger(level: str) -> PortfolioLogger:
+    """Logger sans console ni fichier, avec un sink nul au niveau demandé"""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump({'exchange': {}, 'database': {}, 'portfolio': {},
+                   'logging': {'level': level, 'console': False, 'file': False}}, f)
+        config_path = f.name
+    cl._config_instance = None
+    try:
+        portfolio_logger = PortfolioLogger(config_path)
+    finally:
+        os.unlink(config_path)
+    loguru_logger.add(lambda message: None, level=level, format="{message}")
+    portfolio_logger._register_sink_level(level)
+    return portfolio_logger
+
+
+def rate(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=200000)
+    args = parser.parse_args()
+    
+    symbol, price = 'BTC/USDT', 45000.0
+    details = {'symbol': symbol, 'count': 3}
+    
+    for level in ('WARNING', 'INFO', 'DEBUG'):
+        log = make_logger(level)
+        calls = args.calls if level != 'DEBUG' else max(1, args.calls // 20)
+        print(f"niveau {level}")
+        print(f"  f-string + loguru.debug       : "
+              f"{rate(lambda: loguru_logger.debug(f'Ticker récupéré pour {symbol}: {price}'), calls):12,.0f} appels/s")
+        print(f"  log_debug (formatage différé) : "
+              f"{rate(lambda: log.log_debug('Ticker récupéré pour {}: {}', symbol, price), calls):12,.0f} appels/s")
+        print(f"  log_execution (détails)       : "
+              f"{rate(lambda: log.log_execution('exchange', 'fetch_tickers', details), calls):12,.0f} appels/s")
+        loguru_logger.remove()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Latence d'un cycle de polling selon le profil de logging (development / production)
+
+Chaque cycle reproduit les appels de log d'un polling (exécutions, debug, une
+exception journalisée avec sa trace) vers une console lente (terminal ou pipe
+simulé) et un fichier; on mesure p50 / p99 / max de la durée du cycle côté
+appelant.
+
+Usage:
+    python benchmarks/bench_logging_profiles.py --cycles 500 --console-delay-ms 0.2
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+from loguru import logger as loguru_logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.config_loader as cl
+from core.logger import PortfolioLogger
+
+
+class SlowStream:
+    """Flux console dont chaque écriture prend delay secondes"""
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+    
+    def write(self, message: str) -> None:
+        time.sleep(self.delay)
+    
+    def flush(self) -> None:
+        pass
+
+
+def make_logger(profile: str, directory: str) -> PortfolioLogger:
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump({'exchange': {}, 'database': {}, 'portfolio': {},
+                   'logging': {'profile': profile, 'level': 'INFO', 'console': True,
+                               'file': True, 'directory': directory, 'compression': None}}, f)
+        config_path = f.name
+    cl._config_instance = None
+    try:
+        return PortfolioLogger(config_path)
+    finally:
+        os.unlink(config_path)
+
+
+def polling_cycle(log: PortfolioLogger, assets: int) -> None:
+    """Appels de log d'un cycle: balances, tickers, règles et une erreur réseau"""
+    log.log_execution('exchange', 'fetch_balances')
+    log.log_info("Balances récupérées: {} assets avec balance > 0", assets)
+    log.log_execution('exchange', 'fetch_tickers', {'symbol_count': assets})
+    for i in range(assets):
+        log.log_debug("Ticker récupéré pour {}: {}", f"C{i}/USDT", 1.0)
+    local_state = {'symbols': [f"C{i}/USDT" for i in range(assets)]}
+    try:
+        raise ConnectionError(f"timeout ({len(local_state['symbols'])} symboles)")
+    except ConnectionError:
+        loguru_logger.exception("Erreur réseau pendant le cycle")
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--cycles', type=int, default=500)
+    parser.add_argument('--assets', type=int, default=20)
+    parser.add_argument('--console-delay-ms', type=float, default=0.2)
+    args = parser.parse_args()
+    
+    real_stderr = sys.stderr
+    for profile in ('development', 'production'):
+        with tempfile.TemporaryDirectory() as directory:
+            sys.stderr = SlowStream(args.console_delay_ms / 1000)
+            try:
+                log = make_logger(profile, directory)
+                durations = []
+                for _ in range(args.cycles):
+                    start = time.perf_counter()
+                    polling_cycle(log, args.assets)
+                    durations.append(time.perf_counter() - start)
+                log.flush()
+                loguru_logger.remove()
+            finally:
+                sys.stderr = real_stderr
+        
+        print(f"profil {profile} ({args.cycles} cycles)")
+        print(f"  p50 : {statistics.median(durations) * 1000:8.3f} ms")
+        print(f"  p99 : {percentile(durations, 0.99) * 1000:8.3f} ms")
+        print(f"  max : {max(durations) * 1000:8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark du cache de marchés: démarrage depuis le disque vs téléchargement, et index précision/limites
+
+Les marchés synthétiques imitent ceux de Binance (réponse brute 'info' comprise).
+Le téléchargement est simulé par une latence plus le décodage JSON d'une
+réponse exchangeInfo de taille équivalente.
+
+Usage:
+    python benchmarks/bench_markets.py --markets 3000 --latency 0.8
+"""
+
+import argparse
+import json
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ccxt
+
+from core.markets import MarketCache, MarketIndex
+
+
+def _market(i: int) -> dict:
+    """Marché ccxt de type Binance spot pour une paire synthétique"""
+    base = f"C{i}"
+    info = {
+        'symbol': f"{base}USDT", 'status': 'TRADING', 'baseAsset': base, 'quoteAsset': 'USDT',
+        'orderTypes': ['LIMIT', 'LIMIT_MAKER', 'MARKET', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'],
+        'filters': [
+            {'filterType': 'PRICE_FILTER', 'minPrice': '0.01', 'maxPrice': '1000000.00', 'tickSize': '0.01'},
+            {'filterType': 'LOT_SIZE', 'minQty': '0.00001', 'maxQty': '9000.00', 'stepSize': '0.00001'},
+            {'filterType': 'NOTIONAL', 'minNotional': '5.00', 'applyMinToMarket': True},
+            {'filterType': 'PERCENT_PRICE_BY_SIDE', 'bidMultiplierUp': '5', 'askMultiplierDown': '0.2'},
+        ],
+        'permissions': [], 'permissionSets': [['SPOT', 'MARGIN', 'TRD_GRP_004', 'TRD_GRP_005', 'TRD_GRP_006']],
+    }
+    return {
+        'id': info['symbol'], 'symbol': f"{base}/USDT", 'base': base, 'quote': 'USDT',
+        'baseId': base, 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True,
+        'precision': {'amount': 0.00001, 'price': 0.01},
+        'limits': {
+            'amount': {'min': 0.00001, 'max': 9000.0}, 'price': {'min': 0.01, 'max': 1000000.0},
+            'cost': {'min': 5.0, 'max': None},
+        },
+        'info': info,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--markets', type=int, default=3000, help="Nombre de marchés")
+    parser.add_argument('--latency', type=float, default=0.8, help="Latence simulée du téléchargement (s)")
+    parser.add_argument('--orders', type=int, default=100000, help="Ordres validés pour la mesure de l'index")
+    args = parser.parse_args()
+    
+    markets = {m['symbol']: m for m in map(_market, range(args.markets))}
+    payload = json.dumps({'symbols': [m['info'] for m in markets.values()]})
+    
+    with tempfile.TemporaryDirectory() as directory:
+        cache = MarketCache(Path(directory) / 'binance.markets', 3600)
+        
+        start = time.perf_counter()
+        time.sleep(args.latency)
+        json.loads(payload)
+        exchange = ccxt.binance()
+        exchange.set_markets(markets)
+        download = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        cache.save(exchange)
+        save = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        exchange = ccxt.binance()
+        cache.apply(exchange)
+        exchange.load_markets()
+        cached = time.perf_counter() - start
+        cache_size = cache.path.stat().st_size
+    
+    print(f"{args.markets} marchés, réponse exchangeInfo ~{len(payload) / 1e6:.1f} Mo, latence {args.latency}s")
+    print(f"  téléchargement simulé : {download * 1000:8.1f} ms")
+    print(f"  démarrage depuis cache: {cached * 1000:8.1f} ms (fichier {cache_size / 1e6:.1f} Mo, "
+          f"écriture {save * 1000:.1f} ms)")
+    
+    start = time.perf_counter()
+    index = MarketIndex.from_markets(exchange.markets, exchange.precisionMode)
+    build = time.perf_counter() - start
+    markets_size = len(pickle.dumps(exchange.markets, protocol=pickle.HIGHEST_PROTOCOL))
+    print(f"  index: construit en {build * 1000:.1f} ms, {index.nbytes / 1e3:.0f} Ko de valeurs "
+          f"(marchés ccxt sérialisés: {markets_size / 1e6:.1f} Mo)")
+    
+    symbols = list(exchange.markets)
+    start = time.perf_counter()
+    for i in range(args.orders):
+        index.validate_order(symbols[i % len(symbols)], 0.0123, price=100.0)
+    per_order = (time.perf_counter() - start) / args.orders
+    print(f"  validate_order: {per_order * 1e6:.2f} µs/ordre")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
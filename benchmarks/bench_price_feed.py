@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark du flux de prix: latence entre l'envoi d'une trame et la mise à jour du carnet
+
+Rejoue des trames enregistrées depuis un serveur WebSocket local.
+
+Usage:
+    python benchmarks/bench_price_feed.py --rounds 20 --interval 0.001
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.config_loader as cl
+import core.logger as lg
+from core.price_feed import PriceFeed
+from benchmarks.ws_replay_server import FrameReplayServer, load_frames
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=20, help="Nombre de rejeux du fichier de trames")
+    parser.add_argument('--interval', type=float, default=0.001, help="Pause entre trames (s)")
+    args = parser.parse_args()
+    
+    frames = load_frames() * args.rounds
+    server = FrameReplayServer(frames, interval=args.interval, stamp_event_time=True).start()
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump({
+            'exchange': {}, 'database': {}, 'portfolio': {},
+            'logging': {'level': 'WARNING', 'console': False, 'file': False},
+            'price_feed': {'url': server.url},
+        }, f)
+        config_path = f.name
+    
+    cl._config_instance = None
+    lg._logger_instance = None
+    latencies = []
+    done = threading.Event()
+    
+    def on_update(symbol, ticker):
+        latencies.append(time.time() * 1000 - ticker['timestamp'])
+        if len(latencies) >= len(frames):
+            done.set()
+    
+    feed = PriceFeed(['BTC/USDT', 'ETH/USDT', 'BNB/USDT'], config_path=config_path, on_update=on_update)
+    try:
+        feed.start()
+        done.wait(timeout=60)
+    finally:
+        feed.stop()
+        server.stop()
+        os.unlink(config_path)
+    
+    latencies.sort()
+    print(f"mises à jour: {len(latencies)}/{len(frames)}")
+    if latencies:
+        print(f"latence trame -> carnet: médiane={statistics.median(latencies):.3f}ms "
+              f"p99={latencies[int(len(latencies) * 0.99) - 1]:.3f}ms max={latencies[-1]:.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark du moteur de règles: évaluation incrémentale contre rescan complet
+
+Chaque tick modifie le prix d'une fraction des assets; le moteur n'évalue que
+ceux-là, la référence recalcule le PnL de tout le portefeuille.
+
+Usage:
+    python benchmarks/bench_rules.py --assets 5000 --changed 0.05 --ticks 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.config_loader as cl
+from core.rules import RulesEngine
+
+
+def full_scan(prices, anchors, profit=20.0, loss=-10.0):
+    """Évaluation de référence: PnL de chaque asset à chaque tick"""
+    hits = 0
+    for symbol, price in prices.items():
+        anchor = anchors[symbol]
+        pnl_percent = (price - anchor) / anchor * 100
+        if pnl_percent >= profit or pnl_percent <= loss:
+            hits += 1
+    return hits
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--assets', type=int, default=5000)
+    parser.add_argument('--changed', type=float, default=0.05, help="Fraction d'assets modifiés par tick")
+    parser.add_argument('--ticks', type=int, default=200)
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    symbols = [f"C{i}/USDT" for i in range(args.assets)]
+    prices = {s: rng.uniform(1, 1000) for s in symbols}
+    anchors = dict(prices)
+    changed = max(1, int(args.assets * args.changed))
+    # Variations faibles: peu de décisions, on mesure le coût de l'évaluation
+    ticks = [
+        {s: prices[s] * rng.uniform(0.99, 1.01) for s in rng.sample(symbols, changed)}
+        for _ in range(args.ticks)
+    ]
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump({'exchange': {}, 'database': {}, 'logging': {},
+                   'portfolio': {'base_currency': 'USDT'}, 'rules': {'enabled': True}}, f)
+        config_path = f.name
+    cl._config_instance = None
+    try:
+        engine = RulesEngine(config_path, anchor_prices={s.split('/')[0]: p for s, p in prices.items()})
+    finally:
+        os.unlink(config_path)
+    RulesEngine.logger = property(lambda self: MagicMock())
+    engine.evaluate(prices, now=0.0)
+    
+    current = dict(prices)
+    start = time.perf_counter()
+    for tick in ticks:
+        current.update(tick)
+        full_scan(current, anchors)
+    naive = (time.perf_counter() - start) / args.ticks
+    
+    start = time.perf_counter()
+    for i, tick in enumerate(ticks):
+        engine.evaluate(tick, now=float(i))
+    incremental = (time.perf_counter() - start) / args.ticks
+    
+    print(f"règles ({args.assets} assets, {changed} modifiés par tick)")
+    print(f"  rescan complet       : {naive * 1000:8.3f} ms/tick")
+    print(f"  moteur incrémental   : {incremental * 1000:8.3f} ms/tick")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
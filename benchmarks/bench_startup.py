@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark du temps de démarrage de run.py avec et sans initialisation lazy de l'exchange
+
+Chaque mesure lance un nouveau processus Python (import de ccxt inclus).
+En mode eager, le temps inclut le test de connexion réseau.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _write_config(lazy: bool) -> str:
+    """Écrit une copie de la configuration du projet avec lazy_init forcé"""
+    with open(PROJECT_ROOT / 'config' / 'settings.yaml', 'r', encoding='utf-8') as f:
+        config_data = yaml.safe_load(f)
+    config_data['exchange']['lazy_init'] = lazy
+    config_data['logging'].update({'console': False, 'file': False})
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump(config_data, f)
+        return f.name
+
+
+def _time_run(config_path: str) -> float:
+    """Mesure la durée d'une exécution complète de run.py"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, str(PROJECT_ROOT / 'run.py'), '--config', config_path],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+    )
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    
+    for lazy in (False, True):
+        config_path = _write_config(lazy)
+        try:
+            durations = [_time_run(config_path) for _ in range(args.runs)]
+        finally:
+            os.unlink(config_path)
+        label = 'lazy ' if lazy else 'eager'
+        print(f"{label}: médiane={statistics.median(durations):.3f}s "
+              f"min={min(durations):.3f}s max={max(durations):.3f}s ({args.runs} exécutions)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
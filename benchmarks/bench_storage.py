@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark d'écriture des snapshots SQLite: lignes par seconde
+
+Compare une insertion par ligne (une transaction chacune) avec l'écrivain
+groupé (executemany, WAL) alimenté comme par la boucle de polling.
+
+Usage:
+    python benchmarks/bench_storage.py --assets 200 --cycles 200
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from storage.snapshots import INSERT_BALANCE, SCHEMA, SnapshotStore, SnapshotWriter, balance_rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--assets', type=int, default=200)
+    parser.add_argument('--cycles', type=int, default=200)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--naive-rows', type=int, default=2000,
+                        help="Lignes écrites par la référence (une transaction par ligne est lente)")
+    args = parser.parse_args()
+    
+    balances = {f"C{i}": {'free': 1.0, 'used': 0.0, 'total': 1.0} for i in range(args.assets)}
+    total_rows = args.assets * args.cycles
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Référence: une transaction par ligne, journal par défaut
+        conn = sqlite3.connect(str(Path(tmp) / 'naive.db'))
+        conn.executescript(SCHEMA)
+        naive_rows = [row for cycle in range(args.cycles) for row in balance_rows(balances, float(cycle))]
+        naive_rows = naive_rows[:args.naive_rows]
+        start = time.perf_counter()
+        for row in naive_rows:
+            with conn:
+                conn.execute(INSERT_BALANCE, row)
+        naive = time.perf_counter() - start
+        conn.close()
+        
+        # Écrivain groupé: temps passé côté appelant et temps jusqu'à l'écriture complète
+        store = SnapshotStore(str(Path(tmp) / 'batched.db'))
+        writer = SnapshotWriter(store, batch_size=args.batch_size, flush_interval=1.0,
+                                max_queue=args.cycles + 1)
+        start = time.perf_counter()
+        for cycle in range(args.cycles):
+            writer.submit_balances(balances, timestamp=float(cycle))
+        submitted = time.perf_counter() - start
+        writer.flush()
+        batched = time.perf_counter() - start
+        writer.close()
+    
+    print(f"{total_rows} lignes ({args.assets} assets x {args.cycles} cycles)")
+    print(f"  une transaction par ligne : {len(naive_rows) / naive:>12,.0f} lignes/s "
+          f"(mesuré sur {len(naive_rows)} lignes)")
+    print(f"  écrivain groupé           : {total_rows / batched:>12,.0f} lignes/s "
+          f"({writer.stats['batches_written']} transactions)")
+    print(f"  coût côté boucle de polling: {submitted / args.cycles * 1e6:.1f} µs par cycle")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
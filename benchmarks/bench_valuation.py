@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark du moteur de valorisation: passe vectorisée contre boucle naïve par asset
+
+Usage:
+    python benchmarks/bench_valuation.py --assets 500 --points 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.config_loader as cl
+from core.ticker_table import TickerTable
+from core.valuation import ValuationEngine
+
+
+def naive_value(balances, tickers, anchors, base='USDT', threshold=10.0):
+    """Valorisation de référence: une itération Python par asset"""
+    total_value = 0.0
+    total_pnl = 0.0
+    rows = {}
+    for asset, balance in balances.items():
+        price = 1.0 if asset == base else (tickers.get(f"{asset}/{base}") or {}).get('last')
+        if price is None:
+            continue
+        value = balance['total'] * price
+        if value < threshold:
+            continue
+        anchor = anchors.get(asset)
+        pnl = (price - anchor) * balance['total'] if anchor else None
+        rows[asset] = {'value': value, 'pnl': pnl}
+        total_value += value
+        total_pnl += pnl or 0.0
+    return rows, total_value, total_pnl
+
+
+def naive_history(quantities, history):
+    """Historique de référence: double boucle points x assets"""
+    totals = []
+    for row in history:
+        total = 0.0
+        for quantity, price in zip(quantities, row):
+            if price == price:  # NaN != NaN
+                total += quantity * price
+        totals.append(total)
+    return totals
+
+
+def _timeit(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--assets', type=int, default=500)
+    parser.add_argument('--points', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(42)
+    assets = [f"C{i}" for i in range(args.assets)]
+    balances = {a: {'free': q, 'used': 0.0, 'total': q} for a, q in zip(assets, rng.uniform(0, 100, args.assets))}
+    tickers = {f"{a}/USDT": {'symbol': f"{a}/USDT", 'last': p} for a, p in zip(assets, rng.uniform(0.1, 1000, args.assets))}
+    anchors = {a: p for a, p in zip(assets, rng.uniform(0.1, 1000, args.assets))}
+    table = TickerTable.from_rows(tickers)
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump({'exchange': {}, 'database': {}, 'logging': {},
+                   'portfolio': {'base_currency': 'USDT', 'min_balance_threshold': 10.0}}, f)
+        config_path = f.name
+    cl._config_instance = None
+    try:
+        engine = ValuationEngine(config_path, anchor_prices=anchors)
+    finally:
+        os.unlink(config_path)
+    
+    naive = _timeit(lambda: naive_value(balances, tickers, anchors), args.repeat)
+    vector_dicts = _timeit(lambda: engine.value(balances, tickers), args.repeat)
+    vector_table = _timeit(lambda: engine.value(balances, table), args.repeat)
+    print(f"valorisation ({args.assets} assets)")
+    print(f"  boucle naïve         : {naive * 1000:8.3f} ms")
+    print(f"  moteur (dict tickers): {vector_dicts * 1000:8.3f} ms")
+    print(f"  moteur (TickerTable) : {vector_table * 1000:8.3f} ms")
+    
+    quantities = np.array([balances[a]['total'] for a in assets])
+    history = rng.uniform(0.1, 1000, (args.points, args.assets))
+    repeat = max(1, args.repeat // 10)
+    naive = _timeit(lambda: naive_history(quantities.tolist(), history.tolist()), repeat)
+    vector = _timeit(lambda: engine.value_history(quantities, history), args.repeat)
+    print(f"historique ({args.points} points x {args.assets} assets)")
+    print(f"  boucle naïve         : {naive * 1000:8.3f} ms")
+    print(f"  moteur               : {vector * 1000:8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Faux exchange ccxt avec latence et erreurs injectées, utilisé par les benchmarks
+"""
+
+import random
+import time
+import threading
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Any
+
+
+class FakeExchangeError(Exception):
+    """Erreur générique levée par le faux exchange"""
+
+
+class FakeNetworkError(FakeExchangeError):
+    """Erreur réseau injectée (équivalent de ccxt.NetworkError)"""
+
+
+class FakeNotSupported(FakeExchangeError):
+    """Endpoint non supporté (équivalent de ccxt.NotSupported)"""
+
+
+def fake_symbols(count: int, quote: str = 'USDT') -> List[str]:
+    """Symboles synthétiques C0/USDT, C1/USDT..."""
+    return [f"C{i}/{quote}" for i in range(count)]
+
+
+class FakeExchange:
+    """Imite l'interface synchrone d'un exchange ccxt sans accès réseau"""
+    
+    precisionMode = 4  # ccxt.TICK_SIZE
+    
+    def __init__(self, params: Optional[Dict[str, Any]] = None, latency: float = 0.05,
+                 bulk_supported: bool = True, symbols: Optional[List[str]] = None,
+                 markets: int = 0, balances: int = 0, error_rate: float = 0.0,
+                 seed: Optional[int] = 0):
+        """
+        Initialise le faux exchange
+        
+        Args:
+            params: Paramètres passés par ExchangeManager (ignorés)
+            latency: Latence simulée par requête REST (secondes)
+            bulk_supported: Expose ou non l'endpoint multi-symboles fetchTickers
+            symbols: Symboles connus de l'exchange (défaut: `markets` symboles synthétiques)
+            markets: Nombre de marchés synthétiques quand symbols n'est pas fourni
+            balances: Nombre d'assets détenus (les premiers marchés, plus la quote)
+            error_rate: Probabilité qu'une requête lève FakeNetworkError
+            seed: Graine du tirage des erreurs (None = aléatoire)
+        """
+        self.params = params or {}
+        self.latency = latency
+        self.has = {'fetchTickers': bulk_supported}
+        self.symbols = symbols if symbols is not None else fake_symbols(markets)
+        self.balance_count = balances
+        self.error_rate = error_rate
+        self.request_count = 0
+        self.error_count = 0
+        self.markets: Optional[Dict[str, Dict[str, Any]]] = None
+        self.currencies: Dict[str, Any] = {}
+        self.last_response_headers: Dict[str, str] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def _request(self) -> None:
+        """Simule un aller-retour réseau (et l'éventuelle erreur injectée)"""
+        with self._lock:
+            self.request_count += 1
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            if failed:
+                self.error_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            raise FakeNetworkError("Erreur réseau simulée")
+    
+    def _ticker(self, symbol: str) -> Dict[str, Any]:
+        """Construit un ticker ccxt déterministe pour un symbole"""
+        price = float(sum(map(ord, symbol)) % 1000 + 1)
+        return {
+            'symbol': symbol,
+            'last': price,
+            'bid': price * 0.999,
+            'ask': price * 1.001,
+            'high': price * 1.05,
+            'low': price * 0.95,
+            'quoteVolume': price * 1000.0,
+            'timestamp': int(time.time() * 1000),
+            'datetime': '2024-01-01T00:00:00.000Z',
+        }
+    
+    def _market(self, symbol: str) -> Dict[str, Any]:
+        """Construit un marché ccxt (précision et limites) pour un symbole"""
+        base, quote = symbol.split('/')
+        return {
+            'id': f"{base}{quote}", 'symbol': symbol, 'base': base, 'quote': quote,
+            'type': 'spot', 'spot': True, 'active': True,
+            'precision': {'amount': 0.001, 'price': 0.01},
+            'limits': {
+                'amount': {'min': 0.001, 'max': 9000.0}, 'price': {'min': 0.01, 'max': 1000000.0},
+                'cost': {'min': 5.0, 'max': None},
+            },
+        }
+    
+    def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        self._request()
+        return self._ticker(symbol)
+    
+    def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        self._request()
+        wanted = symbols if symbols is not None else self.symbols
+        return {symbol: self._ticker(symbol) for symbol in wanted}
+    
+    def fetch_balance(self) -> Dict[str, Any]:
+        self._request()
+        response: Dict[str, Any] = {'info': {}, 'free': {}, 'used': {}, 'total': {}}
+        if self.balance_count:
+            assets = [symbol.split('/')[0] for symbol in self.symbols[:self.balance_count - 1]] + ['USDT']
+            for i, asset in enumerate(assets):
+                total = float(i + 1)
+                response[asset] = {'free': total * 0.75, 'used': total * 0.25, 'total': total}
+                for key in ('free', 'used', 'total'):
+                    response[key][asset] = response[asset][key]
+        return response
+    
+    def set_markets(self, markets: Dict[str, Any], currencies: Optional[Dict[str, Any]] = None):
+        self.markets = dict(markets)
+        return self.markets
+    
+    def load_markets(self, reload: bool = False) -> Dict[str, Dict[str, Any]]:
+        if self.markets and not reload:
+            return self.markets
+        self._request()
+        return self.set_markets({symbol: self._market(symbol) for symbol in self.symbols})
+
+
+def make_fake_ccxt(**exchange_kwargs) -> SimpleNamespace:
+    """
+    Construit un faux module ccxt exposant 'binance' comme FakeExchange
+    
+    Args:
+        **exchange_kwargs: Arguments transmis au constructeur de FakeExchange
+    
+    Returns:
+        Objet utilisable à la place du module ccxt (ex: patch('core.exchange.ccxt', ...))
+    """
+    return SimpleNamespace(
+        binance=lambda params: FakeExchange(params, **exchange_kwargs),
+        NotSupported=FakeNotSupported,
+        NetworkError=FakeNetworkError,
+        AuthenticationError=FakeExchangeError,
+    )
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Test de charge par rejeu: pipeline complet sur des réponses d'exchange enregistrées
+
+Rejoue un enregistrement (exchange.transport.mode: record, voir core.replay)
+à travers ExchangeManager et ccxt, puis valorisation, règles et écriture SQLite,
+cycle après cycle jusqu'à épuisement. Aucun accès réseau. L'horloge des règles
+et des snapshots est celle de l'enregistrement: deux rejeus d'un même fichier
+produisent les mêmes décisions et la même empreinte ('checksum').
+
+Seules les requêtes réellement envoyées sont enregistrées: avec un cache de
+marchés valide à l'enregistrement, exchangeInfo est absent et le même cache
+(exchange.markets_cache) doit être présent au rejeu; les prix reçus par le flux
+temps réel (price_feed, désactivé au rejeu) ne sont pas rejoués. Une requête
+absente de l'enregistrement termine le rejeu (compteur 'missing').
+
+Usage:
+    python -m benchmarks.replay_load storage/recordings/binance.jsonl.gz --speed 0 --output replay.json
+    python -m benchmarks.replay_load storage/recordings/binance.jsonl.gz --speed 10 --baseline replay.json
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yaml
+
+import core.exchange as ex
+import storage.snapshots as sn
+from benchmarks.suite import (
+    RESULTS_FORMAT, Environment, _git_revision, compare, load_results, metric, print_comparison, print_results
+)
+from core.replay import close_transports, replay_adapter
+from core.rules import RulesEngine
+from core.valuation import ValuationEngine
+
+
+STAGES = ('balances', 'tickers', 'valuation', 'rules', 'storage')
+
+
+def replay_config(base: Dict[str, Any], recording: str, speed: float, directory: Path) -> Dict[str, Any]:
+    """
+    Configuration du rejeu: celle de production, transport en rejeu et effets de bord isolés
+    
+    Le cache de tickers est conservé (ses TTL suivent l'horloge de l'enregistrement,
+    voir ExchangeManager._build_ticker_cache); les balances sont relues à chaque
+    cycle et le limiteur est désactivé (aucune requête ne part).
+    """
+    config = copy.deepcopy(base)
+    exchange = config.setdefault('exchange', {})
+    exchange.update({
+        'lazy_init': False, 'balance_max_age_seconds': 0,
+        'transport': {'mode': 'replay', 'path': recording, 'speed': speed},
+    })
+    exchange['rate_limit'] = {**(exchange.get('rate_limit') or {}), 'enabled': False}
+    config['exchanges'] = []
+    config['price_feed'] = {'enabled': False}
+    config['config_reload'] = {'enabled': False}
+    config['database'] = {
+        **(config.get('database') or {}), 'type': 'sqlite', 'sqlite': {'path': str(directory / 'replay.db')},
+    }
+    config['logging'] = {'level': 'WARNING', 'console': False, 'file': False}
+    return config
+
+
+def replay_load(recording: str, config_path: str, speed: float) -> Dict[str, Any]:
+    """
+    Rejoue un enregistrement à travers le pipeline complet
+    
+    Args:
+        recording: Fichier d'enregistrement
+        config_path: Configuration de production (exchange, portfolio, règles)
+        speed: Vitesse de rejeu (0 = sans attente)
+    
+    Returns:
+        Résultats au format de benchmarks.suite ({'format', 'meta', 'results': {'replay': ...}})
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        base = yaml.safe_load(f) or {}
+    directory = Path(tempfile.mkdtemp(prefix='replay-load-'))
+    replay_path = str(directory / 'settings.yaml')
+    with open(replay_path, 'w', encoding='utf-8') as f:
+        yaml.dump(replay_config(base, str(Path(recording).resolve()), speed, directory), f)
+    
+    durations: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    digest = hashlib.sha256()
+    cycles = errors = decisions = 0
+    Environment.reset()
+    close_transports()
+    try:
+        manager = ex.ExchangeManager(replay_path)
+        adapter = replay_adapter(manager.exchange_config)
+        writer = sn.get_snapshot_writer(replay_path)
+        rules = RulesEngine(replay_path)
+        valuation = ValuationEngine(replay_path)
+        base_currency = valuation.base_currency
+        start = time.perf_counter()
+        
+        while not adapter.exhausted and adapter.remaining():
+            timings = {}
+            try:
+                stage = time.perf_counter()
+                balances = manager.refresh_balances().to_dict()
+                timings['balances'] = time.perf_counter() - stage
+                
+                stage = time.perf_counter()
+                symbols = [manager.normalize_symbol(asset, base_currency) for asset in balances if asset != base_currency]
+                tickers = manager.fetch_tickers(symbols) if symbols else {}
+                timings['tickers'] = time.perf_counter() - stage
+            except Exception:
+                # Erreur enregistrée (rejouée telle quelle) ou fin de l'enregistrement
+                errors += 0 if adapter.exhausted else 1
+                continue
+            now = adapter.clock()
+            
+            stage = time.perf_counter()
+            portfolio = valuation.value(balances, tickers)
+            timings['valuation'] = time.perf_counter() - stage
+            
+            stage = time.perf_counter()
+            decided = rules.evaluate(tickers, balances, now=now)
+            timings['rules'] = time.perf_counter() - stage
+            
+            stage = time.perf_counter()
+            writer.submit_balances(balances, timestamp=now)
+            if tickers:
+                writer.submit_prices(tickers, timestamp=now)
+            timings['storage'] = time.perf_counter() - stage
+            
+            for name, duration in timings.items():
+                durations[name].append(duration)
+            cycles += 1
+            decisions += len(decided)
+            digest.update(json.dumps(
+                [now, round(portfolio.total_value, 8), [(d.asset, d.decision) for d in decided]]
+            ).encode())
+        
+        writer.flush(timeout=60)
+        elapsed = time.perf_counter() - start
+        rows = writer.stats['rows_written']
+        span = adapter.last_at - adapter.first_at
+        served, missing = adapter.stats['served'], adapter.stats['missing']
+    finally:
+        Environment.reset()
+        close_transports()
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    results = {
+        'cycles': metric(cycles, 'count', 'higher'),
+        'responses': metric(served, 'count', 'higher'),
+        'cycles_per_second': metric(cycles / elapsed if elapsed else 0.0, 'cycles/s', 'higher'),
+        'speedup': metric(span / elapsed if elapsed else 0.0, 'x', 'higher'),
+        'rows_written': metric(rows, 'rows', 'higher'),
+        'decisions': metric(decisions, 'count'),
+        'errors': metric(errors, 'count'),
+        'missing': metric(missing, 'count'),
+    }
+    for stage, values in durations.items():
+        if values:
+            results[f"{stage}_ms"] = metric(statistics.median(values) * 1000, 'ms')
+    return {
+        'format': RESULTS_FORMAT,
+        'meta': {
+            'revision': _git_revision(),
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'params': {'recording': str(recording), 'speed': speed, 'span_seconds': round(span, 3)},
+            'checksum': digest.hexdigest(),
+        },
+        'results': {'replay': results},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('recording', help="Fichier d'enregistrement (core.replay)")
+    parser.add_argument('--config', default='config/settings.yaml', help="Configuration de production")
+    parser.add_argument('--speed', type=float, default=0.0, help="1 = temps réel, N = N fois plus vite, 0 = sans attente")
+    parser.add_argument('--output', help="Fichier JSON des résultats (format de benchmarks.suite)")
+    parser.add_argument('--baseline', help="Résultats de référence à comparer à ce rejeu")
+    parser.add_argument('--threshold', type=float, default=10.0, help="Écart signalé (%%, défaut 10)")
+    args = parser.parse_args(argv)
+    
+    current = replay_load(args.recording, args.config, args.speed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+    print_results(current)
+    print(f"empreinte {current['meta']['checksum'][:16]}")
+    if not args.baseline:
+        return 0
+    
+    baseline = load_results(args.baseline)
+    if baseline['meta'].get('checksum') != current['meta']['checksum']:
+        print("!! résultats différents de la référence (enregistrement ou logique modifiés)")
+    rows = compare(baseline, current, args.threshold)
+    print_comparison(rows, baseline, current)
+    regressions = [row for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"{len(regressions)} régression(s) au-delà de {args.threshold:.0f}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks hors ligne: exchange simulé, résultats JSON et comparaison entre commits
+
+Mesure fetch_tickers, fetch_balances, le débit du logger, les lectures de
+configuration et un cycle complet de run.py (balances, tickers, règles,
+snapshot écrit en base) contre un faux exchange ccxt: N marchés, M balances,
+latence et taux d'erreur injectés. Aucun accès réseau.
+
+Usage:
+    python -m benchmarks.suite --output base.json
+    python -m benchmarks.suite --baseline base.json --output head.json
+    python -m benchmarks.suite --compare base.json head.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from unittest.mock import patch
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import core.config_loader as cl
+import core.exchange as ex
+import core.logger as lg
+import core.rate_limiter as rl
+import storage.snapshots as sn
+from benchmarks.fake_exchange import FakeExchangeError, fake_symbols, make_fake_ccxt
+
+
+# Version du format des résultats JSON
+RESULTS_FORMAT = 1
+
+# Paramètres par défaut et réduits (--quick)
+DEFAULTS = {'markets': 2000, 'balances': 50, 'latency': 0.0, 'error_rate': 0.0, 'repeat': 15, 'calls': 100000}
+QUICK = {'markets': 200, 'balances': 10, 'repeat': 3, 'calls': 5000}
+
+
+def metric(value: float, unit: str, better: str = 'lower') -> Dict[str, Any]:
+    """Mesure exportée: valeur, unité et sens de l'amélioration ('lower' ou 'higher')"""
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+def timed(func: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """
+    Exécute func repeat fois
+    
+    Returns:
+        (médiane des durées réussies en secondes, nombre d'appels en erreur)
+    """
+    durations, errors = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            func()
+        except FakeExchangeError:
+            errors += 1
+            continue
+        durations.append(time.perf_counter() - start)
+    return (statistics.median(durations) if durations else float('nan')), errors
+
+
+def rate(func: Callable[[], Any], calls: int, repeat: int = 3) -> float:
+    """Meilleur débit (appels par seconde) sur repeat séries de calls appels"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return calls / best
+
+
+class Environment:
+    """Configuration temporaire, singletons réinitialisés et ccxt remplacé par le faux exchange"""
+    
+    def __init__(self, params: Dict[str, Any]):
+        self.params = params
+        self.directory = Path(tempfile.mkdtemp(prefix='bench-suite-'))
+        self.config_path = str(self.directory / 'settings.yaml')
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            yaml.dump(self.config_data(), f)
+    
+    def config_data(self) -> Dict[str, Any]:
+        """Configuration mesurée: caches locaux désactivés pour solliciter l'exchange à chaque appel"""
+        return {
+            'exchange': {
+                'name': 'binance', 'sandbox': False, 'testnet': False, 'balance_max_age_seconds': 0,
+                'rate_limit': {'enabled': False},
+                'ticker_cache': {'enabled': False},
+                'http': {'enabled': False},
+            },
+            'database': {
+                'type': 'sqlite', 'sqlite': {'path': str(self.directory / 'portfolio.db')},
+                'writer': {'batch_size': 500, 'flush_interval_seconds': 0.05},
+            },
+            'portfolio': {'base_currency': 'USDT'},
+            'rules': {'enabled': True, 'profit_threshold_percent': 20.0, 'loss_threshold_percent': -10.0},
+            'logging': {'level': 'WARNING', 'console': False, 'file': False},
+        }
+    
+    @staticmethod
+    def reset() -> None:
+        """Réinitialise les singletons du projet"""
+        cl._config_instance = None
+        lg._logger_instance = None
+        ex._exchange_instance = None
+        if sn._writer_instance is not None:
+            sn._writer_instance.close()
+            sn._writer_instance = None
+        rl._limiters.clear()
+    
+    @contextmanager
+    def exchange(self, **overrides) -> Iterator[ex.ExchangeManager]:
+        """ExchangeManager branché sur un faux exchange (paramètres de la suite, surchargés)"""
+        kwargs = {
+            'latency': self.params['latency'], 'markets': self.params['markets'],
+            'balances': self.params['balances'], 'error_rate': self.params['error_rate'], **overrides,
+        }
+        self.reset()
+        with patch.object(ex, 'ccxt', make_fake_ccxt(**kwargs)):
+            yield ex.ExchangeManager(self.config_path)
+    
+    def close(self) -> None:
+        self.reset()
+        for path in sorted(self.directory.rglob('*'), reverse=True):
+            path.rmdir() if path.is_dir() else path.unlink()
+        self.directory.rmdir()
+
+
+def bench_fetch_tickers(env: Environment) -> Dict[str, Any]:
+    """fetch_tickers: symboles détenus (requête groupée), marché entier (dicts et colonnes), repli concurrent"""
+    repeat = env.params['repeat']
+    held = fake_symbols(max(1, env.params['balances'] - 1))
+    results = {}
+    with env.exchange() as manager:
+        duration, errors = timed(lambda: manager.fetch_tickers(held), repeat)
+        results['held_bulk_ms'] = metric(duration * 1000, 'ms')
+        duration, more = timed(lambda: manager.fetch_tickers(), repeat)
+        results['all_markets_ms'] = metric(duration * 1000, 'ms')
+        duration, most = timed(lambda: manager.fetch_tickers(columnar=True), repeat)
+        results['all_markets_columnar_ms'] = metric(duration * 1000, 'ms')
+        errors += more + most
+    with env.exchange(bulk_supported=False) as manager:
+        duration, more = timed(lambda: manager.fetch_tickers(held), repeat)
+        results['held_concurrent_ms'] = metric(duration * 1000, 'ms')
+        errors += more
+    results['errors'] = metric(errors, 'count')
+    return results
+
+
+def bench_fetch_balances(env: Environment) -> Dict[str, Any]:
+    """fetch_balances: rafraîchissement de l'instantané et lecture de l'instantané en cours"""
+    repeat = env.params['repeat']
+    with env.exchange() as manager:
+        refresh, errors = timed(manager.refresh_balances, repeat)
+        manager.balance_max_age = 3600.0
+        cached, more = timed(manager.fetch_balances, repeat)
+    return {
+        'refresh_ms': metric(refresh * 1000, 'ms'),
+        'snapshot_read_us': metric(cached * 1e6, 'us'),
+        'errors': metric(errors + more, 'count'),
+    }
+
+
+def bench_logger(env: Environment) -> Dict[str, Any]:
+    """Débit du logger vers un sink nul: message actif, debug inactif, log_execution"""
+    from loguru import logger as loguru_logger
+    
+    env.reset()
+    log = lg.get_logger(env.config_path)
+    sink = loguru_logger.add(lambda message: None, level='INFO', format="{message}")
+    log._register_sink_level('INFO')
+    calls = env.params['calls']
+    details = {'symbol': 'BTC/USDT', 'count': 3}
+    try:
+        return {
+            'info_per_s': metric(rate(lambda: log.log_info('Cycle terminé'), calls // 10), 'calls/s', 'higher'),
+            'debug_inactive_per_s': metric(
+                rate(lambda: log.log_debug('Ticker {}: {}', 'BTC/USDT', 45000.0), calls), 'calls/s', 'higher'
+            ),
+            'execution_per_s': metric(
+                rate(lambda: log.log_execution('exchange', 'fetch_tickers', details), calls // 10),
+                'calls/s', 'higher'
+            ),
+        }
+    finally:
+        loguru_logger.remove(sink)
+
+
+def bench_config(env: Environment) -> Dict[str, Any]:
+    """Configuration: chargement (cache compilé en mémoire), get() et lecture de la vue figée"""
+    env.reset()
+    config = cl.get_config(env.config_path)
+    keys = ['rules.profit_threshold_percent', 'exchange.name', 'database.sqlite.path', 'rules.missing']
+    calls = env.params['calls']
+    snapshot = config.snapshot()
+    
+    def lookups():
+        for key in keys:
+            config.get(key)
+    
+    def snapshot_lookups():
+        for key in keys:
+            snapshot.get(key)
+    
+    load, _ = timed(lambda: cl.ConfigLoader(env.config_path), env.params['repeat'])
+    return {
+        'load_us': metric(load * 1e6, 'us'),
+        'get_per_s': metric(rate(lookups, calls // len(keys)) * len(keys), 'calls/s', 'higher'),
+        'snapshot_get_per_s': metric(rate(snapshot_lookups, calls // len(keys)) * len(keys), 'calls/s', 'higher'),
+    }
+
+
+def bench_run_cycle(env: Environment) -> Dict[str, Any]:
+    """Cycle complet de run.py: balances, tickers détenus, règles, snapshot écrit en base"""
+    import run
+    from core.rules import RulesEngine
+    
+    with env.exchange() as manager:
+        writer = sn.get_snapshot_writer(env.config_path)
+        collector = run.Collector(manager, writer, RulesEngine(env.config_path))
+        
+        def cycle():
+            collector.collect_balances()
+            collector.collect_tickers()
+            collector.evaluate_rules()
+            collector.snapshot()
+            writer.flush(timeout=30)
+        
+        duration, errors = timed(cycle, env.params['repeat'])
+        rows = writer.stats['rows_written']
+        requests = manager.exchange.request_count
+    return {
+        'cycle_ms': metric(duration * 1000, 'ms'),
+        'rows_written': metric(rows, 'rows', 'higher'),
+        'exchange_requests': metric(requests, 'count'),
+        'errors': metric(errors, 'count'),
+    }
+
+
+BENCHMARKS: Dict[str, Callable[[Environment], Dict[str, Any]]] = {
+    'fetch_tickers': bench_fetch_tickers,
+    'fetch_balances': bench_fetch_balances,
+    'logger': bench_logger,
+    'config': bench_config,
+    'run_cycle': bench_run_cycle,
+}
+
+
+def _git_revision() -> Optional[str]:
+    """Commit courant (suffixé de '-dirty' si l'arbre est modifié), None hors dépôt git"""
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{revision}-dirty" if dirty else revision
+
+
+def run_suite(params: Dict[str, Any], only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Exécute les benchmarks
+    
+    Args:
+        params: Paramètres (markets, balances, latency, error_rate, repeat, calls)
+        only: Noms des benchmarks à exécuter (défaut: tous)
+    
+    Returns:
+        Résultats {'format', 'meta', 'results': {benchmark: {mesure: metric}}}
+    """
+    env = Environment(params)
+    results = {}
+    try:
+        for name, bench in BENCHMARKS.items():
+            if only and name not in only:
+                continue
+            results[name] = bench(env)
+    finally:
+        env.close()
+    return {
+        'format': RESULTS_FORMAT,
+        'meta': {
+            'revision': _git_revision(),
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'params': params,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = 10.0) -> List[Dict[str, Any]]:
+    """
+    Compare deux résultats mesure par mesure
+    
+    Args:
+        baseline: Résultats de référence
+        current: Résultats comparés
+        threshold: Écart (en %) au-delà duquel une mesure est une régression ou une amélioration
+    
+    Returns:
+        Lignes {benchmark, metric, unit, baseline, current, change_percent, status} où status
+        vaut 'regression', 'improvement', 'unchanged' ou 'new'
+    """
+    rows = []
+    for bench, metrics in current['results'].items():
+        for name, entry in metrics.items():
+            base = baseline['results'].get(bench, {}).get(name)
+            row = {
+                'benchmark': bench, 'metric': name, 'unit': entry['unit'],
+                'baseline': None if base is None else base['value'], 'current': entry['value'],
+                'change_percent': None, 'status': 'new',
+            }
+            if base is not None and base['value']:
+                change = (entry['value'] - base['value']) / abs(base['value']) * 100
+                worse = change if entry['better'] == 'lower' else -change
+                row['change_percent'] = change
+                row['status'] = (
+                    'regression' if worse > threshold else 'improvement' if worse < -threshold else 'unchanged'
+                )
+            elif base is not None:
+                row['status'] = 'unchanged' if not entry['value'] else 'regression'
+            rows.append(row)
+    return rows
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """Affiche les résultats d'une exécution"""
+    meta = results['meta']
+    print(f"révision {meta['revision']} - {meta['params']}")
+    for bench, metrics in results['results'].items():
+        for name, entry in metrics.items():
+            print(f"  {bench:<15} {name:<26} {entry['value']:>14,.3f} {entry['unit']}")
+
+
+def print_comparison(rows: List[Dict[str, Any]], baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Affiche une comparaison (voir compare)"""
+    print(f"référence {baseline['meta'].get('revision')} -> {current['meta'].get('revision')}")
+    marks = {'regression': '!! ', 'improvement': '++ ', 'unchanged': '   ', 'new': ' * '}
+    for row in rows:
+        base = '-' if row['baseline'] is None else f"{row['baseline']:,.3f}"
+        change = '' if row['change_percent'] is None else f"{row['change_percent']:+.1f}%"
+        print(f"{marks[row['status']]}{row['benchmark']:<15} {row['metric']:<26} "
+              f"{base:>14} -> {row['current']:>14,.3f} {row['unit']:<8} {change:>8}")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Charge un fichier de résultats JSON"""
+    with open(path, 'r', encoding='utf-8') as f:
+        results = json.load(f)
+    if results.get('format') != RESULTS_FORMAT:
+        raise ValueError(f"{path}: format de résultats {results.get('format')} non supporté")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--markets', type=int, help="Marchés du faux exchange")
+    parser.add_argument('--balances', type=int, help="Assets détenus")
+    parser.add_argument('--latency', type=float, help="Latence injectée par requête (s)")
+    parser.add_argument('--error-rate', type=float, help="Probabilité d'erreur réseau par requête")
+    parser.add_argument('--repeat', type=int, help="Répétitions par mesure de durée (médiane)")
+    parser.add_argument('--calls', type=int, help="Appels par mesure de débit")
+    parser.add_argument('--quick', action='store_true', help="Tailles réduites (vérification rapide)")
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="Benchmarks à exécuter")
+    parser.add_argument('--output', help="Fichier JSON des résultats (défaut: sortie standard)")
+    parser.add_argument('--baseline', help="Résultats de référence à comparer à cette exécution")
+    parser.add_argument('--compare', nargs=2, metavar=('REFERENCE', 'COURANT'),
+                        help="Compare deux fichiers de résultats sans rien exécuter")
+    parser.add_argument('--threshold', type=float, default=10.0, help="Écart signalé (%%, défaut 10)")
+    args = parser.parse_args(argv)
+    
+    if args.compare:
+        baseline, current = map(load_results, args.compare)
+    else:
+        params = {**DEFAULTS, **(QUICK if args.quick else {})}
+        for name in DEFAULTS:
+            if getattr(args, name) is not None:
+                params[name] = getattr(args, name)
+        baseline = load_results(args.baseline) if args.baseline else None
+        current = run_suite(params, args.only)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(current, f, indent=2)
+            print_results(current)
+        elif baseline is None:
+            json.dump(current, sys.stdout, indent=2)
+            print()
+    
+    if baseline is None:
+        return 0
+    rows = compare(baseline, current, args.threshold)
+    print_comparison(rows, baseline, current)
+    regressions = [row for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"{len(regressions)} régression(s) au-delà de {args.threshold:.0f}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Serveur WebSocket local qui rejoue des trames de ticker enregistrées
+
+Imite le protocole des flux Binance (requêtes SUBSCRIBE puis événements
+'24hrTicker') pour tester et mesurer core.price_feed sans exchange réel.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from aiohttp import web, WSMsgType
+
+
+FRAMES_PATH = Path(__file__).parent / 'data' / 'binance_ticker_frames.jsonl'
+
+
+def load_frames(path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Charge des trames enregistrées (une trame JSON par ligne)"""
+    with open(path or FRAMES_PATH, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class FrameReplayServer:
+    """Serveur WebSocket de rejeu exécuté dans un thread dédié"""
+    
+    def __init__(self, frames: List[Dict[str, Any]], interval: float = 0.0,
+                 close_after_replay: bool = False, stamp_event_time: bool = False):
+        """
+        Initialise le serveur
+        
+        Args:
+            frames: Trames '24hrTicker' à rejouer
+            interval: Pause entre deux trames (secondes)
+            close_after_replay: Fermer la connexion une fois les trames envoyées
+            stamp_event_time: Remplacer 'E' par l'heure d'envoi (mesure de latence)
+        """
+        self.frames = frames
+        self.interval = interval
+        self.close_after_replay = close_after_replay
+        self.stamp_event_time = stamp_event_time
+        self.subscriptions: List[List[str]] = []
+        self.connections = 0
+        self.port: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+    
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}/ws"
+    
+    def start(self) -> 'FrameReplayServer':
+        """Démarre le serveur sur un port libre"""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._serve, name='ws-replay', daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=5)
+        return self
+    
+    def stop(self) -> None:
+        """Arrête le serveur"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+    
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        app = web.Application()
+        app.router.add_get('/ws', self._handle)
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        self._loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+    
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        streams = set()
+        replay_task = None
+        
+        async for message in ws:
+            if message.type != WSMsgType.TEXT:
+                continue
+            command = json.loads(message.data)
+            if command.get('method') == 'SUBSCRIBE':
+                self.subscriptions.append(list(command['params']))
+                streams.update(command['params'])
+                await ws.send_str(json.dumps({'result': None, 'id': command.get('id')}))
+                if replay_task is None:
+                    replay_task = asyncio.ensure_future(self._replay(ws, streams))
+        
+        if replay_task is not None:
+            replay_task.cancel()
+        return ws
+    
+    async def _replay(self, ws: web.WebSocketResponse, streams: set) -> None:
+        for frame in self.frames:
+            if f"{frame['s'].lower()}@ticker" not in streams:
+                continue
+            if self.stamp_event_time:
+                frame = {**frame, 'E': time.time() * 1000}
+            await ws.send_str(json.dumps(frame))
+            if self.interval:
+                await asyncio.sleep(self.interval)
+        if self.close_after_replay:
+            await ws.close()
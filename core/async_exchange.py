@@ -0,0 +1,378 @@
+"""
+Module de connexion asynchrone aux exchanges crypto (ccxt.async_support)
+"""
+
+import asyncio
+import weakref
+from typing import Dict, List, Optional, Any
+import ccxt.async_support as ccxt_async
+from .config_loader import get_config
+from .logger import get_logger
+from .exchange import build_exchange_params, format_ticker
+from .balances import BalanceSnapshot
+from .http_pool import acquire_async_session, release_async_session
+from .markets import MarketCache
+from .rate_limiter import ENDPOINT_WEIGHTS, background, ban_errors, get_rate_limiter, tickers_weight
+
+
+class AsyncExchangeManager:
+    """Gestionnaire asynchrone de connexion et d'interaction avec l'exchange"""
+    
+    def __init__(self, config_path: Optional[str] = None):
+        """
+        Initialise le gestionnaire d'exchange asynchrone
+        
+        La session HTTP n'est ouverte qu'à la première requête; elle doit être
+        fermée avec close() (ou via 'async with').
+        
+        Args:
+            config_path: Chemin vers le fichier de configuration
+        """
+        self.config = get_config(config_path)
+        self.logger = get_logger(config_path)
+        self.exchange_config = self.config.get_exchange_config()
+        self.exchange = None
+        # Section exchange ayant servi à obtenir la session partagée (clé de libération)
+        self._shared_session: Optional[Dict[str, Any]] = None
+        self.balance_max_age = float(self.exchange_config.get('balance_max_age_seconds', 10.0))
+        self._balance_snapshot: Optional[BalanceSnapshot] = None
+        # Un verrou par boucle d'événements (un asyncio.Lock est lié à sa boucle)
+        self._balance_locks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = \
+            weakref.WeakKeyDictionary()
+        # Même budget que le gestionnaire synchrone
+        self.rate_limiter = get_rate_limiter(self.exchange_config)
+        self._initialize_exchange()
+    
+    def _initialize_exchange(self) -> None:
+        """Crée l'instance ccxt asynchrone (aucune requête réseau)"""
+        exchange_name = self.exchange_config.get('name', 'binance').lower()
+        
+        if not hasattr(ccxt_async, exchange_name):
+            raise ValueError(f"Exchange '{exchange_name}' non supporté par ccxt")
+        exchange_class = getattr(ccxt_async, exchange_name)
+        
+        self.exchange = exchange_class(build_exchange_params(self.exchange_config))
+        # Marchés du cache disque écrit par le gestionnaire synchrone (lecture seule)
+        market_cache = MarketCache.from_config(self.exchange_config)
+        if market_cache is not None:
+            market_cache.apply(self.exchange)
+        self.logger.log_info(
+            f"Exchange asynchrone {exchange_name} initialisé",
+            testnet=self.exchange_config.get('testnet', False),
+            sandbox=self.exchange_config.get('sandbox', True)
+        )
+    
+    async def __aenter__(self) -> 'AsyncExchangeManager':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Ferme la session HTTP de l'exchange (ou libère la session partagée)"""
+        if self.exchange is not None:
+            await self.exchange.close()
+            if self._shared_session is not None:
+                shared, self._shared_session = self._shared_session, None
+                await release_async_session(shared)
+            self.logger.log_debug("Session de l'exchange asynchrone fermée")
+    
+    async def _ensure_session(self) -> None:
+        """Branche la session aiohttp partagée de l'hôte avant la première requête"""
+        if self._shared_session is not None or getattr(self.exchange, 'session', None) is not None:
+            return
+        session = await acquire_async_session(self.exchange_config)
+        if session is not None:
+            # ccxt ne ferme pas une session qui ne lui appartient pas
+            self.exchange.session = session
+            self.exchange.own_session = False
+            self._shared_session = self.exchange_config
+    
+    async def test_connection(self) -> bool:
+        """
+        Teste la connexion à l'exchange
+        
+        Returns:
+            True si la requête publique de test a réussi
+        """
+        try:
+            with background():
+                await self._limited(ENDPOINT_WEIGHTS['fetch_ticker'], self.exchange.fetch_ticker, 'BTC/USDT')
+            self.logger.log_debug("Test de connexion réussi")
+            return True
+        except Exception as e:
+            self.logger.log_warning(f"Test de connexion échoué (normal si pas d'API key): {e}")
+            return False
+    
+    async def fetch_balances(self) -> Dict[str, Any]:
+        """
+        Récupère les balances du compte
+        
+        Returns:
+            Dictionnaire contenant les balances (free, used, total) par asset
+        """
+        try:
+            self.logger.log_execution('exchange', 'fetch_balances')
+            
+            balances_cleaned = (await self.get_balance_snapshot()).to_dict()
+            
+            self.logger.log_info(
+                f"Balances récupérées: {len(balances_cleaned)} assets avec balance > 0",
+                asset_count=len(balances_cleaned)
+            )
+            
+            return balances_cleaned
+        
+        except ccxt_async.AuthenticationError as e:
+            self.logger.log_error(f"Erreur d'authentification: {e}")
+            raise
+        except ccxt_async.NetworkError as e:
+            self.logger.log_error(f"Erreur réseau: {e}")
+            raise
+        except Exception as e:
+            self.logger.log_error(f"Erreur lors de la récupération des balances: {e}")
+            raise
+    
+    async def get_balance_snapshot(self, max_age: Optional[float] = None) -> BalanceSnapshot:
+        """
+        Retourne l'instantané des balances, rafraîchi s'il est plus ancien que max_age
+        
+        Les coroutines concurrentes attendent un seul appel fetch_balance.
+        
+        Args:
+            max_age: Âge maximum accepté en secondes (défaut: exchange.balance_max_age_seconds)
+        
+        Returns:
+            Instance BalanceSnapshot
+        """
+        if max_age is None:
+            max_age = self.balance_max_age
+        
+        snapshot = self._balance_snapshot
+        if snapshot is not None and snapshot.is_fresh(max_age):
+            return snapshot
+        
+        async with self._balance_lock():
+            snapshot = self._balance_snapshot
+            if snapshot is not None and snapshot.is_fresh(max_age):
+                return snapshot
+            return await self._refresh_balances_locked()
+    
+    async def refresh_balances(self) -> BalanceSnapshot:
+        """
+        Force la récupération d'un nouvel instantané des balances
+        
+        Returns:
+            Nouvelle instance BalanceSnapshot
+        """
+        async with self._balance_lock():
+            return await self._refresh_balances_locked()
+    
+    def _balance_lock(self) -> asyncio.Lock:
+        """Verrou des balances de la boucle courante (le singleton peut servir plusieurs asyncio.run)"""
+        loop = asyncio.get_running_loop()
+        lock = self._balance_locks.get(loop)
+        if lock is None:
+            lock = self._balance_locks[loop] = asyncio.Lock()
+        return lock
+    
+    async def _refresh_balances_locked(self) -> BalanceSnapshot:
+        """Récupère les balances et remplace l'instantané (verrou déjà acquis)"""
+        snapshot = BalanceSnapshot.from_response(
+            await self._limited(ENDPOINT_WEIGHTS['fetch_balance'], self.exchange.fetch_balance)
+        )
+        self._balance_snapshot = snapshot
+        return snapshot
+    
+    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        """
+        Récupère le ticker (prix actuel) pour un symbole
+        
+        Args:
+            symbol: Symbole de trading (ex: 'BTC/USDT')
+        
+        Returns:
+            Dictionnaire contenant les informations du ticker
+        """
+        try:
+            self.logger.log_execution('exchange', 'fetch_ticker', {'symbol': symbol})
+            
+            ticker = await self._limited(ENDPOINT_WEIGHTS['fetch_ticker'], self.exchange.fetch_ticker, symbol)
+            return format_ticker(symbol, ticker)
+        
+        except Exception as e:
+            self.logger.log_error(f"Erreur lors de la récupération du ticker pour {symbol}: {e}")
+            raise
+    
+    async def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les tickers pour plusieurs symboles
+        
+        Args:
+            symbols: Liste de symboles (ex: ['BTC/USDT', 'ETH/USDT'])
+                    Si None, récupère tous les tickers
+        
+        Returns:
+            Dictionnaire de tickers indexés par symbole
+        """
+        try:
+            self.logger.log_execution(
+                'exchange',
+                'fetch_tickers',
+                {'symbol_count': len(symbols) if symbols else 'all'}
+            )
+            
+            if symbols:
+                has = getattr(self.exchange, 'has', None) or {}
+                if has.get('fetchTickers'):
+                    try:
+                        tickers_raw = await self._limited(
+                            tickers_weight(len(symbols)), self.exchange.fetch_tickers, symbols
+                        )
+                    except ccxt_async.NotSupported as e:
+                        self.logger.log_debug("fetch_tickers groupé non supporté, repli concurrent: {}", e)
+                        return await self._fetch_tickers_concurrent(symbols)
+                    tickers = {}
+                    for symbol in symbols:
+                        if symbol not in tickers_raw:
+                            self.logger.log_warning(
+                                f"Impossible de récupérer le ticker pour {symbol}: absent de la réponse"
+                            )
+                            continue
+                        tickers[symbol] = format_ticker(symbol, tickers_raw[symbol])
+                    return tickers
+                return await self._fetch_tickers_concurrent(symbols)
+            
+            tickers_raw = await self._limited(tickers_weight(None), self.exchange.fetch_tickers)
+            tickers = {
+                symbol: format_ticker(symbol, ticker)
+                for symbol, ticker in tickers_raw.items()
+                if symbol.endswith('/USDT')  # Filtrer uniquement les paires USDT
+            }
+            self.logger.log_info(f"Tickers récupérés: {len(tickers)} paires USDT")
+            return tickers
+        
+        except Exception as e:
+            self.logger.log_error(f"Erreur lors de la récupération des tickers: {e}")
+            raise
+    
+    async def _fetch_tickers_concurrent(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Récupère les tickers un par un avec un nombre borné de requêtes simultanées"""
+        semaphore = asyncio.Semaphore(max(1, int(self.exchange_config.get('max_concurrent_requests', 8))))
+        
+        async def fetch_one(symbol: str) -> Dict[str, Any]:
+            async with semaphore:
+                return format_ticker(
+                    symbol,
+                    await self._limited(ENDPOINT_WEIGHTS['fetch_ticker'], self.exchange.fetch_ticker, symbol)
+                )
+        
+        results = await asyncio.gather(*(fetch_one(s) for s in symbols), return_exceptions=True)
+        
+        tickers = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.logger.log_warning(f"Impossible de récupérer le ticker pour {symbol}: {result}")
+            else:
+                tickers[symbol] = result
+        return tickers
+    
+    async def _limited(self, weight: int, func, *args) -> Any:
+        """
+        Exécute un appel ccxt asynchrone via le limiteur partagé
+        
+        Args:
+            weight: Poids de l'endpoint
+            func: Méthode ccxt (coroutine) à appeler
+        
+        Returns:
+            Réponse de l'exchange
+        """
+        await self._ensure_session()
+        if self.rate_limiter is None:
+            return await func(*args)
+        return await self.rate_limiter.call_async(
+            weight, func, *args, exchange=self.exchange, ban_errors=ban_errors(ccxt_async)
+        )
+    
+    async def get_account_info(self) -> Dict[str, Any]:
+        """
+        Récupère les informations du compte
+        
+        Returns:
+            Dictionnaire contenant les informations du compte
+        """
+        try:
+            self.logger.log_execution('exchange', 'get_account_info')
+            
+            snapshot = await self.get_balance_snapshot()
+            
+            return {
+                'exchange': self.exchange_config.get('name', 'unknown'),
+                'timestamp': snapshot.timestamp,
+                'balances_count': snapshot.asset_count
+            }
+        
+        except Exception as e:
+            self.logger.log_error(f"Erreur lors de la récupération des infos du compte: {e}")
+            raise
+    
+    async def fetch_cycle(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Exécute un cycle de polling complet (balances + tickers) de façon concurrente
+        
+        Args:
+            symbols: Symboles dont récupérer les tickers (None = toutes les paires USDT)
+        
+        Returns:
+            Dictionnaire {'balances': ..., 'tickers': ...}
+        """
+        balances, tickers = await asyncio.gather(
+            self.fetch_balances(),
+            self.fetch_tickers(symbols)
+        )
+        return {'balances': balances, 'tickers': tickers}
+    
+    def normalize_symbol(self, asset: str, quote: str = 'USDT') -> str:
+        """
+        Normalise un symbole au format de l'exchange (ex: 'BTC' -> 'BTC/USDT')
+        
+        Args:
+            asset: Asset de base (ex: 'BTC')
+            quote: Quote currency (défaut: 'USDT')
+        
+        Returns:
+            Symbole normalisé (ex: 'BTC/USDT')
+        """
+        return f"{asset}/{quote}"
+
+
+# Instance globale asynchrone (sera initialisée au premier appel)
+_async_exchange_instance: Optional[AsyncExchangeManager] = None
+
+
+def get_async_exchange(config_path: Optional[str] = None) -> AsyncExchangeManager:
+    """
+    Obtient l'instance globale du gestionnaire d'exchange asynchrone (singleton)
+    
+    Args:
+        config_path: Chemin vers le fichier de configuration (uniquement au premier appel)
+    
+    Returns:
+        Instance AsyncExchangeManager
+    """
+    global _async_exchange_instance
+    
+    if _async_exchange_instance is None:
+        _async_exchange_instance = AsyncExchangeManager(config_path)
+    
+    return _async_exchange_instance
+
+
+async def close_async_exchange() -> None:
+    """Ferme la session de l'instance globale asynchrone et réinitialise le singleton"""
+    global _async_exchange_instance
+    
+    if _async_exchange_instance is not None:
+        await _async_exchange_instance.close()
+        _async_exchange_instance = None
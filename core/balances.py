@@ -0,0 +1,95 @@
+"""
+Instantané des balances du compte partagé au sein d'un cycle de polling
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping
+
+
+def format_balances(balances_response: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Formate la réponse brute de fetch_balance (balances à zéro et clés système retirées)
+    
+    Args:
+        balances_response: Réponse brute de ccxt fetch_balance
+    
+    Returns:
+        Dictionnaire des balances (free, used, total) par asset
+    """
+    balances = {}
+    for asset, balance_info in balances_response.items():
+        if isinstance(balance_info, dict):
+            total = balance_info.get('total', 0)
+            free = balance_info.get('free', 0)
+            used = balance_info.get('used', 0)
+            
+            # Ignorer les balances complètement à zéro
+            if total > 0 or free > 0 or used > 0:
+                balances[asset] = {
+                    'free': free,
+                    'used': used,
+                    'total': total
+                }
+    
+    # Retirer les clés système de ccxt (info, free, used, total, etc.)
+    return {
+        k: v for k, v in balances.items()
+        if k not in ['info', 'free', 'used', 'total'] and isinstance(v, dict)
+    }
+
+
+@dataclass(frozen=True)
+class BalanceSnapshot:
+    """Balances formatées à un instant donné (lecture seule)"""
+    
+    balances: Mapping[str, Mapping[str, Any]]
+    fetched_at: float  # Horloge monotone au moment de la récupération
+    timestamp: str  # Date ISO de la récupération
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False, compare=False)
+    
+    @classmethod
+    def from_response(cls, balances_response: Dict[str, Any],
+                      clock: Callable[[], float] = time.monotonic) -> 'BalanceSnapshot':
+        """
+        Construit un instantané depuis la réponse brute de fetch_balance
+        
+        Le filtrage des balances nulles et des clés système n'a lieu qu'ici.
+        
+        Args:
+            balances_response: Réponse brute de ccxt fetch_balance
+            clock: Horloge monotone utilisée pour l'âge
+        
+        Returns:
+            Instance BalanceSnapshot
+        """
+        balances = {
+            asset: MappingProxyType(values)
+            for asset, values in format_balances(balances_response).items()
+        }
+        return cls(
+            balances=MappingProxyType(balances),
+            fetched_at=clock(),
+            timestamp=datetime.now().isoformat(),
+            clock=clock
+        )
+    
+    @property
+    def age(self) -> float:
+        """Âge de l'instantané en secondes"""
+        return self.clock() - self.fetched_at
+    
+    def is_fresh(self, max_age: float) -> bool:
+        """Indique si l'instantané a moins de max_age secondes"""
+        return self.age <= max_age
+    
+    @property
+    def asset_count(self) -> int:
+        """Nombre d'assets avec une balance totale positive"""
+        return sum(1 for values in self.balances.values() if values.get('total', 0) > 0)
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Retourne une copie modifiable des balances (free, used, total) par asset"""
+        return {asset: dict(values) for asset, values in self.balances.items()}
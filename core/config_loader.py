@@ -2,23 +2,235 @@
 Module de chargement et validation de la configuration
 """
 
+import hashlib
+import inspect
+import marshal
 import os
+import pickle
+import sys
+import threading
+import time
+import weakref
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Any, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 from loguru import logger
 
 
+# Marqueur des chemins absents (mis en cache comme les autres)
+_MISSING = object()
+
+# Chargeur libyaml (C) quand PyYAML a été compilé avec, sinon chargeur Python
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Version du format et du schéma du cache compilé (à incrémenter si CONFIG_SCHEMA change)
+COMPILED_FORMAT = 5
+
+# Types attendus des clés lues par le code ('number' = int ou float; None toujours accepté,
+# clés inconnues ignorées). Un dict imbriqué décrit une sous-section.
+CONFIG_SCHEMA: Dict[str, Any] = {
+    'exchange': {
+        'name': 'str', 'account': 'str', 'api_key': 'str', 'api_secret': 'str', 'testnet': 'bool',
+        'sandbox': 'bool', 'lazy_init': 'bool', 'balance_max_age_seconds': 'number', 'max_concurrent_requests': 'int',
+        'rate_limit': {
+            'enabled': 'bool', 'weight_per_minute': 'number', 'reserve_percent': 'number',
+            'used_weight_header': 'str', 'key': 'str',
+        },
+        'ticker_cache': {
+            'enabled': 'bool', 'ttl_seconds': 'number', 'max_size': 'int', 'ttl_overrides': 'dict',
+        },
+        'http': {
+            'enabled': 'bool', 'pool_size': 'int', 'pool_block': 'bool', 'keepalive_seconds': 'number',
+            'timeout_ms': 'int', 'share_key': 'str',
+        },
+        'markets_cache': {
+            'enabled': 'bool', 'directory': 'str', 'max_age_hours': 'number', 'refresh_in_background': 'bool',
+        },
+        'transport': {'mode': 'str', 'path': 'str', 'speed': 'number'},
+    },
+    'exchanges': 'list',
+    'price_feed': {
+        'enabled': 'bool', 'url': 'str', 'reconnect_delay_seconds': 'number',
+        'max_reconnect_delay_seconds': 'number', 'max_age_seconds': 'number',
+    },
+    'database': {
+        'type': 'str',
+        'sqlite': {'path': 'str'},
+        'writer': {'batch_size': 'int', 'flush_interval_seconds': 'number', 'max_queue': 'int'},
+        'rollups': 'dict',
+        'mysql': 'dict',
+    },
+    'portfolio': {
+        'base_currency': 'str', 'min_balance_threshold': 'number', 'snapshot_interval_hours': 'number',
+        'intraday_snapshot_interval_minutes': 'number',
+    },
+    'scheduler': {
+        'balances_interval_seconds': 'number', 'tickers_interval_seconds': 'number',
+        'rules_interval_seconds': 'number', 'jitter_seconds': 'number', 'metrics_interval_seconds': 'number',
+    },
+    'config_reload': {'enabled': 'bool', 'inotify': 'bool', 'poll_interval_seconds': 'number'},
+    'rules': {
+        'enabled': 'bool', 'profit_threshold_percent': 'number', 'loss_threshold_percent': 'number',
+        'rebase_enabled': 'bool', 'cooldown_hours': 'number', 'conversion_percent': 'number',
+    },
+    'logging': {
+        'level': 'str', 'profile': 'str', 'console': 'bool', 'file': 'bool', 'directory': 'str',
+        'index': 'bool', 'format': 'str', 'file_buffer_size': 'int', 'database': 'dict',
+    },
+    'web': 'dict',
+    'notifications': 'dict',
+    'export': 'dict',
+}
+
+# Fichier modifié moins de 2 s avant sa mise en cache: mtime non fiable, contenu haché
+RACY_WINDOW_NS = 2_000_000_000
+
+REQUIRED_SECTIONS = ('exchange', 'database', 'portfolio', 'logging')
+
+
+def _type_ok(value: Any, expected: str) -> bool:
+    if value is None:
+        return True
+    if expected == 'bool':
+        return isinstance(value, bool)
+    if expected == 'int':
+        return isinstance(value, int) and not isinstance(value, bool)
+    if expected == 'number':
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if expected == 'str':
+        return isinstance(value, str)
+    if expected == 'list':
+        return isinstance(value, list)
+    return isinstance(value, dict)
+
+
+def _check_schema(config: Mapping[str, Any], schema: Mapping[str, Any], prefix: str,
+                  errors: List[str]) -> None:
+    """Compare une section au schéma et ajoute les erreurs de type"""
+    for key, expected in schema.items():
+        if key not in config:
+            continue
+        value = config[key]
+        path = f"{prefix}{key}"
+        if isinstance(expected, dict):
+            if value is None:
+                continue
+            if not isinstance(value, dict):
+                errors.append(f"'{path}' doit être une section (mapping), pas {type(value).__name__}")
+            else:
+                _check_schema(value, expected, f"{path}.", errors)
+        elif not _type_ok(value, expected):
+            errors.append(f"'{path}' doit être de type {expected}, pas {type(value).__name__} ({value!r})")
+
+
+def validate_config(config: Any) -> List[str]:
+    """
+    Vérifie une configuration contre CONFIG_SCHEMA
+    
+    Args:
+        config: Configuration chargée depuis le YAML
+    
+    Returns:
+        Avertissements (sections requises manquantes)
+    
+    Raises:
+        ValueError: Racine qui n'est pas un mapping ou valeurs de mauvais type
+    """
+    if not isinstance(config, dict):
+        raise ValueError(f"La configuration doit être un mapping, pas {type(config).__name__}")
+    errors: List[str] = []
+    _check_schema(config, CONFIG_SCHEMA, '', errors)
+    if errors:
+        raise ValueError("Configuration invalide: " + "; ".join(errors))
+    return [
+        f"Section '{section}' manquante dans la configuration"
+        for section in REQUIRED_SECTIONS if section not in config
+    ]
+
+
+# Configurations compilées du processus, par fichier (rechargements sans accès disque)
+_compiled: Dict[str, Dict[str, Any]] = {}
+
+
+def compiled_cache_path(config_path: Path) -> Path:
+    """Fichier du cache compilé d'une configuration (à la manière des .pyc)"""
+    return config_path.parent / '__pycache__' / f"{config_path.name}.cache"
+
+
+def _freeze(value: Any) -> Any:
+    """Copie immuable d'une valeur de configuration (dict -> mapping en lecture seule, list -> tuple)"""
+    # Types concrets: isinstance(value, Mapping) passe par l'ABC, bien plus lent
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _flatten(value: Any, prefix: str, out: Dict[str, Any]) -> None:
+    """Indexe chaque chemin pointé d'une configuration figée ('a', 'a.b', 'a.b.c'...)"""
+    for k, v in value.items():
+        path = f"{prefix}{k}"
+        out[path] = v
+        if isinstance(v, MappingProxyType):
+            _flatten(v, f"{path}.", out)
+
+
+class ConfigSnapshot:
+    """
+    Vue immuable de la configuration à un instant donné, pour les boucles critiques
+    
+    Tous les chemins pointés sont résolus à la création: get() est une seule
+    recherche dans un dict. Les sections sont des mappings en lecture seule et les
+    listes des tuples; la vue n'est pas affectée par les set() et reload() suivants.
+    """
+    
+    __slots__ = ('data', 'version', '_values')
+    
+    def __init__(self, config: Mapping[str, Any], version: int = 0):
+        """
+        Fige une configuration
+        
+        Args:
+            config: Configuration (dict imbriqué)
+            version: Version du chargeur au moment de la capture
+        """
+        self.data = _freeze(config)
+        self.version = version
+        self._values: Dict[str, Any] = {}
+        _flatten(self.data, '', self._values)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Récupère une valeur (notation pointée), comme ConfigLoader.get"""
+        return self._values.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+    
+    def section(self, name: str) -> Mapping[str, Any]:
+        """Section de premier niveau (mapping vide si absente)"""
+        value = self._values.get(name)
+        return value if isinstance(value, Mapping) else MappingProxyType({})
+
+
 class ConfigLoader:
     """Chargeur de configuration depuis settings.yaml"""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, use_cache: bool = True):
         """
         Initialise le chargeur de configuration
         
         Args:
             config_path: Chemin vers le fichier settings.yaml
                         Si None, cherche dans config/settings.yaml
+            use_cache: Lire et écrire le cache compilé sur disque (__pycache__/<fichier>.cache)
         """
         if config_path is None:
             # Chercher depuis la racine du projet
@@ -26,40 +238,237 @@ class ConfigLoader:
             config_path = project_root / "config" / "settings.yaml"
         
         self.config_path = Path(config_path)
+        self.use_cache = use_cache
+        self._compiled_key = str(self.config_path.resolve())
         self.config: Dict[str, Any] = {}
+        # Chemins déjà résolus par get() et vue figée, invalidés par set() et reload()
+        self.version = 0
+        self._cache: Dict[str, Any] = {}
+        self._snapshot: Optional[ConfigSnapshot] = None
+        # Abonnés aux changements: [(référence faible ou callable, sections ou None)]
+        self._subscribers: List[Tuple[Any, Optional[FrozenSet[str]]]] = []
+        self._subscribers_lock = threading.Lock()
         self._load_config()
     
-    def _load_config(self) -> None:
-        """Charge la configuration depuis le fichier YAML"""
+    def _load_config(self) -> Set[str]:
+        """
+        Charge la configuration depuis le fichier YAML et la publie
+        
+        Returns:
+            Sections de premier niveau modifiées
+        """
+        return self._publish(self._parse_config())
+    
+    def _parse_config(self) -> Dict[str, Any]:
+        """
+        Lit et valide le fichier YAML sans modifier la configuration publiée
+        
+        Un fichier dont le mtime et la taille n'ont pas changé est servi depuis le
+        cache compilé (mémoire puis disque) sans être relu; sinon son contenu est
+        haché et seul un contenu inconnu est analysé et validé.
+        """
         if not self.config_path.exists():
             raise FileNotFoundError(
                 f"Fichier de configuration non trouvé: {self.config_path}"
             )
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f) or {}
-            
-            logger.info(f"Configuration chargée depuis {self.config_path}")
-            self._validate_config()
+            st = os.stat(self.config_path)
+            entry = self._compiled_entry()
+            source = 'cache'
+            if entry is None or not self._stat_unchanged(entry, st):
+                data = self.config_path.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if entry is None or entry['sha256'] != digest:
+                    config = yaml.load(data, Loader=_YAML_LOADER) or {}
+                    warnings = validate_config(config)
+                    entry = {
+                        'format': COMPILED_FORMAT, 'sha256': digest, 'warnings': warnings,
+                        'payload': pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL),
+                    }
+                    source = 'fichier'
+                entry = {**entry, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'checked_ns': time.time_ns()}
+                self._store_compiled(entry)
             
+            # Copie indépendante à chaque chargement (set() modifie la configuration publiée)
+            config = pickle.loads(entry['payload'])
+            logger.info(f"Configuration chargée depuis {self.config_path} ({source})")
+            for warning in entry['warnings']:
+                logger.warning(warning)
+            return config
+        
         except yaml.YAMLError as e:
             raise ValueError(f"Erreur de syntaxe dans le fichier YAML: {e}")
+        except ValueError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Erreur lors du chargement de la configuration: {e}")
     
-    def _validate_config(self) -> None:
-        """Valide la structure de base de la configuration"""
-        required_sections = ['exchange', 'database', 'portfolio', 'logging']
+    @staticmethod
+    def _stat_unchanged(entry: Dict[str, Any], st: os.stat_result) -> bool:
+        """
+        Indique si le fichier est sûrement identique à l'entrée (mtime et taille)
+        
+        Un fichier modifié peu avant sa mise en cache peut l'être de nouveau sans
+        que son mtime change (résolution du système de fichiers): il est alors haché.
+        """
+        return (
+            (entry['mtime_ns'], entry['size']) == (st.st_mtime_ns, st.st_size)
+            and st.st_mtime_ns < entry['checked_ns'] - RACY_WINDOW_NS
+        )
+    
+    def _compiled_entry(self) -> Optional[Dict[str, Any]]:
+        """Entrée du cache compilé (mémoire, sinon disque), None si absente ou d'un autre format"""
+        key = self._compiled_key
+        entry = _compiled.get(key)
+        if entry is None and self.use_cache:
+            entry = self._read_compiled()
+        if not isinstance(entry, dict) or entry.get('format') != COMPILED_FORMAT:
+            return None
+        _compiled[key] = entry
+        return entry
+    
+    def _read_compiled(self) -> Optional[Dict[str, Any]]:
+        """
+        Lit le cache compilé sur disque (marshal: données seulement, aucun code exécuté)
+        
+        Un fichier d'un autre utilisateur ou modifiable par le groupe ou les autres
+        est ignoré: il pourrait injecter une configuration.
+        """
+        try:
+            with open(compiled_cache_path(self.config_path), 'rb') as f:
+                st = os.fstat(f.fileno())
+                if st.st_mode & 0o022 or (hasattr(os, 'getuid') and st.st_uid != os.getuid()):
+                    return None
+                entry = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get('config'), dict):
+            return None
+        config = entry.pop('config')
+        return {**entry, 'payload': pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)}
+    
+    def _store_compiled(self, entry: Dict[str, Any]) -> None:
+        """
+        Enregistre une entrée du cache compilé (disque en best effort, comme les .pyc)
+        
+        Le fichier contient les secrets de la configuration: il est créé en 0600.
+        """
+        _compiled[self._compiled_key] = entry
+        if not self.use_cache or sys.dont_write_bytecode:
+            return
+        stored = {key: value for key, value in entry.items() if key != 'payload'}
+        stored['config'] = pickle.loads(entry['payload'])
+        try:
+            data = marshal.dumps(stored)
+        except ValueError:
+            return  # Valeurs non sérialisables (ex: dates YAML): cache en mémoire seulement
+        target = compiled_cache_path(self.config_path)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, target)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+    
+    def _publish(self, config: Dict[str, Any]) -> Set[str]:
+        """
+        Remplace la configuration publiée puis prévient les abonnés concernés
+        
+        Les lecteurs ne prennent pas de verrou: l'ancienne configuration reste
+        cohérente pour qui la détient, la nouvelle est visible dès l'affectation.
+        
+        Returns:
+            Sections de premier niveau modifiées
+        """
+        previous = self.config
+        changed = {
+            section for section in set(previous) | set(config)
+            if previous.get(section, _MISSING) != config.get(section, _MISSING)
+        }
+        # La configuration avant le cache: un get() concurrent ne peut pas remplir
+        # le nouveau cache avec une valeur de l'ancienne configuration
+        self.config = config
+        self._invalidate()
+        if previous and changed:
+            self._notify(changed)
+        return changed
+    
+    def _invalidate(self) -> None:
+        """Vide le cache des chemins et la vue figée (configuration modifiée)"""
+        self.version += 1
+        self._cache = {}
+        self._snapshot = None
+    
+    def subscribe(self, callback: Callable[[ConfigSnapshot, Set[str]], Any],
+                  sections: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """
+        Abonne une fonction aux rechargements de la configuration
+        
+        Les méthodes liées sont référencées faiblement: l'abonnement disparaît avec
+        l'objet. Le rappel s'exécute dans le thread qui recharge (ex: ConfigWatcher).
+        
+        Args:
+            callback: Fonction (snapshot, sections modifiées)
+            sections: Sections de premier niveau surveillées (None = toutes)
+        
+        Returns:
+            Fonction de désabonnement
+        """
+        ref = weakref.WeakMethod(callback) if inspect.ismethod(callback) else callback
+        entry = (ref, frozenset(sections) if sections is not None else None)
+        with self._subscribers_lock:
+            self._subscribers.append(entry)
+        
+        def unsubscribe() -> None:
+            with self._subscribers_lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+    
+    def _notify(self, changed: Set[str]) -> None:
+        """Appelle les abonnés dont une section surveillée a changé"""
+        snapshot = self.snapshot()
+        with self._subscribers_lock:
+            self._subscribers = [
+                (ref, sections) for ref, sections in self._subscribers
+                if not isinstance(ref, weakref.WeakMethod) or ref() is not None
+            ]
+            subscribers = list(self._subscribers)
         
-        for section in required_sections:
-            if section not in self.config:
-                logger.warning(f"Section '{section}' manquante dans la configuration")
+        for ref, sections in subscribers:
+            callback = ref() if isinstance(ref, weakref.WeakMethod) else ref
+            if callback is None or (sections is not None and not sections & changed):
+                continue
+            try:
+                callback(snapshot, changed if sections is None else changed & sections)
+            except Exception as e:
+                logger.error(f"Erreur dans un abonné aux changements de configuration: {e}")
+    
+    def _resolve(self, key: str) -> Any:
+        """Parcourt les dicts imbriqués pour un chemin pointé (_MISSING si absent)"""
+        value = self.config
+        try:
+            for k in key.split('.'):
+                value = value[k]
+            return value
+        except (KeyError, TypeError):
+            return _MISSING
     
     def get(self, key: str, default: Any = None) -> Any:
         """
         Récupère une valeur de configuration (notation pointée supportée)
         
+        Le chemin n'est parcouru qu'au premier appel, le résultat (y compris une
+        clé absente) est mis en cache jusqu'au prochain set() ou reload(). Les
+        sections retournées sont partagées: les modifier via set().
+        
         Args:
             key: Clé de configuration (ex: 'exchange.api_key' ou 'exchange')
             default: Valeur par défaut si la clé n'existe pas
@@ -67,15 +476,29 @@ class ConfigLoader:
         Returns:
             Valeur de configuration ou default
         """
-        keys = key.split('.')
-        value = self.config
-        
+        cache = self._cache
         try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+            value = cache[key]
+        except KeyError:
+            value = cache[key] = self._resolve(key)
+        return default if value is _MISSING else value
+    
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Retourne une vue immuable de la configuration courante (à passer aux boucles critiques)
+        
+        La même vue est retournée tant que la configuration n'est pas modifiée.
+        
+        Returns:
+            Instance ConfigSnapshot
+        """
+        snapshot = self._snapshot
+        version = self.version
+        if snapshot is None or snapshot.version != version:
+            snapshot = ConfigSnapshot(self.config, version)
+            if self.version == version:
+                self._snapshot = snapshot
+        return snapshot
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -94,12 +517,23 @@ class ConfigLoader:
             config = config[k]
         
         config[keys[-1]] = value
+        self._invalidate()
         logger.debug(f"Configuration mise à jour: {key} = {value}")
     
-    def reload(self) -> None:
-        """Recharge la configuration depuis le fichier"""
-        self._load_config()
-        logger.info("Configuration rechargée")
+    def reload(self) -> Set[str]:
+        """
+        Recharge la configuration depuis le fichier
+        
+        Le fichier est lu et validé avant remplacement: en cas d'erreur la
+        configuration courante reste en place. Les abonnés des sections
+        modifiées sont prévenus.
+        
+        Returns:
+            Sections de premier niveau modifiées
+        """
+        changed = self._load_config()
+        logger.info(f"Configuration rechargée (sections modifiées: {sorted(changed) or 'aucune'})")
+        return changed
     
     def get_exchange_config(self) -> Dict[str, Any]:
         """Récupère la configuration de l'exchange"""
@@ -0,0 +1,165 @@
+"""
+Surveillance du fichier de configuration et rechargement à chaud (inotify, sinon scrutation du mtime)
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import threading
+import time
+from typing import Optional, Tuple
+from .config_loader import ConfigLoader, get_config
+from .logger import get_logger
+
+
+# Événements inotify (linux/inotify.h): écriture terminée, renommage ou création
+# dans le répertoire (éditeurs et déploiements qui remplacent le fichier), suppression
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+def _inotify_fd(directory: str) -> Optional[int]:
+    """
+    Ouvre un descripteur inotify sur un répertoire
+    
+    Returns:
+        Descripteur de fichier, ou None si inotify n'est pas disponible
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class ConfigWatcher:
+    """
+    Recharge la configuration quand son fichier change
+    
+    Le fichier est relu et validé dans le thread du watcher; la nouvelle
+    configuration n'est publiée que si elle est valide (voir ConfigLoader.reload),
+    puis les abonnés des sections modifiées sont prévenus. Le répertoire est
+    surveillé par inotify sous Linux, sinon le mtime est scruté périodiquement.
+    """
+    
+    def __init__(self, loader: Optional[ConfigLoader] = None, poll_interval: float = 2.0,
+                 debounce: float = 0.2, use_inotify: bool = True):
+        """
+        Initialise le watcher (aucun thread avant start())
+        
+        Args:
+            loader: Chargeur à recharger (défaut: instance globale)
+            poll_interval: Période de scrutation du mtime (secondes, aussi filet de sécurité avec inotify)
+            debounce: Attente après un événement inotify, le temps que l'écriture se termine
+            use_inotify: Utiliser inotify quand il est disponible
+        """
+        self.loader = loader or get_config()
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        self.mode: Optional[str] = None
+        self.stats = {'checks': 0, 'reloads': 0, 'errors': 0}
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+    
+    @property
+    def logger(self):
+        """Logger du projet (résolu au premier message pour ne pas configurer les sinks inutilement)"""
+        return get_logger()
+    
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        """Signature du fichier (inode, taille, mtime en ns), None s'il est absent"""
+        try:
+            st = os.stat(self.loader.config_path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    
+    def check(self) -> bool:
+        """
+        Recharge la configuration si le fichier a changé depuis la dernière vérification
+        
+        Returns:
+            True si une nouvelle configuration a été publiée
+        """
+        self.stats['checks'] += 1
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            changed = self.loader.reload()
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.log_error(f"Configuration invalide ignorée, la précédente reste active: {e}")
+            return False
+        self.stats['reloads'] += 1
+        return bool(changed)
+    
+    def start(self) -> None:
+        """Démarre le thread de surveillance"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        if self.use_inotify:
+            self._fd = _inotify_fd(str(self.loader.config_path.resolve().parent))
+        self.mode = 'inotify' if self._fd is not None else 'polling'
+        self._thread = threading.Thread(target=self._run, name='config-watcher', daemon=True)
+        self._thread.start()
+        self.logger.log_info(f"Surveillance de {self.loader.config_path} ({self.mode})")
+    
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Arrête le thread de surveillance"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+    
+    def _run(self) -> None:
+        """Boucle du thread: attente d'un événement (ou du délai de scrutation) puis vérification"""
+        last_check = time.monotonic()
+        while not self._stop.is_set():
+            if self._fd is None:
+                if self._stop.wait(self.poll_interval):
+                    return
+            else:
+                # Délai borné pour relire _stop; une vérification périodique reste
+                # faite au cas où un événement serait manqué (répertoire remplacé)
+                readable, _, _ = select.select([self._fd], [], [], min(self.poll_interval, 0.5))
+                if readable:
+                    try:
+                        while os.read(self._fd, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    if self._stop.wait(self.debounce):
+                        return
+                elif time.monotonic() - last_check < self.poll_interval:
+                    continue
+            last_check = time.monotonic()
+            try:
+                self.check()
+            except Exception as e:
+                self.logger.log_error(f"Erreur de surveillance de la configuration: {e}")
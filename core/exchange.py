@@ -2,34 +2,214 @@
 Module de connexion et d'interaction avec les exchanges crypto
 """
 
-from typing import Dict, List, Optional, Any
-import ccxt
+import importlib
+import threading
+import time
+from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .config_loader import get_config
 from .logger import get_logger
+from .http_pool import connection_stats, http_settings, pool_key
+from .replay import replay_adapter, transport_session, transport_settings
+from .markets import MarketCache, MarketIndex, TICK_SIZE, market_cache_settings
+from .ticker_cache import TickerCache
+from .balances import BalanceSnapshot
+from .rate_limiter import ENDPOINT_WEIGHTS, background, ban_errors, get_rate_limiter, tickers_weight
+
+if TYPE_CHECKING:
+    from .ticker_table import TickerTable
+
+
+class _LazyModule:
+    """Module importé au premier accès à l'un de ses attributs"""
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+    
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# ccxt est lourd à importer: l'import n'a lieu qu'à la création de l'exchange
+ccxt = _LazyModule('ccxt')
+
+
+def build_exchange_params(exchange_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Construit les paramètres du constructeur ccxt depuis la section 'exchange'
+    
+    Args:
+        exchange_config: Section 'exchange' de la configuration
+    
+    Returns:
+        Paramètres à passer à la classe d'exchange ccxt (sync ou async)
+    """
+    exchange_name = exchange_config.get('name', 'binance').lower()
+    
+    exchange_params = {
+        'apiKey': exchange_config.get('api_key', ''),
+        'secret': exchange_config.get('api_secret', ''),
+        # Le limiteur partagé (core.rate_limiter) remplace la pause par instance de ccxt
+        'enableRateLimit': not (exchange_config.get('rate_limit', {}) or {}).get('enabled', True),
+        'timeout': int(http_settings(exchange_config)['timeout_ms']),
+        'options': {
+            'defaultType': 'spot',  # Spot trading
+        }
+    }
+    
+    # Configuration pour testnet
+    if exchange_config.get('testnet', False) and exchange_name == 'binance':
+        exchange_params['options']['defaultType'] = 'test'
+        exchange_params['urls'] = {
+            'api': {
+                'public': 'https://testnet.binance.vision/api',
+                'private': 'https://testnet.binance.vision/api',
+            }
+        }
+    
+    return exchange_params
+
+
+def format_ticker(symbol: str, ticker: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Formate un ticker ccxt brut dans le format du projet
+    
+    Args:
+        symbol: Symbole de trading
+        ticker: Ticker brut retourné par ccxt
+    
+    Returns:
+        Dictionnaire contenant les informations importantes du ticker
+    """
+    return {
+        'symbol': symbol,
+        'last': ticker.get('last'),  # Prix actuel
+        'bid': ticker.get('bid'),    # Meilleur prix d'achat
+        'ask': ticker.get('ask'),    # Meilleur prix de vente
+        'high': ticker.get('high'),  # Prix le plus haut (24h)
+        'low': ticker.get('low'),    # Prix le plus bas (24h)
+        'volume': ticker.get('quoteVolume'),  # Volume en quote currency
+        'timestamp': ticker.get('timestamp'),
+        # Date par défaut calculée seulement si l'exchange n'en fournit pas
+        'datetime': ticker['datetime'] if 'datetime' in ticker else datetime.now().isoformat()
+    }
 
 
 class ExchangeManager:
     """Gestionnaire de connexion et d'interaction avec l'exchange"""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None,
+                 exchange_config: Optional[Dict[str, Any]] = None):
         """
         Initialise le gestionnaire d'exchange
         
+        Avec 'exchange.lazy_init', l'instance ccxt n'est créée qu'au premier usage
+        et le test de connexion tourne en arrière-plan (voir get_health()).
+        
         Args:
             config_path: Chemin vers le fichier de configuration
+            exchange_config: Section exchange explicite (un compte de 'exchanges', voir
+                            core.exchange_pool); défaut: section 'exchange', suivie au rechargement
         """
         self.config = get_config(config_path)
         self.logger = get_logger(config_path)
-        self.exchange_config = self.config.get_exchange_config()
-        self.exchange = None
-        self._initialize_exchange()
+        self.follows_config = exchange_config is None
+        self.exchange_config = self.config.get_exchange_config() if exchange_config is None else exchange_config
+        self.account = self.exchange_config.get('account')
+        self.lazy = bool(self.exchange_config.get('lazy_init', False))
+        self._exchange = None
+        self._exchange_lock = threading.RLock()
+        self._health: Dict[str, Any] = {
+            'status': 'unknown', 'checked_at': None, 'latency_ms': None, 'error': None
+        }
+        self._probe_thread: Optional[threading.Thread] = None
+        self.ticker_cache = self._build_ticker_cache()
+        self.balance_max_age = float(self.exchange_config.get('balance_max_age_seconds', 10.0))
+        self._balance_snapshot: Optional[BalanceSnapshot] = None
+        self._balance_lock = threading.Lock()
+        self.price_book = None
+        self.price_book_max_age: Optional[float] = None
+        self.rate_limiter = get_rate_limiter(self.exchange_config)
+        self.market_cache = MarketCache.from_config(self.exchange_config)
+        self._market_index: Optional[MarketIndex] = None
+        self._markets_thread: Optional[threading.Thread] = None
+        
+        if self.lazy:
+            self._start_background_probe()
+        else:
+            self._initialize_exchange()
+        if self.follows_config:
+            self.config.subscribe(self._on_config_change, sections=['exchange'])
+    
+    # Clés dont la modification impose de recréer l'instance ccxt
+    CONNECTION_KEYS = ('name', 'api_key', 'api_secret', 'sandbox', 'testnet', 'rate_limit', 'http', 'transport')
     
-    def _initialize_exchange(self) -> None:
-        """Initialise la connexion à l'exchange"""
+    def _on_config_change(self, snapshot: Any, changed: Any) -> None:
+        """
+        Applique une section 'exchange' rechargée
+        
+        Les réglages locaux (cache de tickers, âge des balances) sont remplacés;
+        l'instance ccxt n'est recréée que si un paramètre de connexion a changé.
+        """
+        previous = self.exchange_config
+        exchange_config = self.config.get_exchange_config()
+        self.exchange_config = exchange_config
+        self.balance_max_age = float(exchange_config.get('balance_max_age_seconds', 10.0))
+        if any(exchange_config.get(k) != previous.get(k) for k in ('ticker_cache', 'transport')):
+            self.ticker_cache = self._build_ticker_cache()
+        if exchange_config.get('markets_cache') != previous.get('markets_cache'):
+            self.market_cache = MarketCache.from_config(exchange_config)
+        
+        reconnect = [k for k in self.CONNECTION_KEYS if exchange_config.get(k) != previous.get(k)]
+        if reconnect:
+            self.logger.log_info(f"Paramètres de connexion modifiés ({', '.join(reconnect)}): exchange recréé")
+            with self._exchange_lock:
+                self.rate_limiter = get_rate_limiter(exchange_config)
+                self._balance_snapshot = None
+                self._initialize_exchange(probe=False)
+    
+    @property
+    def exchange(self) -> Any:
+        """Instance ccxt de l'exchange (créée au premier accès en mode lazy)"""
+        if self._exchange is None and self.lazy:
+            with self._exchange_lock:
+                if self._exchange is None:
+                    self._initialize_exchange(probe=False)
+        return self._exchange
+    
+    @exchange.setter
+    def exchange(self, value: Any) -> None:
+        self._exchange = value
+    
+    def _build_ticker_cache(self) -> Optional[TickerCache]:
+        """Construit le cache de tickers depuis 'exchange.ticker_cache' (None si désactivé)"""
+        cache_config = self.exchange_config.get('ticker_cache', {}) or {}
+        if not cache_config.get('enabled', True):
+            return None
+        # En rejeu, les TTL suivent l'horloge de l'enregistrement: mêmes requêtes qu'à l'enregistrement
+        replay = replay_adapter(self.exchange_config)
+        return TickerCache(
+            ttl_seconds=cache_config.get('ttl_seconds', 1.0),
+            max_size=cache_config.get('max_size', 1024),
+            ttl_overrides=cache_config.get('ttl_overrides'),
+            **({'clock': replay.clock} if replay is not None else {})
+        )
+    
+    def _initialize_exchange(self, probe: bool = True) -> None:
+        """
+        Initialise la connexion à l'exchange
+        
+        Args:
+            probe: Exécuter le test de connexion de manière synchrone
+        """
         exchange_name = self.exchange_config.get('name', 'binance').lower()
-        api_key = self.exchange_config.get('api_key', '')
-        api_secret = self.exchange_config.get('api_secret', '')
         sandbox = self.exchange_config.get('sandbox', True)
         testnet = self.exchange_config.get('testnet', False)
         
@@ -39,38 +219,36 @@ class ExchangeManager:
                 raise ValueError(f"Exchange '{exchange_name}' non supporté par ccxt")
             exchange_class = getattr(ccxt, exchange_name)
             
-            # Configuration de base
-            exchange_params = {
-                'apiKey': api_key,
-                'secret': api_secret,
-                'enableRateLimit': True,
-                'options': {
-                    'defaultType': 'spot',  # Spot trading
-                }
-            }
+            # Configuration de base (+ testnet le cas échéant)
+            exchange_params = build_exchange_params(self.exchange_config)
+            # Session HTTP partagée avec les autres gestionnaires du même hôte (keep-alive),
+            # ou transport d'enregistrement / de rejeu (voir core.replay)
+            session = transport_session(self.exchange_config)
+            if session is not None:
+                exchange_params['session'] = session
+            if transport_settings(self.exchange_config)['mode'] == 'replay':
+                # Requêtes privées signées localement, jamais envoyées: des clés factices suffisent
+                exchange_params['apiKey'] = exchange_params['apiKey'] or 'replay'
+                exchange_params['secret'] = exchange_params['secret'] or 'replay'
+                # Le rythme est celui de l'enregistrement (exchange.transport.speed), pas celui de ccxt
+                exchange_params['enableRateLimit'] = False
             
-            # Configuration pour testnet/sandbox
-            if testnet or sandbox:
-                if exchange_name == 'binance':
-                    if testnet:
-                        exchange_params['options']['defaultType'] = 'test'
-                        exchange_params['urls'] = {
-                            'api': {
-                                'public': 'https://testnet.binance.vision/api',
-                                'private': 'https://testnet.binance.vision/api',
-                            }
-                        }
-                    else:
-                        # Mode sandbox (simulation)
-                        self.logger.log_warning(
-                            "Mode sandbox activé - les ordres ne seront pas exécutés réellement"
-                        )
+            if sandbox and not testnet and exchange_name == 'binance':
+                # Mode sandbox (simulation)
+                self.logger.log_warning(
+                    "Mode sandbox activé - les ordres ne seront pas exécutés réellement"
+                )
             
             # Créer l'instance de l'exchange
             self.exchange = exchange_class(exchange_params)
+            self._market_index = None
+            
+            # Marchés depuis le cache disque (sinon téléchargés ici plutôt qu'au test de connexion)
+            self._prime_markets()
             
             # Test de connexion basique
-            self._test_connection()
+            if probe:
+                self._test_connection()
             
             self.logger.log_info(
                 f"Exchange {exchange_name} initialisé avec succès",
@@ -84,50 +262,163 @@ class ExchangeManager:
             self.logger.log_error(f"Erreur lors de l'initialisation de l'exchange: {e}")
             raise
     
-    def _test_connection(self) -> None:
-        """Teste la connexion à l'exchange"""
+    def _prime_markets(self) -> None:
+        """
+        Charge les marchés depuis le cache disque
+        
+        Cache frais: aucune requête. Cache périmé: utilisé tel quel et rafraîchi en
+        arrière-plan (ou immédiatement si 'refresh_in_background' est faux). Cache
+        absent: téléchargement immédiat puis écriture du cache.
+        """
+        if self.market_cache is None:
+            return
+        entry = self.market_cache.apply(self._exchange)
+        if entry is not None:
+            age = self.market_cache.age(entry)
+            self.logger.log_info(
+                f"Marchés chargés depuis le cache: {len(entry['state']['markets'])} symboles (âge {age:.0f}s)"
+            )
+            if not self.market_cache.is_stale(entry):
+                return
+            if market_cache_settings(self.exchange_config)['refresh_in_background']:
+                self._start_markets_refresh()
+                return
+        self.refresh_markets()
+    
+    def _start_markets_refresh(self) -> None:
+        """Lance le rafraîchissement des marchés dans un thread (un seul à la fois)"""
+        if self._markets_thread is not None and self._markets_thread.is_alive():
+            return
+        self._markets_thread = threading.Thread(target=self.refresh_markets, name='markets-refresh', daemon=True)
+        self._markets_thread.start()
+    
+    def refresh_markets(self) -> bool:
+        """
+        Télécharge les marchés (load_markets, basse priorité) et réécrit le cache disque
+        
+        Returns:
+            True si les marchés ont été rechargés
+        """
+        exchange = self._exchange
+        start = time.perf_counter()
+        try:
+            with background():
+                self._limited(ENDPOINT_WEIGHTS['load_markets'], exchange.load_markets, True)
+        except Exception as e:
+            self.logger.log_warning(f"Rechargement des marchés échoué: {e}")
+            return False
+        self._market_index = None
+        markets = exchange.markets
+        saved = self.market_cache is not None and self.market_cache.save(exchange)
+        self.logger.log_info(
+            f"Marchés rechargés: {len(markets)} symboles en {time.perf_counter() - start:.2f}s"
+            + (" (cache écrit)" if saved else "")
+        )
+        return True
+    
+    @property
+    def market_index(self) -> MarketIndex:
+        """
+        Index symbole -> précision et limites (voir MarketIndex.validate_order)
+        
+        Construit depuis les marchés chargés (cache ou load_markets), reconstruit
+        après un rafraîchissement.
+        """
+        index = self._market_index
+        if index is None:
+            exchange = self.exchange
+            exchange.load_markets()
+            index = self._market_index = MarketIndex.from_markets(
+                exchange.markets, getattr(exchange, 'precisionMode', TICK_SIZE)
+            )
+        return index
+    
+    def _test_connection(self) -> bool:
+        """
+        Teste la connexion à l'exchange et met à jour le statut de santé
+        
+        Returns:
+            True si la requête de test a réussi
+        """
+        self._set_health('checking')
+        start = time.perf_counter()
         try:
-            # Tester avec une requête publique (pas besoin d'API key)
+            # Tester avec une requête publique (pas besoin d'API key), en basse priorité
             if hasattr(self.exchange, 'fetch_ticker'):
-                self.exchange.fetch_ticker('BTC/USDT')
+                with background():
+                    self._get_ticker('BTC/USDT')
                 self.logger.log_debug("Test de connexion réussi")
+            self._set_health('ok', latency_ms=(time.perf_counter() - start) * 1000)
+            return True
         except Exception as e:
             self.logger.log_warning(f"Test de connexion échoué (normal si pas d'API key): {e}")
+            self._set_health('unreachable', error=str(e))
+            return False
+    
+    def _start_background_probe(self) -> None:
+        """Lance la création de l'exchange et le test de connexion dans un thread"""
+        self._set_health('checking')
+        self._probe_thread = threading.Thread(
+            target=self._background_probe, name='exchange-probe', daemon=True
+        )
+        self._probe_thread.start()
+    
+    def _background_probe(self) -> None:
+        """Corps du thread de test de connexion (mode lazy)"""
+        try:
+            self.exchange
+            self._test_connection()
+        except Exception as e:
+            self._set_health('error', error=str(e))
+    
+    def _set_health(self, status: str, latency_ms: Optional[float] = None,
+                    error: Optional[str] = None) -> None:
+        """Met à jour le statut de santé de la connexion"""
+        self._health = {
+            'status': status,
+            'checked_at': datetime.now().isoformat() if status != 'checking' else None,
+            'latency_ms': latency_ms,
+            'error': error,
+        }
+    
+    def get_health(self) -> Dict[str, Any]:
+        """
+        Retourne le statut de santé de la connexion à l'exchange
+        
+        Returns:
+            Dictionnaire {'status', 'checked_at', 'latency_ms', 'error'} où status vaut
+            'unknown', 'checking', 'ok', 'unreachable' (test échoué) ou 'error' (init échouée)
+        """
+        return dict(self._health)
+    
+    def wait_ready(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Attend la fin du test de connexion en arrière-plan (mode lazy)
+        
+        Args:
+            timeout: Délai d'attente maximum en secondes
+        
+        Returns:
+            Statut de santé courant
+        """
+        if self._probe_thread is not None:
+            self._probe_thread.join(timeout)
+        return self.get_health()
     
     def fetch_balances(self) -> Dict[str, Any]:
         """
         Récupère les balances du compte
         
+        Dérivé de l'instantané courant (voir get_balance_snapshot): un seul appel
+        fetch_balance par période 'exchange.balance_max_age_seconds'.
+        
         Returns:
             Dictionnaire contenant les balances (free, used, total) par asset
         """
         try:
             self.logger.log_execution('exchange', 'fetch_balances')
             
-            # Récupérer les balances
-            balances_response = self.exchange.fetch_balance()
-            
-            # Formater les balances (ignorer les balances à zéro)
-            balances = {}
-            for asset, balance_info in balances_response.items():
-                if isinstance(balance_info, dict):
-                    total = balance_info.get('total', 0)
-                    free = balance_info.get('free', 0)
-                    used = balance_info.get('used', 0)
-                    
-                    # Ignorer les balances complètement à zéro
-                    if total > 0 or free > 0 or used > 0:
-                        balances[asset] = {
-                            'free': free,
-                            'used': used,
-                            'total': total
-                        }
-            
-            # Retirer les clés système de ccxt (info, free, used, total, etc.)
-            balances_cleaned = {
-                k: v for k, v in balances.items()
-                if k not in ['info', 'free', 'used', 'total'] and isinstance(v, dict)
-            }
+            balances_cleaned = self.get_balance_snapshot().to_dict()
             
             self.logger.log_info(
                 f"Balances récupérées: {len(balances_cleaned)} assets avec balance > 0",
@@ -146,6 +437,48 @@ class ExchangeManager:
             self.logger.log_error(f"Erreur lors de la récupération des balances: {e}")
             raise
     
+    def get_balance_snapshot(self, max_age: Optional[float] = None) -> BalanceSnapshot:
+        """
+        Retourne l'instantané des balances, rafraîchi s'il est plus ancien que max_age
+        
+        Args:
+            max_age: Âge maximum accepté en secondes (défaut: exchange.balance_max_age_seconds)
+        
+        Returns:
+            Instance BalanceSnapshot partagée par fetch_balances et get_account_info
+        """
+        if max_age is None:
+            max_age = self.balance_max_age
+        
+        snapshot = self._balance_snapshot
+        if snapshot is not None and snapshot.is_fresh(max_age):
+            return snapshot
+        
+        with self._balance_lock:
+            # Un autre thread a pu rafraîchir pendant l'attente du verrou
+            snapshot = self._balance_snapshot
+            if snapshot is not None and snapshot.is_fresh(max_age):
+                return snapshot
+            return self._refresh_balances_locked()
+    
+    def refresh_balances(self) -> BalanceSnapshot:
+        """
+        Force la récupération d'un nouvel instantané des balances
+        
+        Returns:
+            Nouvelle instance BalanceSnapshot
+        """
+        with self._balance_lock:
+            return self._refresh_balances_locked()
+    
+    def _refresh_balances_locked(self) -> BalanceSnapshot:
+        """Récupère les balances et remplace l'instantané (verrou déjà acquis)"""
+        snapshot = BalanceSnapshot.from_response(
+            self._limited(ENDPOINT_WEIGHTS['fetch_balance'], self.exchange.fetch_balance)
+        )
+        self._balance_snapshot = snapshot
+        return snapshot
+    
     def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
         """
         Récupère le ticker (prix actuel) pour un symbole
@@ -159,24 +492,11 @@ class ExchangeManager:
         try:
             self.logger.log_execution('exchange', 'fetch_ticker', {'symbol': symbol})
             
-            ticker = self.exchange.fetch_ticker(symbol)
+            # Servi depuis le cache si encore valide (une seule requête amont par symbole)
+            ticker_data = dict(self._get_ticker(symbol))
             
-            # Formater les données importantes
-            ticker_data = {
-                'symbol': symbol,
-                'last': ticker.get('last'),  # Prix actuel
-                'bid': ticker.get('bid'),    # Meilleur prix d'achat
-                'ask': ticker.get('ask'),    # Meilleur prix de vente
-                'high': ticker.get('high'),  # Prix le plus haut (24h)
-                'low': ticker.get('low'),    # Prix le plus bas (24h)
-                'volume': ticker.get('quoteVolume'),  # Volume en quote currency
-                'timestamp': ticker.get('timestamp'),
-                'datetime': ticker.get('datetime', datetime.now().isoformat())
-            }
-            
-            self.logger.log_debug(
-                f"Ticker récupéré pour {symbol}: {ticker_data['last']}"
-            )
+            # Formatage différé: aucun coût si DEBUG est inactif
+            self.logger.log_debug("Ticker récupéré pour {}: {}", symbol, ticker_data['last'])
             
             return ticker_data
             
@@ -184,16 +504,19 @@ class ExchangeManager:
             self.logger.log_error(f"Erreur lors de la récupération du ticker pour {symbol}: {e}")
             raise
     
-    def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    def fetch_tickers(self, symbols: Optional[List[str]] = None,
+                      columnar: bool = False) -> Union[Dict[str, Dict[str, Any]], 'TickerTable']:
         """
         Récupère les tickers pour plusieurs symboles
         
         Args:
             symbols: Liste de symboles (ex: ['BTC/USDT', 'ETH/USDT'])
                     Si None, récupère tous les tickers
+            columnar: Retourner une TickerTable (colonnes NumPy) au lieu de dicts par ligne;
+                      table.as_dict() donne une vue dict paresseuse compatible
         
         Returns:
-            Dictionnaire de tickers indexés par symbole
+            Dictionnaire de tickers indexés par symbole, ou TickerTable si columnar
         """
         try:
             self.logger.log_execution(
@@ -203,32 +526,30 @@ class ExchangeManager:
             )
             
             if symbols:
-                tickers = {}
-                for symbol in symbols:
-                    try:
-                        tickers[symbol] = self.fetch_ticker(symbol)
-                    except Exception as e:
-                        self.logger.log_warning(f"Impossible de récupérer le ticker pour {symbol}: {e}")
+                if self._supports_bulk_tickers():
+                    tickers = self._fetch_tickers_bulk(symbols)
+                else:
+                    tickers = self._fetch_tickers_concurrent(symbols)
+                if columnar:
+                    from .ticker_table import TickerTable
+                    return TickerTable.from_rows(tickers)
                 return tickers
             else:
                 # Récupérer tous les tickers
-                tickers_raw = self.exchange.fetch_tickers()
+                tickers_raw = self._limited(tickers_weight(None), self.exchange.fetch_tickers)
+                
+                if columnar:
+                    # Colonnes NumPy sans dict intermédiaire par paire
+                    from .ticker_table import TickerTable
+                    table = TickerTable.from_ccxt(tickers_raw, quote='USDT')
+                    self.logger.log_info(f"Tickers récupérés: {len(table)} paires USDT (colonnes)")
+                    return table
                 
                 # Formater les tickers
                 tickers = {}
                 for symbol, ticker in tickers_raw.items():
                     if symbol.endswith('/USDT'):  # Filtrer uniquement les paires USDT
-                        tickers[symbol] = {
-                            'symbol': symbol,
-                            'last': ticker.get('last'),
-                            'bid': ticker.get('bid'),
-                            'ask': ticker.get('ask'),
-                            'high': ticker.get('high'),
-                            'low': ticker.get('low'),
-                            'volume': ticker.get('quoteVolume'),
-                            'timestamp': ticker.get('timestamp'),
-                            'datetime': ticker.get('datetime', datetime.now().isoformat())
-                        }
+                        tickers[symbol] = format_ticker(symbol, ticker)
                 
                 self.logger.log_info(f"Tickers récupérés: {len(tickers)} paires USDT")
                 return tickers
@@ -237,6 +558,172 @@ class ExchangeManager:
             self.logger.log_error(f"Erreur lors de la récupération des tickers: {e}")
             raise
     
+    def _supports_bulk_tickers(self) -> bool:
+        """Indique si l'exchange expose un endpoint multi-symboles pour les tickers"""
+        has = getattr(self.exchange, 'has', None) or {}
+        return bool(has.get('fetchTickers'))
+    
+    def _fetch_tickers_bulk(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les tickers en une seule requête via l'endpoint multi-symboles
+        
+        Bascule sur la récupération concurrente si l'exchange refuse la requête groupée.
+        
+        Args:
+            symbols: Liste de symboles à récupérer
+        
+        Returns:
+            Dictionnaire de tickers indexés par symbole
+        """
+        tickers = {}
+        missing = symbols
+        if self.ticker_cache is not None or self.price_book is not None:
+            missing = []
+            for symbol in symbols:
+                local = self._get_streamed_ticker(symbol)
+                if local is None and self.ticker_cache is not None:
+                    local = self.ticker_cache.get(symbol)
+                if local is None:
+                    missing.append(symbol)
+                else:
+                    tickers[symbol] = dict(local)
+            if not missing:
+                return tickers
+        
+        try:
+            tickers_raw = self._limited(tickers_weight(len(missing)), self.exchange.fetch_tickers, missing)
+        except ccxt.NotSupported as e:
+            self.logger.log_debug("fetch_tickers groupé non supporté, repli concurrent: {}", e)
+            return self._fetch_tickers_concurrent(symbols)
+        
+        for symbol in missing:
+            ticker = tickers_raw.get(symbol)
+            if ticker is None:
+                self.logger.log_warning(f"Impossible de récupérer le ticker pour {symbol}: absent de la réponse")
+                continue
+            tickers[symbol] = format_ticker(symbol, ticker)
+            if self.ticker_cache is not None:
+                self.ticker_cache.put(symbol, tickers[symbol])
+        
+        self.logger.log_info(f"Tickers récupérés: {len(tickers)}/{len(symbols)} symboles (requête groupée)")
+        return tickers
+    
+    def _fetch_tickers_concurrent(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les tickers symbole par symbole avec un nombre borné de requêtes simultanées
+        
+        Args:
+            symbols: Liste de symboles à récupérer
+        
+        Returns:
+            Dictionnaire de tickers indexés par symbole (les échecs sont journalisés et ignorés)
+        """
+        max_workers = max(1, min(len(symbols), int(self.exchange_config.get('max_concurrent_requests', 8))))
+        
+        def fetch_one(symbol: str) -> Dict[str, Any]:
+            return dict(self._get_ticker(symbol))
+        
+        tickers = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(symbol, executor.submit(fetch_one, symbol)) for symbol in symbols]
+            for symbol, future in futures:
+                try:
+                    tickers[symbol] = future.result()
+                except Exception as e:
+                    self.logger.log_warning(f"Impossible de récupérer le ticker pour {symbol}: {e}")
+        
+        self.logger.log_info(f"Tickers récupérés: {len(tickers)}/{len(symbols)} symboles (requêtes concurrentes)")
+        return tickers
+    
+    def attach_price_book(self, price_book, max_age_seconds: Optional[float] = None) -> None:
+        """
+        Branche un carnet de prix alimenté par un flux temps réel (voir core.price_feed)
+        
+        Les lectures de tickers sont alors servies depuis le carnet, sans requête
+        réseau, tant que l'entrée du symbole a moins de max_age_seconds.
+        
+        Args:
+            price_book: Instance PriceBook (None pour débrancher)
+            max_age_seconds: Âge maximum d'un prix du carnet (défaut: price_feed.max_age_seconds)
+        """
+        if max_age_seconds is None:
+            max_age_seconds = self.config.get('price_feed.max_age_seconds', 5.0)
+        self.price_book = price_book
+        self.price_book_max_age = max_age_seconds
+    
+    def get_last_price(self, symbol: str) -> Optional[float]:
+        """
+        Retourne le dernier prix connu localement (carnet temps réel puis cache), sans requête réseau
+        
+        Args:
+            symbol: Symbole de trading (ex: 'BTC/USDT')
+        
+        Returns:
+            Dernier prix ou None si aucun prix local récent
+        """
+        ticker = self._get_streamed_ticker(symbol)
+        if ticker is None and self.ticker_cache is not None:
+            ticker = self.ticker_cache.get(symbol)
+        return ticker['last'] if ticker else None
+    
+    def _get_streamed_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Retourne le ticker du carnet temps réel s'il est assez récent"""
+        if self.price_book is None:
+            return None
+        return self.price_book.get(symbol, self.price_book_max_age)
+    
+    def _fetch_ticker_upstream(self, symbol: str) -> Dict[str, Any]:
+        """Récupère et formate un ticker directement depuis l'exchange"""
+        return format_ticker(
+            symbol, self._limited(ENDPOINT_WEIGHTS['fetch_ticker'], self.exchange.fetch_ticker, symbol)
+        )
+    
+    def _limited(self, weight: int, func, *args) -> Any:
+        """
+        Exécute un appel ccxt via le limiteur partagé (poids, priorité du contexte, en-têtes)
+        
+        Args:
+            weight: Poids de l'endpoint
+            func: Méthode ccxt à appeler
+        
+        Returns:
+            Réponse de l'exchange
+        """
+        if self.rate_limiter is None:
+            return func(*args)
+        return self.rate_limiter.call(
+            weight, func, *args, exchange=self._exchange, ban_errors=ban_errors(ccxt)
+        )
+    
+    def _get_ticker(self, symbol: str) -> Dict[str, Any]:
+        """Récupère un ticker via le carnet temps réel, le cache (requêtes regroupées) ou en direct"""
+        streamed = self._get_streamed_ticker(symbol)
+        if streamed is not None:
+            return streamed
+        if self.ticker_cache is None:
+            return self._fetch_ticker_upstream(symbol)
+        return self.ticker_cache.get_or_fetch(symbol, self._fetch_ticker_upstream)
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Compteurs de la session HTTP partagée de l'exchange
+        
+        Returns:
+            Dictionnaire {opened, reused, requests, reuse_ratio} (vide sans session partagée)
+        """
+        return connection_stats().get(pool_key(self.exchange_config), {})
+    
+    def get_ticker_cache_stats(self) -> Dict[str, Any]:
+        """
+        Retourne les compteurs du cache de tickers (hits, misses, coalesced, ...)
+        
+        Returns:
+            Dictionnaire de compteurs (vide si le cache est désactivé)
+        """
+        if self.ticker_cache is None:
+            return {}
+        return self.ticker_cache.stats()
+    
     def get_account_info(self) -> Dict[str, Any]:
         """
         Récupère les informations du compte
@@ -247,14 +734,13 @@ class ExchangeManager:
         try:
             self.logger.log_execution('exchange', 'get_account_info')
             
-            # Pour Binance, on peut utiliser fetch_balance qui contient aussi des infos
-            balance = self.exchange.fetch_balance()
+            # Même instantané que fetch_balances (pas de second appel fetch_balance)
+            snapshot = self.get_balance_snapshot()
             
             account_info = {
                 'exchange': self.exchange_config.get('name', 'unknown'),
-                'timestamp': datetime.now().isoformat(),
-                'balances_count': len([k for k, v in balance.items() 
-                                     if isinstance(v, dict) and v.get('total', 0) > 0])
+                'timestamp': snapshot.timestamp,
+                'balances_count': snapshot.asset_count
             }
             
             return account_info
@@ -0,0 +1,241 @@
+"""
+Pool de comptes et d'exchanges: collecte concurrente et vue agrégée du portefeuille
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+from .config_loader import get_config
+from .exchange import ExchangeManager
+from .logger import get_logger
+
+
+def account_configs(config_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Construit la configuration de chaque compte
+    
+    Chaque entrée de la liste 'exchanges' surcharge la section 'exchange' (réglages
+    communs: cache de tickers, limiteur...). Sans liste, la section 'exchange' seule
+    forme un compte.
+    
+    Args:
+        config_path: Chemin vers le fichier de configuration
+    
+    Returns:
+        Liste de sections exchange complètes, avec un identifiant 'account' unique
+    """
+    config = get_config(config_path)
+    defaults = config.get_exchange_config()
+    entries = config.get('exchanges') or [{}]
+    
+    accounts = []
+    seen = set()
+    for entry in entries:
+        merged = {**defaults, **entry}
+        for section in ('rate_limit', 'ticker_cache', 'http', 'markets_cache', 'transport'):
+            if isinstance(defaults.get(section), dict) and isinstance(entry.get(section), dict):
+                merged[section] = {**defaults[section], **entry[section]}
+        account = str(merged.get('account') or merged.get('name', 'binance'))
+        if account in seen:
+            raise ValueError(f"Identifiant de compte en double dans 'exchanges': {account}")
+        seen.add(account)
+        merged['account'] = account
+        accounts.append(merged)
+    return accounts
+
+
+@dataclass
+class PortfolioView:
+    """Vue agrégée d'un cycle de collecte sur tous les comptes"""
+    
+    balances: Dict[str, Dict[str, float]]
+    by_source: Dict[str, Dict[str, Dict[str, Any]]]
+    tickers: Dict[str, Dict[str, Any]]
+    tickers_by_source: Dict[str, Dict[str, Dict[str, Any]]]
+    errors: Dict[str, str] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+    cycle_seconds: float = 0.0
+    
+    def sources(self, asset: str) -> Dict[str, float]:
+        """Quantité totale détenue par compte pour un asset"""
+        return {
+            account: balances[asset].get('total', 0) or 0
+            for account, balances in self.by_source.items() if asset in balances
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Retourne la vue sous forme de dictionnaire (balances annotées de leurs sources)"""
+        return {
+            'balances': {
+                asset: {**values, 'sources': self.sources(asset)}
+                for asset, values in self.balances.items()
+            },
+            'tickers': self.tickers,
+            'errors': self.errors,
+            'durations': self.durations,
+            'cycle_seconds': self.cycle_seconds,
+        }
+
+
+def merge_balances(by_source: Mapping[str, Mapping[str, Mapping[str, Any]]]) -> Dict[str, Dict[str, float]]:
+    """
+    Additionne les balances de plusieurs comptes
+    
+    Args:
+        by_source: Balances par compte ({compte: {asset: {free, used, total}}})
+    
+    Returns:
+        Balances totales par asset ({asset: {free, used, total}})
+    """
+    merged: Dict[str, Dict[str, float]] = {}
+    for balances in by_source.values():
+        for asset, values in balances.items():
+            total = merged.setdefault(asset, {'free': 0.0, 'used': 0.0, 'total': 0.0})
+            for key in ('free', 'used', 'total'):
+                total[key] += values.get(key) or 0
+    return merged
+
+
+class ExchangePool:
+    """
+    Gestionnaires d'exchange d'un ensemble de comptes, interrogés en parallèle
+    
+    Chaque compte a son instance ccxt et son budget de requêtes (voir
+    get_rate_limiter). Les appels d'un cycle partent en même temps, un thread par
+    compte: la durée du cycle est celle du compte le plus lent. L'échec d'un
+    compte est rapporté dans la vue sans bloquer les autres.
+    """
+    
+    def __init__(self, config_path: Optional[str] = None,
+                 accounts: Optional[List[Dict[str, Any]]] = None):
+        """
+        Crée un gestionnaire par compte
+        
+        Args:
+            config_path: Chemin vers le fichier de configuration
+            accounts: Sections exchange des comptes (défaut: account_configs(config_path))
+        """
+        self.config_path = config_path
+        self.logger = get_logger(config_path)
+        accounts = account_configs(config_path) if accounts is None else accounts
+        if not accounts:
+            raise ValueError("Aucun compte configuré pour le pool d'exchanges")
+        
+        self._executor = ThreadPoolExecutor(max_workers=len(accounts), thread_name_prefix='exchange-pool')
+        # Créations (et tests de connexion) en parallèle elles aussi
+        futures = {}
+        for account_config in accounts:
+            account = str(account_config.get('account') or account_config.get('name', 'binance'))
+            if account in futures:
+                self._executor.shutdown(wait=False)
+                raise ValueError(f"Identifiant de compte en double: {account}")
+            futures[account] = self._executor.submit(
+                ExchangeManager, config_path, {**account_config, 'account': account}
+            )
+        try:
+            self.managers: Dict[str, ExchangeManager] = {
+                account: future.result() for account, future in futures.items()
+            }
+        except Exception:
+            self._executor.shutdown(wait=False)
+            raise
+        self.logger.log_info(f"Pool d'exchanges initialisé: {', '.join(self.managers)}")
+    
+    def __enter__(self) -> 'ExchangePool':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Arrête les threads du pool"""
+        self._executor.shutdown(wait=True)
+    
+    def _fan_out(self, call: Callable[[ExchangeManager], Any]):
+        """
+        Exécute call sur chaque compte en parallèle
+        
+        Returns:
+            (résultats par compte, erreurs par compte, durées par compte)
+        """
+        def timed(manager: ExchangeManager):
+            start = time.perf_counter()
+            try:
+                return call(manager), None, time.perf_counter() - start
+            except Exception as e:
+                return None, e, time.perf_counter() - start
+        
+        futures = {account: self._executor.submit(timed, manager) for account, manager in self.managers.items()}
+        results, errors, durations = {}, {}, {}
+        for account, future in futures.items():
+            result, error, duration = future.result()
+            durations[account] = duration
+            if error is not None:
+                errors[account] = str(error)
+                self.logger.log_warning(f"Compte {account}: {error}")
+            else:
+                results[account] = result
+        return results, errors, durations
+    
+    def fetch_balances(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Récupère les balances de tous les comptes en parallèle
+        
+        Returns:
+            Balances par compte (comptes en erreur absents)
+        """
+        return self._fan_out(lambda manager: manager.fetch_balances())[0]
+    
+    def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Récupère les tickers sur tous les comptes en parallèle
+        
+        Args:
+            symbols: Symboles à récupérer (None = toutes les paires USDT)
+        
+        Returns:
+            Tickers par compte (comptes en erreur absents)
+        """
+        return self._fan_out(lambda manager: manager.fetch_tickers(symbols))[0]
+    
+    def fetch_portfolio(self, symbols: Optional[List[str]] = None) -> PortfolioView:
+        """
+        Exécute un cycle complet (balances puis tickers de chaque compte) sur tous les comptes
+        
+        Les deux requêtes d'un compte s'enchaînent dans son thread; les comptes
+        avancent en parallèle.
+        
+        Args:
+            symbols: Symboles dont récupérer les tickers (None = toutes les paires USDT)
+        
+        Returns:
+            Instance PortfolioView; les prix agrégés viennent du premier compte
+            (ordre de configuration) qui cote le symbole
+        """
+        start = time.perf_counter()
+        results, errors, durations = self._fan_out(
+            lambda manager: (manager.fetch_balances(), manager.fetch_tickers(symbols))
+        )
+        
+        by_source = {account: balances for account, (balances, _) in results.items()}
+        tickers_by_source = {account: tickers for account, (_, tickers) in results.items()}
+        tickers: Dict[str, Dict[str, Any]] = {}
+        for account in self.managers:
+            for symbol, ticker in tickers_by_source.get(account, {}).items():
+                tickers.setdefault(symbol, ticker)
+        
+        view = PortfolioView(
+            balances=merge_balances(by_source),
+            by_source=by_source,
+            tickers=tickers,
+            tickers_by_source=tickers_by_source,
+            errors=errors,
+            durations=durations,
+            cycle_seconds=time.perf_counter() - start,
+        )
+        self.logger.log_info(
+            f"Cycle multi-comptes: {len(by_source)}/{len(self.managers)} comptes, "
+            f"{len(view.balances)} assets en {view.cycle_seconds:.3f}s"
+        )
+        return view
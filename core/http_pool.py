@@ -0,0 +1,269 @@
+"""
+Sessions HTTP partagées des exchanges: taille du pool, keep-alive, délais et compteurs de connexions
+"""
+
+import asyncio
+import socket
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+# Valeurs par défaut de 'exchange.http'
+HTTP_DEFAULTS = {
+    'enabled': True,
+    'pool_size': 32,  # Connexions gardées ouvertes par hôte
+    'pool_block': True,  # Attendre une connexion libre plutôt qu'en ouvrir une jetable
+    'keepalive_seconds': 30,  # Inactivité avant sondes TCP keep-alive (sync) / fermeture (async)
+    'timeout_ms': 10000,  # Délai des requêtes ccxt (connexion + lecture)
+}
+
+
+class ConnectionStats:
+    """Compteurs de connexions d'une session (ouvertes, réutilisées, requêtes)"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        self.requests = 0
+    
+    def record_request(self, new_connection: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            if new_connection:
+                self.opened += 1
+            else:
+                self.reused += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Retourne les compteurs et le taux de réutilisation"""
+        with self._lock:
+            return {
+                'opened': self.opened,
+                'reused': self.reused,
+                'requests': self.requests,
+                'reuse_ratio': self.reused / self.requests if self.requests else None,
+            }
+
+
+def http_settings(exchange_config: Mapping[str, Any]) -> Dict[str, Any]:
+    """Réglages HTTP d'un exchange ('exchange.http' complété des valeurs par défaut)"""
+    return {**HTTP_DEFAULTS, **(exchange_config.get('http', {}) or {})}
+
+
+def pool_key(exchange_config: Mapping[str, Any]) -> str:
+    """
+    Clé de partage de la session: les gestionnaires qui parlent au même hôte partagent son pool
+    
+    'http.share_key' force la clé; sinon nom de l'exchange (+ testnet, autre hôte).
+    """
+    settings = http_settings(exchange_config)
+    if settings.get('share_key'):
+        return str(settings['share_key'])
+    name = exchange_config.get('name', 'binance').lower()
+    return f"{name}:testnet" if exchange_config.get('testnet', False) else name
+
+
+def _socket_options(keepalive_seconds: Optional[float]) -> list:
+    """Options de socket: TCP_NODELAY (urllib3) + sondes keep-alive après keepalive_seconds"""
+    options = list(HTTPConnection.default_socket_options)
+    if keepalive_seconds:
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, max(1, int(keepalive_seconds))))
+    return options
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    Adaptateur requests dont les pools comptent les connexions ouvertes et réutilisées
+    
+    Une requête servie sans création de connexion (_new_conn) a réutilisé une
+    connexion keep-alive du pool.
+    """
+    
+    def __init__(self, stats: ConnectionStats, pool_size: int, pool_block: bool,
+                 keepalive_seconds: Optional[float]):
+        self.stats = stats
+        self._local = threading.local()
+        self._socket_options = _socket_options(keepalive_seconds)
+        super().__init__(pool_connections=4, pool_maxsize=pool_size, pool_block=pool_block, max_retries=0)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+        local = self._local
+        
+        def counting(base):
+            class CountingPool(base):
+                def _new_conn(self):
+                    local.opened = True
+                    return super()._new_conn()
+            return CountingPool
+        
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': counting(HTTPConnectionPool),
+            'https': counting(HTTPSConnectionPool),
+        }
+    
+    def send(self, request, *args, **kwargs):
+        self._local.opened = False
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            self.stats.record_request(self._local.opened)
+
+
+class SharedSession(requests.Session):
+    """
+    Session partagée entre plusieurs instances ccxt
+    
+    ccxt ferme sa session à la destruction de l'instance (Exchange.__del__):
+    close() est donc sans effet, seul release() ferme les connexions du pool.
+    """
+    
+    def close(self) -> None:
+        pass
+    
+    def release(self) -> None:
+        """Ferme réellement les adaptateurs (voir close_sessions)"""
+        super().close()
+
+
+# Sessions synchrones partagées par clé d'hôte
+_sessions: Dict[str, Tuple[SharedSession, ConnectionStats, Tuple[Any, ...]]] = {}
+_sessions_lock = threading.Lock()
+
+
+def pool_settings(settings: Mapping[str, Any]) -> Tuple[Any, ...]:
+    """Réglages qui définissent l'adaptateur (un changement impose de le remplacer)"""
+    return int(settings['pool_size']), bool(settings['pool_block']), settings['keepalive_seconds']
+
+
+def _mount_pool(session: requests.Session, stats: ConnectionStats, pool: Tuple[Any, ...]) -> PooledAdapter:
+    """Monte un nouvel adaptateur sur la session et ferme le précédent"""
+    previous = session.adapters.get('https://')
+    adapter = PooledAdapter(stats, *pool)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if previous is not None:
+        previous.close()
+    return adapter
+
+
+def get_session(exchange_config: Mapping[str, Any]) -> Optional[requests.Session]:
+    """
+    Session requests partagée de l'hôte de l'exchange (à passer en 'session' à ccxt)
+    
+    Args:
+        exchange_config: Section 'exchange' (ou un compte de 'exchanges')
+    
+    Returns:
+        Session, ou None si 'exchange.http.enabled' est faux (session propre à ccxt)
+    """
+    settings = http_settings(exchange_config)
+    if not settings['enabled']:
+        return None
+    key = pool_key(exchange_config)
+    pool = pool_settings(settings)
+    with _sessions_lock:
+        entry = _sessions.get(key)
+        if entry is None:
+            session, stats = SharedSession(), ConnectionStats()
+            _mount_pool(session, stats, pool)
+            entry = _sessions[key] = (session, stats, pool)
+        elif entry[2] != pool:
+            # Taille ou keep-alive modifiés (rechargement): même session, nouveau pool
+            _mount_pool(entry[0], entry[1], pool)
+            entry = _sessions[key] = (entry[0], entry[1], pool)
+        return entry[0]
+
+
+# Sessions aiohttp partagées par (boucle, clé d'hôte): [session, stats, nombre d'utilisateurs]
+_async_sessions: Dict[Tuple[int, str], list] = {}
+
+
+def _async_stats_trace(stats: ConnectionStats):
+    """TraceConfig aiohttp alimentant les compteurs (connexion créée ou reprise du pool)"""
+    import aiohttp
+    
+    trace = aiohttp.TraceConfig()
+    
+    async def on_create(session, context, params):
+        stats.record_request(True)
+    
+    async def on_reuse(session, context, params):
+        stats.record_request(False)
+    
+    trace.on_connection_create_end.append(on_create)
+    trace.on_connection_reuseconn.append(on_reuse)
+    return trace
+
+
+async def acquire_async_session(exchange_config: Mapping[str, Any]) -> Optional[Any]:
+    """
+    Session aiohttp partagée de l'hôte pour la boucle courante
+    
+    Chaque appel doit être suivi de release_async_session (la dernière libération
+    ferme la session).
+    
+    Returns:
+        aiohttp.ClientSession, ou None si 'exchange.http.enabled' est faux
+    """
+    settings = http_settings(exchange_config)
+    if not settings['enabled']:
+        return None
+    import aiohttp
+    
+    key = (id(asyncio.get_running_loop()), pool_key(exchange_config))
+    entry = _async_sessions.get(key)
+    if entry is None or entry[0].closed:
+        stats = ConnectionStats()
+        connector = aiohttp.TCPConnector(
+            limit=int(settings['pool_size']),
+            limit_per_host=int(settings['pool_size']),
+            keepalive_timeout=float(settings['keepalive_seconds'] or 15),
+            enable_cleanup_closed=True,
+        )
+        session = aiohttp.ClientSession(connector=connector, trace_configs=[_async_stats_trace(stats)])
+        entry = _async_sessions[key] = [session, stats, 0]
+    entry[2] += 1
+    return entry[0]
+
+
+async def release_async_session(exchange_config: Mapping[str, Any]) -> None:
+    """Libère une session obtenue par acquire_async_session"""
+    key = (id(asyncio.get_running_loop()), pool_key(exchange_config))
+    entry = _async_sessions.get(key)
+    if entry is None:
+        return
+    entry[2] -= 1
+    if entry[2] <= 0:
+        del _async_sessions[key]
+        await entry[0].close()
+
+
+def connection_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Compteurs de connexions des sessions partagées
+    
+    Returns:
+        {clé: {opened, reused, requests, reuse_ratio}} (clés async suffixées de ':async')
+    """
+    with _sessions_lock:
+        stats = {key: entry[1].to_dict() for key, entry in _sessions.items()}
+    for (_, key), entry in list(_async_sessions.items()):
+        stats[f"{key}:async"] = entry[1].to_dict()
+    return stats
+
+
+def close_sessions() -> None:
+    """Ferme les sessions synchrones partagées (connexions keep-alive comprises)"""
+    with _sessions_lock:
+        for session, _, _ in _sessions.values():
+            session.release()
+        _sessions.clear()
@@ -0,0 +1,388 @@
+"""
+Index des fichiers de logs (actifs, tournés et compressés) et recherche par positions
+
+Chaque fichier tourné reçoit un index annexe '<fichier>.idx' (JSON) qui associe aux
+types d'événement (EXECUTION, DECISION, TRANSACTION, ALERT), aux assets et aux
+tranches horaires la liste des positions (octets, dans le contenu décompressé) des
+lignes concernées. Une recherche intersecte ces listes puis lit les lignes par seek.
+
+Usage:
+    python -m core.log_index search --event DECISION --asset ETH --since 2026-10-10
+    python -m core.log_index build
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Union
+
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = '.idx'
+BUCKET_SECONDS = 3600
+EVENT_TYPES = ('EXECUTION', 'DECISION', 'TRANSACTION', 'ALERT')
+
+_TIME_RE = re.compile(rb'^(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2})')
+_EVENT_RE = re.compile(rb'\| (EXECUTION|DECISION|TRANSACTION|ALERT) \|')
+# 'Asset: ETH' (transactions) ou 'Reason: ETH: ...' / 'Message: ETH: ...' (règles, alertes)
+_ASSET_RES = (
+    re.compile(rb'Asset: ([A-Z0-9]{2,15})\b'),
+    re.compile(rb'(?:Reason|Message): ([A-Z0-9]{2,15}):'),
+)
+
+TimeLike = Union[float, int, datetime, str, None]
+
+
+def _parse_time(value: TimeLike) -> Optional[float]:
+    """Convertit un epoch, datetime ou texte ISO ('2026-10-17' ou '2026-10-17 12:00:00') en epoch"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _find_asset(text: bytes) -> Optional[str]:
+    for asset_re in _ASSET_RES:
+        found = asset_re.search(text)
+        if found:
+            return found.group(1).decode()
+    return None
+
+
+def _parse_line(line: bytes, is_json: bool) -> Optional[Dict[str, Any]]:
+    """
+    Extrait horodatage, type d'événement et asset d'une ligne de log
+    
+    Returns:
+        Dictionnaire {'time', 'event', 'asset'} ou None pour une ligne de continuation
+    """
+    if is_json:
+        try:
+            record = json.loads(line)['record']
+        except (ValueError, KeyError, TypeError):
+            return None
+        extra = record.get('extra') or {}
+        event = extra.get('event') if extra.get('event') in EVENT_TYPES else None
+        return {
+            'time': (record.get('time') or {}).get('timestamp'),
+            'event': event,
+            'asset': extra.get('asset') or (_find_asset(str(record.get('message', '')).encode()) if event else None),
+        }
+    
+    match = _TIME_RE.match(line)
+    if match is None:
+        return None  # Suite d'un message multi-lignes (trace d'exception)
+    try:
+        timestamp = datetime.fromisoformat(match.group(1).decode()).timestamp()
+    except ValueError:
+        timestamp = None
+    event = _EVENT_RE.search(line)
+    return {
+        'time': timestamp,
+        'event': event.group(1).decode() if event else None,
+        'asset': _find_asset(line) if event else None,
+    }
+
+
+def open_log(path: Union[str, Path]) -> BinaryIO:
+    """
+    Ouvre un fichier de log (texte, .gz ou .zip) en lecture binaire avec seek
+    
+    Pour les archives, seek avance dans le flux décompressé sans analyser les lignes.
+    """
+    path = Path(path)
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rb')
+    if path.suffix == '.zip':
+        archive = zipfile.ZipFile(path)
+        member = archive.open(archive.namelist()[0])
+        # Fermer le membre ferme aussi l'archive
+        close_member = member.close
+        
+        def close() -> None:
+            close_member()
+            archive.close()
+        member.close = close
+        return member
+    return open(path, 'rb')
+
+
+def _log_name(path: Path) -> str:
+    """Nom du log d'origine (sans extension de compression)"""
+    name = path.name
+    for suffix in ('.zip', '.gz'):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def index_path(path: Union[str, Path]) -> Path:
+    """Chemin de l'index annexe d'un log (partagé par le fichier et son archive)"""
+    path = Path(path)
+    return path.with_name(_log_name(path) + INDEX_SUFFIX)
+
+
+def build_index(path: Union[str, Path], bucket_seconds: int = BUCKET_SECONDS) -> Dict[str, Any]:
+    """
+    Construit l'index d'un fichier de log en une passe
+    
+    Args:
+        path: Fichier de log (texte, .gz ou .zip)
+        bucket_seconds: Largeur des tranches de temps
+    
+    Returns:
+        Index {'version', 'log', 'bucket_seconds', 'start', 'end', 'records', 'postings'}
+    """
+    path = Path(path)
+    is_json = _log_name(path).endswith('.jsonl')
+    postings: Dict[str, List[int]] = {}
+    start = end = None
+    records = 0
+    offset = 0
+    
+    with open_log(path) as f:
+        for line in f:
+            parsed = _parse_line(line, is_json)
+            if parsed is not None:
+                records += 1
+                timestamp = parsed['time']
+                keys = []
+                if timestamp is not None:
+                    start = timestamp if start is None else min(start, timestamp)
+                    end = timestamp if end is None else max(end, timestamp)
+                    keys.append(f"bucket:{int(timestamp // bucket_seconds) * bucket_seconds}")
+                if parsed['event']:
+                    keys.append(f"event:{parsed['event']}")
+                if parsed['asset']:
+                    keys.append(f"asset:{parsed['asset']}")
+                for key in keys:
+                    postings.setdefault(key, []).append(offset)
+            offset += len(line)
+    
+    return {
+        'version': INDEX_VERSION,
+        'log': _log_name(path),
+        'bucket_seconds': bucket_seconds,
+        'start': start,
+        'end': end,
+        'records': records,
+        'size': offset,
+        'postings': postings,
+    }
+
+
+def write_index(path: Union[str, Path], bucket_seconds: int = BUCKET_SECONDS) -> Path:
+    """
+    Construit et enregistre l'index annexe d'un fichier de log
+    
+    Returns:
+        Chemin de l'index écrit
+    """
+    index = build_index(path, bucket_seconds)
+    target = index_path(path)
+    tmp = target.with_name(target.name + '.tmp')
+    tmp.write_text(json.dumps(index, separators=(',', ':')), encoding='utf-8')
+    os.replace(tmp, target)
+    return target
+
+
+def load_index(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Charge l'index annexe d'un log
+    
+    Returns:
+        Index, ou None s'il est absent, d'une autre version ou périmé (fichier non
+        compressé qui a grandi depuis l'indexation)
+    """
+    path = Path(path)
+    try:
+        index = json.loads(index_path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if index.get('version') != INDEX_VERSION:
+        return None
+    if path.suffix not in ('.zip', '.gz') and path.stat().st_size != index.get('size'):
+        return None
+    return index
+
+
+def compressor(compression: Optional[str]) -> Callable[[str], None]:
+    """
+    Fonction de compression pour loguru: indexe le fichier tourné puis le compresse
+    
+    Args:
+        compression: 'zip', 'gz' ou None (index seul)
+    
+    Returns:
+        Callable(chemin) à passer en 'compression' à logger.add
+    """
+    if isinstance(compression, str) and compression.lower() == 'none':
+        compression = None
+    if compression not in (None, 'zip', 'gz'):
+        raise ValueError(f"Compression non supportée avec l'index: {compression} (zip, gz ou None)")
+    
+    def compress(path: str) -> None:
+        source = Path(path)
+        write_index(source)
+        if compression == 'zip':
+            with zipfile.ZipFile(f"{path}.zip", 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.write(source, arcname=source.name)
+        elif compression == 'gz':
+            with open(source, 'rb') as f_in, gzip.open(f"{path}.gz", 'wb') as f_out:
+                while True:
+                    chunk = f_in.read(1 << 20)
+                    if not chunk:
+                        break
+                    f_out.write(chunk)
+        else:
+            return
+        source.unlink()
+    
+    return compress
+
+
+def _matching_offsets(index: Dict[str, Any], event: Optional[str], asset: Optional[str],
+                      start: Optional[float], end: Optional[float]) -> Optional[List[int]]:
+    """Intersecte les listes de positions (None = aucune contrainte indexable)"""
+    postings = index['postings']
+    sets: List[Set[int]] = []
+    if event is not None:
+        sets.append(set(postings.get(f"event:{event}", ())))
+    if asset is not None:
+        sets.append(set(postings.get(f"asset:{asset}", ())))
+    if start is not None or end is not None:
+        width = index['bucket_seconds']
+        low = int((start if start is not None else index['start'] or 0) // width) * width
+        high = end if end is not None else (index['end'] or 0) + width
+        in_range: Set[int] = set()
+        for key, offsets in postings.items():
+            if key.startswith('bucket:') and low <= int(key[7:]) < high:
+                in_range.update(offsets)
+        sets.append(in_range)
+    if not sets:
+        return None
+    sets.sort(key=len)
+    result = sets[0].intersection(*sets[1:])
+    return sorted(result)
+
+
+def _record_ends(index: Dict[str, Any]) -> Dict[int, int]:
+    """
+    Fin de chaque enregistrement indexé: position indexée suivante (ou fin du fichier)
+    
+    Les lignes de suite (trace d'exception) ne sont pas indexées et restent
+    comprises dans l'enregistrement qui les précède.
+    """
+    starts = sorted(set().union(*index['postings'].values()))
+    return dict(zip(starts, starts[1:] + [index['size']]))
+
+
+def log_files(directory: Union[str, Path]) -> List[Path]:
+    """Fichiers de logs d'un répertoire (actifs et archives), triés par nom"""
+    directory = Path(directory)
+    return sorted(
+        p for p in directory.glob('portfolio_*')
+        if p.is_file() and not p.name.endswith((INDEX_SUFFIX, '.tmp'))
+    )
+
+
+def search(directory: Union[str, Path] = 'logs', event: Optional[str] = None,
+           asset: Optional[str] = None, since: TimeLike = None, until: TimeLike = None,
+           build_missing: bool = True) -> Iterator[str]:
+    """
+    Retourne les lignes de logs correspondant aux critères, fichier par fichier
+    
+    Les fichiers indexés ne sont lus qu'aux positions retenues; les fichiers sans
+    index (fichier du jour en cours d'écriture) sont indexés en mémoire.
+    
+    Args:
+        directory: Répertoire des logs
+        event: Type d'événement (EXECUTION, DECISION, TRANSACTION, ALERT)
+        asset: Asset (ex: 'ETH')
+        since: Début de période (epoch, datetime ou texte ISO, inclus)
+        until: Fin de période (epoch, datetime ou texte ISO, exclu)
+        build_missing: Enregistrer l'index des archives qui n'en ont pas
+    
+    Yields:
+        Lignes de log (sans fin de ligne); un enregistrement retrouvé par l'index
+        est rendu avec ses lignes de suite (trace d'exception)
+    """
+    start, end = _parse_time(since), _parse_time(until)
+    
+    for path in log_files(directory):
+        index = load_index(path)
+        if index is None:
+            if build_missing and path.suffix in ('.zip', '.gz'):
+                write_index(path)
+                index = load_index(path)
+            else:
+                index = build_index(path)
+        if index['start'] is None:
+            continue
+        if (start is not None and index['end'] < start) or (end is not None and index['start'] >= end):
+            continue
+        
+        offsets = _matching_offsets(index, event, asset, start, end)
+        is_json = index['log'].endswith('.jsonl')
+        ends = _record_ends(index) if offsets else {}
+        with open_log(path) as f:
+            if offsets is None:
+                for line in f:
+                    yield line.decode('utf-8', errors='replace').rstrip('\r\n')
+                continue
+            for offset in offsets:
+                if f.tell() != offset:
+                    f.seek(offset)
+                record = f.read(ends[offset] - offset)
+                # Bornes exactes (les tranches de l'index sont horaires)
+                parsed = _parse_line(record.split(b'\n', 1)[0], is_json)
+                timestamp = parsed['time'] if parsed else None
+                if timestamp is not None and (
+                        (start is not None and timestamp < start) or (end is not None and timestamp >= end)):
+                    continue
+                yield record.decode('utf-8', errors='replace').rstrip('\r\n')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Point d'entrée CLI: 'build' (indexer les archives) ou 'search'"""
+    parser = argparse.ArgumentParser(description="Index et recherche dans les logs archivés")
+    parser.add_argument('--dir', default=None, help="Répertoire des logs (défaut: logging.directory)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    subparsers.add_parser('build', help="Indexer les fichiers de logs qui n'ont pas d'index")
+    
+    search_parser = subparsers.add_parser('search', help="Afficher les lignes correspondantes")
+    search_parser.add_argument('--event', choices=EVENT_TYPES)
+    search_parser.add_argument('--asset')
+    search_parser.add_argument('--since', help="Début (ISO, ex: 2026-10-10 ou '2026-10-10 08:00:00')")
+    search_parser.add_argument('--until', help="Fin exclue (ISO)")
+    
+    args = parser.parse_args(argv)
+    directory = args.dir
+    if directory is None:
+        from .config_loader import get_config
+        directory = get_config().get('logging.directory', 'logs')
+    
+    if args.command == 'build':
+        for path in log_files(directory):
+            if load_index(path) is None:
+                print(write_index(path))
+        return 0
+    
+    try:
+        for line in search(directory, args.event, args.asset, args.since, args.until):
+            print(line)
+    except BrokenPipeError:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
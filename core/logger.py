@@ -2,13 +2,41 @@
 Module de journalisation avec rotation automatique et sauvegarde
 """
 
+import math
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 from loguru import logger
 from .config_loader import get_config
 
 
+# Numéros des niveaux loguru (garde de niveau sans appel à loguru)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+CRITICAL = 50
+
+# Options des sinks par profil ('logging.profile'), surchargeables une à une dans 'logging'
+PROFILES = {
+    # Développement: traces détaillées (variables locales), écriture console synchrone
+    'development': {
+        'backtrace': True,
+        'diagnose': True,
+        'console_enqueue': False,
+        'serialize': False,
+    },
+    # Production: pas de parcours des frames sur exception, console via file d'attente,
+    # fichier en lignes JSON
+    'production': {
+        'backtrace': False,
+        'diagnose': False,
+        'console_enqueue': True,
+        'serialize': True,
+    },
+}
+
+
 class PortfolioLogger:
     """Gestionnaire de logs avec rotation journalière et sauvegarde en DB"""
     
@@ -19,7 +47,31 @@ class PortfolioLogger:
         Args:
             config_path: Chemin vers le fichier de configuration
         """
+        self.config_path = config_path
         self.config = get_config(config_path).get_logging_config()
+        self.event_sink = None
+        # Niveau minimum accepté par au moins un sink (inf = aucun sink)
+        self._min_level_no = math.inf
+        self._setup_logger()
+        get_config(config_path).subscribe(self._on_config_change, sections=['logging'])
+    
+    def _on_config_change(self, snapshot: Any, changed: Any) -> None:
+        """Reconfigure les sinks après un rechargement de la section 'logging'"""
+        self.apply_config(get_config(self.config_path).get_logging_config())
+    
+    def apply_config(self, logging_config: Dict[str, Any]) -> None:
+        """
+        Remplace la configuration de logging et recrée les sinks
+        
+        Les messages en file d'attente sont écrits avant la suppression des anciens sinks.
+        
+        Args:
+            logging_config: Nouvelle section 'logging'
+        """
+        self.flush()
+        self.config = logging_config
+        self.event_sink = None
+        self._min_level_no = math.inf
         self._setup_logger()
     
     def _setup_logger(self) -> None:
@@ -33,16 +85,19 @@ class PortfolioLogger:
             'format',
             "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
         )
+        options = self.get_profile_options()
         
-        # Handler console
+        # Handler console (file d'attente en production: l'appelant n'attend pas le terminal)
         if self.config.get('console', True):
+            self._register_sink_level(log_level)
             logger.add(
                 sys.stderr,
                 format=log_format,
                 level=log_level,
                 colorize=True,
-                backtrace=True,
-                diagnose=True
+                backtrace=options['backtrace'],
+                diagnose=options['diagnose'],
+                enqueue=options['console_enqueue']
             )
         
         # Handler fichier avec rotation
@@ -54,7 +109,16 @@ class PortfolioLogger:
             rotation = self.config.get('rotation', '00:00')  # Rotation à minuit
             retention = self.config.get('retention', '30 days')
             compression = self.config.get('compression', 'zip')
+            if self.config.get('index', True):
+                # Index annexe (positions par type, asset et heure) écrit avant compression
+                from .log_index import compressor
+                compression = compressor(compression)
+            
+            # Lignes JSON (serialize) en production; écritures regroupées par le tampon du fichier
+            if options['serialize']:
+                log_file = log_dir / "portfolio_{time:YYYY-MM-DD}.jsonl"
             
+            self._register_sink_level(log_level)
             logger.add(
                 str(log_file),
                 format=log_format,
@@ -62,32 +126,116 @@ class PortfolioLogger:
                 rotation=rotation,
                 retention=retention,
                 compression=compression,
-                backtrace=True,
-                diagnose=True,
+                backtrace=options['backtrace'],
+                diagnose=options['diagnose'],
+                serialize=options['serialize'],
+                buffering=int(self.config.get('file_buffer_size', -1)),
                 enqueue=True  # Thread-safe
             )
         
-        logger.info("Système de logging initialisé")
+        # Sink base de données des événements structurés (écritures groupées en arrière-plan)
+        events_config = self.config.get('database', {}) or {}
+        if events_config.get('enabled', False):
+            from storage.events import EventSink
+            self.event_sink = EventSink(
+                events_config.get('path')
+                or get_config(self.config_path).get('database.sqlite.path', 'storage/portfolio.db'),
+                batch_size=events_config.get('batch_size', 500),
+                flush_interval=events_config.get('flush_interval_seconds', 1.0),
+                max_queue=events_config.get('max_queue', 10000)
+            )
+            self._register_sink_level('INFO')
+            logger.add(self.event_sink, level='INFO', filter=EventSink.accepts, format="{message}")
+        
+        logger.info("Système de logging initialisé (profil {})", self.profile)
+    
+    @property
+    def profile(self) -> str:
+        """Profil de logging configuré ('development' ou 'production')"""
+        return self.config.get('profile', 'development')
+    
+    def get_profile_options(self) -> Dict[str, bool]:
+        """
+        Retourne les options des sinks du profil, avec les surcharges de 'logging'
+        
+        Returns:
+            Dictionnaire {backtrace, diagnose, console_enqueue, serialize}
+        """
+        if self.profile not in PROFILES:
+            raise ValueError(f"Profil de logging inconnu: {self.profile} (attendu: {list(PROFILES)})")
+        options = dict(PROFILES[self.profile])
+        for key in options:
+            if key in self.config:
+                options[key] = bool(self.config[key])
+        return options
     
-    def log_info(self, message: str, **kwargs) -> None:
+    def flush(self) -> None:
+        """Attend l'écriture des messages en file d'attente (sinks 'enqueue' et base de données)"""
+        logger.complete()
+        if self.event_sink is not None:
+            self.event_sink.drain()
+    
+    def _register_sink_level(self, level: Any) -> None:
+        """Prend en compte le niveau d'un sink ajouté dans la garde de niveau"""
+        level_no = level if isinstance(level, int) else logger.level(str(level).upper()).no
+        self._min_level_no = min(self._min_level_no, level_no)
+    
+    def is_enabled(self, level: str = 'INFO') -> bool:
+        """
+        Indique si un message de ce niveau serait écrit par au moins un sink
+        
+        Permet d'éviter de préparer un message coûteux qui serait ignoré.
+        
+        Args:
+            level: Nom du niveau (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        """
+        return logger.level(level.upper()).no >= self._min_level_no
+    
+    # Les messages acceptent des arguments de formatage différé:
+    # log_debug("Ticker {}: {}", symbol, price) ne formate que si le niveau est actif.
+    
+    def log_info(self, message: str, *args, **kwargs) -> None:
         """Enregistre un message d'information"""
-        logger.info(message, **kwargs)
+        if self._min_level_no <= INFO:
+            logger.info(message, *args, **kwargs)
     
-    def log_debug(self, message: str, **kwargs) -> None:
+    def log_debug(self, message: str, *args, **kwargs) -> None:
         """Enregistre un message de debug"""
-        logger.debug(message, **kwargs)
+        if self._min_level_no <= DEBUG:
+            logger.debug(message, *args, **kwargs)
     
-    def log_warning(self, message: str, **kwargs) -> None:
+    def log_warning(self, message: str, *args, **kwargs) -> None:
         """Enregistre un avertissement"""
-        logger.warning(message, **kwargs)
+        if self._min_level_no <= WARNING:
+            logger.warning(message, *args, **kwargs)
     
-    def log_error(self, message: str, **kwargs) -> None:
+    def log_error(self, message: str, *args, **kwargs) -> None:
         """Enregistre une erreur"""
-        logger.error(message, **kwargs)
+        if self._min_level_no <= ERROR:
+            logger.error(message, *args, **kwargs)
     
-    def log_critical(self, message: str, **kwargs) -> None:
+    def log_critical(self, message: str, *args, **kwargs) -> None:
         """Enregistre une erreur critique"""
-        logger.critical(message, **kwargs)
+        if self._min_level_no <= CRITICAL:
+            logger.critical(message, *args, **kwargs)
+    
+    def log_event(self, event: str, message: str = '', level: str = 'INFO', **fields) -> None:
+        """
+        Enregistre un événement structuré
+        
+        Les champs sont transmis dans record['extra'] (avec 'event') sans être
+        interpolés dans le message; rien n'est construit si le niveau est inactif.
+        
+        Args:
+            event: Type d'événement (ex: 'EXECUTION', 'DECISION')
+            message: Texte libre (non interprété comme gabarit)
+            level: Niveau loguru
+            **fields: Champs structurés (ex: module='exchange', action='fetch_ticker')
+        """
+        level = level.upper()
+        if logger.level(level).no < self._min_level_no:
+            return
+        logger.log(level, "{} | {}", event, message, event=event, **fields)
     
     def log_execution(self, module: str, action: str, details: Optional[dict] = None) -> None:
         """
@@ -98,8 +246,19 @@ class PortfolioLogger:
             action: Action effectuée (ex: 'fetch_balances', 'calculate_pnl')
             details: Détails supplémentaires à logger
         """
-        details_str = f" | Details: {details}" if details else ""
-        logger.info(f"EXECUTION | Module: {module} | Action: {action}{details_str}")
+        if self._min_level_no > INFO:
+            return
+        # Arguments de formatage: str(details) n'est calculé que si un sink écrit le message
+        if details:
+            logger.info(
+                "EXECUTION | Module: {} | Action: {} | Details: {}", module, action, details,
+                event='EXECUTION', module=module, action=action, details=details
+            )
+        else:
+            logger.info(
+                "EXECUTION | Module: {} | Action: {}", module, action,
+                event='EXECUTION', module=module, action=action
+            )
     
     def log_decision(self, module: str, decision: str, reason: str, **kwargs) -> None:
         """
@@ -110,9 +269,11 @@ class PortfolioLogger:
             decision: Décision prise (ex: 'convert_to_usdt', 'rebase_price')
             reason: Raison de la décision
         """
+        if self._min_level_no > INFO:
+            return
         logger.info(
-            f"DECISION | Module: {module} | Decision: {decision} | Reason: {reason}",
-            **kwargs
+            "DECISION | Module: {} | Decision: {} | Reason: {}", module, decision, reason,
+            event='DECISION', module=module, decision=decision, reason=reason, **kwargs
         )
     
     def log_transaction(self, transaction_type: str, asset: str, amount: float, 
@@ -126,11 +287,17 @@ class PortfolioLogger:
             amount: Montant de la transaction
             price: Prix de la transaction (optionnel)
         """
-        price_str = f" | Price: {price}" if price else ""
+        if self._min_level_no > INFO:
+            return
+        template = "TRANSACTION | Type: {} | Asset: {} | Amount: {}"
+        args = [transaction_type, asset, amount]
+        if price:
+            template += " | Price: {}"
+            args.append(price)
         logger.info(
-            f"TRANSACTION | Type: {transaction_type} | Asset: {asset} | "
-            f"Amount: {amount}{price_str}",
-            **kwargs
+            template, *args,
+            event='TRANSACTION', transaction_type=transaction_type, asset=asset,
+            amount=amount, price=price, **kwargs
         )
     
     def log_alert(self, alert_type: str, message: str, severity: str = 'WARNING', **kwargs) -> None:
@@ -142,8 +309,16 @@ class PortfolioLogger:
             message: Message d'alerte
             severity: Niveau de sévérité (INFO, WARNING, ERROR, CRITICAL)
         """
-        log_method = getattr(logger, severity.lower(), logger.warning)
-        log_method(f"ALERT | Type: {alert_type} | Message: {message}", **kwargs)
+        try:
+            level = logger.level(severity.upper())
+        except ValueError:
+            level = logger.level('WARNING')
+        if level.no < self._min_level_no:
+            return
+        logger.log(
+            level.name, "ALERT | Type: {} | Message: {}", alert_type, message,
+            event='ALERT', alert_type=alert_type, alert_message=message, **kwargs
+        )
 
 
 # Instance globale de logger (sera initialisée lors de l'import)
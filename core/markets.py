@@ -0,0 +1,319 @@
+"""
+Métadonnées de marchés: cache disque de load_markets et index précision/limites par symbole
+"""
+
+import gc
+import math
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Version du format du fichier de cache (à incrémenter si son contenu change)
+CACHE_FORMAT = 1
+
+# Attributs ccxt remplis par set_markets: restaurés tels quels, sans refaire les index
+# (set_markets coûte ~0.2 s pour 3000 marchés), si la version de ccxt est celle de l'écriture
+MARKET_ATTRIBUTES = (
+    'markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id',
+    'codes', 'baseCurrencies', 'quoteCurrencies',
+)
+
+# Valeurs par défaut de 'exchange.markets_cache'
+MARKET_CACHE_DEFAULTS = {
+    'enabled': False,
+    'directory': 'storage/markets',
+    'max_age_hours': 24.0,  # Au-delà, le cache est rafraîchi
+    'refresh_in_background': True,  # Cache périmé utilisé pendant le rafraîchissement
+}
+
+# Modes de précision ccxt (ccxt.DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE)
+DECIMAL_PLACES = 2
+SIGNIFICANT_DIGITS = 3
+TICK_SIZE = 4
+
+
+def _ccxt_version() -> Optional[str]:
+    """Version de ccxt installée (structures internes propres à chaque version)"""
+    import ccxt
+    return getattr(ccxt, '__version__', None)
+
+
+def market_cache_settings(exchange_config: Mapping[str, Any]) -> Dict[str, Any]:
+    """Réglages du cache de marchés ('exchange.markets_cache' complété des valeurs par défaut)"""
+    return {**MARKET_CACHE_DEFAULTS, **(exchange_config.get('markets_cache', {}) or {})}
+
+
+class MarketCache:
+    """
+    Fichier de cache des marchés d'un exchange (sortie de load_markets)
+    
+    Écriture atomique (fichier temporaire puis renommage); un fichier illisible
+    ou d'un autre format est traité comme absent.
+    """
+    
+    def __init__(self, path: Path, max_age_seconds: float):
+        """
+        Args:
+            path: Fichier de cache
+            max_age_seconds: Âge au-delà duquel le contenu doit être rafraîchi
+        """
+        self.path = Path(path)
+        self.max_age_seconds = float(max_age_seconds)
+    
+    @classmethod
+    def from_config(cls, exchange_config: Mapping[str, Any]) -> Optional['MarketCache']:
+        """
+        Construit le cache depuis la section 'exchange' (un fichier par exchange, testnet à part)
+        
+        Returns:
+            Instance MarketCache, ou None si 'exchange.markets_cache.enabled' est faux
+        """
+        settings = market_cache_settings(exchange_config)
+        if not settings['enabled']:
+            return None
+        name = exchange_config.get('name', 'binance').lower()
+        if exchange_config.get('testnet', False):
+            name = f"{name}-testnet"
+        return cls(Path(settings['directory']) / f"{name}.markets", float(settings['max_age_hours']) * 3600)
+    
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Lit le cache
+        
+        Returns:
+            Entrée {'format', 'ccxt', 'fetched_at', 'state'} (state: attributs de MARKET_ATTRIBUTES),
+            ou None si absente
+        """
+        # Des dizaines de milliers de petits dicts: le ramasse-miettes triplerait la durée
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # Fichier écrit par ce module à partir des réponses de l'exchange
+            with open(self.path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+        if not isinstance(entry, dict) or entry.get('format') != CACHE_FORMAT:
+            return None
+        if not isinstance(entry.get('state'), dict) or not entry['state'].get('markets'):
+            return None
+        return entry
+    
+    def save(self, exchange: Any) -> bool:
+        """
+        Écrit le cache depuis une instance ccxt dont les marchés sont chargés
+        
+        Returns:
+            True si le fichier a été écrit
+        """
+        state = {name: getattr(exchange, name, None) for name in MARKET_ATTRIBUTES}
+        if not state['markets']:
+            return False
+        entry = {
+            'format': CACHE_FORMAT,
+            'ccxt': _ccxt_version(),
+            'fetched_at': time.time(),
+            'state': {name: value for name, value in state.items() if value is not None},
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+            return True
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+    
+    def age(self, entry: Mapping[str, Any], now: Optional[float] = None) -> float:
+        """Âge d'une entrée en secondes"""
+        return (time.time() if now is None else now) - float(entry.get('fetched_at', 0.0))
+    
+    def is_stale(self, entry: Mapping[str, Any], now: Optional[float] = None) -> bool:
+        """Indique si une entrée doit être rafraîchie"""
+        return self.age(entry, now) > self.max_age_seconds
+    
+    def apply(self, exchange: Any) -> Optional[Dict[str, Any]]:
+        """
+        Injecte les marchés en cache dans une instance ccxt (load_markets ne télécharge plus)
+        
+        Les attributs sont restaurés directement si le cache a été écrit par la même
+        version de ccxt; sinon les index sont reconstruits par set_markets.
+        
+        Returns:
+            Entrée appliquée, ou None si le cache est absent
+        """
+        entry = self.load()
+        if entry is None:
+            return None
+        state = entry['state']
+        restorable = state.keys() >= {'markets', 'markets_by_id', 'symbols', 'currencies'}
+        if restorable and entry.get('ccxt') is not None and entry.get('ccxt') == _ccxt_version():
+            for name, value in state.items():
+                setattr(exchange, name, value)
+        else:
+            exchange.set_markets(state['markets'], state.get('currencies') or None)
+        return entry
+
+
+class MarketLimits(NamedTuple):
+    """Précision (pas) et limites d'un symbole (NaN = non défini)"""
+    
+    amount_step: float
+    price_step: float
+    min_amount: float
+    max_amount: float
+    min_price: float
+    max_price: float
+    min_cost: float
+    max_cost: float
+
+
+def _step(value: Any, precision_mode: int) -> float:
+    """Convertit une précision ccxt en pas (NaN si inconnue ou en chiffres significatifs)"""
+    if value is None:
+        return math.nan
+    if precision_mode == TICK_SIZE:
+        return float(value)
+    if precision_mode == DECIMAL_PLACES:
+        return 10.0 ** -float(value)
+    return math.nan
+
+
+def _number(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+class MarketIndex:
+    """
+    Index symbole -> précision et limites, pour valider la taille des ordres
+    
+    Une matrice float64 (une ligne par symbole, une colonne par champ de
+    MarketLimits) et un dict symbole -> ligne: quelques dizaines d'octets par
+    symbole au lieu des structures ccxt complètes (réponse brute comprise).
+    """
+    
+    COLUMNS = MarketLimits._fields
+    
+    def __init__(self, symbols: Sequence[str], values: 'np.ndarray'):
+        """
+        Args:
+            symbols: Symboles, dans l'ordre des lignes
+            values: Matrice (len(symbols), len(COLUMNS)) de pas et limites
+        """
+        if values.shape != (len(symbols), len(self.COLUMNS)):
+            raise ValueError(f"Matrice de forme {values.shape} pour {len(symbols)} symboles")
+        self.values = values
+        self._rows: Dict[str, int] = {symbol: row for row, symbol in enumerate(symbols)}
+    
+    @classmethod
+    def from_markets(cls, markets: Mapping[str, Mapping[str, Any]],
+                     precision_mode: int = TICK_SIZE) -> 'MarketIndex':
+        """
+        Construit l'index depuis exchange.markets
+        
+        Args:
+            markets: Marchés ccxt indexés par symbole
+            precision_mode: exchange.precisionMode (pas de prix/quantité en TICK_SIZE)
+        
+        Returns:
+            Instance MarketIndex
+        """
+        import numpy as np
+        
+        symbols = list(markets)
+        values = np.full((len(symbols), len(cls.COLUMNS)), np.nan)
+        for row, symbol in enumerate(symbols):
+            market = markets[symbol]
+            precision = market.get('precision') or {}
+            limits = market.get('limits') or {}
+            amount = limits.get('amount') or {}
+            price = limits.get('price') or {}
+            cost = limits.get('cost') or {}
+            values[row] = (
+                _step(precision.get('amount'), precision_mode), _step(precision.get('price'), precision_mode),
+                _number(amount.get('min')), _number(amount.get('max')),
+                _number(price.get('min')), _number(price.get('max')),
+                _number(cost.get('min')), _number(cost.get('max')),
+            )
+        return cls(symbols, values)
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._rows
+    
+    @property
+    def nbytes(self) -> int:
+        """Taille de la matrice de valeurs en octets"""
+        return self.values.nbytes
+    
+    def get(self, symbol: str) -> Optional[MarketLimits]:
+        """Précision et limites d'un symbole (None s'il est inconnu)"""
+        row = self._rows.get(symbol)
+        if row is None:
+            return None
+        return MarketLimits(*self.values[row].tolist())
+    
+    def round_amount(self, symbol: str, amount: float) -> float:
+        """
+        Arrondit une quantité au pas du symbole, par défaut (jamais au-delà de la quantité demandée)
+        
+        Raises:
+            KeyError: Symbole inconnu
+        """
+        step = self.values[self._rows[symbol], 0]
+        if not step > 0:
+            return amount
+        # Tolérance relative: 0.3 / 0.1 = 2.9999999999999996
+        return math.floor(amount / step + 1e-9) * step
+    
+    def validate_order(self, symbol: str, amount: float, price: Optional[float] = None) -> List[str]:
+        """
+        Vérifie un ordre contre la précision et les limites du symbole
+        
+        Args:
+            symbol: Symbole (ex: 'BTC/USDT')
+            amount: Quantité en asset de base
+            price: Prix (vérifications de prix et de montant ignorées si None)
+        
+        Returns:
+            Violations constatées (liste vide si l'ordre est valide)
+        """
+        limits = self.get(symbol)
+        if limits is None:
+            return [f"{symbol}: marché inconnu"]
+        errors = []
+        
+        if limits.amount_step > 0 and abs(self.round_amount(symbol, amount) - amount) > limits.amount_step * 1e-6:
+            errors.append(f"quantité {amount} hors du pas {limits.amount_step}")
+        if amount < limits.min_amount:
+            errors.append(f"quantité {amount} < minimum {limits.min_amount}")
+        if amount > limits.max_amount:
+            errors.append(f"quantité {amount} > maximum {limits.max_amount}")
+        
+        if price is not None:
+            if price < limits.min_price:
+                errors.append(f"prix {price} < minimum {limits.min_price}")
+            if price > limits.max_price:
+                errors.append(f"prix {price} > maximum {limits.max_price}")
+            cost = amount * price
+            if cost < limits.min_cost:
+                errors.append(f"montant {cost} < minimum {limits.min_cost}")
+            if cost > limits.max_cost:
+                errors.append(f"montant {cost} > maximum {limits.max_cost}")
+        return errors
@@ -0,0 +1,295 @@
+"""
+Flux de prix temps réel par WebSocket et carnet des derniers prix en mémoire
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import aiohttp
+from .config_loader import get_config
+from .logger import get_logger
+
+
+DEFAULT_STREAM_URL = 'wss://stream.binance.com:9443/ws'
+
+
+class PriceBook:
+    """Carnet thread-safe des derniers tickers reçus par symbole"""
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialise le carnet
+        
+        Args:
+            clock: Horloge monotone utilisée pour l'âge des entrées
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple] = {}
+    
+    def update(self, symbol: str, ticker: Dict[str, Any]) -> None:
+        """
+        Enregistre le dernier ticker d'un symbole
+        
+        Args:
+            symbol: Symbole de trading (ex: 'BTC/USDT')
+            ticker: Ticker au format du projet (voir exchange.format_ticker)
+        """
+        with self._lock:
+            self._entries[symbol] = (self._clock(), ticker)
+    
+    def get(self, symbol: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Retourne le dernier ticker d'un symbole
+        
+        Args:
+            symbol: Symbole de trading
+            max_age: Âge maximum accepté en secondes (None = pas de limite)
+        
+        Returns:
+            Copie du ticker, ou None si absent ou trop ancien
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+        if entry is None:
+            return None
+        received_at, ticker = entry
+        if max_age is not None and self._clock() - received_at > max_age:
+            return None
+        return dict(ticker)
+    
+    def get_last_price(self, symbol: str, max_age: Optional[float] = None) -> Optional[float]:
+        """Retourne le dernier prix d'un symbole (None si absent ou trop ancien)"""
+        ticker = self.get(symbol, max_age)
+        return ticker['last'] if ticker else None
+    
+    def age(self, symbol: str) -> Optional[float]:
+        """Retourne l'âge en secondes de la dernière mise à jour d'un symbole"""
+        with self._lock:
+            entry = self._entries.get(symbol)
+        return self._clock() - entry[0] if entry else None
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Retourne une copie de tous les derniers tickers"""
+        with self._lock:
+            return {symbol: dict(ticker) for symbol, (_, ticker) in self._entries.items()}
+    
+    def symbols(self) -> List[str]:
+        """Retourne les symboles présents dans le carnet"""
+        with self._lock:
+            return list(self._entries)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def stream_name(symbol: str) -> str:
+    """
+    Convertit un symbole en nom de flux ticker Binance (ex: 'BTC/USDT' -> 'btcusdt@ticker')
+    
+    Args:
+        symbol: Symbole de trading
+    
+    Returns:
+        Nom du flux
+    """
+    return f"{symbol.replace('/', '').lower()}@ticker"
+
+
+def parse_ticker_event(payload: Dict[str, Any], symbol: str) -> Dict[str, Any]:
+    """
+    Convertit un événement '24hrTicker' Binance au format du projet
+    
+    Args:
+        payload: Événement brut (champs c, b, a, h, l, q, E)
+        symbol: Symbole de trading correspondant
+    
+    Returns:
+        Ticker au format du projet
+    """
+    timestamp = payload.get('E')
+    return {
+        'symbol': symbol,
+        'last': float(payload['c']),
+        'bid': float(payload['b']) if payload.get('b') is not None else None,
+        'ask': float(payload['a']) if payload.get('a') is not None else None,
+        'high': float(payload['h']) if payload.get('h') is not None else None,
+        'low': float(payload['l']) if payload.get('l') is not None else None,
+        'volume': float(payload['q']) if payload.get('q') is not None else None,
+        'timestamp': timestamp,
+        'datetime': (
+            datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).isoformat()
+            if timestamp else None
+        ),
+    }
+
+
+class PriceFeed:
+    """Abonnement WebSocket aux tickers, avec reconnexion et réabonnement automatiques"""
+    
+    def __init__(self, symbols: Optional[Iterable[str]] = None,
+                 config_path: Optional[str] = None,
+                 price_book: Optional[PriceBook] = None,
+                 on_update: Optional[Callable[[str, Dict[str, Any]], None]] = None):
+        """
+        Initialise le flux de prix (aucune connexion avant start())
+        
+        Args:
+            symbols: Symboles à suivre (ex: ['BTC/USDT', 'ETH/USDT'])
+            config_path: Chemin vers le fichier de configuration
+            price_book: Carnet à alimenter (créé si None)
+            on_update: Callback appelé après chaque mise à jour du carnet
+        """
+        self.config = get_config(config_path).get('price_feed', {}) or {}
+        self.logger = get_logger(config_path)
+        self.url = self.config.get('url', DEFAULT_STREAM_URL)
+        self.reconnect_delay = float(self.config.get('reconnect_delay_seconds', 1.0))
+        self.max_reconnect_delay = float(self.config.get('max_reconnect_delay_seconds', 30.0))
+        self.price_book = price_book if price_book is not None else PriceBook()
+        self.on_update = on_update
+        
+        self._streams: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._request_id = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._connected = threading.Event()
+        self.stats = {'connects': 0, 'reconnects': 0, 'messages': 0, 'updates': 0, 'errors': 0}
+        
+        for symbol in symbols or []:
+            self._streams[stream_name(symbol)] = symbol
+    
+    @property
+    def connected(self) -> bool:
+        """Indique si la connexion WebSocket est active"""
+        return self._connected.is_set()
+    
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """Attend l'établissement de la connexion (True si connecté)"""
+        return self._connected.wait(timeout)
+    
+    def start(self) -> None:
+        """Démarre le flux dans un thread dédié avec sa propre boucle asyncio"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._loop = asyncio.new_event_loop()
+        # Tâche créée avant le thread: stop() peut l'annuler même si la boucle n'a pas encore tourné
+        self._task = self._loop.create_task(self._run())
+        self._thread = threading.Thread(target=self._run_loop, name='price-feed', daemon=True)
+        self._thread.start()
+        self.logger.log_info(f"Flux de prix démarré ({len(self._streams)} symboles)", url=self.url)
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Arrête le flux et ferme la connexion"""
+        if self._loop is None or self._thread is None:
+            return
+        if self._task is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._task.cancel)
+        self._thread.join(timeout)
+        self._thread = None
+        self._task = None
+        self._loop = None
+        self._connected.clear()
+        self.logger.log_info("Flux de prix arrêté", **self.stats)
+    
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        """
+        Ajoute des symboles au flux (envoyé immédiatement si connecté)
+        
+        Args:
+            symbols: Symboles à suivre
+        """
+        new_streams = []
+        with self._lock:
+            for symbol in symbols:
+                name = stream_name(symbol)
+                if name not in self._streams:
+                    self._streams[name] = symbol
+                    new_streams.append(name)
+        
+        if new_streams and self._loop is not None and self._ws is not None:
+            asyncio.run_coroutine_threadsafe(self._send_subscribe(new_streams), self._loop)
+    
+    def _run_loop(self) -> None:
+        """Point d'entrée du thread du flux"""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
+    
+    async def _run(self) -> None:
+        """Boucle de connexion avec reconnexion exponentielle"""
+        delay = self.reconnect_delay
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    async with session.ws_connect(self.url, heartbeat=30) as ws:
+                        self._ws = ws
+                        self.stats['connects'] += 1
+                        delay = self.reconnect_delay
+                        with self._lock:
+                            streams = list(self._streams)
+                        if streams:
+                            await self._send_subscribe(streams)
+                        self._connected.set()
+                        await self._consume(ws)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    self.logger.log_warning(f"Flux de prix déconnecté: {e}")
+                finally:
+                    self._ws = None
+                    self._connected.clear()
+                
+                self.stats['reconnects'] += 1
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+    
+    async def _consume(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Lit les messages jusqu'à la fermeture de la connexion"""
+        async for message in ws:
+            if message.type == aiohttp.WSMsgType.TEXT:
+                self._handle_message(message.data)
+            elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                break
+    
+    async def _send_subscribe(self, streams: List[str]) -> None:
+        """Envoie une requête SUBSCRIBE pour les flux donnés"""
+        ws = self._ws
+        if ws is None or ws.closed:
+            return
+        self._request_id += 1
+        await ws.send_str(json.dumps({'method': 'SUBSCRIBE', 'params': streams, 'id': self._request_id}))
+    
+    def _handle_message(self, raw: str) -> None:
+        """Met à jour le carnet à partir d'un message brut"""
+        self.stats['messages'] += 1
+        try:
+            message = json.loads(raw)
+            # Flux combinés: {"stream": "...", "data": {...}}
+            payload = message.get('data', message)
+            if payload.get('e') != '24hrTicker':
+                return  # Réponse de souscription ou autre événement
+            symbol = self._streams.get(f"{payload['s'].lower()}@ticker")
+            if symbol is None:
+                return
+            ticker = parse_ticker_event(payload, symbol)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.stats['errors'] += 1
+            self.logger.log_debug("Message du flux de prix ignoré: {}", e)
+            return
+        
+        self.price_book.update(symbol, ticker)
+        self.stats['updates'] += 1
+        if self.on_update is not None:
+            self.on_update(symbol, ticker)
@@ -0,0 +1,339 @@
+"""
+Limiteur de débit partagé, basé sur le poids des requêtes (modèle "request weight" de Binance)
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+
+PRIORITY_HIGH = 'high'
+PRIORITY_LOW = 'low'
+
+# Poids des endpoints REST Binance spot utilisés par ccxt
+ENDPOINT_WEIGHTS = {
+    'fetch_ticker': 2,
+    'fetch_balance': 20,
+    'load_markets': 20,
+    'fetch_ohlcv': 2,
+    'fetch_order_book': 5,
+}
+
+# Priorité des appels du contexte courant (threads et coroutines)
+_priority: contextvars.ContextVar = contextvars.ContextVar('rate_limit_priority', default=PRIORITY_HIGH)
+
+
+def tickers_weight(symbol_count: Optional[int]) -> int:
+    """
+    Poids de fetch_tickers selon le nombre de symboles (None = tout le marché)
+    
+    Args:
+        symbol_count: Nombre de symboles demandés
+    
+    Returns:
+        Poids de la requête
+    """
+    if not symbol_count or symbol_count > 100:
+        return 80
+    if symbol_count > 20:
+        return 40
+    return 2
+
+
+def ban_errors(ccxt_module: Any) -> tuple:
+    """
+    Exceptions ccxt signalant un dépassement de limite (HTTP 429 / 418)
+    
+    Args:
+        ccxt_module: Module ccxt (sync ou async_support)
+    
+    Returns:
+        Tuple de classes d'exception (vide si le module n'en expose pas)
+    """
+    errors = (getattr(ccxt_module, name, None) for name in ('DDoSProtection', 'RateLimitExceeded'))
+    return tuple(e for e in errors if isinstance(e, type) and issubclass(e, BaseException))
+
+
+@contextlib.contextmanager
+def background() -> Iterator[None]:
+    """Exécute les appels du bloc en basse priorité (tests de connexion, tâches de fond)"""
+    token = _priority.set(PRIORITY_LOW)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class WeightRateLimiter:
+    """
+    Seau à jetons exprimé en poids de requête, partagé par les appels sync et async
+    
+    Le seau se remplit de weight_per_minute par minute. Les appels de basse priorité
+    ne peuvent pas entamer la réserve (reserve_percent de la capacité), gardée pour
+    les lectures de balances et de tickers. Le budget est recalé sur le poids
+    consommé annoncé par l'exchange (en-tête de réponse).
+    """
+    
+    def __init__(self, weight_per_minute: float = 6000, reserve_percent: float = 20.0,
+                 used_weight_header: str = 'x-mbx-used-weight-1m',
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialise un seau plein
+        
+        Args:
+            weight_per_minute: Poids autorisé par minute
+            reserve_percent: Part de la capacité réservée aux appels prioritaires
+            used_weight_header: En-tête donnant le poids consommé sur la minute
+            clock: Horloge monotone (secondes)
+        """
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._set_budget(weight_per_minute, reserve_percent, used_weight_header)
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._high_waiting = 0
+        self.stats = {'acquired': 0, 'waits': 0, 'waited_seconds': 0.0, 'header_updates': 0, 'bans': 0}
+    
+    def _set_budget(self, weight_per_minute: float, reserve_percent: float, used_weight_header: str) -> None:
+        self.capacity = float(weight_per_minute)
+        self.rate = self.capacity / 60.0
+        self.reserve = self.capacity * reserve_percent / 100.0
+        self.used_weight_header = used_weight_header.lower()
+        self.settings = (self.capacity, float(reserve_percent), self.used_weight_header)
+    
+    def configure(self, weight_per_minute: float, reserve_percent: float = 20.0,
+                  used_weight_header: str = 'x-mbx-used-weight-1m') -> None:
+        """
+        Applique un nouveau budget sans perdre le poids déjà consommé (rechargement de configuration)
+        
+        Args:
+            weight_per_minute: Poids autorisé par minute
+            reserve_percent: Part de la capacité réservée aux appels prioritaires
+            used_weight_header: En-tête donnant le poids consommé sur la minute
+        """
+        with self._cond:
+            self._refill(self.clock())
+            used = self.capacity - self._tokens
+            self._set_budget(weight_per_minute, reserve_percent, used_weight_header)
+            self._tokens = max(0.0, self.capacity - used)
+            self._cond.notify_all()
+    
+    @property
+    def available(self) -> float:
+        """Poids disponible immédiatement"""
+        with self._cond:
+            self._refill(self.clock())
+            return self._tokens
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def _try_acquire(self, weight: float, priority: str) -> float:
+        """Consomme le poids si possible (verrou acquis); sinon retourne l'attente estimée"""
+        now = self.clock()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        self._refill(now)
+        
+        floor = 0.0
+        if priority == PRIORITY_LOW:
+            if self._high_waiting:
+                return max(weight / self.rate, 0.01)
+            floor = self.reserve
+        # Une requête plus lourde que la capacité passe dès que le seau est plein
+        needed = min(weight + floor, self.capacity)
+        if self._tokens >= needed:
+            self._tokens -= weight
+            self.stats['acquired'] += 1
+            return 0.0
+        return (needed - self._tokens) / self.rate
+    
+    def acquire(self, weight: float = 1, priority: Optional[str] = None,
+                timeout: Optional[float] = None) -> bool:
+        """
+        Attend que le poids soit disponible puis le consomme (appels synchrones)
+        
+        Args:
+            weight: Poids de la requête
+            priority: PRIORITY_HIGH ou PRIORITY_LOW (défaut: priorité du contexte)
+            timeout: Attente maximum (None = illimitée)
+        
+        Returns:
+            False si le délai a expiré sans obtenir le poids
+        """
+        priority = priority or _priority.get()
+        deadline = None if timeout is None else self.clock() + timeout
+        start = self.clock()
+        with self._cond:
+            delay = self._try_acquire(weight, priority)
+            if delay == 0.0:
+                return True
+            self.stats['waits'] += 1
+            if priority == PRIORITY_HIGH:
+                self._high_waiting += 1
+            try:
+                while delay > 0.0:
+                    if deadline is not None:
+                        remaining = deadline - self.clock()
+                        if remaining <= 0:
+                            return False
+                        delay = min(delay, remaining)
+                    self._cond.wait(delay)
+                    delay = self._try_acquire(weight, priority)
+            finally:
+                if priority == PRIORITY_HIGH:
+                    self._high_waiting -= 1
+                    self._cond.notify_all()
+                self.stats['waited_seconds'] += self.clock() - start
+        return True
+    
+    async def acquire_async(self, weight: float = 1, priority: Optional[str] = None) -> None:
+        """
+        Attend que le poids soit disponible puis le consomme (coroutines)
+        
+        Args:
+            weight: Poids de la requête
+            priority: PRIORITY_HIGH ou PRIORITY_LOW (défaut: priorité du contexte)
+        """
+        priority = priority or _priority.get()
+        with self._cond:
+            delay = self._try_acquire(weight, priority)
+            if delay == 0.0:
+                return
+            self.stats['waits'] += 1
+            if priority == PRIORITY_HIGH:
+                self._high_waiting += 1
+        start = self.clock()
+        try:
+            while delay > 0.0:
+                await asyncio.sleep(delay)
+                with self._cond:
+                    delay = self._try_acquire(weight, priority)
+        finally:
+            with self._cond:
+                if priority == PRIORITY_HIGH:
+                    self._high_waiting -= 1
+                    self._cond.notify_all()
+                self.stats['waited_seconds'] += self.clock() - start
+    
+    def update_from_headers(self, headers: Any, status: Optional[int] = None) -> None:
+        """
+        Recale le budget sur les en-têtes de la dernière réponse
+        
+        Args:
+            headers: En-têtes HTTP de la réponse (ignorés s'ils ne sont pas un mapping)
+            status: Code HTTP (429/418: pause jusqu'à Retry-After)
+        """
+        if not isinstance(headers, Mapping):
+            if status not in (418, 429):
+                return
+            headers = {}
+        lowered = {str(k).lower(): v for k, v in headers.items()}
+        with self._cond:
+            now = self.clock()
+            self._refill(now)
+            used = lowered.get(self.used_weight_header)
+            if used is not None:
+                try:
+                    # Le serveur fait foi: ne jamais croire disposer de plus qu'il ne reste
+                    self._tokens = min(self._tokens, self.capacity - float(used))
+                    self.stats['header_updates'] += 1
+                except (TypeError, ValueError):
+                    pass
+            if status in (418, 429):
+                self.stats['bans'] += 1
+                try:
+                    retry_after = float(lowered.get('retry-after', 60))
+                except (TypeError, ValueError):
+                    retry_after = 60.0
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+                self._tokens = 0.0
+    
+    def call(self, weight: float, func: Callable[..., Any], *args, exchange: Any = None,
+             priority: Optional[str] = None, ban_errors: tuple = (), **kwargs) -> Any:
+        """
+        Exécute un appel synchrone après avoir obtenu son poids
+        
+        Args:
+            weight: Poids de la requête
+            func: Fonction à appeler (ex: exchange.fetch_balance)
+            exchange: Instance ccxt dont lire last_response_headers après l'appel
+            priority: Priorité de l'appel (défaut: priorité du contexte)
+            ban_errors: Exceptions signalant un dépassement (429/418) et déclenchant une pause
+        
+        Returns:
+            Résultat de func
+        """
+        self.acquire(weight, priority)
+        status = None
+        try:
+            return func(*args, **kwargs)
+        except ban_errors:
+            status = 429
+            raise
+        finally:
+            self._after_call(exchange, status)
+    
+    async def call_async(self, weight: float, func: Callable[..., Any], *args, exchange: Any = None,
+                         priority: Optional[str] = None, ban_errors: tuple = (), **kwargs) -> Any:
+        """Équivalent asynchrone de call (func retourne une coroutine)"""
+        await self.acquire_async(weight, priority)
+        status = None
+        try:
+            return await func(*args, **kwargs)
+        except ban_errors:
+            status = 429
+            raise
+        finally:
+            self._after_call(exchange, status)
+    
+    def _after_call(self, exchange: Any, status: Optional[int]) -> None:
+        headers = getattr(exchange, 'last_response_headers', None) if exchange is not None else None
+        self.update_from_headers(headers, status)
+
+
+# Limiteurs partagés par exchange (sync et async utilisent le même budget)
+_limiters: Dict[str, WeightRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(exchange_config: Mapping[str, Any]) -> Optional[WeightRateLimiter]:
+    """
+    Obtient le limiteur partagé de l'exchange configuré ('exchange.rate_limit')
+    
+    Un budget par exchange, ou par compte ('account') dans un pool multi-comptes;
+    'rate_limit.key' force le partage d'un budget (ex: limite par IP commune).
+    
+    Args:
+        exchange_config: Section 'exchange' de la configuration
+    
+    Returns:
+        Instance WeightRateLimiter, ou None si le limiteur est désactivé
+    """
+    limit_config = exchange_config.get('rate_limit', {}) or {}
+    if not limit_config.get('enabled', True):
+        return None
+    name = exchange_config.get('name', 'binance').lower()
+    if limit_config.get('key'):
+        name = str(limit_config['key'])
+    elif exchange_config.get('account'):
+        name = f"{name}:{exchange_config['account']}"
+    budget = {
+        'weight_per_minute': limit_config.get('weight_per_minute', 6000),
+        'reserve_percent': limit_config.get('reserve_percent', 20.0),
+        'used_weight_header': limit_config.get('used_weight_header', 'x-mbx-used-weight-1m'),
+    }
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = _limiters[name] = WeightRateLimiter(**budget)
+        elif limiter.settings != (float(budget['weight_per_minute']), float(budget['reserve_percent']),
+                                  budget['used_weight_header'].lower()):
+            # Budget modifié (rechargement): le limiteur partagé est reconfiguré en place
+            limiter.configure(**budget)
+        return limiter
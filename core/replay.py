@@ -0,0 +1,413 @@
+"""
+Transport HTTP d'enregistrement et de rejeu des réponses de l'exchange
+
+En mode 'record', chaque réponse brute reçue par ccxt (statut, en-têtes utiles,
+corps) est ajoutée avec son horodatage à un fichier JSONL compressé. En mode
+'replay', ces réponses sont resservies sans réseau, à la vitesse d'origine,
+N fois plus vite ou sans attente: ccxt, la valorisation, les règles et le
+stockage tournent comme en production sur une journée de marché réelle.
+
+Le rejeu est déterministe: les réponses d'une même requête (méthode, chemin et
+paramètres hors signature/horodatage) sont servies dans l'ordre d'enregistrement.
+
+Usage:
+    python -m core.replay info storage/recordings/binance.jsonl.gz
+"""
+
+import argparse
+import atexit
+import gzip
+import http
+import json
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .http_pool import PooledAdapter, ConnectionStats, SharedSession, pool_settings, get_session, http_settings
+
+
+# Version du format des enregistrements
+RECORDING_FORMAT = 1
+
+# Valeurs par défaut de 'exchange.transport'
+TRANSPORT_DEFAULTS = {
+    'mode': 'live',  # live, record ou replay
+    'path': 'storage/recordings/binance.jsonl.gz',
+    'speed': 1.0,  # Rejeu: 1 = temps réel, N = N fois plus vite, 0 = sans attente
+}
+
+TRANSPORT_MODES = ('live', 'record', 'replay')
+
+# Paramètres propres à chaque requête signée, exclus de la clé (et jamais enregistrés)
+VOLATILE_PARAMS = frozenset({'signature', 'timestamp', 'recvWindow', 'nonce'})
+
+# En-têtes de réponse conservés (poids consommé lu par le limiteur, Retry-After)
+KEPT_HEADERS = ('content-type', 'retry-after')
+KEPT_HEADER_PREFIXES = ('x-mbx-', 'x-sapi-')
+
+# Délai max entre deux écritures sur disque de l'enregistrement (secondes)
+FLUSH_INTERVAL = 1.0
+
+
+def transport_settings(exchange_config: Mapping[str, Any]) -> Dict[str, Any]:
+    """Réglages du transport ('exchange.transport' complété des valeurs par défaut)"""
+    settings = {**TRANSPORT_DEFAULTS, **(exchange_config.get('transport', {}) or {})}
+    if settings['mode'] not in TRANSPORT_MODES:
+        raise ValueError(f"Mode de transport invalide: {settings['mode']} (attendu: {TRANSPORT_MODES})")
+    return settings
+
+
+def request_key(method: str, url: str) -> str:
+    """
+    Clé de rejeu d'une requête: méthode, chemin et paramètres stables triés
+    
+    Args:
+        method: Méthode HTTP
+        url: URL complète (hôte ignoré: miroirs et testnet partagent leurs clés)
+    
+    Returns:
+        Clé (ex: 'GET /api/v3/ticker/24hr?symbol=BTCUSDT')
+    """
+    parts = urlsplit(url)
+    params = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in VOLATILE_PARAMS)
+    query = f"?{urlencode(params)}" if params else ''
+    return f"{method.upper()} {parts.path}{query}"
+
+
+def _kept_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {
+        name.lower(): value for name, value in headers.items()
+        if name.lower() in KEPT_HEADERS or name.lower().startswith(KEPT_HEADER_PREFIXES)
+    }
+
+
+class Recorder:
+    """
+    Écrit les réponses dans un fichier JSONL gzip (ajout: un segment par ouverture)
+    
+    Chaque segment commence par un en-tête {'format', 'started_at'}; chaque
+    réponse donne une ligne {'t': secondes depuis started_at, 'd': durée,
+    'k': clé, 's': statut, 'h': en-têtes, 'b': corps} ou {'t', 'd', 'k', 'e': erreur}.
+    Les corps contiennent les données du compte (balances): à traiter comme telles.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._file = gzip.open(self.path, 'at', encoding='utf-8')
+        self._last_flush = time.monotonic()
+        self.count = 0
+        self._write({'format': RECORDING_FORMAT, 'started_at': self.started_at})
+        atexit.register(self.close)
+    
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n')
+    
+    def record(self, key: str, started: float, response: Optional[requests.Response],
+               error: Optional[BaseException] = None) -> None:
+        """
+        Ajoute une réponse (ou l'erreur de transport) à l'enregistrement
+        
+        Args:
+            key: Clé de la requête (voir request_key)
+            started: time.perf_counter() à l'envoi de la requête
+            response: Réponse reçue (None en cas d'erreur)
+            error: Erreur de transport (délai dépassé, connexion refusée...)
+        """
+        now = time.perf_counter()
+        record: Dict[str, Any] = {'t': round(now - self._start, 6), 'd': round(now - started, 6), 'k': key}
+        if response is not None:
+            record.update({
+                's': response.status_code,
+                'h': _kept_headers(response.headers),
+                'b': response.content.decode('utf-8', errors='replace'),
+            })
+        else:
+            record['e'] = f"{type(error).__name__}: {error}"
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write(record)
+            self.count += 1
+            if time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+                self._file.flush()
+                self._last_flush = time.monotonic()
+    
+    def close(self) -> None:
+        """Ferme le fichier (membre gzip terminé)"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class RecordingAdapter(BaseAdapter):
+    """Adaptateur requests qui délègue au réseau et enregistre chaque réponse"""
+    
+    def __init__(self, inner: BaseAdapter, recorder: Recorder, pool: Optional[Tuple[Any, ...]] = None):
+        super().__init__()
+        self.inner = inner
+        self.recorder = recorder
+        self.pool = pool
+    
+    @property
+    def stats(self) -> Optional[ConnectionStats]:
+        return getattr(self.inner, 'stats', None)
+    
+    def send(self, request, *args, **kwargs):
+        key = request_key(request.method, request.url)
+        started = time.perf_counter()
+        try:
+            response = self.inner.send(request, *args, **kwargs)
+        except requests.RequestException as e:
+            self.recorder.record(key, started, None, e)
+            raise
+        self.recorder.record(key, started, response)
+        return response
+    
+    def close(self) -> None:
+        self.inner.close()
+
+
+def load_recording(path: Path) -> Tuple[float, List[Dict[str, Any]]]:
+    """
+    Lit un enregistrement
+    
+    Args:
+        path: Fichier JSONL gzip écrit par Recorder
+    
+    Returns:
+        (début du premier segment en epoch, réponses triées par instant absolu 'at')
+    """
+    entries: List[Dict[str, Any]] = []
+    started_at: Optional[float] = None
+    segment_start = 0.0
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if 'format' in record:
+                if record['format'] != RECORDING_FORMAT:
+                    raise ValueError(f"{path}:{line_number}: format d'enregistrement {record['format']} non supporté")
+                segment_start = float(record['started_at'])
+                if started_at is None:
+                    started_at = segment_start
+                continue
+            record['at'] = segment_start + record['t']
+            entries.append(record)
+    if started_at is None:
+        raise ValueError(f"{path}: enregistrement vide")
+    entries.sort(key=lambda entry: entry['at'])
+    return started_at, entries
+
+
+class ReplayExhausted(requests.ConnectionError):
+    """Plus aucune réponse enregistrée pour la requête (fin de l'enregistrement)"""
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Adaptateur requests qui resservit les réponses d'un enregistrement
+    
+    Avec speed > 0, une réponse n'est pas rendue avant son instant
+    d'enregistrement ramené à l'échelle (début du rejeu + décalage / speed):
+    le rythme et les pics de l'enregistrement sont reproduits. Avec speed = 0,
+    les réponses sont rendues sans attente.
+    """
+    
+    def __init__(self, path: Path, speed: float = 1.0):
+        """
+        Args:
+            path: Enregistrement (voir Recorder)
+            speed: Facteur de vitesse (0 = sans attente)
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.speed = float(speed)
+        self.started_at, entries = load_recording(self.path)
+        self.first_at = entries[0]['at'] if entries else self.started_at
+        self.last_at = entries[-1]['at'] if entries else self.started_at
+        self._queues: Dict[str, Deque[Dict[str, Any]]] = {}
+        for entry in entries:
+            self._queues.setdefault(entry['k'], deque()).append(entry)
+        self._lock = threading.Lock()
+        self._replay_start: Optional[float] = None
+        self._clock = self.first_at
+        self.exhausted = False
+        self.stats = {'served': 0, 'errors': 0, 'missing': 0, 'waited_seconds': 0.0}
+        self.total = len(entries)
+    
+    def remaining(self) -> int:
+        """Nombre de réponses encore disponibles"""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+    
+    def set_speed(self, speed: float) -> None:
+        """Change la vitesse en cours de rejeu (la position dans l'enregistrement est conservée)"""
+        with self._lock:
+            speed = float(speed)
+            if speed == self.speed:
+                return
+            if self._replay_start is not None and speed > 0:
+                self._replay_start = time.perf_counter() - (self._clock - self.first_at) / speed
+            self.speed = speed
+    
+    def clock(self) -> float:
+        """
+        Horloge du rejeu: instant d'enregistrement (epoch) de la dernière réponse servie
+        
+        À passer comme horodatage aux règles et aux snapshots pour des résultats
+        identiques d'un rejeu à l'autre.
+        """
+        return self._clock
+    
+    def send(self, request, *args, **kwargs):
+        key = request_key(request.method, request.url)
+        with self._lock:
+            if self._replay_start is None:
+                self._replay_start = time.perf_counter()
+            queue = self._queues.get(key)
+            if not queue:
+                self.stats['missing'] += 1
+                self.exhausted = True
+                raise ReplayExhausted(
+                    f"{key}: {'réponses épuisées' if queue is not None else 'absente de l’enregistrement'}",
+                    request=request
+                )
+            entry = queue.popleft()
+            self._clock = max(self._clock, entry['at'])
+        if self.speed > 0:
+            delay = self._replay_start + (entry['at'] - self.first_at) / self.speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+                with self._lock:
+                    self.stats['waited_seconds'] += delay
+        with self._lock:
+            self.stats['served'] += 1
+        if 'e' in entry:
+            with self._lock:
+                self.stats['errors'] += 1
+            raise requests.ConnectionError(f"Erreur enregistrée: {entry['e']}", request=request)
+        return self._response(request, entry)
+    
+    def _response(self, request, entry: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry['s']
+        try:
+            response.reason = http.HTTPStatus(entry['s']).phrase
+        except ValueError:
+            response.reason = ''
+        response.headers = CaseInsensitiveDict(entry.get('h', {}))
+        response._content = entry['b'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+    
+    def close(self) -> None:
+        pass
+
+
+# Sessions d'enregistrement / de rejeu partagées par (mode, fichier)
+_transports: Dict[Tuple[str, str], SharedSession] = {}
+_transports_lock = threading.Lock()
+
+
+def transport_session(exchange_config: Mapping[str, Any]) -> Optional[requests.Session]:
+    """
+    Session requests à passer à ccxt selon 'exchange.transport.mode'
+    
+    'live': session partagée de l'hôte (voir http_pool.get_session); 'record':
+    même pool, réponses enregistrées; 'replay': aucune connexion, réponses lues
+    dans l'enregistrement. Les gestionnaires qui visent le même fichier
+    partagent la session (un seul enregistreur, une seule file de rejeu).
+    
+    Returns:
+        Session, ou None (mode 'live' avec 'exchange.http.enabled' faux)
+    """
+    settings = transport_settings(exchange_config)
+    mode = settings['mode']
+    if mode == 'live':
+        return get_session(exchange_config)
+    key = (mode, str(Path(settings['path']).resolve()))
+    # Pool HTTP réel: enregistrement seulement (le rejeu n'ouvre aucune connexion)
+    pool = pool_settings(http_settings(exchange_config)) if mode == 'record' else None
+    with _transports_lock:
+        session = _transports.get(key)
+        if session is None:
+            session = SharedSession()
+            if mode == 'record':
+                inner = PooledAdapter(ConnectionStats(), *pool)
+                adapter: BaseAdapter = RecordingAdapter(inner, Recorder(Path(settings['path'])), pool)
+            else:
+                adapter = ReplayAdapter(Path(settings['path']), float(settings['speed']))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _transports[key] = session
+            return session
+        # Réglages rechargés: vitesse du rejeu, pool de l'enregistrement
+        adapter = session.get_adapter('https://')
+        if isinstance(adapter, ReplayAdapter):
+            adapter.set_speed(float(settings['speed']))
+        elif isinstance(adapter, RecordingAdapter) and adapter.pool != pool:
+            previous, adapter.inner, adapter.pool = adapter.inner, PooledAdapter(adapter.inner.stats, *pool), pool
+            previous.close()
+        return session
+
+
+def replay_adapter(exchange_config: Mapping[str, Any]) -> Optional[ReplayAdapter]:
+    """Adaptateur de rejeu de la configuration (None hors mode 'replay')"""
+    settings = transport_settings(exchange_config)
+    if settings['mode'] != 'replay':
+        return None
+    adapter = transport_session(exchange_config).get_adapter('https://')
+    return adapter if isinstance(adapter, ReplayAdapter) else None
+
+
+def close_transports() -> None:
+    """Ferme les enregistreurs et oublie les sessions de rejeu"""
+    with _transports_lock:
+        for session in _transports.values():
+            adapter = session.get_adapter('https://')
+            if isinstance(adapter, RecordingAdapter):
+                adapter.recorder.close()
+            session.release()
+        _transports.clear()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Point d'entrée CLI: 'info' (résumé d'un enregistrement)"""
+    parser = argparse.ArgumentParser(description="Enregistrements des réponses de l'exchange")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    info_parser = subparsers.add_parser('info', help="Résumer un enregistrement")
+    info_parser.add_argument('path')
+    args = parser.parse_args(argv)
+    
+    started_at, entries = load_recording(Path(args.path))
+    span = entries[-1]['at'] - entries[0]['at'] if entries else 0.0
+    counts: Dict[str, int] = {}
+    for entry in entries:
+        endpoint = entry['k'].split('?', 1)[0]
+        counts[endpoint] = counts.get(endpoint, 0) + 1
+    errors = sum(1 for entry in entries if 'e' in entry or entry.get('s', 200) >= 400)
+    print(f"{args.path}: {len(entries)} réponses sur {span:.1f}s "
+          f"(début {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(started_at))}), {errors} erreurs")
+    for endpoint, count in sorted(counts.items(), key=lambda item: -item[1]):
+        print(f"  {count:>8}  {endpoint}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
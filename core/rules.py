@@ -0,0 +1,238 @@
+"""
+Moteur de règles incrémental: seuils de gain/perte, conversion et rebase avec cooldown
+"""
+
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from .config_loader import get_config
+from .logger import get_logger
+from .ticker_table import TickerTable
+
+
+@dataclass
+class RuleDecision:
+    """Décision produite par une évaluation des règles"""
+    
+    asset: str
+    decision: str
+    reason: str
+    price: float
+    anchor_price: float
+    pnl_percent: float
+    amount: Optional[float] = None
+
+
+class RulesEngine:
+    """
+    Évalue les règles uniquement pour les assets dont le prix a changé
+    
+    Les prix reçus sont comparés au dernier prix évalué: seuls les assets modifiés
+    sont marqués à évaluer. Les cooldowns sont rangés dans un tas trié par date
+    d'expiration; un asset dont le cooldown expire est réévalué même si son prix
+    n'a pas bougé.
+    """
+    
+    MODULE = 'rules'
+    
+    def __init__(self, config_path: Optional[str] = None,
+                 anchor_prices: Optional[Mapping[str, float]] = None):
+        """
+        Initialise le moteur depuis les sections 'rules' et 'portfolio' de la configuration
+        
+        Args:
+            config_path: Chemin vers le fichier de configuration
+            anchor_prices: Prix d'ancrage initiaux par asset (défaut: premier prix observé)
+        """
+        config = get_config(config_path)
+        self.config_path = config_path
+        # Prix et assets à évaluer partagés avec le thread de rechargement de la configuration
+        self._lock = threading.RLock()
+        self.apply_config(config.get_rules_config(), config.get_portfolio_config())
+        
+        self.anchor_prices: Dict[str, float] = dict(anchor_prices or {})
+        self._prices: Dict[str, float] = {}
+        self._evaluated: Dict[str, float] = {}
+        self._dirty: Set[str] = set()
+        # Tas (expiration, asset) + expiration courante par asset (entrées périmées ignorées)
+        self._cooldown_heap: List[Tuple[float, str]] = []
+        self._cooldown_until: Dict[str, float] = {}
+        # Abonnement en dernier: un rechargement peut arriver dès l'inscription
+        config.subscribe(self._on_config_change, sections=['rules', 'portfolio'])
+    
+    def apply_config(self, rules_config: Mapping[str, Any], portfolio_config: Mapping[str, Any]) -> None:
+        """
+        Applique les sections 'rules' et 'portfolio' (seuils, cooldown, devise de référence)
+        
+        Les prix d'ancrage et les cooldowns en cours sont conservés; tous les
+        assets connus sont réévalués au prochain evaluate().
+        """
+        with self._lock:
+            self.enabled = bool(rules_config.get('enabled', False))
+            self.profit_threshold = float(rules_config.get('profit_threshold_percent', 20.0))
+            self.loss_threshold = float(rules_config.get('loss_threshold_percent', -10.0))
+            self.rebase_enabled = bool(rules_config.get('rebase_enabled', False))
+            self.cooldown = float(rules_config.get('cooldown_hours', 24)) * 3600
+            self.conversion_percent = float(rules_config.get('conversion_percent', 50.0))
+            self.base_currency = portfolio_config.get('base_currency', 'USDT')
+            if getattr(self, '_prices', None):
+                self._dirty.update(self._prices)
+    
+    def _on_config_change(self, snapshot: Any, changed: Any) -> None:
+        """Applique les seuils rechargés (appelé par ConfigLoader)"""
+        self.apply_config(snapshot.section('rules'), snapshot.section('portfolio'))
+        self.logger.log_info(
+            f"Règles rechargées: gain {self.profit_threshold}%, perte {self.loss_threshold}%"
+        )
+    
+    @property
+    def logger(self):
+        """Logger du projet (résolu au premier message pour ne pas configurer les sinks inutilement)"""
+        return get_logger(self.config_path)
+    
+    def update_price(self, asset: str, price: Optional[float]) -> bool:
+        """
+        Enregistre le dernier prix d'un asset (ex: depuis le flux WebSocket)
+        
+        Args:
+            asset: Asset (ex: 'BTC')
+            price: Prix dans la devise de référence (None ignoré)
+        
+        Returns:
+            True si l'asset doit être réévalué
+        """
+        if price is None or price <= 0 or asset == self.base_currency:
+            return False
+        price = float(price)
+        with self._lock:
+            self._prices[asset] = price
+            if self._evaluated.get(asset) == price:
+                return False
+            self._dirty.add(asset)
+        return True
+    
+    def update_prices(self, prices: Any) -> int:
+        """
+        Enregistre un lot de prix cotés dans la devise de référence
+        
+        Args:
+            prices: TickerTable, dict de tickers formatés ou dict {symbole: prix}
+        
+        Returns:
+            Nombre d'assets marqués à réévaluer
+        """
+        suffix = f"/{self.base_currency}"
+        if isinstance(prices, TickerTable):
+            items = zip(prices.symbols, prices.last.tolist())
+        else:
+            items = (
+                (symbol, entry.get('last') if isinstance(entry, dict) else entry)
+                for symbol, entry in prices.items()
+            )
+        changed = 0
+        for symbol, price in items:
+            if symbol.endswith(suffix) and price == price:  # NaN != NaN
+                changed += self.update_price(symbol[:-len(suffix)], price)
+        return changed
+    
+    def in_cooldown(self, asset: str, now: Optional[float] = None) -> bool:
+        """Indique si un asset est en cooldown"""
+        now = time.time() if now is None else now
+        return self._cooldown_until.get(asset, 0.0) > now
+    
+    def _start_cooldown(self, asset: str, now: float) -> None:
+        until = now + self.cooldown
+        self._cooldown_until[asset] = until
+        heapq.heappush(self._cooldown_heap, (until, asset))
+    
+    def _expire_cooldowns(self, now: float) -> None:
+        """Retire les cooldowns expirés (O(log n) chacun) et remet leurs assets à évaluer"""
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= now:
+            until, asset = heapq.heappop(heap)
+            if self._cooldown_until.get(asset) != until:
+                continue  # Entrée remplacée par un cooldown plus récent
+            del self._cooldown_until[asset]
+            if asset in self._prices:
+                self._dirty.add(asset)
+    
+    def evaluate(self, prices: Any = None, balances: Optional[Mapping[str, Mapping[str, Any]]] = None,
+                 now: Optional[float] = None) -> List[RuleDecision]:
+        """
+        Évalue les règles pour les assets modifiés depuis la dernière évaluation
+        
+        Args:
+            prices: Prix à enregistrer avant évaluation (voir update_prices)
+            balances: Sortie de fetch_balances (quantités pour les conversions)
+            now: Horodatage epoch de référence (défaut: maintenant)
+        
+        Returns:
+            Décisions prises (également enregistrées via log_decision)
+        """
+        with self._lock:
+            if prices is not None:
+                self.update_prices(prices)
+            if not self.enabled:
+                return []
+            
+            now = time.time() if now is None else now
+            self._expire_cooldowns(now)
+            
+            decisions = []
+            dirty, self._dirty = self._dirty, set()
+            for asset in dirty:
+                price = self._prices[asset]
+                self._evaluated[asset] = price
+                if asset in self._cooldown_until:
+                    continue
+                anchor = self.anchor_prices.setdefault(asset, price)
+                decision = self._check(asset, price, anchor, balances)
+                if decision is not None:
+                    decisions.append(decision)
+                    self._apply(decision, now)
+            return decisions
+    
+    def _check(self, asset: str, price: float, anchor: float,
+               balances: Optional[Mapping[str, Mapping[str, Any]]]) -> Optional[RuleDecision]:
+        """Applique les seuils à un asset"""
+        pnl_percent = (price - anchor) / anchor * 100
+        
+        if pnl_percent >= self.profit_threshold:
+            amount = None
+            if balances is not None and asset in balances:
+                # Surplus (en unités de l'asset) au-delà de la valeur d'ancrage
+                quantity = float(balances[asset].get('total') or 0.0)
+                amount = quantity * (price - anchor) / price * self.conversion_percent / 100
+            return RuleDecision(
+                asset, 'convert_to_stablecoin',
+                f"PnL {pnl_percent:.2f}% >= seuil {self.profit_threshold:.2f}%",
+                price, anchor, pnl_percent, amount
+            )
+        
+        if pnl_percent <= self.loss_threshold:
+            return RuleDecision(
+                asset, 'loss_alert',
+                f"PnL {pnl_percent:.2f}% <= seuil {self.loss_threshold:.2f}%",
+                price, anchor, pnl_percent
+            )
+        
+        return None
+    
+    def _apply(self, decision: RuleDecision, now: float) -> None:
+        """Enregistre la décision, démarre le cooldown et rebase si activé"""
+        logger = self.logger
+        fields = {'asset': decision.asset, 'price': decision.price}
+        logger.log_decision(self.MODULE, decision.decision, f"{decision.asset}: {decision.reason}", **fields)
+        if decision.decision == 'convert_to_stablecoin':
+            logger.log_alert('profit_threshold', f"{decision.asset}: {decision.reason}", severity='INFO', **fields)
+            if self.rebase_enabled:
+                self.anchor_prices[decision.asset] = decision.price
+                logger.log_decision(
+                    self.MODULE, 'rebase_price',
+                    f"{decision.asset}: nouveau prix d'ancrage {decision.price}", **fields
+                )
+        else:
+            logger.log_alert('loss_threshold', f"{decision.asset}: {decision.reason}", **fields)
+        self._start_cooldown(decision.asset, now)
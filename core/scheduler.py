@@ -0,0 +1,202 @@
+"""
+Planificateur à cadence fixe des tâches de collecte (sans dérive, sans empilement)
+"""
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from .logger import get_logger
+
+
+def next_run(scheduled: float, now: float, interval: float) -> Tuple[float, int]:
+    """
+    Calcule la prochaine échéance d'une tâche à cadence fixe
+    
+    Les échéances restent alignées sur la grille start + k * interval: une exécution
+    lente ne décale pas les suivantes, et les échéances déjà dépassées sont sautées.
+    
+    Args:
+        scheduled: Échéance de l'exécution qui vient de se terminer (horloge monotone)
+        now: Instant courant (horloge monotone)
+        interval: Période de la tâche (secondes)
+    
+    Returns:
+        (prochaine échéance, nombre d'échéances sautées)
+    """
+    following = scheduled + interval
+    if now < following:
+        return following, 0
+    skipped = math.floor((now - following) / interval) + 1
+    return following + skipped * interval, skipped
+
+
+@dataclass
+class Job:
+    """Tâche périodique et ses métriques"""
+    
+    name: str
+    func: Callable[[], Any]
+    interval: float
+    jitter: float = 0.0
+    run_immediately: bool = True
+    runs: int = 0
+    skipped: int = 0
+    errors: int = 0
+    last_lag: Optional[float] = None
+    max_lag: float = 0.0
+    last_duration: Optional[float] = None
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    _thread: Optional[threading.Thread] = field(default=None, repr=False)
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Retourne les métriques de retard et de durée (secondes)"""
+        return {
+            'interval': self.interval,
+            'runs': self.runs,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'last_lag': self.last_lag,
+            'max_lag': self.max_lag,
+            'last_duration': self.last_duration,
+            'max_duration': self.max_duration,
+            'avg_duration': self.total_duration / self.runs if self.runs else None,
+        }
+
+
+class Scheduler:
+    """
+    Exécute des tâches à cadence fixe, chacune dans son thread
+    
+    Une tâche qui déborde de sa période saute les échéances manquées au lieu de
+    s'exécuter plusieurs fois d'affilée; un délai aléatoire (jitter) par exécution
+    évite que toutes les tâches sollicitent l'exchange au même instant.
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialise le planificateur (aucune tâche lancée avant start())
+        
+        Args:
+            clock: Horloge monotone (secondes)
+            rng: Générateur du jitter (défaut: random.Random())
+        """
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.jobs: Dict[str, Job] = {}
+        self._stop = threading.Event()
+        self._started = False
+    
+    @property
+    def logger(self):
+        """Logger du projet (résolu au premier message pour ne pas configurer les sinks inutilement)"""
+        return get_logger()
+    
+    @property
+    def running(self) -> bool:
+        """Indique si le planificateur est démarré et non arrêté"""
+        return self._started and not self._stop.is_set()
+    
+    def add_job(self, name: str, func: Callable[[], Any], interval: float,
+                jitter: float = 0.0, run_immediately: bool = True) -> Job:
+        """
+        Enregistre une tâche périodique
+        
+        Args:
+            name: Nom unique de la tâche (ex: 'tickers')
+            func: Fonction sans argument à exécuter
+            interval: Période en secondes
+            jitter: Délai aléatoire maximum ajouté à chaque exécution (secondes)
+            run_immediately: Première exécution au démarrage (sinon après une période)
+        
+        Returns:
+            Instance Job (métriques mises à jour à chaque exécution)
+        """
+        if interval <= 0:
+            raise ValueError(f"Intervalle invalide pour la tâche '{name}': {interval}")
+        if name in self.jobs:
+            raise ValueError(f"Tâche déjà enregistrée: {name}")
+        # Le jitter reste inférieur à la période pour ne jamais chevaucher l'échéance suivante
+        job = Job(name, func, float(interval), min(max(jitter, 0.0), interval / 2), run_immediately)
+        self.jobs[name] = job
+        if self._started:
+            self._start_job(job)
+        return job
+    
+    def start(self) -> None:
+        """Démarre un thread par tâche"""
+        if self._started:
+            return
+        self._started = True
+        self._stop.clear()
+        for job in self.jobs.values():
+            self._start_job(job)
+        self.logger.log_info(f"Planificateur démarré ({len(self.jobs)} tâches)")
+    
+    def _start_job(self, job: Job) -> None:
+        job._thread = threading.Thread(
+            target=self._run_job, args=(job,), name=f"job-{job.name}", daemon=True
+        )
+        job._thread.start()
+    
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        Arrête le planificateur et attend la fin des exécutions en cours
+        
+        Args:
+            timeout: Délai maximum d'attente par tâche (secondes)
+        """
+        self._stop.set()
+        for job in self.jobs.values():
+            if job._thread is not None and job._thread is not threading.current_thread():
+                job._thread.join(timeout)
+                job._thread = None
+        if self._started:
+            self.logger.log_info("Planificateur arrêté")
+        self._started = False
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Bloque jusqu'à l'arrêt du planificateur (True si arrêté)"""
+        return self._stop.wait(timeout)
+    
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Retourne les métriques de chaque tâche"""
+        return {name: job.metrics() for name, job in self.jobs.items()}
+    
+    def _run_job(self, job: Job) -> None:
+        """Boucle d'une tâche: attente de l'échéance, exécution, échéance suivante"""
+        scheduled = self.clock() + (0.0 if job.run_immediately else job.interval)
+        
+        while not self._stop.is_set():
+            target = scheduled + (self.rng.uniform(0.0, job.jitter) if job.jitter else 0.0)
+            delay = target - self.clock()
+            if delay > 0 and self._stop.wait(delay):
+                return
+            
+            started = self.clock()
+            # Retard par rapport à l'échéance nominale (jitter exclu)
+            job.last_lag = max(0.0, started - target)
+            job.max_lag = max(job.max_lag, job.last_lag)
+            try:
+                job.func()
+            except Exception as e:
+                job.errors += 1
+                self.logger.log_error(f"Erreur dans la tâche '{job.name}': {e}")
+            finished = self.clock()
+            
+            job.runs += 1
+            job.last_duration = finished - started
+            job.max_duration = max(job.max_duration, job.last_duration)
+            job.total_duration += job.last_duration
+            
+            scheduled, skipped = next_run(scheduled, finished, job.interval)
+            if skipped:
+                job.skipped += skipped
+                self.logger.log_warning(
+                    f"Tâche '{job.name}' en retard: {skipped} exécution(s) sautée(s)",
+                    duration=job.last_duration
+                )
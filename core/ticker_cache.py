@@ -0,0 +1,178 @@
+"""
+Cache de tickers en mémoire avec TTL, éviction LRU et regroupement des requêtes concurrentes
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class _InFlight:
+    """Requête amont en cours pour un symbole (partagée par les appelants concurrents)"""
+    
+    __slots__ = ('event', 'value', 'error')
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class TickerCache:
+    """Cache de tickers par symbole, borné en taille, thread-safe"""
+    
+    def __init__(self, ttl_seconds: float = 1.0, max_size: int = 1024,
+                 ttl_overrides: Optional[Dict[str, float]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialise le cache
+        
+        Args:
+            ttl_seconds: Durée de validité par défaut d'un ticker (secondes)
+            max_size: Nombre maximum de symboles conservés (éviction LRU au-delà)
+            ttl_overrides: TTL spécifiques par symbole (ex: {'BTC/USDT': 0.5})
+            clock: Horloge monotone (injectable pour les tests)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size doit être strictement positif")
+        
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_size = int(max_size)
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0}
+    
+    def _ttl_for(self, symbol: str) -> float:
+        """Retourne le TTL applicable à un symbole"""
+        return self.ttl_overrides.get(symbol, self.ttl_seconds)
+    
+    def _lookup(self, symbol: str, now: float) -> Optional[Dict[str, Any]]:
+        """Retourne l'entrée valide pour un symbole (verrou déjà acquis)"""
+        entry = self._entries.get(symbol)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._entries[symbol]
+            return None
+        self._entries.move_to_end(symbol)
+        return value
+    
+    def _store(self, symbol: str, value: Dict[str, Any], now: float) -> None:
+        """Insère une entrée et applique l'éviction LRU (verrou déjà acquis)"""
+        self._entries[symbol] = (now + self._ttl_for(symbol), value)
+        self._entries.move_to_end(symbol)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+    
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne le ticker en cache s'il est encore valide
+        
+        Args:
+            symbol: Symbole de trading
+        
+        Returns:
+            Ticker en cache ou None
+        """
+        with self._lock:
+            value = self._lookup(symbol, self._clock())
+            self._stats['hits' if value is not None else 'misses'] += 1
+            return value
+    
+    def put(self, symbol: str, value: Dict[str, Any]) -> None:
+        """
+        Insère (ou remplace) un ticker dans le cache
+        
+        Args:
+            symbol: Symbole de trading
+            value: Ticker formaté
+        """
+        with self._lock:
+            self._store(symbol, value, self._clock())
+    
+    def get_or_fetch(self, symbol: str,
+                     fetcher: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Retourne le ticker en cache ou le récupère via fetcher
+        
+        Les appels concurrents manquant le même symbole attendent une seule
+        requête amont et partagent son résultat (ou son exception).
+        
+        Args:
+            symbol: Symbole de trading
+            fetcher: Fonction de récupération amont (ex: exchange.fetch_ticker formaté)
+        
+        Returns:
+            Ticker formaté
+        """
+        with self._lock:
+            value = self._lookup(symbol, self._clock())
+            if value is not None:
+                self._stats['hits'] += 1
+                return value
+            
+            flight = self._in_flight.get(symbol)
+            leader = flight is None
+            if leader:
+                self._stats['misses'] += 1
+                flight = _InFlight()
+                self._in_flight[symbol] = flight
+            else:
+                self._stats['coalesced'] += 1
+        
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        
+        try:
+            value = fetcher(symbol)
+            flight.value = value
+            with self._lock:
+                self._store(symbol, value, self._clock())
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(symbol, None)
+            flight.event.set()
+    
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """
+        Invalide un symbole, ou tout le cache si symbol est None
+        
+        Args:
+            symbol: Symbole à invalider (None = tout)
+        """
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne les compteurs du cache
+        
+        Returns:
+            Dictionnaire {'hits', 'misses', 'coalesced', 'evictions', 'size', 'hit_ratio'}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses'] + stats['coalesced']
+        stats['hit_ratio'] = (stats['hits'] + stats['coalesced']) / lookups if lookups else 0.0
+        return stats
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,232 @@
+"""
+Table de tickers en colonnes NumPy pour les requêtes sur l'ensemble du marché
+"""
+
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import numpy as np
+
+
+# Colonnes numériques et clé correspondante dans un ticker ccxt brut
+CCXT_COLUMNS = {
+    'last': 'last',
+    'bid': 'bid',
+    'ask': 'ask',
+    'high': 'high',
+    'low': 'low',
+    'volume': 'quoteVolume',  # Volume en quote currency
+    'timestamp': 'timestamp',
+    'percentage': 'percentage',  # Variation 24h en %
+}
+
+# Mêmes colonnes depuis des tickers déjà formatés (voir exchange.format_ticker)
+FORMATTED_COLUMNS = {name: name for name in CCXT_COLUMNS}
+
+
+class TickerTable:
+    """Struct of arrays: une colonne float64 par champ et un index symbole -> ligne"""
+    
+    def __init__(self, symbols: Sequence[str], columns: Dict[str, np.ndarray],
+                 datetimes: Optional[Sequence[Optional[str]]] = None):
+        """
+        Initialise la table
+        
+        Args:
+            symbols: Symboles, dans l'ordre des lignes
+            columns: Colonnes numériques (valeurs manquantes = NaN), même longueur que symbols
+            datetimes: Dates ISO fournies par l'exchange (optionnel, même longueur)
+        """
+        self.symbols = np.asarray(symbols, dtype=object)
+        self.columns = columns
+        self._datetimes = datetimes
+        self._index: Optional[Dict[str, int]] = None
+        
+        for name, values in columns.items():
+            if len(values) != len(self.symbols):
+                raise ValueError(f"Colonne '{name}' de longueur {len(values)} != {len(self.symbols)} symboles")
+    
+    @classmethod
+    def from_ccxt(cls, tickers_raw: Dict[str, Dict[str, Any]],
+                  quote: Optional[str] = 'USDT') -> 'TickerTable':
+        """
+        Construit la table depuis la réponse brute de ccxt fetch_tickers
+        
+        Args:
+            tickers_raw: Tickers bruts indexés par symbole
+            quote: Ne garder que les paires de cette quote currency (None = toutes)
+        
+        Returns:
+            Instance TickerTable
+        """
+        return cls._build(tickers_raw, CCXT_COLUMNS, quote)
+    
+    @classmethod
+    def from_rows(cls, tickers: Dict[str, Dict[str, Any]]) -> 'TickerTable':
+        """
+        Construit la table depuis des tickers déjà formatés (sortie de fetch_tickers)
+        
+        Args:
+            tickers: Tickers formatés indexés par symbole
+        
+        Returns:
+            Instance TickerTable
+        """
+        return cls._build(tickers, FORMATTED_COLUMNS, None)
+    
+    @classmethod
+    def _build(cls, tickers: Dict[str, Dict[str, Any]], mapping: Dict[str, str],
+               quote: Optional[str]) -> 'TickerTable':
+        """Extrait les colonnes en une seule passe, sans dict intermédiaire par ligne"""
+        suffix = f"/{quote}" if quote else None
+        symbols: List[str] = []
+        rows: List[Dict[str, Any]] = []
+        for symbol, ticker in tickers.items():
+            if suffix is None or symbol.endswith(suffix):
+                symbols.append(symbol)
+                rows.append(ticker)
+        
+        columns = {
+            name: np.array([row.get(key) for row in rows], dtype=np.float64)
+            for name, key in mapping.items()
+        }
+        datetimes = [row.get('datetime') for row in rows]
+        return cls(symbols, columns, datetimes)
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+    
+    @property
+    def index(self) -> Dict[str, int]:
+        """Index symbole -> numéro de ligne (construit au premier accès)"""
+        if self._index is None:
+            self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        return self._index
+    
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Accès direct aux colonnes: table.last, table.volume, ...
+        columns = self.__dict__.get('columns')
+        if columns is not None and name in columns:
+            return columns[name]
+        raise AttributeError(name)
+    
+    @property
+    def spread(self) -> np.ndarray:
+        """Écart relatif (ask - bid) / mid, NaN si bid ou ask manquant"""
+        bid, ask = self.columns['bid'], self.columns['ask']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (ask - bid) / ((ask + bid) / 2)
+    
+    def take(self, rows: np.ndarray) -> 'TickerTable':
+        """
+        Retourne une nouvelle table restreinte à certaines lignes
+        
+        Args:
+            rows: Masque booléen ou indices de lignes
+        
+        Returns:
+            Nouvelle instance TickerTable
+        """
+        datetimes = None
+        if self._datetimes is not None:
+            indices = np.flatnonzero(rows) if np.asarray(rows).dtype == bool else rows
+            datetimes = [self._datetimes[i] for i in indices]
+        return TickerTable(
+            self.symbols[rows],
+            {name: values[rows] for name, values in self.columns.items()},
+            datetimes
+        )
+    
+    def by_quote(self, quote: str) -> 'TickerTable':
+        """Filtre les paires d'une quote currency (ex: 'USDT')"""
+        mask = np.char.endswith(self.symbols.astype(str), f"/{quote}")
+        return self.take(mask)
+    
+    def with_min_volume(self, min_volume: float) -> 'TickerTable':
+        """Filtre les paires dont le volume (quote) est au moins min_volume"""
+        return self.take(np.nan_to_num(self.columns['volume'], nan=-np.inf) >= min_volume)
+    
+    def with_max_spread(self, max_spread: float) -> 'TickerTable':
+        """Filtre les paires dont l'écart relatif bid/ask est au plus max_spread (ex: 0.001)"""
+        return self.take(np.nan_to_num(self.spread, nan=np.inf) <= max_spread)
+    
+    def top_movers(self, n: int = 10, column: str = 'percentage',
+                   ascending: bool = False) -> 'TickerTable':
+        """
+        Retourne les n paires aux plus fortes valeurs d'une colonne
+        
+        Args:
+            n: Nombre de paires
+            column: Colonne de tri (défaut: variation 24h en %)
+            ascending: True pour les plus fortes baisses
+        
+        Returns:
+            Nouvelle table triée
+        """
+        values = self.columns[column]
+        fill = np.inf if ascending else -np.inf
+        keys = np.nan_to_num(values, nan=fill)
+        if not ascending:
+            keys = -keys
+        n = min(n, len(keys))
+        if n == 0:
+            return self.take(np.array([], dtype=np.intp))
+        top = np.argpartition(keys, n - 1)[:n]
+        top = top[np.argsort(keys[top], kind='stable')]
+        return self.take(top)
+    
+    def row(self, symbol: str) -> Dict[str, Any]:
+        """
+        Matérialise une ligne au format de exchange.format_ticker
+        
+        Args:
+            symbol: Symbole de trading
+        
+        Returns:
+            Dictionnaire du ticker
+        """
+        i = self.index[symbol]
+        ticker = {'symbol': symbol}
+        for name in ('last', 'bid', 'ask', 'high', 'low', 'volume'):
+            value = self.columns[name][i]
+            ticker[name] = None if np.isnan(value) else float(value)
+        timestamp = self.columns['timestamp'][i]
+        ticker['timestamp'] = None if np.isnan(timestamp) else int(timestamp)
+        ticker['datetime'] = self._datetime_at(i, ticker['timestamp'])
+        return ticker
+    
+    def _datetime_at(self, i: int, timestamp: Optional[int]) -> Optional[str]:
+        """Date ISO de la ligne i (fournie par l'exchange, sinon dérivée du timestamp)"""
+        if self._datetimes is not None and self._datetimes[i] is not None:
+            return self._datetimes[i]
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).isoformat()
+    
+    def as_dict(self) -> 'TickerRowsView':
+        """Vue dict paresseuse {symbole: ticker} compatible avec fetch_tickers"""
+        return TickerRowsView(self)
+
+
+class TickerRowsView(Mapping):
+    """Vue en lecture seule qui matérialise les lignes à la demande"""
+    
+    def __init__(self, table: TickerTable):
+        self._table = table
+    
+    def __getitem__(self, symbol: str) -> Dict[str, Any]:
+        if symbol not in self._table.index:
+            raise KeyError(symbol)
+        return self._table.row(symbol)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.symbols)
+    
+    def __len__(self) -> int:
+        return len(self._table)
+    
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._table.index
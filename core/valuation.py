@@ -0,0 +1,199 @@
+"""
+Moteur de valorisation vectorisé du portefeuille et calcul du PnL
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+import numpy as np
+from .config_loader import get_config
+from .ticker_table import TickerTable
+
+
+PriceSource = Union[TickerTable, Mapping[str, Any]]
+
+
+@dataclass
+class PortfolioValuation:
+    """Résultat d'une valorisation: colonnes alignées par asset et totaux"""
+    
+    base_currency: str
+    assets: np.ndarray
+    quantities: np.ndarray
+    prices: np.ndarray
+    values: np.ndarray
+    anchor_prices: np.ndarray
+    pnl: np.ndarray
+    pnl_percent: np.ndarray
+    total_value: float
+    total_pnl: float
+    total_pnl_percent: Optional[float]
+    missing_prices: List[str] = field(default_factory=list)
+    below_threshold: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Retourne la valorisation par asset sous forme de dictionnaires"""
+        def clean(value: float) -> Optional[float]:
+            return None if np.isnan(value) else float(value)
+        
+        return {
+            asset: {
+                'quantity': float(self.quantities[i]),
+                'price': clean(self.prices[i]),
+                'value': clean(self.values[i]),
+                'anchor_price': clean(self.anchor_prices[i]),
+                'pnl': clean(self.pnl[i]),
+                'pnl_percent': clean(self.pnl_percent[i]),
+            }
+            for i, asset in enumerate(self.assets)
+        }
+
+
+class ValuationEngine:
+    """Valorise toutes les balances dans la devise de référence en une passe NumPy"""
+    
+    def __init__(self, config_path: Optional[str] = None,
+                 anchor_prices: Optional[Mapping[str, float]] = None):
+        """
+        Initialise le moteur depuis la section 'portfolio' de la configuration
+        
+        Args:
+            config_path: Chemin vers le fichier de configuration
+            anchor_prices: Prix d'ancrage initiaux par asset (ex: {'BTC': 40000.0})
+        """
+        portfolio_config = get_config(config_path).get_portfolio_config()
+        self.base_currency = portfolio_config.get('base_currency', 'USDT')
+        self.min_balance_threshold = float(portfolio_config.get('min_balance_threshold', 0.0))
+        self.anchor_prices: Dict[str, float] = dict(anchor_prices or {})
+    
+    def set_anchor_price(self, asset: str, price: float) -> None:
+        """Définit le prix d'ancrage d'un asset (base du calcul de PnL)"""
+        self.anchor_prices[asset] = float(price)
+    
+    def rebase(self, valuation: PortfolioValuation, assets: Optional[Sequence[str]] = None) -> None:
+        """
+        Remet les prix d'ancrage aux prix courants d'une valorisation
+        
+        Args:
+            valuation: Valorisation dont reprendre les prix
+            assets: Assets à rebaser (None = tous ceux qui ont un prix)
+        """
+        wanted = set(assets) if assets is not None else None
+        for asset, price in zip(valuation.assets, valuation.prices):
+            if not np.isnan(price) and (wanted is None or asset in wanted):
+                self.anchor_prices[asset] = float(price)
+    
+    def symbol_for(self, asset: str) -> str:
+        """Symbole de cotation d'un asset dans la devise de référence"""
+        return f"{asset}/{self.base_currency}"
+    
+    def lookup_prices(self, assets: Sequence[str], prices: PriceSource) -> np.ndarray:
+        """
+        Aligne les derniers prix sur la liste d'assets (NaN si absent)
+        
+        Args:
+            assets: Assets à valoriser
+            prices: TickerTable, dict de tickers formatés ou dict {symbole: prix}
+        
+        Returns:
+            Tableau float64 des prix dans la devise de référence
+        """
+        base = self.base_currency
+        if isinstance(prices, TickerTable):
+            index = prices.index
+            rows = np.array([index.get(f"{a}/{base}", -1) for a in assets], dtype=np.intp)
+            result = np.full(len(assets), np.nan)
+            found = rows >= 0
+            result[found] = prices.last[rows[found]]
+        else:
+            entries = [prices.get(f"{a}/{base}") for a in assets]
+            # Tickers formatés ({'last': ...}) ou prix bruts; None devient NaN
+            result = np.array(
+                [e.get('last') if isinstance(e, dict) else e for e in entries],
+                dtype=np.float64
+            )
+        
+        # La devise de référence vaut 1 par définition
+        result[np.asarray(assets, dtype=object) == base] = 1.0
+        return result
+    
+    def value(self, balances: Mapping[str, Mapping[str, Any]],
+              prices: PriceSource) -> PortfolioValuation:
+        """
+        Valorise les balances et calcule le PnL par rapport aux prix d'ancrage
+        
+        Args:
+            balances: Sortie de ExchangeManager.fetch_balances ({asset: {free, used, total}})
+            prices: TickerTable, dict de tickers formatés ou dict {symbole: prix}
+        
+        Returns:
+            Instance PortfolioValuation (assets sous min_balance_threshold exclus)
+        """
+        assets = np.array(list(balances), dtype=object)
+        quantities = np.fromiter(
+            (balance.get('total', 0) or 0 for balance in balances.values()),
+            dtype=np.float64, count=len(assets)
+        )
+        asset_prices = self.lookup_prices(assets, prices)
+        values = quantities * asset_prices
+        
+        # Seuil de suivi en devise de référence (les assets sans prix sont conservés)
+        missing = np.isnan(asset_prices)
+        keep = missing | (values >= self.min_balance_threshold)
+        below_threshold = assets[~keep].tolist()
+        
+        assets, quantities = assets[keep], quantities[keep]
+        asset_prices, values, missing = asset_prices[keep], values[keep], missing[keep]
+        
+        anchors = np.fromiter(
+            (self.anchor_prices.get(asset, np.nan) for asset in assets),
+            dtype=np.float64, count=len(assets)
+        )
+        pnl = (asset_prices - anchors) * quantities
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_percent = (asset_prices / anchors - 1.0) * 100.0
+        
+        has_pnl = ~np.isnan(pnl)
+        cost_basis = float(np.sum(anchors[has_pnl] * quantities[has_pnl]))
+        total_pnl = float(np.sum(pnl[has_pnl]))
+        
+        return PortfolioValuation(
+            base_currency=self.base_currency,
+            assets=assets,
+            quantities=quantities,
+            prices=asset_prices,
+            values=values,
+            anchor_prices=anchors,
+            pnl=pnl,
+            pnl_percent=pnl_percent,
+            total_value=float(np.nansum(values)),
+            total_pnl=total_pnl,
+            total_pnl_percent=total_pnl / cost_basis * 100.0 if cost_basis else None,
+            missing_prices=assets[missing].tolist(),
+            below_threshold=below_threshold,
+        )
+    
+    def value_history(self, quantities: np.ndarray, price_history: np.ndarray,
+                      anchors: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Valorise un historique de prix en une opération matricielle
+        
+        Args:
+            quantities: Quantités par asset, forme (N,)
+            price_history: Prix par point et par asset, forme (T, N) (NaN = inconnu)
+            anchors: Prix d'ancrage par asset, forme (N,) (None = pas de PnL)
+        
+        Returns:
+            Dictionnaire {'total_value': (T,), 'total_pnl': (T,)} (total_pnl absent sans ancrage)
+        """
+        quantities = np.asarray(quantities, dtype=np.float64)
+        price_history = np.asarray(price_history, dtype=np.float64)
+        known = ~np.isnan(price_history)
+        prices = np.where(known, price_history, 0.0)
+        
+        result = {'total_value': prices @ quantities}
+        if anchors is not None:
+            anchors = np.asarray(anchors, dtype=np.float64)
+            with_anchor = known & ~np.isnan(anchors)
+            deltas = np.where(with_anchor, price_history - np.nan_to_num(anchors), 0.0)
+            result['total_pnl'] = deltas @ quantities
+        return result
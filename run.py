@@ -3,7 +3,10 @@
 Point d'entrée principal de Crypto Portfolio Guard
 """
 
+import argparse
+import signal
 import sys
+import threading
 from pathlib import Path
 
 # Ajouter le répertoire racine au PYTHONPATH
@@ -14,14 +17,193 @@ from core.logger import get_logger
 from core.config_loader import get_config
 
 
-def main():
+def parse_args(argv=None):
+    """Analyse les arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Crypto Portfolio Guard")
+    parser.add_argument(
+        '--config',
+        default=None,
+        help="Chemin vers le fichier de configuration (défaut: config/settings.yaml)"
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help="Lancer la collecte en continu (tickers, balances, snapshots, règles)"
+    )
+    return parser.parse_args(argv)
+
+
+class Collector:
+    """Tâches de collecte partageant les dernières balances et les derniers tickers"""
+    
+    def __init__(self, exchange, writer, rules, base_currency: str = 'USDT', price_feed=None):
+        """
+        Args:
+            exchange: ExchangeManager
+            writer: SnapshotWriter
+            rules: RulesEngine
+            base_currency: Devise de référence des symboles suivis
+            price_feed: PriceFeed abonné aux symboles détenus (None = polling REST seul)
+        """
+        self.exchange = exchange
+        self.writer = writer
+        self.rules = rules
+        self.base_currency = base_currency
+        self.price_feed = price_feed
+        self.balances = {}
+        self.tickers = {}
+    
+    def held_symbols(self):
+        """Symboles des assets détenus, cotés dans la devise de référence"""
+        return [
+            self.exchange.normalize_symbol(asset, self.base_currency)
+            for asset in self.balances if asset != self.base_currency
+        ]
+    
+    def collect_balances(self) -> None:
+        """Rafraîchit l'instantané des balances (et abonne le flux aux nouveaux assets)"""
+        self.balances = self.exchange.refresh_balances().to_dict()
+        if self.price_feed is not None:
+            self.price_feed.subscribe(self.held_symbols())
+    
+    def collect_tickers(self) -> None:
+        """Récupère les tickers des assets détenus (carnet temps réel, sinon REST)"""
+        symbols = self.held_symbols()
+        if symbols:
+            self.tickers = self.exchange.fetch_tickers(symbols)
+    
+    def snapshot(self, kind: str = 'intraday') -> None:
+        """Met en file un snapshot des dernières balances et des derniers prix"""
+        if self.balances:
+            self.writer.submit_balances(self.balances, kind=kind)
+        if self.tickers:
+            self.writer.submit_prices(self.tickers, kind=kind)
+    
+    def evaluate_rules(self) -> None:
+        """Évalue les règles sur les prix modifiés depuis la dernière évaluation"""
+        if self.tickers:
+            self.rules.evaluate(self.tickers, self.balances)
+
+
+def build_scheduler(config, collector: Collector):
+    """
+    Construit le planificateur des tâches de collecte depuis la section 'scheduler'
+    
+    Args:
+        config: ConfigLoader
+        collector: Tâches de collecte
+    
+    Returns:
+        Instance Scheduler (non démarrée)
+    """
+    from core.scheduler import Scheduler
+    
+    scheduler_config = config.get('scheduler', {}) or {}
+    portfolio_config = config.get_portfolio_config()
+    jitter = float(scheduler_config.get('jitter_seconds', 0.0))
+    
+    scheduler = Scheduler()
+    scheduler.add_job('balances', collector.collect_balances,
+                      scheduler_config.get('balances_interval_seconds', 60), jitter)
+    scheduler.add_job('tickers', collector.collect_tickers,
+                      scheduler_config.get('tickers_interval_seconds', 60), jitter)
+    scheduler.add_job('rules', collector.evaluate_rules,
+                      scheduler_config.get('rules_interval_seconds', 60), jitter)
+    # Snapshots: pas de jitter (horodatages réguliers), premier passage après une période
+    scheduler.add_job('snapshot_intraday', collector.snapshot,
+                      portfolio_config.get('intraday_snapshot_interval_minutes', 5) * 60,
+                      run_immediately=False)
+    scheduler.add_job('snapshot_daily', lambda: collector.snapshot('daily'),
+                      portfolio_config.get('snapshot_interval_hours', 24) * 3600,
+                      run_immediately=False)
+    return scheduler
+
+
+def start_price_feed(config_path, config, exchange):
+    """
+    Démarre le flux de prix temps réel si 'price_feed.enabled' et branche son carnet sur l'exchange
+    
+    Les symboles sont ajoutés par Collector.collect_balances (assets détenus).
+    
+    Returns:
+        PriceFeed démarré, ou None si le flux est désactivé
+    """
+    if not (config.get('price_feed', {}) or {}).get('enabled', False):
+        return None
+    from core.price_feed import PriceFeed
+    
+    price_feed = PriceFeed(config_path=config_path)
+    exchange.attach_price_book(price_feed.price_book)
+    price_feed.start()
+    return price_feed
+
+
+def run_daemon(config_path, config, logger) -> int:
+    """Lance la collecte en continu jusqu'à SIGINT/SIGTERM puis écrit les snapshots en attente"""
+    from core.exchange import get_exchange
+    from core.rules import RulesEngine
+    from storage.snapshots import get_snapshot_writer
+    
+    exchange = get_exchange(config_path)
+    writer = get_snapshot_writer(config_path)
+    rules = RulesEngine(config_path)
+    price_feed = start_price_feed(config_path, config, exchange)
+    collector = Collector(
+        exchange, writer, rules, config.get_portfolio_config().get('base_currency', 'USDT'), price_feed
+    )
+    scheduler = build_scheduler(config, collector)
+    metrics_interval = float((config.get('scheduler', {}) or {}).get('metrics_interval_seconds', 300))
+    
+    shutdown = threading.Event()
+    
+    def request_shutdown(signum, frame):
+        logger.log_info(f"Signal {signum} reçu: arrêt en cours")
+        shutdown.set()
+    
+    signal.signal(signal.SIGINT, request_shutdown)
+    signal.signal(signal.SIGTERM, request_shutdown)
+    
+    # Rechargement à chaud: logging, exchange et règles suivent le fichier sans redémarrage
+    watcher = None
+    reload_config = config.get('config_reload', {}) or {}
+    if reload_config.get('enabled', True):
+        from core.config_watcher import ConfigWatcher
+        watcher = ConfigWatcher(
+            config,
+            poll_interval=float(reload_config.get('poll_interval_seconds', 2.0)),
+            use_inotify=bool(reload_config.get('inotify', True))
+        )
+        watcher.start()
+    
+    scheduler.start()
+    try:
+        while not shutdown.wait(metrics_interval):
+            for name, metrics in scheduler.metrics().items():
+                logger.log_info(f"Tâche {name}: {metrics}")
+    finally:
+        if watcher is not None:
+            watcher.stop()
+        scheduler.stop()
+        if price_feed is not None:
+            price_feed.stop()
+            exchange.attach_price_book(None)
+        collector.snapshot()
+        writer.close()
+        logger.log_info("=== Crypto Portfolio Guard arrêté ===")
+        logger.flush()
+    return 0
+
+
+def main(argv=None):
     """Fonction principale"""
+    args = parse_args(argv)
+    
     try:
         # Charger la configuration
-        config = get_config()
+        config = get_config(args.config)
         
         # Initialiser le logger
-        logger = get_logger()
+        logger = get_logger(args.config)
         
         logger.log_info("=== Crypto Portfolio Guard démarré ===")
         logger.log_info(f"Version: 0.1.0")
@@ -37,19 +219,29 @@ def main():
         # Module 2: API Exchange
         try:
             from core.exchange import get_exchange
-            exchange = get_exchange()
+            exchange = get_exchange(args.config)
             
-            # Test de récupération d'un ticker (requête publique, pas besoin d'API key)
-            logger.log_info("Module 2 (API Exchange) - Test de connexion...")
-            ticker = exchange.fetch_ticker('BTC/USDT')
-            logger.log_info(f"Module 2 (API Exchange) - ✅ Opérationnel")
-            logger.log_info(f"  Test réussi: BTC/USDT = ${ticker['last']:.2f}")
+            if exchange.lazy:
+                # Le test de connexion tourne en arrière-plan: ne pas bloquer le démarrage
+                health = exchange.get_health()
+                logger.log_info(
+                    f"Module 2 (API Exchange) - ⏳ Initialisation en arrière-plan "
+                    f"(statut: {health['status']})"
+                )
+            else:
+                # Test de récupération d'un ticker (requête publique, pas besoin d'API key)
+                # Servi depuis le cache rempli par le test de connexion de l'exchange
+                logger.log_info("Module 2 (API Exchange) - Test de connexion...")
+                ticker = exchange.fetch_ticker('BTC/USDT')
+                logger.log_info(f"Module 2 (API Exchange) - ✅ Opérationnel")
+                logger.log_info(f"  Test réussi: BTC/USDT = ${ticker['last']:.2f}")
             
         except Exception as e:
             logger.log_warning(f"Module 2 (API Exchange) - ⚠️  Erreur: {e}")
             logger.log_info("  (Normal si pas d'API key configurée ou pas de connexion internet)")
         
-        # TODO: Ajouter les modules suivants ici
+        if args.daemon:
+            return run_daemon(args.config, config, logger)
         
         return 0
         
@@ -0,0 +1,3 @@
+"""
+Couche de stockage de Crypto Portfolio Guard (snapshots de balances et de prix)
+"""
@@ -0,0 +1,244 @@
+"""
+Sink loguru persistant les événements du logger (EXECUTION, DECISION, TRANSACTION, ALERT) en base
+"""
+
+import json
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+EVENT_TYPES = ('EXECUTION', 'DECISION', 'TRANSACTION', 'ALERT')
+
+EVENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_events (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    level TEXT NOT NULL,
+    event TEXT NOT NULL,
+    module TEXT,
+    action TEXT,
+    asset TEXT,
+    amount REAL,
+    price REAL,
+    message TEXT NOT NULL,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_log_events_event_ts
+    ON log_events (event, timestamp);
+"""
+
+INSERT_EVENT = (
+    "INSERT INTO log_events (timestamp, level, event, module, action, asset, amount, price, message, details) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Champs 'extra' portés par des colonnes dédiées (le reste va dans 'details' en JSON)
+_ACTION_FIELDS = ('action', 'decision', 'transaction_type', 'alert_type')
+_COLUMN_FIELDS = ('event', 'module', 'asset', 'amount', 'price') + _ACTION_FIELDS
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def event_row(record: Dict[str, Any]) -> Tuple:
+    """
+    Convertit un record loguru en ligne log_events
+    
+    Args:
+        record: Record loguru (message.record) portant extra['event']
+    
+    Returns:
+        Tuple prêt pour executemany
+    """
+    extra = record['extra']
+    action = next((extra[key] for key in _ACTION_FIELDS if extra.get(key) is not None), None)
+    details = {key: value for key, value in extra.items() if key not in _COLUMN_FIELDS}
+    if 'details' in details and len(details) == 1:
+        details = details['details']
+    return (
+        record['time'].timestamp(),
+        record['level'].name,
+        extra['event'],
+        extra.get('module'),
+        action,
+        extra.get('asset'),
+        _number(extra.get('amount')),
+        _number(extra.get('price')),
+        record['message'],
+        json.dumps(details, default=str, ensure_ascii=False) if details else None,
+    )
+
+
+class EventSink:
+    """
+    Sink loguru: met les événements en file bornée, un thread les écrit par lots
+    
+    L'écriture ne fait qu'un put_nowait; file pleine = événement ignoré et compté.
+    Objet de type flux pour loguru (write/stop): logger.remove() appelle stop().
+    Pas de méthode flush: loguru l'appellerait après chaque message (voir drain).
+    """
+    
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 1.0,
+                 max_queue: int = 10000):
+        """
+        Crée la table et démarre le thread d'écriture
+        
+        Args:
+            path: Chemin du fichier SQLite
+            batch_size: Nombre d'événements déclenchant une transaction
+            flush_interval: Délai maximum avant écriture des événements en attente (secondes)
+            max_queue: Nombre maximum d'événements en attente (mémoire bornée)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self.stats = {'written': 0, 'batches': 0, 'dropped': 0, 'errors': 0}
+        
+        conn = self._connect()
+        with conn:
+            conn.executescript(EVENTS_SCHEMA)
+        conn.close()
+        
+        self._thread = threading.Thread(target=self._run, name='log-event-writer', daemon=True)
+        self._thread.start()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    @staticmethod
+    def accepts(record: Dict[str, Any]) -> bool:
+        """Filtre loguru: seuls les événements structurés persistés"""
+        return record['extra'].get('event') in EVENT_TYPES
+    
+    def write(self, message: Any) -> None:
+        """Point d'entrée loguru (thread appelant): mise en file sans attente"""
+        if self._closed:
+            self.stats['dropped'] += 1
+            return
+        try:
+            self._queue.put_nowait(('record', message.record))
+        except queue.Full:
+            self.stats['dropped'] += 1
+    
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend l'écriture des événements en file
+        
+        Args:
+            timeout: Délai maximum d'attente (None = illimité)
+        
+        Returns:
+            True si la file a été entièrement écrite
+        """
+        if self._closed:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(('flush', done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+    
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """Écrit les événements en attente puis arrête le thread (appelé par logger.remove)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(('stop', None))
+        self._thread.join(timeout)
+    
+    def _run(self) -> None:
+        """Boucle du thread d'écriture"""
+        conn = self._connect()
+        pending: List[Dict[str, Any]] = []
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                kind, payload = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                kind, payload = 'timeout', None
+            
+            if kind == 'record':
+                pending.append(payload)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            
+            if pending and (kind in ('timeout', 'flush', 'stop') or len(pending) >= self.batch_size):
+                self._write(conn, pending)
+                pending, deadline = [], None
+            
+            if kind == 'flush':
+                payload.set()
+            elif kind == 'stop':
+                conn.close()
+                return
+    
+    def _write(self, conn: sqlite3.Connection, records: List[Dict[str, Any]]) -> None:
+        """Écrit un lot dans une transaction (les erreurs sont comptées, pas journalisées: boucle)"""
+        try:
+            rows = [event_row(record) for record in records]
+            with conn:
+                conn.executemany(INSERT_EVENT, rows)
+            self.stats['written'] += len(rows)
+            self.stats['batches'] += 1
+        except (sqlite3.Error, KeyError, TypeError, ValueError):
+            self.stats['errors'] += 1
+
+
+def get_events(path: str, event: Optional[str] = None, start: Optional[float] = None,
+               end: Optional[float] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Lit les événements persistés
+    
+    Args:
+        path: Chemin du fichier SQLite
+        event: Filtrer sur un type (ex: 'DECISION')
+        start: Début de période (epoch, inclus)
+        end: Fin de période (epoch, exclu)
+        limit: Nombre maximum d'événements (les plus récents)
+    
+    Returns:
+        Liste de dictionnaires triés par horodatage
+    """
+    query = "SELECT * FROM log_events WHERE 1 = 1"
+    params: List[Any] = []
+    if event is not None:
+        query += " AND event = ?"
+        params.append(event)
+    if start is not None:
+        query += " AND timestamp >= ?"
+        params.append(start)
+    if end is not None:
+        query += " AND timestamp < ?"
+        params.append(end)
+    query += " ORDER BY timestamp DESC, id DESC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    
+    conn = sqlite3.connect(str(path), timeout=30)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = [dict(row) for row in conn.execute(query, params)]
+    finally:
+        conn.close()
+    for row in rows:
+        if row['details'] is not None:
+            row['details'] = json.loads(row['details'])
+    return rows[::-1]
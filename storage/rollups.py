@@ -0,0 +1,319 @@
+"""
+Agrégats temporels (1 minute, 1 heure, 1 jour) des snapshots et politiques de rétention
+"""
+
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .snapshots import SnapshotStore
+
+
+MINUTE = 60
+HOUR = 3600
+DAY = 86400
+
+# Résolutions maintenues, de la plus fine à la plus grossière (secondes)
+RESOLUTIONS = (MINUTE, HOUR, DAY)
+
+ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS price_rollups (
+    asset TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    bucket REAL NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    first_ts REAL NOT NULL,
+    last_ts REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (asset, resolution, bucket)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS balance_rollups (
+    asset TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    bucket REAL NOT NULL,
+    total REAL,
+    last_ts REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (asset, resolution, bucket)
+) WITHOUT ROWID;
+"""
+
+# Fusion d'un agrégat partiel (lot courant) avec l'agrégat déjà stocké
+UPSERT_PRICE = """
+INSERT INTO price_rollups (asset, resolution, bucket, open, high, low, close, first_ts, last_ts, count)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (asset, resolution, bucket) DO UPDATE SET
+    open = CASE WHEN excluded.first_ts < first_ts THEN excluded.open ELSE open END,
+    first_ts = MIN(first_ts, excluded.first_ts),
+    high = MAX(high, excluded.high),
+    low = MIN(low, excluded.low),
+    close = CASE WHEN excluded.last_ts >= last_ts THEN excluded.close ELSE close END,
+    last_ts = MAX(last_ts, excluded.last_ts),
+    count = count + excluded.count
+"""
+
+UPSERT_BALANCE = """
+INSERT INTO balance_rollups (asset, resolution, bucket, total, last_ts, count)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (asset, resolution, bucket) DO UPDATE SET
+    total = CASE WHEN excluded.last_ts >= last_ts THEN excluded.total ELSE total END,
+    last_ts = MAX(last_ts, excluded.last_ts),
+    count = count + excluded.count
+"""
+
+
+class RollupManager:
+    """Maintient les agrégats à chaque écriture de snapshots et applique la rétention"""
+    
+    def __init__(self, store: SnapshotStore, raw_retention: Optional[float] = 2 * DAY,
+                 retention: Optional[Dict[int, Optional[float]]] = None,
+                 retention_interval: Optional[float] = HOUR):
+        """
+        Initialise les tables d'agrégats et s'enregistre auprès du store
+        
+        Args:
+            store: Base des snapshots
+            raw_retention: Durée de conservation des snapshots bruts 'intraday' (secondes,
+                None = illimitée); les snapshots 'daily' sont conservés
+            retention: Durée de conservation par résolution (secondes, None = illimitée)
+            retention_interval: Intervalle d'application de la rétention lors des écritures
+                (secondes, None = uniquement via apply_retention)
+        """
+        self.store = store
+        self.retention_interval = retention_interval
+        self._last_retention = time.monotonic()
+        self.raw_retention = raw_retention
+        self.retention = {MINUTE: 7 * DAY, HOUR: 365 * DAY, DAY: None}
+        self.retention.update(retention or {})
+        with store.connection() as conn:
+            conn.executescript(ROLLUP_SCHEMA)
+        store.add_batch_hook(self.apply)
+    
+    @classmethod
+    def from_config(cls, store: SnapshotStore, rollups_config: Dict[str, Any]) -> 'RollupManager':
+        """
+        Construit le gestionnaire depuis la section 'database.rollups'
+        
+        Args:
+            store: Base des snapshots
+            rollups_config: Section de configuration (durées en heures / jours)
+        
+        Returns:
+            Instance RollupManager
+        """
+        def hours(key: str, default: Optional[float]) -> Optional[float]:
+            value = rollups_config.get(key, default)
+            return None if value is None else float(value) * HOUR
+        
+        def days(key: str, default: Optional[float]) -> Optional[float]:
+            value = rollups_config.get(key, default)
+            return None if value is None else float(value) * DAY
+        
+        return cls(
+            store,
+            raw_retention=hours('raw_retention_hours', 48),
+            retention={
+                MINUTE: days('minute_retention_days', 7),
+                HOUR: days('hour_retention_days', 365),
+                DAY: days('day_retention_days', None),
+            },
+            retention_interval=rollups_config.get('retention_interval_seconds', HOUR)
+        )
+    
+    def apply(self, conn: sqlite3.Connection, balances: List[Tuple], prices: List[Tuple]) -> None:
+        """
+        Agrège un lot de snapshots (appelé dans la transaction de write_batch)
+        
+        Args:
+            conn: Connexion en cours de transaction
+            balances: Lignes balance_snapshots du lot
+            prices: Lignes price_snapshots du lot
+        """
+        if prices:
+            conn.executemany(UPSERT_PRICE, self._aggregate_prices(prices))
+        if balances:
+            conn.executemany(UPSERT_BALANCE, self._aggregate_balances(balances))
+        if (self.retention_interval is not None
+                and time.monotonic() - self._last_retention >= self.retention_interval):
+            self._delete_expired(conn, time.time())
+            self._last_retention = time.monotonic()
+    
+    @staticmethod
+    def _aggregate_prices(prices: List[Tuple]) -> List[Tuple]:
+        """Pré-agrège le lot en mémoire: une ligne par (asset, résolution, bucket)"""
+        buckets: Dict[Tuple[str, int, float], List[Any]] = {}
+        for timestamp, asset, _symbol, price, *_rest in prices:
+            if price is None:
+                continue
+            for resolution in RESOLUTIONS:
+                key = (asset, resolution, timestamp - timestamp % resolution)
+                agg = buckets.get(key)
+                if agg is None:
+                    # open, high, low, close, first_ts, last_ts, count
+                    buckets[key] = [price, price, price, price, timestamp, timestamp, 1]
+                    continue
+                if timestamp < agg[4]:
+                    agg[0], agg[4] = price, timestamp
+                if price > agg[1]:
+                    agg[1] = price
+                if price < agg[2]:
+                    agg[2] = price
+                if timestamp >= agg[5]:
+                    agg[3], agg[5] = price, timestamp
+                agg[6] += 1
+        return [key + tuple(agg) for key, agg in buckets.items()]
+    
+    @staticmethod
+    def _aggregate_balances(balances: List[Tuple]) -> List[Tuple]:
+        """Pré-agrège le lot en mémoire: dernière balance par (asset, résolution, bucket)"""
+        buckets: Dict[Tuple[str, int, float], List[Any]] = {}
+        for timestamp, asset, _free, _used, total, _kind in balances:
+            for resolution in RESOLUTIONS:
+                key = (asset, resolution, timestamp - timestamp % resolution)
+                agg = buckets.get(key)
+                if agg is None:
+                    buckets[key] = [total, timestamp, 1]
+                    continue
+                if timestamp >= agg[1]:
+                    agg[0], agg[1] = total, timestamp
+                agg[2] += 1
+        return [key + tuple(agg) for key, agg in buckets.items()]
+    
+    def apply_retention(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Supprime les snapshots bruts et agrégats au-delà de leur durée de conservation
+        
+        Seuls les snapshots 'intraday' expirent: l'historique 'daily' est conservé.
+        
+        Les snapshots bruts sont agrégés dans la transaction qui les insère: tout
+        snapshot brut supprimé ici est déjà présent dans les agrégats.
+        
+        Args:
+            now: Horodatage de référence (epoch, défaut: maintenant)
+        
+        Returns:
+            Nombre de lignes supprimées par catégorie
+        """
+        now = time.time() if now is None else now
+        conn = self.store.connection()
+        with conn:
+            return self._delete_expired(conn, now)
+    
+    def _delete_expired(self, conn: sqlite3.Connection, now: float) -> Dict[str, int]:
+        """Suppressions de rétention sur une transaction ouverte par l'appelant"""
+        deleted = {}
+        if self.raw_retention is not None:
+            cutoff = now - self.raw_retention
+            deleted['raw'] = (
+                conn.execute(
+                    "DELETE FROM price_snapshots WHERE kind = 'intraday' AND timestamp < ?", (cutoff,)
+                ).rowcount
+                + conn.execute(
+                    "DELETE FROM balance_snapshots WHERE kind = 'intraday' AND timestamp < ?", (cutoff,)
+                ).rowcount
+            )
+        for resolution, keep in self.retention.items():
+            if keep is None:
+                continue
+            cutoff = now - keep
+            deleted[f"{resolution}s"] = sum(
+                conn.execute(
+                    f"DELETE FROM {table} WHERE resolution = ? AND bucket < ?", (resolution, cutoff)
+                ).rowcount
+                for table in ('price_rollups', 'balance_rollups')
+            )
+        return deleted
+    
+    def choose_resolution(self, start: float, end: float, max_points: int,
+                          now: Optional[float] = None) -> int:
+        """
+        Choisit la résolution la plus fine qui respecte le budget de points et dont
+        les données couvrent encore le début de la période
+        
+        Args:
+            start: Début de période (epoch)
+            end: Fin de période (epoch)
+            max_points: Nombre maximum de points souhaités
+            now: Horodatage de référence pour la rétention (défaut: maintenant)
+        
+        Returns:
+            Résolution en secondes (0 = snapshots bruts)
+        """
+        now = time.time() if now is None else now
+        span = max(end - start, 0.0)
+        
+        candidates: Sequence[Tuple[int, Optional[float]]] = [(0, self.raw_retention)] + [
+            (resolution, self.retention.get(resolution)) for resolution in RESOLUTIONS
+        ]
+        for resolution, keep in candidates:
+            retained = keep is None or start >= now - keep
+            # Snapshots bruts: budget estimé avec l'intervalle le plus fin agrégé
+            points = span / (resolution or MINUTE)
+            if retained and points <= max_points:
+                return resolution
+        return RESOLUTIONS[-1]
+    
+    def query_prices(self, asset: str, start: float, end: float, max_points: int = 500,
+                     now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Retourne l'historique de prix d'un asset à la résolution adaptée
+        
+        Args:
+            asset: Asset (ex: 'BTC')
+            start: Début de période (epoch, inclus)
+            end: Fin de période (epoch, exclu)
+            max_points: Budget de points
+            now: Horodatage de référence pour la rétention (défaut: maintenant)
+        
+        Returns:
+            Dictionnaire {'resolution': secondes, 'points': [(bucket, open, high, low, close), ...]}
+        """
+        resolution = self.choose_resolution(start, end, max_points, now)
+        conn = self.store.connection()
+        if resolution == 0:
+            rows = conn.execute(
+                "SELECT timestamp, price, price, price, price FROM price_snapshots "
+                "WHERE asset = ? AND timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+                (asset, start, end)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT bucket, open, high, low, close FROM price_rollups "
+                "WHERE asset = ? AND resolution = ? AND bucket >= ? AND bucket < ? ORDER BY bucket",
+                (asset, resolution, start - start % resolution, end)
+            ).fetchall()
+        return {'resolution': resolution, 'points': rows}
+    
+    def query_balances(self, asset: str, start: float, end: float, max_points: int = 500,
+                       now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Retourne l'historique de balance d'un asset à la résolution adaptée
+        
+        Args:
+            asset: Asset (ex: 'BTC')
+            start: Début de période (epoch, inclus)
+            end: Fin de période (epoch, exclu)
+            max_points: Budget de points
+            now: Horodatage de référence pour la rétention (défaut: maintenant)
+        
+        Returns:
+            Dictionnaire {'resolution': secondes, 'points': [(bucket, total), ...]}
+        """
+        resolution = self.choose_resolution(start, end, max_points, now)
+        conn = self.store.connection()
+        if resolution == 0:
+            rows = conn.execute(
+                "SELECT timestamp, total FROM balance_snapshots "
+                "WHERE asset = ? AND timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+                (asset, start, end)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT bucket, total FROM balance_rollups "
+                "WHERE asset = ? AND resolution = ? AND bucket >= ? AND bucket < ? ORDER BY bucket",
+                (asset, resolution, start - start % resolution, end)
+            ).fetchall()
+        return {'resolution': resolution, 'points': rows}
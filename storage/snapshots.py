@@ -0,0 +1,401 @@
+"""
+Stockage SQLite des snapshots de balances et de prix (écritures groupées en arrière-plan)
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+from core.config_loader import get_config
+from core.logger import get_logger
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS balance_snapshots (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    asset TEXT NOT NULL,
+    free REAL,
+    used REAL,
+    total REAL NOT NULL,
+    kind TEXT NOT NULL DEFAULT 'intraday'
+);
+CREATE INDEX IF NOT EXISTS idx_balance_snapshots_asset_ts
+    ON balance_snapshots (asset, timestamp);
+
+CREATE TABLE IF NOT EXISTS price_snapshots (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    asset TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    price REAL,
+    bid REAL,
+    ask REAL,
+    volume REAL,
+    kind TEXT NOT NULL DEFAULT 'intraday'
+);
+CREATE INDEX IF NOT EXISTS idx_price_snapshots_asset_ts
+    ON price_snapshots (asset, timestamp);
+"""
+
+INSERT_BALANCE = (
+    "INSERT INTO balance_snapshots (timestamp, asset, free, used, total, kind) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+INSERT_PRICE = (
+    "INSERT INTO price_snapshots (timestamp, asset, symbol, price, bid, ask, volume, kind) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+SNAPSHOT_KINDS = ('intraday', 'daily')
+
+
+def balance_rows(balances: Mapping[str, Mapping[str, Any]], timestamp: float,
+                 kind: str = 'intraday') -> List[Tuple]:
+    """
+    Convertit la sortie de fetch_balances en lignes balance_snapshots
+    
+    Args:
+        balances: Balances par asset ({asset: {free, used, total}})
+        timestamp: Horodatage epoch (secondes)
+        kind: 'intraday' ou 'daily'
+    
+    Returns:
+        Liste de tuples prêts pour executemany
+    """
+    return [
+        (timestamp, asset, b.get('free'), b.get('used'), b.get('total', 0), kind)
+        for asset, b in balances.items()
+    ]
+
+
+def price_rows(tickers: Mapping[str, Mapping[str, Any]], timestamp: float,
+               kind: str = 'intraday') -> List[Tuple]:
+    """
+    Convertit la sortie de fetch_tickers en lignes price_snapshots
+    
+    Args:
+        tickers: Tickers formatés par symbole
+        timestamp: Horodatage epoch (secondes)
+        kind: 'intraday' ou 'daily'
+    
+    Returns:
+        Liste de tuples prêts pour executemany
+    """
+    return [
+        (timestamp, symbol.split('/')[0], symbol, t.get('last'), t.get('bid'), t.get('ask'),
+         t.get('volume'), kind)
+        for symbol, t in tickers.items()
+    ]
+
+
+class SnapshotStore:
+    """Base SQLite des snapshots (mode WAL, une connexion par thread)"""
+    
+    def __init__(self, path: str):
+        """
+        Ouvre (et crée si besoin) la base
+        
+        Args:
+            path: Chemin du fichier SQLite (':memory:' non supporté: partage entre threads)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._batch_hooks: List[Callable[[sqlite3.Connection, List[Tuple], List[Tuple]], None]] = []
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+    
+    def add_batch_hook(self, hook: Callable[[sqlite3.Connection, List[Tuple], List[Tuple]], None]) -> None:
+        """
+        Enregistre une fonction appelée dans la transaction de chaque write_batch
+        
+        Args:
+            hook: Fonction (connexion, lignes de balances, lignes de prix) (ex: agrégats)
+        """
+        self._batch_hooks.append(hook)
+    
+    def connection(self) -> sqlite3.Connection:
+        """Retourne la connexion du thread courant (créée au premier appel)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def close(self) -> None:
+        """Ferme la connexion du thread courant"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    def write_batch(self, balances: Iterable[Tuple] = (), prices: Iterable[Tuple] = ()) -> int:
+        """
+        Écrit des lignes de balances et de prix dans une seule transaction
+        
+        Les hooks enregistrés (voir add_batch_hook) s'exécutent dans la même transaction.
+        
+        Args:
+            balances: Lignes balance_snapshots (voir balance_rows)
+            prices: Lignes price_snapshots (voir price_rows)
+        
+        Returns:
+            Nombre de lignes écrites
+        """
+        balances, prices = list(balances), list(prices)
+        conn = self.connection()
+        with conn:
+            if balances:
+                conn.executemany(INSERT_BALANCE, balances)
+            if prices:
+                conn.executemany(INSERT_PRICE, prices)
+            for hook in self._batch_hooks:
+                hook(conn, balances, prices)
+        return len(balances) + len(prices)
+    
+    def get_balance_history(self, asset: str, start: Optional[float] = None,
+                            end: Optional[float] = None,
+                            kind: Optional[str] = None) -> List[Tuple[float, float]]:
+        """
+        Retourne l'historique (timestamp, total) d'un asset
+        
+        Args:
+            asset: Asset (ex: 'BTC')
+            start: Début de période (epoch, inclus)
+            end: Fin de période (epoch, exclu)
+            kind: Filtrer sur 'intraday' ou 'daily'
+        
+        Returns:
+            Liste triée de (timestamp, total)
+        """
+        return self._history('balance_snapshots', 'total', asset, start, end, kind)
+    
+    def get_price_history(self, asset: str, start: Optional[float] = None,
+                          end: Optional[float] = None,
+                          kind: Optional[str] = None) -> List[Tuple[float, float]]:
+        """
+        Retourne l'historique (timestamp, prix) d'un asset
+        
+        Args:
+            asset: Asset (ex: 'BTC')
+            start: Début de période (epoch, inclus)
+            end: Fin de période (epoch, exclu)
+            kind: Filtrer sur 'intraday' ou 'daily'
+        
+        Returns:
+            Liste triée de (timestamp, prix)
+        """
+        return self._history('price_snapshots', 'price', asset, start, end, kind)
+    
+    def _history(self, table: str, column: str, asset: str, start: Optional[float],
+                 end: Optional[float], kind: Optional[str]) -> List[Tuple[float, float]]:
+        """Requête d'historique servie par l'index (asset, timestamp)"""
+        query = f"SELECT timestamp, {column} FROM {table} WHERE asset = ?"
+        params: List[Any] = [asset]
+        if start is not None:
+            query += " AND timestamp >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND timestamp < ?"
+            params.append(end)
+        if kind is not None:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " ORDER BY timestamp"
+        return self.connection().execute(query, params).fetchall()
+    
+    def count(self, table: str) -> int:
+        """Retourne le nombre de lignes d'une table de snapshots"""
+        if table not in ('balance_snapshots', 'price_snapshots'):
+            raise ValueError(f"Table inconnue: {table}")
+        return self.connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class SnapshotWriter:
+    """Écrivain en arrière-plan: file bornée, transactions groupées par taille ou délai"""
+    
+    def __init__(self, store: SnapshotStore, batch_size: int = 500,
+                 flush_interval: float = 1.0, max_queue: int = 10000):
+        """
+        Initialise et démarre le thread d'écriture
+        
+        Args:
+            store: Base de destination
+            batch_size: Nombre de lignes déclenchant une transaction
+            flush_interval: Délai maximum avant écriture des lignes en attente (secondes)
+            max_queue: Nombre maximum de lots en attente (au-delà, les lots sont ignorés)
+        """
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self.stats = {'rows_written': 0, 'batches_written': 0, 'dropped': 0, 'errors': 0}
+        self._thread = threading.Thread(target=self._run, name='snapshot-writer', daemon=True)
+        self._thread.start()
+    
+    @property
+    def logger(self):
+        """Logger du projet (résolu au premier message pour ne pas configurer les sinks inutilement)"""
+        return get_logger()
+    
+    def submit_balances(self, balances: Mapping[str, Mapping[str, Any]],
+                        timestamp: Optional[float] = None, kind: str = 'intraday') -> bool:
+        """
+        Met en file un snapshot de balances (retour immédiat)
+        
+        Args:
+            balances: Sortie de fetch_balances
+            timestamp: Horodatage epoch (défaut: maintenant)
+            kind: 'intraday' ou 'daily'
+        
+        Returns:
+            False si le snapshot a été ignoré (file pleine ou écrivain fermé)
+        """
+        if kind not in SNAPSHOT_KINDS:
+            raise ValueError(f"Type de snapshot invalide: {kind} (attendu: {SNAPSHOT_KINDS})")
+        rows = balance_rows(balances, timestamp if timestamp is not None else time.time(), kind)
+        return self._submit(('balances', rows))
+    
+    def submit_prices(self, tickers: Mapping[str, Mapping[str, Any]],
+                      timestamp: Optional[float] = None, kind: str = 'intraday') -> bool:
+        """
+        Met en file un snapshot de prix (retour immédiat)
+        
+        Args:
+            tickers: Sortie de fetch_tickers
+            timestamp: Horodatage epoch (défaut: maintenant)
+            kind: 'intraday' ou 'daily'
+        
+        Returns:
+            False si le snapshot a été ignoré (file pleine ou écrivain fermé)
+        """
+        if kind not in SNAPSHOT_KINDS:
+            raise ValueError(f"Type de snapshot invalide: {kind} (attendu: {SNAPSHOT_KINDS})")
+        rows = price_rows(tickers, timestamp if timestamp is not None else time.time(), kind)
+        return self._submit(('prices', rows))
+    
+    def _submit(self, item: Tuple[str, List[Tuple]]) -> bool:
+        if self._closed:
+            self.stats['dropped'] += 1
+            return False
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.stats['dropped'] += 1
+            self.logger.log_warning("File des snapshots pleine: snapshot ignoré")
+            return False
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend l'écriture de tous les snapshots en file
+        
+        Args:
+            timeout: Délai maximum d'attente (None = illimité)
+        
+        Returns:
+            True si la file a été entièrement écrite
+        """
+        if self._closed:
+            # 'stop' est déjà en file: attendre la fin du thread (qui écrit le reste)
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        done = threading.Event()
+        try:
+            self._queue.put(('flush', done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+    
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Écrit les snapshots en attente puis arrête le thread d'écriture"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(('stop', None))
+        self._thread.join(timeout)
+    
+    def _run(self) -> None:
+        """Boucle du thread d'écriture"""
+        balances: List[Tuple] = []
+        prices: List[Tuple] = []
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                kind, payload = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                kind, payload = 'timeout', None
+            
+            if kind == 'balances':
+                balances.extend(payload)
+            elif kind == 'prices':
+                prices.extend(payload)
+            
+            if (balances or prices) and deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            
+            pending = len(balances) + len(prices)
+            if pending and (kind in ('timeout', 'flush', 'stop') or pending >= self.batch_size):
+                self._write(balances, prices)
+                balances, prices, deadline = [], [], None
+            
+            if kind == 'flush':
+                payload.set()
+            elif kind == 'stop':
+                self.store.close()
+                return
+    
+    def _write(self, balances: List[Tuple], prices: List[Tuple]) -> None:
+        """Écrit un lot dans une transaction (les erreurs sont comptées, pas propagées)"""
+        try:
+            self.stats['rows_written'] += self.store.write_batch(balances, prices)
+            self.stats['batches_written'] += 1
+        except Exception as e:
+            # Erreur SQLite ou levée par un hook (lot annulé): le thread doit survivre pour flush()
+            self.stats['errors'] += 1
+            self.logger.log_error(f"Erreur d'écriture des snapshots: {e}")
+
+
+# Instance globale de l'écrivain (sera initialisée au premier appel)
+_writer_instance: Optional[SnapshotWriter] = None
+
+
+def get_snapshot_writer(config_path: Optional[str] = None) -> SnapshotWriter:
+    """
+    Obtient l'écrivain de snapshots global (singleton) configuré depuis 'database'
+    
+    Args:
+        config_path: Chemin vers le fichier de configuration (uniquement au premier appel)
+    
+    Returns:
+        Instance SnapshotWriter
+    """
+    global _writer_instance
+    
+    if _writer_instance is None:
+        database_config = get_config(config_path).get_database_config()
+        db_type = database_config.get('type', 'sqlite')
+        if db_type != 'sqlite':
+            raise ValueError(f"Backend de stockage '{db_type}' non supporté (sqlite uniquement)")
+        sqlite_config = database_config.get('sqlite', {}) or {}
+        writer_config = database_config.get('writer', {}) or {}
+        store = SnapshotStore(sqlite_config.get('path', 'storage/portfolio.db'))
+        if (database_config.get('rollups', {}) or {}).get('enabled', True):
+            from .rollups import RollupManager
+            RollupManager.from_config(store, database_config.get('rollups', {}) or {})
+        _writer_instance = SnapshotWriter(
+            store,
+            batch_size=writer_config.get('batch_size', 500),
+            flush_interval=writer_config.get('flush_interval_seconds', 1.0),
+            max_queue=writer_config.get('max_queue', 10000)
+        )
+    
+    return _writer_instance
@@ -0,0 +1,223 @@
+"""
+Tests unitaires pour le module async_exchange
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+import tempfile
+import yaml
+import os
+import ccxt
+from core.async_exchange import AsyncExchangeManager, get_async_exchange, close_async_exchange
+
+
+class TestAsyncExchangeManager:
+    """Tests pour AsyncExchangeManager"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_singletons(self):
+        """Réinitialiser les singletons avant chaque test"""
+        import core.async_exchange as aex
+        import core.config_loader as cl
+        import core.logger as lg
+        aex._async_exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        yield
+        aex._async_exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+    
+    @pytest.fixture
+    def temp_config(self):
+        """Créer un fichier de config temporaire pour les tests"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            config_data = {
+                'exchange': {
+                    'name': 'binance',
+                    'api_key': 'test_api_key',
+                    'api_secret': 'test_api_secret',
+                    'sandbox': True,
+                    'testnet': False,
+                    'max_concurrent_requests': 2
+                },
+                'database': {},
+                'portfolio': {},
+                'logging': {
+                    'level': 'DEBUG',
+                    'console': False,
+                    'file': False
+                }
+            }
+            yaml.dump(config_data, f)
+            temp_path = f.name
+        
+        yield temp_path
+        
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+    
+    @pytest.fixture
+    def mock_async_exchange(self):
+        """Mock de l'exchange ccxt asynchrone"""
+        mock_exchange = MagicMock()
+        mock_exchange.has = {'fetchTickers': True}
+        mock_ticker = {
+            'last': 45000.0,
+            'bid': 44999.0,
+            'ask': 45001.0,
+            'quoteVolume': 1000000.0,
+            'timestamp': 1234567890000,
+            'datetime': '2023-01-01T00:00:00.000Z'
+        }
+        mock_exchange.fetch_ticker = AsyncMock(return_value=mock_ticker)
+        mock_exchange.fetch_tickers = AsyncMock(return_value={
+            'BTC/USDT': mock_ticker,
+            'ETH/USDT': {**mock_ticker, 'last': 3000.0},
+            'ETH/BTC': {**mock_ticker, 'last': 0.05}
+        })
+        mock_exchange.fetch_balance = AsyncMock(return_value={
+            'BTC': {'free': 0.5, 'used': 0.0, 'total': 0.5},
+            'DOGE': {'free': 0.0, 'used': 0.0, 'total': 0.0},
+            'info': {},
+            'free': {},
+            'used': {},
+            'total': {}
+        })
+        mock_exchange.close = AsyncMock()
+        return mock_exchange
+    
+    @pytest.fixture
+    def manager(self, temp_config, mock_async_exchange):
+        """AsyncExchangeManager branché sur le mock"""
+        with patch('core.async_exchange.ccxt_async') as mock_ccxt:
+            mock_ccxt.binance = MagicMock(return_value=mock_async_exchange)
+            for error in ('NotSupported', 'AuthenticationError', 'NetworkError'):
+                setattr(mock_ccxt, error, getattr(ccxt, error))
+            yield AsyncExchangeManager(temp_config)
+    
+    def test_initialization_does_no_io(self, manager, mock_async_exchange):
+        """Test que l'initialisation ne fait aucune requête"""
+        assert manager.exchange is mock_async_exchange
+        mock_async_exchange.fetch_ticker.assert_not_called()
+    
+    def test_fetch_ticker(self, manager):
+        """Test de récupération asynchrone d'un ticker"""
+        ticker = asyncio.run(manager.fetch_ticker('BTC/USDT'))
+        
+        assert ticker['symbol'] == 'BTC/USDT'
+        assert ticker['last'] == 45000.0
+    
+    def test_fetch_balances(self, manager):
+        """Test que les balances nulles et clés système sont retirées"""
+        balances = asyncio.run(manager.fetch_balances())
+        
+        assert set(balances) == {'BTC'}
+        assert balances['BTC']['total'] == 0.5
+    
+    def test_balances_from_successive_event_loops(self, manager, mock_async_exchange):
+        """Test du singleton utilisé par plusieurs asyncio.run (verrou propre à chaque boucle)"""
+        response = mock_async_exchange.fetch_balance.return_value
+        
+        async def slow_fetch_balance():
+            await asyncio.sleep(0.01)
+            return response
+        mock_async_exchange.fetch_balance.side_effect = slow_fetch_balance
+        
+        async def concurrent_refreshes():
+            # Deux appels simultanés: le second attend le verrou (qui se lie alors à la boucle)
+            return await asyncio.gather(manager.refresh_balances(), manager.refresh_balances())
+        
+        for _ in range(2):
+            snapshots = asyncio.run(concurrent_refreshes())
+            assert [set(s.to_dict()) for s in snapshots] == [{'BTC'}, {'BTC'}]
+        assert mock_async_exchange.fetch_balance.await_count == 4
+    
+    def test_fetch_balances_authentication_error_logged(self, manager, mock_async_exchange):
+        """Test du message dédié aux erreurs d'authentification (comme le gestionnaire synchrone)"""
+        mock_async_exchange.fetch_balance.side_effect = ccxt.AuthenticationError("clé invalide")
+        manager.logger = MagicMock()
+        
+        with pytest.raises(ccxt.AuthenticationError):
+            asyncio.run(manager.fetch_balances())
+        
+        manager.logger.log_error.assert_called_once_with("Erreur d'authentification: clé invalide")
+    
+    def test_fetch_tickers_bulk_and_all(self, manager, mock_async_exchange):
+        """Test de fetch_tickers groupé et sans filtre"""
+        tickers = asyncio.run(manager.fetch_tickers(['BTC/USDT', 'XYZ/USDT']))
+        assert set(tickers) == {'BTC/USDT'}
+        
+        all_tickers = asyncio.run(manager.fetch_tickers())
+        assert set(all_tickers) == {'BTC/USDT', 'ETH/USDT'}
+    
+    def test_fetch_tickers_concurrent_fallback(self, manager, mock_async_exchange):
+        """Test du repli concurrent borné sans endpoint multi-symboles"""
+        mock_async_exchange.has = {'fetchTickers': False}
+        in_flight = {'current': 0, 'max': 0}
+        
+        async def fake_fetch_ticker(symbol):
+            in_flight['current'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            await asyncio.sleep(0.01)
+            in_flight['current'] -= 1
+            if symbol == 'BAD/USDT':
+                raise RuntimeError("symbole inconnu")
+            return {'last': 1.0}
+        
+        mock_async_exchange.fetch_ticker.side_effect = fake_fetch_ticker
+        symbols = ['A/USDT', 'B/USDT', 'BAD/USDT', 'C/USDT']
+        tickers = asyncio.run(manager.fetch_tickers(symbols))
+        
+        assert set(tickers) == {'A/USDT', 'B/USDT', 'C/USDT'}
+        assert in_flight['max'] <= 2
+    
+    def test_bulk_not_supported_falls_back_to_concurrent(self, manager, mock_async_exchange):
+        """Test du repli concurrent quand l'exchange refuse la requête groupée"""
+        mock_async_exchange.fetch_tickers.side_effect = ccxt.NotSupported("symbols non supporté")
+        
+        tickers = asyncio.run(manager.fetch_tickers(['BTC/USDT', 'ETH/USDT']))
+        
+        assert set(tickers) == {'BTC/USDT', 'ETH/USDT'}
+        assert mock_async_exchange.fetch_ticker.await_count == 2
+    
+    def test_fetch_cycle_and_account_info(self, manager):
+        """Test d'un cycle complet piloté par une seule boucle"""
+        async def cycle():
+            return await asyncio.gather(
+                manager.fetch_cycle(['BTC/USDT']),
+                manager.get_account_info()
+            )
+        
+        result, account_info = asyncio.run(cycle())
+        
+        assert set(result['balances']) == {'BTC'}
+        assert set(result['tickers']) == {'BTC/USDT'}
+        assert account_info['exchange'] == 'binance'
+        assert account_info['balances_count'] == 1
+        assert manager.normalize_symbol('ETH', 'BTC') == 'ETH/BTC'
+    
+    def test_context_manager_closes_session(self, manager, mock_async_exchange):
+        """Test que 'async with' ferme la session"""
+        async def use():
+            async with manager:
+                await manager.fetch_ticker('BTC/USDT')
+        
+        asyncio.run(use())
+        mock_async_exchange.close.assert_awaited_once()
+    
+    def test_singleton_get_async_exchange(self, temp_config, mock_async_exchange):
+        """Test du singleton asynchrone et de sa fermeture"""
+        with patch('core.async_exchange.ccxt_async') as mock_ccxt:
+            mock_ccxt.binance = MagicMock(return_value=mock_async_exchange)
+            exchange1 = get_async_exchange(temp_config)
+            exchange2 = get_async_exchange()
+        
+        assert exchange1 is exchange2
+        
+        asyncio.run(close_async_exchange())
+        mock_async_exchange.close.assert_awaited_once()
+        
+        import core.async_exchange as aex
+        assert aex._async_exchange_instance is None
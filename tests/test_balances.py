@@ -0,0 +1,70 @@
+"""
+Tests unitaires pour le module balances
+"""
+
+import pytest
+from core.balances import BalanceSnapshot, format_balances
+
+
+RAW_BALANCE = {
+    'BTC': {'free': 0.5, 'used': 0.1, 'total': 0.6},
+    'ETH': {'free': 0.0, 'used': 0.0, 'total': 0.0},
+    'USDT': {'free': 1000.0, 'used': 0.0, 'total': 1000.0},
+    'info': {'raw': 'payload'},
+    'free': {'BTC': 0.5, 'USDT': 1000.0},
+    'used': {'BTC': 0.1},
+    'total': {'BTC': 0.6, 'USDT': 1000.0},
+    'timestamp': 1234567890000,
+}
+
+
+class FakeClock:
+    """Horloge manuelle"""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestBalanceSnapshot:
+    """Tests pour BalanceSnapshot"""
+    
+    def test_format_balances_filters_zero_and_system_keys(self):
+        """Test du filtrage des balances nulles et des clés système ccxt"""
+        balances = format_balances(RAW_BALANCE)
+        
+        assert set(balances) == {'BTC', 'USDT'}
+        assert balances['BTC'] == {'free': 0.5, 'used': 0.1, 'total': 0.6}
+    
+    def test_from_response(self):
+        """Test de la construction d'un instantané"""
+        snapshot = BalanceSnapshot.from_response(RAW_BALANCE)
+        
+        assert set(snapshot.balances) == {'BTC', 'USDT'}
+        assert snapshot.asset_count == 2
+        assert snapshot.timestamp
+    
+    def test_snapshot_is_read_only(self):
+        """Test que l'instantané partagé ne peut pas être modifié"""
+        snapshot = BalanceSnapshot.from_response(RAW_BALANCE)
+        
+        with pytest.raises(TypeError):
+            snapshot.balances['BTC']['total'] = 0.0
+        with pytest.raises(TypeError):
+            snapshot.balances['DOGE'] = {}
+        
+        copy = snapshot.to_dict()
+        copy['BTC']['total'] = 0.0
+        assert snapshot.balances['BTC']['total'] == 0.6
+    
+    def test_age_and_freshness(self):
+        """Test du calcul de l'âge et de la fraîcheur"""
+        clock = FakeClock()
+        snapshot = BalanceSnapshot.from_response(RAW_BALANCE, clock=clock)
+        
+        clock.now = 103.0
+        assert snapshot.age == 3.0
+        assert snapshot.is_fresh(5.0)
+        assert not snapshot.is_fresh(2.0)
@@ -0,0 +1,77 @@
+"""
+Tests de la suite de benchmarks hors ligne (faux exchange, résultats, comparaison)
+"""
+
+import json
+import pytest
+from benchmarks import suite
+from benchmarks.fake_exchange import FakeExchange, FakeNetworkError
+
+
+TINY = {'markets': 20, 'balances': 5, 'latency': 0.0, 'error_rate': 0.0, 'repeat': 2, 'calls': 200}
+
+
+def results(**metrics):
+    return {
+        'format': suite.RESULTS_FORMAT, 'meta': {'revision': 'x'},
+        'results': {'bench': {name: suite.metric(*args) for name, args in metrics.items()}},
+    }
+
+
+class TestFakeExchange:
+    """Tests pour le faux exchange"""
+    
+    def test_markets_and_balances(self):
+        exchange = FakeExchange(latency=0, markets=10, balances=3)
+        assert len(exchange.fetch_tickers()) == 10
+        balance = exchange.fetch_balance()
+        assert set(balance['total']) == {'C0', 'C1', 'USDT'}
+        assert balance['C1']['total'] == 2.0
+        assert len(exchange.load_markets()) == 10
+    
+    def test_error_rate_is_deterministic(self):
+        def failures(seed):
+            exchange = FakeExchange(latency=0, markets=1, error_rate=0.5, seed=seed)
+            outcome = []
+            for _ in range(20):
+                try:
+                    exchange.fetch_ticker('C0/USDT')
+                    outcome.append(False)
+                except FakeNetworkError:
+                    outcome.append(True)
+            return outcome
+        
+        assert failures(1) == failures(1)
+        assert 0 < sum(failures(1)) < 20
+
+
+class TestSuite:
+    """Tests pour l'exécution et la comparaison des résultats"""
+    
+    def test_run_suite_is_json_serializable(self):
+        output = suite.run_suite(TINY, only=['fetch_balances', 'run_cycle'])
+        assert set(output['results']) == {'fetch_balances', 'run_cycle'}
+        cycle = output['results']['run_cycle']
+        assert cycle['cycle_ms']['value'] > 0
+        assert cycle['rows_written']['value'] > 0
+        assert cycle['errors']['value'] == 0
+        json.loads(json.dumps(output))
+    
+    def test_compare_classifies_changes(self):
+        baseline = results(latency=(10.0, 'ms'), throughput=(100.0, 'calls/s', 'higher'), errors=(0, 'count'))
+        current = results(latency=(12.0, 'ms'), throughput=(150.0, 'calls/s', 'higher'),
+                          errors=(0, 'count'), extra=(1.0, 'ms'))
+        rows = {row['metric']: row for row in suite.compare(baseline, current, threshold=10)}
+        assert rows['latency']['status'] == 'regression'
+        assert rows['latency']['change_percent'] == pytest.approx(20.0)
+        assert rows['throughput']['status'] == 'improvement'
+        assert rows['errors']['status'] == 'unchanged'
+        assert rows['extra']['status'] == 'new'
+    
+    def test_compare_mode_exit_code(self, tmp_path, capsys):
+        base, head = tmp_path / 'base.json', tmp_path / 'head.json'
+        base.write_text(json.dumps(results(latency=(10.0, 'ms'))))
+        head.write_text(json.dumps(results(latency=(20.0, 'ms'))))
+        assert suite.main(['--compare', str(base), str(base)]) == 0
+        assert suite.main(['--compare', str(base), str(head)]) == 1
+        assert '1 régression' in capsys.readouterr().out
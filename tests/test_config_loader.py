@@ -45,7 +45,7 @@ class TestConfigLoader:
             assert config.get('exchange.name') == 'binance'
             assert config.get('exchange.api_key') == 'test_key'
             assert config.get('database.type') == 'sqlite'
-            
+        
         finally:
             os.unlink(temp_path)
     
@@ -73,7 +73,7 @@ class TestConfigLoader:
             assert config.get('exchange.api_key') == 'test_key'
             assert config.get('exchange.nonexistent', 'default') == 'default'
             assert config.get('nonexistent.section', None) is None
-            
+        
         finally:
             os.unlink(temp_path)
     
@@ -87,7 +87,7 @@ class TestConfigLoader:
         try:
             config = ConfigLoader(temp_path)
             assert config.get('test_key') == 'test_value'
-            
+        
         finally:
             os.unlink(temp_path)
     
@@ -106,7 +106,7 @@ class TestConfigLoader:
             
             config.set('new_section.key', 'value')
             assert config.get('new_section.key') == 'value'
-            
+        
         finally:
             os.unlink(temp_path)
     
@@ -128,7 +128,7 @@ class TestConfigLoader:
             
             assert exchange_config['name'] == 'binance'
             assert exchange_config['api_key'] == 'test_key'
-            
+        
         finally:
             os.unlink(temp_path)
     
@@ -150,7 +150,7 @@ class TestConfigLoader:
             
             assert db_config['type'] == 'sqlite'
             assert db_config['sqlite']['path'] == 'test.db'
-            
+        
         finally:
             os.unlink(temp_path)
     
@@ -172,7 +172,7 @@ class TestConfigLoader:
             
             assert logging_config['level'] == 'DEBUG'
             assert logging_config['console'] is True
-            
+        
         finally:
             os.unlink(temp_path)
     
@@ -193,7 +193,7 @@ class TestConfigLoader:
             
             # Devrait être la même instance
             assert config1 is config2
-            
+        
         finally:
             os.unlink(temp_path)
     
@@ -208,3 +208,206 @@ class TestConfigLoader:
                 ConfigLoader(temp_path)
         finally:
             os.unlink(temp_path)
+    
+    def test_get_cache_invalidated_by_set(self):
+        """Test que le cache des chemins suit set() (clé absente, parent et enfant)"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({'rules': {'profit_threshold_percent': 20.0}}, f)
+            temp_path = f.name
+        
+        try:
+            config = ConfigLoader(temp_path)
+            assert config.get('rules.profit_threshold_percent') == 20.0
+            assert config.get('rules.cooldown_hours', 24) == 24
+            assert config.get('rules.cooldown_hours', 12) == 12
+            
+            config.set('rules.cooldown_hours', 6)
+            config.set('rules.profit_threshold_percent', 15.0)
+            assert config.get('rules.cooldown_hours', 24) == 6
+            assert config.get('rules.profit_threshold_percent') == 15.0
+            
+            config.set('rules', {'enabled': True})
+            assert config.get('rules.profit_threshold_percent') is None
+            assert config.get('rules.enabled') is True
+        
+        finally:
+            os.unlink(temp_path)
+    
+    def test_get_cache_invalidated_by_reload(self):
+        """Test que reload() relit les valeurs mises en cache"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({'rules': {'profit_threshold_percent': 20.0}}, f)
+            temp_path = f.name
+        
+        try:
+            config = ConfigLoader(temp_path)
+            assert config.get('rules.profit_threshold_percent') == 20.0
+            
+            with open(temp_path, 'w') as f:
+                yaml.dump({'rules': {'profit_threshold_percent': 30.0}}, f)
+            config.reload()
+            
+            assert config.get('rules.profit_threshold_percent') == 30.0
+        
+        finally:
+            os.unlink(temp_path)
+    
+    def test_snapshot(self):
+        """Test de la vue immuable de la configuration"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({'rules': {'profit_threshold_percent': 20.0},
+                       'exchange': {'symbols': ['BTC/USDT']}}, f)
+            temp_path = f.name
+        
+        try:
+            config = ConfigLoader(temp_path)
+            snapshot = config.snapshot()
+            
+            assert config.snapshot() is snapshot
+            assert snapshot.get('rules.profit_threshold_percent') == 20.0
+            assert snapshot.get('rules.missing', 5) == 5
+            assert snapshot['exchange.symbols'] == ('BTC/USDT',)
+            assert snapshot.section('rules')['profit_threshold_percent'] == 20.0
+            assert dict(snapshot.section('missing')) == {}
+            with pytest.raises(TypeError):
+                snapshot.section('rules')['profit_threshold_percent'] = 0
+            
+            config.set('rules.profit_threshold_percent', 10.0)
+            
+            # L'ancienne vue est inchangée, la suivante reflète set()
+            assert snapshot.get('rules.profit_threshold_percent') == 20.0
+            assert config.snapshot() is not snapshot
+            assert config.snapshot().get('rules.profit_threshold_percent') == 10.0
+        
+        finally:
+            os.unlink(temp_path)
+
+
+class TestCompiledConfig:
+    """Tests pour le cache compilé et le schéma de configuration"""
+    
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        path = tmp_path / 'settings.yaml'
+        path.write_text(yaml.dump({
+            'exchange': {'name': 'binance'}, 'database': {}, 'portfolio': {}, 'logging': {},
+            'rules': {'profit_threshold_percent': 20.0}
+        }))
+        # Fichier ancien: le mtime fait foi
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+        return path
+    
+    @pytest.fixture(autouse=True)
+    def clear_memory_cache(self, monkeypatch):
+        import core.config_loader as cl
+        import sys
+        monkeypatch.setattr(cl, '_compiled', {})
+        monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+    
+    def count_parses(self, monkeypatch):
+        import core.config_loader as cl
+        calls = []
+        real_load = cl.yaml.load
+        
+        def load(*args, **kwargs):
+            calls.append(kwargs.get('Loader'))
+            return real_load(*args, **kwargs)
+        monkeypatch.setattr(cl.yaml, 'load', load)
+        return calls
+    
+    def test_unchanged_file_not_parsed_again(self, config_file, monkeypatch):
+        """Test qu'un fichier inchangé est servi par le cache (mémoire puis disque)"""
+        import core.config_loader as cl
+        calls = self.count_parses(monkeypatch)
+        
+        first = ConfigLoader(str(config_file))
+        second = ConfigLoader(str(config_file))
+        cl._compiled.clear()  # Nouveau processus: seul le cache disque subsiste
+        third = ConfigLoader(str(config_file))
+        
+        assert len(calls) == 1
+        assert calls[0] is getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        assert cl.compiled_cache_path(config_file).exists()
+        assert third.get('rules.profit_threshold_percent') == 20.0
+        # Chaque chargeur a sa propre copie modifiable
+        second.set('rules.profit_threshold_percent', 5.0)
+        assert first.get('rules.profit_threshold_percent') == 20.0
+    
+    def test_touched_file_with_same_content_not_parsed(self, config_file, monkeypatch):
+        """Test qu'un mtime modifié sans changement de contenu ne relance pas l'analyse"""
+        calls = self.count_parses(monkeypatch)
+        ConfigLoader(str(config_file))
+        os.utime(config_file, (1_000_000_100, 1_000_000_100))
+        
+        ConfigLoader(str(config_file))
+        
+        assert len(calls) == 1
+    
+    def test_changed_content_parsed(self, config_file, monkeypatch):
+        """Test qu'un contenu modifié (même taille, fichier récent) est relu"""
+        calls = self.count_parses(monkeypatch)
+        config = ConfigLoader(str(config_file))
+        
+        config_file.write_text(config_file.read_text().replace('20.0', '30.0'))
+        config.reload()
+        stat = config_file.stat()
+        config_file.write_text(config_file.read_text().replace('30.0', '40.0'))
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        config.reload()
+        
+        assert len(calls) == 3
+        assert config.get('rules.profit_threshold_percent') == 40.0
+    
+    @pytest.mark.skipif(not hasattr(os, 'getuid'), reason="permissions POSIX")
+    def test_disk_cache_private_and_not_executable(self, config_file, monkeypatch):
+        """Test que le cache disque est en 0600, sans pickle, et ignoré s'il est modifiable par d'autres"""
+        import marshal
+        import stat
+        import core.config_loader as cl
+        calls = self.count_parses(monkeypatch)
+        ConfigLoader(str(config_file))
+        path = cl.compiled_cache_path(config_file)
+        
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        with open(path, 'rb') as f:
+            assert marshal.load(f)['config']['rules'] == {'profit_threshold_percent': 20.0}
+        
+        cl._compiled.clear()
+        path.chmod(0o666)
+        ConfigLoader(str(config_file))
+        assert len(calls) == 2
+    
+    def test_no_disk_cache(self, config_file):
+        """Test de use_cache=False"""
+        import core.config_loader as cl
+        ConfigLoader(str(config_file), use_cache=False)
+        assert not cl.compiled_cache_path(config_file).exists()
+    
+    def test_schema_type_errors(self, tmp_path):
+        """Test que les valeurs de mauvais type sont refusées avec leur chemin"""
+        path = tmp_path / 'bad.yaml'
+        path.write_text(yaml.dump({
+            'rules': {'profit_threshold_percent': 'vingt', 'enabled': 'yes please'},
+            'exchange': {'rate_limit': 5}
+        }))
+        
+        with pytest.raises(ValueError) as excinfo:
+            ConfigLoader(str(path))
+        
+        message = str(excinfo.value)
+        assert "'rules.profit_threshold_percent'" in message
+        assert "'rules.enabled'" in message
+        assert "'exchange.rate_limit' doit être une section" in message
+    
+    def test_missing_sections_warned_from_cache(self, tmp_path, monkeypatch):
+        """Test que les avertissements sont rejoués quand la configuration vient du cache"""
+        import core.config_loader as cl
+        path = tmp_path / 'partial.yaml'
+        path.write_text(yaml.dump({'exchange': {}}))
+        warnings = []
+        monkeypatch.setattr(cl.logger, 'warning', warnings.append)
+        
+        ConfigLoader(str(path))
+        ConfigLoader(str(path))
+        
+        assert warnings.count("Section 'database' manquante dans la configuration") == 2
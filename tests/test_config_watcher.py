@@ -0,0 +1,149 @@
+"""
+Tests unitaires pour le rechargement à chaud de la configuration (core.config_watcher)
+"""
+
+import os
+import time
+from unittest.mock import MagicMock
+import pytest
+import yaml
+from core.config_loader import ConfigLoader
+from core.config_watcher import ConfigWatcher
+
+
+BASE = {
+    'exchange': {'name': 'binance'},
+    'database': {},
+    'portfolio': {'base_currency': 'USDT'},
+    'logging': {'level': 'INFO'},
+    'rules': {'profit_threshold_percent': 20.0},
+}
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger(monkeypatch):
+    """Remplace le logger du watcher par un mock"""
+    monkeypatch.setattr(ConfigWatcher, 'logger', property(lambda self: MagicMock()))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / 'settings.yaml'
+    path.write_text(yaml.dump(BASE), encoding='utf-8')
+    return path
+
+
+def rewrite(path, data):
+    """Réécrit le fichier en garantissant un mtime différent"""
+    stat = path.stat()
+    path.write_text(yaml.dump(data) if isinstance(data, dict) else data, encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestReloadSubscribers:
+    """Tests pour ConfigLoader.reload et subscribe"""
+    
+    def test_only_changed_sections_notified(self, config_file):
+        config = ConfigLoader(str(config_file))
+        rules_calls, all_calls, logging_calls = [], [], []
+        config.subscribe(lambda snap, changed: rules_calls.append((snap, changed)), sections=['rules'])
+        config.subscribe(lambda snap, changed: all_calls.append(changed))
+        config.subscribe(lambda snap, changed: logging_calls.append(changed), sections=['logging'])
+        
+        rewrite(config_file, {**BASE, 'rules': {'profit_threshold_percent': 15.0}})
+        changed = config.reload()
+        
+        assert changed == {'rules'}
+        assert len(rules_calls) == 1
+        snapshot, sections = rules_calls[0]
+        assert sections == {'rules'}
+        assert snapshot.get('rules.profit_threshold_percent') == 15.0
+        assert all_calls == [{'rules'}]
+        assert logging_calls == []
+        assert config.get('rules.profit_threshold_percent') == 15.0
+    
+    def test_invalid_file_keeps_current_config(self, config_file):
+        config = ConfigLoader(str(config_file))
+        snapshot = config.snapshot()
+        callback = MagicMock()
+        config.subscribe(callback)
+        
+        rewrite(config_file, 'rules: [unclosed')
+        with pytest.raises(ValueError):
+            config.reload()
+        
+        assert config.snapshot() is snapshot
+        assert config.get('rules.profit_threshold_percent') == 20.0
+        callback.assert_not_called()
+    
+    def test_unsubscribe_and_weak_methods(self, config_file):
+        config = ConfigLoader(str(config_file))
+        
+        class Subscriber:
+            def __init__(self):
+                self.calls = 0
+            
+            def on_change(self, snapshot, changed):
+                self.calls += 1
+        
+        kept, dropped = Subscriber(), Subscriber()
+        unsubscribe = config.subscribe(kept.on_change)
+        config.subscribe(dropped.on_change)
+        del dropped
+        
+        rewrite(config_file, {**BASE, 'rules': {'profit_threshold_percent': 10.0}})
+        config.reload()
+        unsubscribe()
+        rewrite(config_file, {**BASE, 'rules': {'profit_threshold_percent': 5.0}})
+        config.reload()
+        
+        assert kept.calls == 1
+        assert len(config._subscribers) == 0
+
+
+class TestConfigWatcher:
+    """Tests pour ConfigWatcher"""
+    
+    def test_check_reloads_once_per_change(self, config_file):
+        config = ConfigLoader(str(config_file))
+        watcher = ConfigWatcher(config)
+        
+        assert watcher.check() is False
+        rewrite(config_file, {**BASE, 'rules': {'profit_threshold_percent': 12.0}})
+        assert watcher.check() is True
+        assert watcher.check() is False
+        assert config.get('rules.profit_threshold_percent') == 12.0
+        assert watcher.stats['reloads'] == 1
+    
+    def test_check_counts_invalid_config(self, config_file):
+        config = ConfigLoader(str(config_file))
+        watcher = ConfigWatcher(config)
+        
+        rewrite(config_file, 'rules: [unclosed')
+        
+        assert watcher.check() is False
+        assert watcher.stats['errors'] == 1
+        assert config.get('rules.profit_threshold_percent') == 20.0
+    
+    @pytest.mark.parametrize('use_inotify', [True, False])
+    def test_background_reload(self, config_file, use_inotify):
+        config = ConfigLoader(str(config_file))
+        seen = []
+        config.subscribe(lambda snap, changed: seen.append(snap.get('rules.profit_threshold_percent')),
+                         sections=['rules'])
+        watcher = ConfigWatcher(config, poll_interval=0.05, debounce=0.01, use_inotify=use_inotify)
+        watcher.start()
+        try:
+            rewrite(config_file, {**BASE, 'rules': {'profit_threshold_percent': 8.0}})
+            assert wait_for(lambda: seen == [8.0])
+        finally:
+            watcher.stop()
+        
+        assert watcher.mode in (('inotify', 'polling') if use_inotify else ('polling',))
@@ -0,0 +1,89 @@
+"""
+Tests unitaires pour le module storage.events
+"""
+
+import os
+import tempfile
+import pytest
+import yaml
+from loguru import logger as loguru_logger
+from core.logger import PortfolioLogger
+from storage.events import EventSink, get_events
+
+
+class TestEventSink:
+    """Tests pour EventSink"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_singletons(self):
+        import core.config_loader as cl
+        cl._config_instance = None
+        yield
+        cl._config_instance = None
+        loguru_logger.remove()
+    
+    @pytest.fixture
+    def portfolio_logger(self, tmp_path):
+        """Logger sans console ni fichier, événements en base"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({
+                'logging': {
+                    'console': False, 'file': False,
+                    'database': {'enabled': True, 'batch_size': 1000, 'flush_interval_seconds': 60}
+                },
+                'database': {'sqlite': {'path': str(tmp_path / 'portfolio.db')}},
+                'exchange': {}, 'portfolio': {}
+            }, f)
+            temp_path = f.name
+        try:
+            yield PortfolioLogger(temp_path)
+        finally:
+            os.unlink(temp_path)
+    
+    def test_events_persisted_as_typed_rows(self, portfolio_logger, tmp_path):
+        """Test de la persistance des événements structurés en colonnes typées"""
+        portfolio_logger.log_execution('exchange', 'fetch_tickers', {'symbol_count': 2})
+        portfolio_logger.log_decision('rules', 'convert_to_stablecoin', 'PnL 25%', asset='BTC', amount=0.1)
+        portfolio_logger.log_transaction('sell', 'ETH', 2.0, price=3000.0)
+        portfolio_logger.log_alert('loss_threshold', 'ETH -12%', severity='ERROR')
+        portfolio_logger.log_info("Message ordinaire non persisté")
+        portfolio_logger.flush()
+        
+        events = get_events(str(tmp_path / 'portfolio.db'))
+        assert [e['event'] for e in events] == ['EXECUTION', 'DECISION', 'TRANSACTION', 'ALERT']
+        execution, decision, transaction, alert = events
+        assert (execution['module'], execution['action']) == ('exchange', 'fetch_tickers')
+        assert execution['details'] == {'symbol_count': 2}
+        assert (decision['action'], decision['asset'], decision['amount']) == ('convert_to_stablecoin', 'BTC', 0.1)
+        assert decision['details'] == {'reason': 'PnL 25%'}
+        assert (transaction['action'], transaction['price']) == ('sell', 3000.0)
+        assert (alert['level'], alert['action']) == ('ERROR', 'loss_threshold')
+        
+        assert get_events(str(tmp_path / 'portfolio.db'), event='DECISION', limit=5) == [decision]
+        assert portfolio_logger.event_sink.stats['batches'] == 1
+    
+    def test_logger_remove_stops_sink_and_writes_pending(self, portfolio_logger, tmp_path):
+        """Test que la suppression des sinks écrit les événements en attente"""
+        portfolio_logger.log_execution('exchange', 'fetch_balances')
+        sink = portfolio_logger.event_sink
+        
+        loguru_logger.remove()
+        
+        assert not sink._thread.is_alive()
+        assert len(get_events(str(tmp_path / 'portfolio.db'))) == 1
+    
+    def test_full_queue_drops_and_counts(self, tmp_path):
+        """Test de la mémoire bornée: file pleine = événements ignorés et comptés"""
+        sink = EventSink(str(tmp_path / 'events.db'), max_queue=1)
+        sink._queue.put(('record', None))  # Occupe la seule place (ignorée à l'écriture)
+        
+        class Message:
+            record = {}
+        
+        try:
+            for _ in range(3):
+                sink.write(Message())
+            assert sink.stats['dropped'] >= 2
+        finally:
+            sink.stop()
+        assert sink.stats['errors'] == 1
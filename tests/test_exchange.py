@@ -292,3 +292,299 @@ class TestExchangeManager:
         with patch('builtins.hasattr', side_effect=mock_hasattr):
             with pytest.raises(ValueError, match="non supporté"):
                 ExchangeManager(temp_config)
+    
+    @patch('core.exchange.ccxt')
+    def test_fetch_tickers_bulk_single_request(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test que fetch_tickers utilise l'endpoint multi-symboles quand il existe"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        mock_ccxt_exchange.has = {'fetchTickers': True}
+        mock_exchange_class = MagicMock()
+        mock_exchange_class.return_value = mock_ccxt_exchange
+        mock_ccxt.binance = mock_exchange_class
+        
+        exchange = ExchangeManager(temp_config)
+        mock_ccxt_exchange.fetch_ticker.reset_mock()
+        
+        tickers = exchange.fetch_tickers(['BTC/USDT', 'ETH/USDT', 'XYZ/USDT'])
+        
+        # BTC/USDT est déjà en cache (test de connexion): seuls les autres partent en requête groupée
+        mock_ccxt_exchange.fetch_tickers.assert_called_once_with(['ETH/USDT', 'XYZ/USDT'])
+        mock_ccxt_exchange.fetch_ticker.assert_not_called()
+        # Seuls les symboles demandés et présents dans la réponse sont retournés
+        assert set(tickers) == {'BTC/USDT', 'ETH/USDT'}
+        assert tickers['ETH/USDT']['last'] == 3000.0
+    
+    @patch('core.exchange.ccxt')
+    def test_fetch_tickers_concurrent_fallback(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test du repli concurrent quand l'endpoint multi-symboles n'existe pas"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        def fake_fetch_ticker(symbol):
+            if symbol == 'BAD/USDT':
+                raise RuntimeError("symbole inconnu")
+            return {'last': 1.0, 'timestamp': 1234567890000}
+        
+        mock_ccxt_exchange.has = {'fetchTickers': False}
+        mock_ccxt_exchange.fetch_ticker.side_effect = fake_fetch_ticker
+        mock_exchange_class = MagicMock()
+        mock_exchange_class.return_value = mock_ccxt_exchange
+        mock_ccxt.binance = mock_exchange_class
+        
+        exchange = ExchangeManager(temp_config)
+        tickers = exchange.fetch_tickers(['BTC/USDT', 'BAD/USDT', 'ETH/USDT'])
+        
+        mock_ccxt_exchange.fetch_tickers.assert_not_called()
+        # Les échecs par symbole sont ignorés, les autres tickers sont retournés
+        assert set(tickers) == {'BTC/USDT', 'ETH/USDT'}
+        assert tickers['BTC/USDT']['symbol'] == 'BTC/USDT'
+    
+    @patch('core.exchange.ccxt')
+    def test_fetch_ticker_served_from_cache(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test que les appels rapprochés sur un même symbole ne font qu'une requête"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        mock_exchange_class = MagicMock()
+        mock_exchange_class.return_value = mock_ccxt_exchange
+        mock_ccxt.binance = mock_exchange_class
+        
+        exchange = ExchangeManager(temp_config)
+        first = exchange.fetch_ticker('BTC/USDT')
+        first['last'] = 0.0  # Modifier le résultat ne doit pas altérer le cache
+        second = exchange.fetch_ticker('BTC/USDT')
+        
+        # Le test de connexion a déjà rempli le cache pour BTC/USDT
+        assert mock_ccxt_exchange.fetch_ticker.call_count == 1
+        assert second['last'] == 45000.0
+        stats = exchange.get_ticker_cache_stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+    
+    @patch('core.exchange.ccxt')
+    def test_lazy_init_does_not_block(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test que le mode lazy ne bloque pas sur le test de connexion"""
+        import threading
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        with open(temp_config, 'r') as f:
+            config_data = yaml.safe_load(f)
+        config_data['exchange']['lazy_init'] = True
+        with open(temp_config, 'w') as f:
+            yaml.dump(config_data, f)
+        
+        release = threading.Event()
+        
+        def slow_fetch_ticker(symbol):
+            release.wait(timeout=5)
+            return {'last': 45000.0}
+        
+        mock_ccxt_exchange.fetch_ticker.side_effect = slow_fetch_ticker
+        mock_exchange_class = MagicMock()
+        mock_exchange_class.return_value = mock_ccxt_exchange
+        mock_ccxt.binance = mock_exchange_class
+        
+        exchange = get_exchange(temp_config)
+        
+        # Le constructeur rend la main pendant que le test de connexion est en cours
+        assert exchange.lazy is True
+        assert exchange.get_health()['status'] == 'checking'
+        
+        release.set()
+        health = exchange.wait_ready(timeout=5)
+        
+        assert health['status'] == 'ok'
+        assert health['latency_ms'] is not None
+        assert mock_exchange_class.call_count == 1
+        assert exchange.exchange is mock_ccxt_exchange
+    
+    @patch('core.exchange.ccxt')
+    def test_lazy_init_reports_errors_in_health(self, mock_ccxt, temp_config):
+        """Test qu'un échec d'initialisation en arrière-plan est visible dans le statut"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        with open(temp_config, 'r') as f:
+            config_data = yaml.safe_load(f)
+        config_data['exchange']['lazy_init'] = True
+        with open(temp_config, 'w') as f:
+            yaml.dump(config_data, f)
+        
+        mock_ccxt.binance = MagicMock(side_effect=RuntimeError("boom"))
+        
+        exchange = ExchangeManager(temp_config)
+        health = exchange.wait_ready(timeout=5)
+        
+        assert health['status'] == 'error'
+        assert 'boom' in health['error']
+    
+    @patch('core.exchange.ccxt')
+    def test_balance_snapshot_shared(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test que fetch_balances et get_account_info partagent un seul fetch_balance"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        mock_exchange_class = MagicMock()
+        mock_exchange_class.return_value = mock_ccxt_exchange
+        mock_ccxt.binance = mock_exchange_class
+        
+        exchange = ExchangeManager(temp_config)
+        balances = exchange.fetch_balances()
+        account_info = exchange.get_account_info()
+        
+        assert mock_ccxt_exchange.fetch_balance.call_count == 1
+        assert account_info['balances_count'] == len(balances) == 3
+        assert account_info['timestamp'] == exchange.get_balance_snapshot().timestamp
+        
+        # Rafraîchissement explicite ou instantané trop ancien
+        exchange.refresh_balances()
+        assert mock_ccxt_exchange.fetch_balance.call_count == 2
+        exchange.get_balance_snapshot(max_age=0)
+        assert mock_ccxt_exchange.fetch_balance.call_count == 3
+    
+    @patch('core.exchange.ccxt')
+    def test_fetch_tickers_columnar(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test du résultat en colonnes pour tout le marché"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        mock_exchange_class = MagicMock()
+        mock_exchange_class.return_value = mock_ccxt_exchange
+        mock_ccxt.binance = mock_exchange_class
+        
+        exchange = ExchangeManager(temp_config)
+        table = exchange.fetch_tickers(columnar=True)
+        
+        assert len(table) == 3
+        assert table.last[table.index['ETH/USDT']] == 3000.0
+        assert table.as_dict()['BNB/USDT']['last'] == 400.0
+    
+    @patch('core.exchange.ccxt')
+    def test_calls_go_through_rate_limiter(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test que les appels consomment le poids de leur endpoint et lisent les en-têtes"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        import core.rate_limiter as rl
+        from core.rate_limiter import WeightRateLimiter
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        mock_exchange_class = MagicMock()
+        mock_exchange_class.return_value = mock_ccxt_exchange
+        mock_ccxt.binance = mock_exchange_class
+        mock_ccxt_exchange.last_response_headers = {'x-mbx-used-weight-1m': '100'}
+        
+        limiter = WeightRateLimiter(weight_per_minute=6000)
+        with patch.dict(rl._limiters, {'binance': limiter}):
+            exchange = ExchangeManager(temp_config)
+            acquired = limiter.stats['acquired']  # test de connexion
+            exchange.refresh_balances()
+        
+        assert exchange.rate_limiter is limiter
+        assert limiter.stats['acquired'] == acquired + 1
+        assert limiter.stats['header_updates'] == acquired + 1
+        assert limiter.available <= 5900
+        # Le limiteur partagé remplace la pause par instance de ccxt
+        assert mock_exchange_class.call_args[0][0]['enableRateLimit'] is False
+    
+    @patch('core.exchange.ccxt')
+    def test_config_reload(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test qu'un rechargement ne recrée l'exchange que si la connexion change"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        
+        mock_exchange_class = MagicMock()
+        mock_exchange_class.return_value = mock_ccxt_exchange
+        mock_ccxt.binance = mock_exchange_class
+        
+        exchange = ExchangeManager(temp_config)
+        config = cl._config_instance
+        data = yaml.safe_load(open(temp_config))
+        
+        data['exchange']['balance_max_age_seconds'] = 30
+        with open(temp_config, 'w') as f:
+            yaml.dump(data, f)
+        config.reload()
+        assert exchange.balance_max_age == 30.0
+        assert mock_exchange_class.call_count == 1
+        
+        data['exchange']['api_key'] = 'rotated_key'
+        with open(temp_config, 'w') as f:
+            yaml.dump(data, f)
+        config.reload()
+        assert mock_exchange_class.call_count == 2
+        assert mock_exchange_class.call_args[0][0]['apiKey'] == 'rotated_key'
+    
+    @patch('core.exchange.ccxt')
+    def test_config_reload_applies_budget_and_pool(self, mock_ccxt, temp_config, mock_ccxt_exchange):
+        """Test qu'un rechargement applique le nouveau budget et la nouvelle taille de pool"""
+        import core.exchange as ex
+        import core.config_loader as cl
+        import core.logger as lg
+        import core.http_pool as hp
+        import core.rate_limiter as rl
+        ex._exchange_instance = None
+        cl._config_instance = None
+        lg._logger_instance = None
+        rl._limiters.clear()
+        hp.close_sessions()
+        mock_ccxt.binance = MagicMock(return_value=mock_ccxt_exchange)
+        
+        exchange = ExchangeManager(temp_config)
+        limiter = exchange.rate_limiter
+        session = hp.get_session(exchange.exchange_config)
+        assert limiter.capacity == 6000
+        
+        data = yaml.safe_load(open(temp_config))
+        data['exchange']['rate_limit'] = {'weight_per_minute': 1200, 'reserve_percent': 10}
+        data['exchange']['http'] = {'pool_size': 4}
+        with open(temp_config, 'w') as f:
+            yaml.dump(data, f)
+        cl._config_instance.reload()
+        
+        # Mêmes instances partagées, reconfigurées
+        assert exchange.rate_limiter is limiter
+        assert limiter.capacity == 1200
+        assert limiter.reserve == 120
+        assert limiter.available <= 1200
+        assert hp.get_session(exchange.exchange_config) is session
+        assert session.get_adapter('https://')._pool_maxsize == 4
+        rl._limiters.clear()
+        hp.close_sessions()
@@ -0,0 +1,149 @@
+"""
+Tests unitaires pour le module exchange_pool
+"""
+
+import os
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+import ccxt
+import pytest
+import yaml
+from core.exchange_pool import ExchangePool, account_configs, merge_balances
+
+
+def make_exchange(balances, tickers, delay=0.0, error=None):
+    """Exchange ccxt factice avec latence et erreur injectables"""
+    exchange = MagicMock()
+    exchange.has = {'fetchTickers': True}
+    exchange.last_response_headers = {}
+    
+    def fetch_balance():
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return {asset: {'free': total, 'used': 0.0, 'total': total} for asset, total in balances.items()}
+    
+    def fetch_tickers(symbols=None):
+        time.sleep(delay)
+        return {s: {'last': p, 'timestamp': 0} for s, p in tickers.items() if symbols is None or s in symbols}
+    
+    exchange.fetch_balance.side_effect = fetch_balance
+    exchange.fetch_tickers.side_effect = fetch_tickers
+    exchange.fetch_ticker.side_effect = lambda symbol: {'last': 1.0, 'timestamp': 0}
+    return exchange
+
+
+class TestExchangePool:
+    """Tests pour ExchangePool"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_singletons(self):
+        import core.config_loader as cl
+        import core.logger as lg
+        cl._config_instance = None
+        lg._logger_instance = None
+        yield
+        cl._config_instance = None
+        lg._logger_instance = None
+    
+    @pytest.fixture
+    def temp_config(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({
+                'exchange': {
+                    'name': 'binance', 'sandbox': True, 'balance_max_age_seconds': 0,
+                    'rate_limit': {'enabled': True, 'weight_per_minute': 6000},
+                    'ticker_cache': {'enabled': False},
+                },
+                'exchanges': [
+                    {'account': 'main', 'api_key': 'k1'},
+                    {'account': 'savings', 'api_key': 'k2', 'rate_limit': {'weight_per_minute': 1200}},
+                    {'account': 'kraken', 'name': 'kraken'},
+                ],
+                'database': {}, 'portfolio': {},
+                'logging': {'console': False, 'file': False},
+            }, f)
+            temp_path = f.name
+        yield temp_path
+        os.unlink(temp_path)
+    
+    def test_account_configs_merge_defaults(self, temp_config):
+        """Test que chaque compte hérite de la section 'exchange'"""
+        accounts = {a['account']: a for a in account_configs(temp_config)}
+        
+        assert list(accounts) == ['main', 'savings', 'kraken']
+        assert accounts['main']['name'] == 'binance'
+        assert accounts['main']['api_key'] == 'k1'
+        assert accounts['kraken']['name'] == 'kraken'
+        assert accounts['savings']['rate_limit'] == {'enabled': True, 'weight_per_minute': 1200}
+    
+    def test_merge_balances(self):
+        """Test de l'addition des balances de plusieurs comptes"""
+        merged = merge_balances({
+            'a': {'BTC': {'free': 1.0, 'used': 0.5, 'total': 1.5}},
+            'b': {'BTC': {'free': 2.0, 'used': None, 'total': 2.0}, 'ETH': {'free': 3.0, 'used': 0.0, 'total': 3.0}},
+        })
+        assert merged == {
+            'BTC': {'free': 3.0, 'used': 0.5, 'total': 3.5},
+            'ETH': {'free': 3.0, 'used': 0.0, 'total': 3.0},
+        }
+    
+    @patch('core.exchange.ccxt')
+    def test_fetch_portfolio_concurrent_and_tagged(self, mock_ccxt, temp_config):
+        """Test de la vue agrégée et d'un cycle borné par le compte le plus lent"""
+        import core.rate_limiter as rl
+        exchanges = {
+            'k1': make_exchange({'BTC': 1.0, 'USDT': 100.0}, {'BTC/USDT': 50000.0}, delay=0.1),
+            'k2': make_exchange({'BTC': 0.5}, {'BTC/USDT': 50010.0}, delay=0.1),
+            'kraken': make_exchange({'ETH': 2.0}, {'ETH/USDT': 3000.0}, delay=0.1),
+        }
+        mock_ccxt.binance.side_effect = lambda params: exchanges[params['apiKey']]
+        mock_ccxt.kraken.side_effect = lambda params: exchanges['kraken']
+        
+        with patch.dict(rl._limiters, clear=True):
+            with ExchangePool(temp_config) as pool:
+                limiters = {account: m.rate_limiter for account, m in pool.managers.items()}
+                view = pool.fetch_portfolio(['BTC/USDT', 'ETH/USDT'])
+        
+        assert view.balances['BTC']['total'] == 1.5
+        assert view.sources('BTC') == {'main': 1.0, 'savings': 0.5}
+        assert view.to_dict()['balances']['ETH']['sources'] == {'kraken': 2.0}
+        # Prix du premier compte qui cote le symbole
+        assert view.tickers['BTC/USDT']['last'] == 50000.0
+        assert view.tickers_by_source['savings']['BTC/USDT']['last'] == 50010.0
+        assert view.errors == {}
+        # Chaque compte: 2 x 0.1 s; trois comptes en parallèle
+        assert view.cycle_seconds < 0.45
+        assert max(view.durations.values()) >= 0.2
+        # Un budget de requêtes par compte
+        assert len({id(limiter) for limiter in limiters.values()}) == 3
+        assert limiters['savings'].capacity == 1200
+    
+    @patch('core.exchange.ccxt')
+    def test_failed_account_reported(self, mock_ccxt, temp_config):
+        """Test qu'un compte en erreur n'empêche pas la collecte des autres"""
+        import core.rate_limiter as rl
+        exchanges = {
+            'k1': make_exchange({'BTC': 1.0}, {'BTC/USDT': 50000.0}),
+            'k2': make_exchange({}, {}, error=RuntimeError('invalid key')),
+            'kraken': make_exchange({'ETH': 2.0}, {'ETH/USDT': 3000.0}),
+        }
+        mock_ccxt.binance.side_effect = lambda params: exchanges[params['apiKey']]
+        mock_ccxt.kraken.side_effect = lambda params: exchanges['kraken']
+        mock_ccxt.AuthenticationError = ccxt.AuthenticationError
+        mock_ccxt.NetworkError = ccxt.NetworkError
+        
+        with patch.dict(rl._limiters, clear=True):
+            with ExchangePool(temp_config) as pool:
+                view = pool.fetch_portfolio()
+                balances = pool.fetch_balances()
+        
+        assert set(view.by_source) == {'main', 'kraken'}
+        assert 'invalid key' in view.errors['savings']
+        assert set(balances) == {'main', 'kraken'}
+    
+    def test_duplicate_accounts_rejected(self, temp_config):
+        """Test qu'un identifiant de compte en double est refusé"""
+        with pytest.raises(ValueError, match="double"):
+            ExchangePool(temp_config, accounts=[{'account': 'a'}, {'account': 'a'}])
@@ -0,0 +1,128 @@
+"""
+Tests unitaires pour le module http_pool
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import core.http_pool as hp
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Réponse JSON minimale en HTTP/1.1 (connexion gardée ouverte)"""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def reset_sessions():
+    hp.close_sessions()
+    yield
+    hp.close_sessions()
+
+
+class TestHttpPool:
+    """Tests pour les sessions HTTP partagées"""
+    
+    def test_session_shared_per_host(self):
+        first = hp.get_session({'name': 'binance'})
+        assert hp.get_session({'name': 'Binance', 'api_key': 'autre'}) is first
+        assert hp.get_session({'name': 'binance', 'testnet': True}) is not first
+        assert hp.get_session({'name': 'kraken'}) is not first
+    
+    def test_share_key_and_disabled(self):
+        shared = hp.get_session({'name': 'binance', 'http': {'share_key': 'proxy'}})
+        assert hp.get_session({'name': 'kraken', 'http': {'share_key': 'proxy'}}) is shared
+        assert hp.get_session({'name': 'binance', 'http': {'enabled': False}}) is None
+    
+    def test_http_settings_defaults(self):
+        settings = hp.http_settings({'http': {'pool_size': 4}})
+        assert settings['pool_size'] == 4
+        assert settings['timeout_ms'] == hp.HTTP_DEFAULTS['timeout_ms']
+    
+    def test_counts_opened_and_reused_connections(self, server):
+        session = hp.get_session({'name': 'local'})
+        for _ in range(5):
+            assert session.get(server).json() == {'ok': True}
+        stats = hp.connection_stats()['local']
+        assert stats['requests'] == 5
+        assert stats['opened'] == 1
+        assert stats['reused'] == 4
+        assert stats['reuse_ratio'] == pytest.approx(0.8)
+    
+    def test_close_sessions_resets_pool(self, server):
+        session = hp.get_session({'name': 'local'})
+        session.get(server)
+        hp.close_sessions()
+        assert hp.connection_stats() == {}
+        assert hp.get_session({'name': 'local'}) is not session
+    
+    def test_async_session_refcount_and_counters(self, server):
+        async def scenario():
+            config = {'name': 'local'}
+            first = await hp.acquire_async_session(config)
+            second = await hp.acquire_async_session(config)
+            assert first is second
+            for _ in range(3):
+                async with first.get(server) as response:
+                    await response.read()
+            stats = hp.connection_stats()['local:async']
+            await hp.release_async_session(config)
+            assert not first.closed
+            await hp.release_async_session(config)
+            assert first.closed
+            return stats
+        
+        stats = asyncio.run(scenario())
+        assert stats['opened'] == 1
+        assert stats['reused'] == 2
+    
+    def test_collected_manager_keeps_shared_session_open(self, server, tmp_path, monkeypatch):
+        import gc
+        import yaml
+        import core.config_loader as cl
+        import core.exchange as ex
+        import core.logger as lg
+        
+        config_path = tmp_path / 'settings.yaml'
+        config_path.write_text(yaml.dump({
+            'exchange': {'name': 'binance', 'markets_cache': {'enabled': False}},
+            'logging': {'level': 'WARNING', 'console': False, 'file': False},
+        }))
+        cl._config_instance = lg._logger_instance = ex._exchange_instance = None
+        monkeypatch.setattr(ex.ExchangeManager, '_test_connection', lambda self: True)
+        
+        first, second = ex.ExchangeManager(str(config_path)), ex.ExchangeManager(str(config_path))
+        session = second.exchange.session
+        assert first.exchange.session is session
+        session.get(server)
+        del first
+        gc.collect()
+        session.get(server)
+        stats = hp.connection_stats()['binance']
+        assert stats['opened'] == 1
+        assert stats['reused'] == 1
+        cl._config_instance = lg._logger_instance = None
@@ -0,0 +1,170 @@
+"""
+Tests unitaires pour le module core.log_index
+"""
+
+import gzip
+import json
+import zipfile
+from datetime import datetime
+import pytest
+from core.log_index import (
+    build_index, compressor, index_path, load_index, main, search, write_index
+)
+
+
+LINES = [
+    "2026-10-16 08:00:01 | INFO | core.exchange:fetch_balances:80 | Balances récupérées: 3 assets",
+    "2026-10-16 08:15:00 | INFO | core.logger:log_decision:250 | DECISION | Module: rules | "
+    "Decision: convert_to_stablecoin | Reason: ETH: +12.00% >= 10.0%",
+    "2026-10-16 08:15:00 | INFO | core.logger:log_alert:296 | ALERT | Type: profit_threshold | "
+    "Message: ETH: +12.00% >= 10.0%",
+    "2026-10-16 09:30:00 | INFO | core.logger:log_transaction:274 | TRANSACTION | Type: sell | "
+    "Asset: BTC | Amount: 0.5",
+    "2026-10-16 09:45:00 | ERROR | core.exchange:fetch_ticker:169 | Erreur ticker",
+    "Traceback (most recent call last):",
+    "2026-10-16 11:00:00 | INFO | core.logger:log_decision:250 | DECISION | Module: rules | "
+    "Decision: loss_alert | Reason: BTC: -6.00% <= -5.0%",
+]
+
+
+def _epoch(text: str) -> float:
+    return datetime.fromisoformat(text).timestamp()
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    path = tmp_path / 'portfolio_2026-10-16.log'
+    path.write_text('\n'.join(LINES) + '\n', encoding='utf-8')
+    return tmp_path
+
+
+class TestBuildIndex:
+    """Tests pour build_index"""
+    
+    def test_postings(self, log_dir):
+        index = build_index(log_dir / 'portfolio_2026-10-16.log')
+        postings = index['postings']
+        
+        assert index['records'] == 6  # La ligne de trace n'est pas un enregistrement
+        assert len(postings['event:DECISION']) == 2
+        assert len(postings['asset:ETH']) == 2
+        assert len(postings['asset:BTC']) == 2
+        assert index['start'] == _epoch('2026-10-16 08:00:01')
+        assert index['end'] == _epoch('2026-10-16 11:00:00')
+        assert len([k for k in postings if k.startswith('bucket:')]) == 3
+    
+    def test_json_lines(self, tmp_path):
+        path = tmp_path / 'portfolio_2026-10-16.jsonl'
+        record = {'record': {
+            'time': {'timestamp': _epoch('2026-10-16 08:00:00')},
+            'message': 'DECISION | Module: rules | Decision: loss_alert | Reason: SOL: -6%',
+            'extra': {'event': 'DECISION', 'reason': 'SOL: -6%'},
+        }}
+        path.write_text(json.dumps(record) + '\n', encoding='utf-8')
+        
+        index = build_index(path)
+        
+        assert index['postings']['event:DECISION'] == [0]
+        assert index['postings']['asset:SOL'] == [0]
+    
+    def test_stale_index_ignored(self, log_dir):
+        path = log_dir / 'portfolio_2026-10-16.log'
+        write_index(path)
+        assert load_index(path) is not None
+        
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(LINES[0] + '\n')
+        
+        assert load_index(path) is None
+
+
+class TestCompressor:
+    """Tests pour compressor"""
+    
+    @pytest.mark.parametrize('compression,suffix', [('zip', '.zip'), ('gz', '.gz')])
+    def test_index_then_compress(self, log_dir, compression, suffix):
+        path = log_dir / 'portfolio_2026-10-16.log'
+        
+        compressor(compression)(str(path))
+        
+        archive = log_dir / f'portfolio_2026-10-16.log{suffix}'
+        assert not path.exists()
+        assert archive.exists()
+        assert index_path(archive) == log_dir / 'portfolio_2026-10-16.log.idx'
+        assert load_index(archive)['records'] == 6
+    
+    def test_index_only(self, log_dir):
+        path = log_dir / 'portfolio_2026-10-16.log'
+        compressor('None')(str(path))
+        assert path.exists()
+        assert load_index(path) is not None
+    
+    def test_unsupported_compression(self):
+        with pytest.raises(ValueError):
+            compressor('tar.xz')
+
+
+class TestSearch:
+    """Tests pour search"""
+    
+    @pytest.mark.parametrize('compression', [None, 'zip', 'gz'])
+    def test_filters(self, log_dir, compression):
+        compressor(compression)(str(log_dir / 'portfolio_2026-10-16.log'))
+        
+        decisions = list(search(log_dir, event='DECISION'))
+        eth = list(search(log_dir, asset='ETH'))
+        btc_decisions = list(search(log_dir, event='DECISION', asset='BTC'))
+        morning = list(search(log_dir, since='2026-10-16 08:10:00', until='2026-10-16 09:40:00'))
+        
+        assert decisions == [LINES[1], LINES[6]]
+        assert eth == [LINES[1], LINES[2]]
+        assert btc_decisions == [LINES[6]]
+        assert morning == [LINES[1], LINES[2], LINES[3]]
+    
+    @pytest.mark.parametrize('compression', [None, 'zip', 'gz'])
+    def test_multiline_record_read_whole(self, log_dir, compression):
+        compressor(compression)(str(log_dir / 'portfolio_2026-10-16.log'))
+        
+        errors = list(search(log_dir, since='2026-10-16 09:40:00', until='2026-10-16 10:00:00'))
+        
+        assert errors == ['\n'.join(LINES[4:6])]
+    
+    def test_unindexed_current_file(self, log_dir):
+        # Fichier du jour sans index: indexé en mémoire, aucun fichier .idx écrit
+        assert list(search(log_dir, event='TRANSACTION')) == [LINES[3]]
+        assert not index_path(log_dir / 'portfolio_2026-10-16.log').exists()
+    
+    def test_missing_archive_index_built(self, log_dir):
+        path = log_dir / 'portfolio_2026-10-16.log'
+        with zipfile.ZipFile(f"{path}.zip", 'w') as archive:
+            archive.write(path, arcname=path.name)
+        path.unlink()
+        
+        assert list(search(log_dir, event='ALERT')) == [LINES[2]]
+        assert index_path(path).exists()
+    
+    def test_multiple_files(self, log_dir):
+        compressor('gz')(str(log_dir / 'portfolio_2026-10-16.log'))
+        today = "2026-10-17 10:00:00 | INFO | core.logger:log_alert:296 | ALERT | Type: loss_threshold | " \
+                "Message: ETH: -6.00% <= -5.0%"
+        (log_dir / 'portfolio_2026-10-17.log').write_text(today + '\n', encoding='utf-8')
+        
+        assert list(search(log_dir, event='ALERT', asset='ETH')) == [LINES[2], today]
+        assert list(search(log_dir, event='ALERT', since='2026-10-17')) == [today]
+
+
+class TestCli:
+    """Tests pour le point d'entrée CLI"""
+    
+    def test_search(self, log_dir, capsys):
+        with gzip.open(log_dir / 'portfolio_2026-10-15.log.gz', 'wt', encoding='utf-8') as f:
+            f.write(LINES[3].replace('2026-10-16', '2026-10-15') + '\n')
+        
+        assert main(['--dir', str(log_dir), 'build']) == 0
+        assert (log_dir / 'portfolio_2026-10-15.log.idx').exists()
+        capsys.readouterr()
+        
+        assert main(['--dir', str(log_dir), 'search', '--event', 'TRANSACTION', '--asset', 'BTC']) == 0
+        output = capsys.readouterr().out.splitlines()
+        assert len(output) == 2
+        assert output[1] == LINES[3]
@@ -167,3 +167,123 @@ class TestPortfolioLogger:
             
         finally:
             os.unlink(temp_path)
+    
+    def test_disabled_levels_are_not_formatted(self):
+        """Test que les messages sous le niveau configuré ne sont pas formatés"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({
+                'logging': {'level': 'WARNING', 'console': True, 'file': False},
+                'exchange': {}, 'database': {}, 'portfolio': {}
+            }, f)
+            temp_path = f.name
+        
+        class Counting:
+            calls = 0
+            
+            def __str__(self):
+                Counting.calls += 1
+                return 'details'
+            
+            __format__ = lambda self, spec: str(self)
+        
+        try:
+            logger = PortfolioLogger(temp_path)
+            
+            assert not logger.is_enabled('INFO')
+            assert logger.is_enabled('ERROR')
+            logger.log_debug("Ticker {}", Counting())
+            logger.log_execution('exchange', 'fetch_ticker', {'obj': Counting()})
+            logger.log_decision('rules', 'rebase_price', Counting())
+            assert Counting.calls == 0
+        finally:
+            os.unlink(temp_path)
+    
+    def test_structured_fields_in_extra(self):
+        """Test que module, action et détails sont transmis dans record['extra']"""
+        from loguru import logger as loguru_logger
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({
+                'logging': {'level': 'INFO', 'console': False, 'file': False},
+                'exchange': {}, 'database': {}, 'portfolio': {}
+            }, f)
+            temp_path = f.name
+        
+        try:
+            logger = PortfolioLogger(temp_path)
+            records = []
+            sink_id = loguru_logger.add(lambda m: records.append(m.record), level='INFO')
+            logger._register_sink_level('INFO')
+            try:
+                logger.log_execution('exchange', 'fetch_tickers', {'symbol_count': 2})
+                logger.log_decision('rules', 'convert', 'PnL {braces} 25%', asset='BTC')
+                logger.log_event('SNAPSHOT', 'écrit', rows=12)
+                logger.log_alert('loss_threshold', 'ETH -12%', severity='unknown')
+            finally:
+                loguru_logger.remove(sink_id)
+        finally:
+            os.unlink(temp_path)
+        
+        execution, decision, event, alert = records
+        assert execution['message'] == (
+            "EXECUTION | Module: exchange | Action: fetch_tickers | Details: {'symbol_count': 2}"
+        )
+        assert execution['extra'] == {
+            'event': 'EXECUTION', 'module': 'exchange', 'action': 'fetch_tickers',
+            'details': {'symbol_count': 2}
+        }
+        assert decision['message'].endswith("Reason: PnL {braces} 25%")
+        assert decision['extra']['asset'] == 'BTC'
+        assert event['extra'] == {'event': 'SNAPSHOT', 'rows': 12}
+        assert alert['level'].name == 'WARNING'
+        assert alert['extra']['alert_type'] == 'loss_threshold'
+    
+    def test_profile_options_and_overrides(self):
+        """Test des options des profils et des surcharges"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({
+                'logging': {'profile': 'production', 'console': False, 'file': False, 'diagnose': True},
+                'exchange': {}, 'database': {}, 'portfolio': {}
+            }, f)
+            temp_path = f.name
+        
+        try:
+            logger = PortfolioLogger(temp_path)
+            assert logger.get_profile_options() == {
+                'backtrace': False, 'diagnose': True, 'console_enqueue': True, 'serialize': True
+            }
+            logger.config['profile'] = 'staging'
+            with pytest.raises(ValueError):
+                logger.get_profile_options()
+        finally:
+            os.unlink(temp_path)
+    
+    def test_production_profile_writes_json_lines(self, tmp_path):
+        """Test du fichier JSON lines du profil production"""
+        import json
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({
+                'logging': {
+                    'profile': 'production', 'console': False, 'file': True,
+                    'directory': str(tmp_path), 'compression': None
+                },
+                'exchange': {}, 'database': {}, 'portfolio': {}
+            }, f)
+            temp_path = f.name
+        
+        try:
+            logger = PortfolioLogger(temp_path)
+            logger.log_execution('exchange', 'fetch_balances', {'count': 3})
+            logger.flush()
+            from loguru import logger as loguru_logger
+            loguru_logger.remove()  # Ferme le fichier (vide le tampon)
+        finally:
+            os.unlink(temp_path)
+        
+        files = list(tmp_path.glob('portfolio_*.jsonl'))
+        assert len(files) == 1
+        records = [json.loads(line)['record'] for line in files[0].read_text().splitlines()]
+        execution = records[-1]
+        assert execution['extra']['action'] == 'fetch_balances'
+        assert execution['extra']['details'] == {'count': 3}
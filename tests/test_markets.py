@@ -0,0 +1,228 @@
+"""
+Tests unitaires pour le module markets
+"""
+
+import math
+import pickle
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytest
+import yaml
+import core.exchange as ex
+from core.markets import DECIMAL_PLACES, MarketCache, MarketIndex
+
+
+def make_market(symbol, amount_step=0.001, price_step=0.01, min_amount=0.001, min_cost=5.0):
+    return {
+        'symbol': symbol,
+        'precision': {'amount': amount_step, 'price': price_step},
+        'limits': {
+            'amount': {'min': min_amount, 'max': 9000.0},
+            'price': {'min': 0.01, 'max': 1000000.0},
+            'cost': {'min': min_cost, 'max': None},
+        },
+    }
+
+
+MARKETS = {'BTC/USDT': make_market('BTC/USDT'), 'ETH/USDT': make_market('ETH/USDT', amount_step=0.0001)}
+
+
+class FakeExchange:
+    """Exchange ccxt minimal: load_markets compte les téléchargements"""
+    
+    precisionMode = 4
+    has = {'fetchTickers': True}
+    
+    def __init__(self, params=None):
+        self.markets = None
+        self.currencies = {}
+        self.downloads = 0
+        self.last_response_headers = {}
+    
+    def set_markets(self, markets, currencies=None):
+        self.markets = dict(markets)
+        return self.markets
+    
+    def load_markets(self, reload=False):
+        if self.markets and not reload:
+            return self.markets
+        self.downloads += 1
+        return self.set_markets(MARKETS)
+    
+    def fetch_ticker(self, symbol):
+        self.load_markets()
+        return {'last': 1.0, 'timestamp': 0}
+
+
+def loaded(markets):
+    exchange = FakeExchange()
+    exchange.set_markets(markets)
+    return exchange
+
+
+class TestMarketCache:
+    """Tests pour MarketCache"""
+    
+    def test_save_and_load(self, tmp_path):
+        cache = MarketCache(tmp_path / 'sub' / 'binance.markets', 3600)
+        assert cache.load() is None
+        assert not cache.save(FakeExchange())
+        assert cache.save(loaded(MARKETS))
+        entry = cache.load()
+        assert entry['state']['markets'] == MARKETS
+        assert not cache.is_stale(entry)
+        assert cache.is_stale(entry, now=time.time() + 7200)
+    
+    def test_corrupt_or_other_format_ignored(self, tmp_path):
+        cache = MarketCache(tmp_path / 'binance.markets', 3600)
+        cache.path.write_bytes(b'pas un pickle')
+        assert cache.load() is None
+        cache.path.write_bytes(pickle.dumps({'format': 0, 'state': {'markets': MARKETS}}))
+        assert cache.load() is None
+    
+    def test_apply_restores_ccxt_state(self, tmp_path):
+        import ccxt
+        market = {
+            **make_market('BTC/USDT'), 'id': 'BTCUSDT', 'base': 'BTC', 'quote': 'USDT',
+            'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True,
+        }
+        source = ccxt.binance()
+        source.set_markets({'BTC/USDT': market})
+        cache = MarketCache(tmp_path / 'binance.markets', 3600)
+        assert cache.save(source)
+        
+        exchange = ccxt.binance()
+        with patch.object(exchange, 'fetch_markets', side_effect=AssertionError('téléchargement')):
+            assert cache.apply(exchange) is not None
+            assert exchange.load_markets() is exchange.markets
+        assert exchange.safe_market('BTCUSDT')['symbol'] == 'BTC/USDT'
+    
+    def test_other_ccxt_version_rebuilds_indexes(self, tmp_path):
+        import ccxt
+        market = {
+            **make_market('BTC/USDT'), 'id': 'BTCUSDT', 'base': 'BTC', 'quote': 'USDT',
+            'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True,
+        }
+        source = ccxt.binance()
+        source.set_markets({'BTC/USDT': market})
+        cache = MarketCache(tmp_path / 'binance.markets', 3600)
+        assert cache.save(source)
+        
+        def apply_with_version(version):
+            entry = cache.load()
+            entry['ccxt'] = version
+            cache.path.write_bytes(pickle.dumps(entry))
+            exchange = ccxt.binance()
+            with patch.object(exchange, 'set_markets', wraps=exchange.set_markets) as set_markets:
+                assert cache.apply(exchange) is not None
+            assert exchange.safe_market('BTCUSDT')['symbol'] == 'BTC/USDT'
+            return set_markets.call_count
+        
+        assert apply_with_version(ccxt.__version__) == 0
+        assert apply_with_version('0.0.1') == 1
+    
+    def test_import_does_not_load_numpy(self):
+        import subprocess
+        import sys
+        code = "import sys, core.exchange; sys.exit('numpy' in sys.modules)"
+        assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+    
+    def test_from_config(self):
+        assert MarketCache.from_config({'name': 'binance'}) is None
+        cache = MarketCache.from_config({
+            'name': 'Binance', 'testnet': True,
+            'markets_cache': {'enabled': True, 'directory': 'x', 'max_age_hours': 2},
+        })
+        assert cache.path.name == 'binance-testnet.markets'
+        assert cache.max_age_seconds == 7200
+
+
+class TestMarketIndex:
+    """Tests pour MarketIndex"""
+    
+    def test_lookup(self):
+        index = MarketIndex.from_markets(MARKETS)
+        assert len(index) == 2 and 'BTC/USDT' in index and 'XRP/USDT' not in index
+        limits = index.get('ETH/USDT')
+        assert limits.amount_step == 0.0001
+        assert limits.min_cost == 5.0
+        assert math.isnan(limits.max_cost)
+        assert index.get('XRP/USDT') is None
+        assert index.nbytes == 2 * len(MarketIndex.COLUMNS) * 8
+    
+    def test_decimal_places_precision(self):
+        markets = {'BTC/USDT': make_market('BTC/USDT', amount_step=3, price_step=2)}
+        limits = MarketIndex.from_markets(markets, precision_mode=DECIMAL_PLACES).get('BTC/USDT')
+        assert limits.amount_step == pytest.approx(0.001)
+        assert limits.price_step == pytest.approx(0.01)
+    
+    def test_round_amount(self):
+        index = MarketIndex.from_markets(MARKETS)
+        assert index.round_amount('BTC/USDT', 0.12345) == pytest.approx(0.123)
+        assert index.round_amount('BTC/USDT', 0.3) == pytest.approx(0.3)
+    
+    def test_validate_order(self):
+        index = MarketIndex.from_markets(MARKETS)
+        assert index.validate_order('BTC/USDT', 0.123, price=50000) == []
+        errors = index.validate_order('BTC/USDT', 0.00012, price=10)
+        assert len(errors) == 3  # pas, quantité minimum, montant minimum
+        assert index.validate_order('XRP/USDT', 1.0) == ['XRP/USDT: marché inconnu']
+
+
+class TestExchangeMarketsCache:
+    """Tests du chargement des marchés par ExchangeManager"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_singletons(self):
+        import core.config_loader as cl
+        import core.logger as lg
+        cl._config_instance = None
+        lg._logger_instance = None
+        yield
+        cl._config_instance = None
+        lg._logger_instance = None
+    
+    @pytest.fixture
+    def setup(self, tmp_path):
+        config_path = tmp_path / 'settings.yaml'
+        config_path.write_text(yaml.dump({
+            'exchange': {
+                'name': 'binance', 'sandbox': True,
+                'markets_cache': {'enabled': True, 'directory': str(tmp_path / 'markets'), 'max_age_hours': 1},
+            },
+            'database': {}, 'portfolio': {},
+            'logging': {'level': 'WARNING', 'console': False, 'file': False},
+        }))
+        fake_ccxt = SimpleNamespace(binance=FakeExchange)
+        with patch.object(ex, 'ccxt', fake_ccxt):
+            yield str(config_path), tmp_path / 'markets' / 'binance.markets'
+    
+    def test_missing_cache_downloaded_once_and_written(self, setup):
+        config_path, cache_path = setup
+        manager = ex.ExchangeManager(config_path)
+        assert manager.exchange.downloads == 1
+        assert cache_path.exists()
+        assert manager.market_index.get('BTC/USDT').amount_step == 0.001
+    
+    def test_fresh_cache_skips_download(self, setup):
+        config_path, cache_path = setup
+        MarketCache(cache_path, 3600).save(loaded(MARKETS))
+        manager = ex.ExchangeManager(config_path)
+        assert manager.exchange.downloads == 0
+        assert set(manager.exchange.markets) == set(MARKETS)
+    
+    def test_stale_cache_refreshed_in_background(self, setup):
+        config_path, cache_path = setup
+        cache = MarketCache(cache_path, 3600)
+        cache.save(loaded({'OLD/USDT': make_market('OLD/USDT')}))
+        old = time.time() - 7200
+        entry = cache.load()
+        cache.path.write_bytes(pickle.dumps({**entry, 'fetched_at': old}))
+        
+        manager = ex.ExchangeManager(config_path)
+        manager._markets_thread.join(5)
+        assert manager.exchange.downloads == 1
+        assert set(manager.exchange.markets) == set(MARKETS)
+        assert 'BTC/USDT' in manager.market_index
+        assert not cache.is_stale(cache.load())
@@ -0,0 +1,211 @@
+"""
+Tests unitaires pour le module price_feed
+"""
+
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+import tempfile
+import yaml
+import os
+from core.price_feed import PriceBook, PriceFeed, parse_ticker_event, stream_name
+from benchmarks.ws_replay_server import FrameReplayServer, load_frames
+
+
+def wait_until(predicate, timeout=5.0):
+    """Attend qu'une condition devienne vraie"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class FakeClock:
+    """Horloge manuelle"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestPriceBook:
+    """Tests pour PriceBook"""
+    
+    def test_update_and_staleness(self):
+        """Test qu'une entrée trop ancienne n'est pas servie"""
+        clock = FakeClock()
+        book = PriceBook(clock=clock)
+        book.update('BTC/USDT', {'symbol': 'BTC/USDT', 'last': 100.0})
+        
+        clock.now = 2.0
+        assert book.get_last_price('BTC/USDT', max_age=5.0) == 100.0
+        assert book.get('BTC/USDT', max_age=1.0) is None
+        assert book.age('BTC/USDT') == 2.0
+        assert book.get('ETH/USDT') is None
+    
+    def test_get_returns_copy(self):
+        """Test que modifier le résultat n'altère pas le carnet"""
+        book = PriceBook()
+        book.update('BTC/USDT', {'last': 100.0})
+        book.get('BTC/USDT')['last'] = 0.0
+        
+        assert book.get_last_price('BTC/USDT') == 100.0
+        assert book.snapshot() == {'BTC/USDT': {'last': 100.0}}
+
+
+class TestParsing:
+    """Tests de conversion des événements Binance"""
+    
+    def test_stream_name(self):
+        assert stream_name('BTC/USDT') == 'btcusdt@ticker'
+    
+    def test_parse_ticker_event(self):
+        ticker = parse_ticker_event(load_frames()[0], 'BTC/USDT')
+        
+        assert ticker['symbol'] == 'BTC/USDT'
+        assert ticker['last'] == 43227.26
+        assert ticker['bid'] < ticker['last'] < ticker['ask']
+        assert ticker['timestamp'] == 1704067200354
+        assert ticker['datetime'].startswith('2024-01-01T00:00:00')
+
+
+class TestPriceFeed:
+    """Tests du flux contre un serveur WebSocket local de rejeu"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_singletons(self):
+        import core.config_loader as cl
+        import core.logger as lg
+        cl._config_instance = None
+        lg._logger_instance = None
+        yield
+        cl._config_instance = None
+        lg._logger_instance = None
+    
+    def make_config(self, url, **price_feed):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({
+                'exchange': {'name': 'binance', 'sandbox': False},
+                'database': {},
+                'portfolio': {},
+                'logging': {'level': 'DEBUG', 'console': False, 'file': False},
+                'price_feed': {'url': url, 'reconnect_delay_seconds': 0.05, 'max_age_seconds': 60, **price_feed}
+            }, f)
+            return f.name
+    
+    def test_feed_updates_price_book(self):
+        """Test que les trames rejouées alimentent le carnet"""
+        frames = load_frames()
+        server = FrameReplayServer(frames).start()
+        config_path = self.make_config(server.url)
+        feed = PriceFeed(['BTC/USDT', 'ETH/USDT'], config_path=config_path)
+        try:
+            feed.start()
+            expected = [f for f in frames if f['s'] in ('BTCUSDT', 'ETHUSDT')]
+            assert wait_until(lambda: feed.stats['updates'] == len(expected))
+            
+            last_btc = [f for f in expected if f['s'] == 'BTCUSDT'][-1]
+            assert feed.price_book.get_last_price('BTC/USDT') == float(last_btc['c'])
+            # BNB n'est pas abonné
+            assert feed.price_book.get('BNB/USDT') is None
+            assert server.subscriptions[0] == ['btcusdt@ticker', 'ethusdt@ticker']
+        finally:
+            feed.stop()
+            server.stop()
+            os.unlink(config_path)
+    
+    def test_reconnect_and_resubscribe(self):
+        """Test de la reconnexion et du réabonnement après fermeture par le serveur"""
+        server = FrameReplayServer(load_frames()[:3], close_after_replay=True).start()
+        config_path = self.make_config(server.url)
+        feed = PriceFeed(['BTC/USDT'], config_path=config_path)
+        try:
+            feed.start()
+            assert wait_until(lambda: server.connections >= 2 and len(server.subscriptions) >= 2)
+            
+            feed.subscribe(['ETH/USDT'])
+            assert wait_until(lambda: any('ethusdt@ticker' in s for s in server.subscriptions))
+            assert server.subscriptions[1] == ['btcusdt@ticker']
+            assert feed.stats['reconnects'] >= 1
+        finally:
+            feed.stop()
+            server.stop()
+            os.unlink(config_path)
+    
+    @patch('core.exchange.ccxt')
+    def test_exchange_serves_reads_from_book(self, mock_ccxt):
+        """Test que ExchangeManager lit le carnet sans requête réseau"""
+        from core.exchange import ExchangeManager
+        import core.exchange as ex
+        ex._exchange_instance = None
+        
+        mock_exchange = MagicMock()
+        mock_exchange.has = {'fetchTickers': True}
+        mock_exchange.fetch_ticker.return_value = {'last': 1.0}
+        mock_exchange.fetch_tickers.return_value = {}
+        mock_ccxt.binance = MagicMock(return_value=mock_exchange)
+        
+        config_path = self.make_config('ws://127.0.0.1:1/ws')
+        try:
+            exchange = ExchangeManager(config_path)
+            mock_exchange.fetch_ticker.reset_mock()
+            
+            book = PriceBook()
+            book.update('ETH/USDT', parse_ticker_event(load_frames()[1], 'ETH/USDT'))
+            exchange.attach_price_book(book)
+            
+            assert exchange.fetch_ticker('ETH/USDT')['last'] == 2280.73
+            assert exchange.get_last_price('ETH/USDT') == 2280.73
+            assert set(exchange.fetch_tickers(['ETH/USDT'])) == {'ETH/USDT'}
+            mock_exchange.fetch_ticker.assert_not_called()
+            mock_exchange.fetch_tickers.assert_not_called()
+        finally:
+            os.unlink(config_path)
+    
+    def test_stop_right_after_start(self):
+        """Test que stop() arrête le thread même avant le démarrage de la boucle"""
+        config_path = self.make_config('ws://127.0.0.1:1/ws')
+        try:
+            feed = PriceFeed(['BTC/USDT'], config_path=config_path)
+            run_loop = feed._run_loop
+            # Thread lent à démarrer: stop() arrive avant que la boucle ne tourne
+            with patch.object(feed, '_run_loop', lambda: (time.sleep(0.2), run_loop())):
+                feed.start()
+                thread = feed._thread
+                feed.stop(timeout=2.0)
+            assert not thread.is_alive()
+        finally:
+            os.unlink(config_path)
+    
+    def test_daemon_feed_follows_held_assets(self):
+        """Test que le démon branche le carnet du flux et l'abonne aux assets détenus"""
+        import run
+        import core.config_loader as cl
+        
+        server = FrameReplayServer(load_frames()).start()
+        disabled_path = self.make_config(server.url)
+        config_path = self.make_config(server.url, enabled=True)
+        exchange = MagicMock()
+        exchange.normalize_symbol.side_effect = lambda asset, quote: f"{asset}/{quote}"
+        exchange.refresh_balances.return_value.to_dict.return_value = {'BTC': {'total': 1.0}, 'USDT': {'total': 5.0}}
+        feed = None
+        try:
+            assert run.start_price_feed(disabled_path, cl.get_config(disabled_path), exchange) is None
+            cl._config_instance = None
+            feed = run.start_price_feed(config_path, cl.get_config(config_path), exchange)
+            exchange.attach_price_book.assert_called_once_with(feed.price_book)
+            
+            collector = run.Collector(exchange, MagicMock(), MagicMock(), 'USDT', feed)
+            collector.collect_balances()
+            assert wait_until(lambda: feed.price_book.get('BTC/USDT') is not None)
+            assert server.subscriptions[0] == ['btcusdt@ticker']
+        finally:
+            if feed is not None:
+                feed.stop()
+            server.stop()
+            os.unlink(disabled_path)
+            os.unlink(config_path)
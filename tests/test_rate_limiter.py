@@ -0,0 +1,150 @@
+"""
+Tests unitaires pour le module rate_limiter
+"""
+
+import asyncio
+import pytest
+from core.rate_limiter import (
+    PRIORITY_HIGH, PRIORITY_LOW, WeightRateLimiter, background, ban_errors,
+    get_rate_limiter, tickers_weight
+)
+
+
+class FakeClock:
+    """Horloge manuelle"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestWeightRateLimiter:
+    """Tests pour WeightRateLimiter"""
+    
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+    
+    @pytest.fixture
+    def limiter(self, clock):
+        # 600 par minute = 10 par seconde, réserve de 100
+        return WeightRateLimiter(weight_per_minute=600, reserve_percent=100 / 6, clock=clock)
+    
+    def test_tokens_consumed_and_refilled(self, limiter, clock):
+        """Test de la consommation et du remplissage du seau"""
+        assert limiter._try_acquire(500, PRIORITY_HIGH) == 0.0
+        assert limiter.available == pytest.approx(100)
+        assert limiter._try_acquire(200, PRIORITY_HIGH) == pytest.approx(10.0)
+        
+        clock.now = 10.0
+        assert limiter._try_acquire(200, PRIORITY_HIGH) == 0.0
+        clock.now = 1000.0
+        assert limiter.available == 600
+    
+    def test_low_priority_keeps_reserve(self, limiter):
+        """Test que les tâches de fond n'entament pas la réserve"""
+        assert limiter._try_acquire(450, PRIORITY_HIGH) == 0.0
+        
+        # 150 disponibles, réserve de 100: 60 de fond refusés, 60 prioritaires acceptés
+        assert limiter._try_acquire(60, PRIORITY_LOW) > 0.0
+        assert limiter._try_acquire(60, PRIORITY_HIGH) == 0.0
+    
+    def test_low_priority_yields_to_waiting_high(self, limiter):
+        """Test que les tâches de fond cèdent le passage aux appels prioritaires en attente"""
+        limiter._high_waiting = 1
+        
+        assert limiter._try_acquire(1, PRIORITY_LOW) > 0.0
+        assert limiter._try_acquire(1, PRIORITY_HIGH) == 0.0
+    
+    def test_background_context_sets_priority(self, limiter):
+        """Test de la priorité portée par le contexte"""
+        limiter._try_acquire(450, PRIORITY_HIGH)
+        
+        with background():
+            assert limiter.acquire(60, timeout=0) is False
+        assert limiter.acquire(60, timeout=0) is True
+    
+    def test_used_weight_header_shrinks_budget(self, limiter):
+        """Test du recalage sur le poids consommé annoncé par l'exchange"""
+        limiter.update_from_headers({'X-MBX-USED-WEIGHT-1M': '550'})
+        
+        assert limiter.available == pytest.approx(50)
+        assert limiter.stats['header_updates'] == 1
+        # En-têtes absents (ex: mock) ou illisibles: ignorés
+        limiter.update_from_headers(None)
+        limiter.update_from_headers({'x-mbx-used-weight-1m': 'n/a'})
+        assert limiter.available == pytest.approx(50)
+    
+    def test_ban_pauses_until_retry_after(self, limiter, clock):
+        """Test de la pause après un 429"""
+        limiter.update_from_headers({'Retry-After': '30'}, status=429)
+        
+        assert limiter._try_acquire(1, PRIORITY_HIGH) == pytest.approx(30.0)
+        clock.now = 30.0
+        assert limiter._try_acquire(1, PRIORITY_HIGH) == 0.0
+        assert limiter.stats['bans'] == 1
+    
+    def test_call_reads_headers_and_detects_bans(self, limiter):
+        """Test de call: en-têtes lus après l'appel et exceptions de ban"""
+        class Exchange:
+            last_response_headers = {'x-mbx-used-weight-1m': '300'}
+        
+        class RateLimitExceeded(Exception):
+            pass
+        
+        assert limiter.call(2, lambda: 'ok', exchange=Exchange()) == 'ok'
+        assert limiter.available == pytest.approx(300)
+        
+        def banned():
+            raise RateLimitExceeded()
+        
+        with pytest.raises(RateLimitExceeded):
+            limiter.call(2, banned, exchange=Exchange(), ban_errors=(RateLimitExceeded,))
+        assert limiter.stats['bans'] == 1
+    
+    def test_blocking_acquire_waits_for_refill(self):
+        """Test d'une attente réelle jusqu'au remplissage"""
+        limiter = WeightRateLimiter(weight_per_minute=6000)  # 100 par seconde
+        limiter._try_acquire(6000, PRIORITY_HIGH)
+        
+        assert limiter.acquire(5, timeout=1.0)
+        assert limiter.stats['waits'] == 1
+    
+    def test_async_acquire(self):
+        """Test de l'attente asynchrone"""
+        limiter = WeightRateLimiter(weight_per_minute=6000)
+        limiter._try_acquire(6000, PRIORITY_HIGH)
+        
+        async def run():
+            await asyncio.wait_for(limiter.acquire_async(5), timeout=1.0)
+        
+        asyncio.run(run())
+        assert limiter.stats['acquired'] == 2
+
+
+class TestHelpers:
+    """Tests des fonctions utilitaires"""
+    
+    def test_tickers_weight(self):
+        assert tickers_weight(1) == 2
+        assert tickers_weight(50) == 40
+        assert tickers_weight(None) == 80
+    
+    def test_ban_errors_ignores_mocks(self):
+        """Test que seules de vraies classes d'exception sont retenues"""
+        import ccxt
+        from unittest.mock import MagicMock
+        
+        assert ban_errors(ccxt) == (ccxt.DDoSProtection, ccxt.RateLimitExceeded)
+        assert ban_errors(MagicMock()) == ()
+    
+    def test_shared_per_exchange(self):
+        """Test du partage d'un limiteur par exchange"""
+        config = {'name': 'test-shared', 'rate_limit': {'weight_per_minute': 1200}}
+        
+        limiter = get_rate_limiter(config)
+        assert get_rate_limiter(config) is limiter
+        assert limiter.capacity == 1200
+        assert get_rate_limiter({'name': 'test-off', 'rate_limit': {'enabled': False}}) is None
@@ -0,0 +1,285 @@
+"""
+Tests unitaires pour le module replay
+"""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+import ccxt
+import pytest
+import requests
+import yaml
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+import core.exchange as ex
+import core.replay as rp
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Réponse JSON numérotée par requête (l'ordre du rejeu est vérifiable)"""
+    
+    protocol_version = 'HTTP/1.1'
+    count = 0
+    
+    def do_GET(self):
+        _Handler.count += 1
+        body = json.dumps({'path': self.path, 'n': _Handler.count}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('X-MBX-USED-WEIGHT-1M', str(_Handler.count))
+        self.send_header('Set-Cookie', 'secret=1')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.count = 0
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def reset_transports():
+    rp.close_transports()
+    yield
+    rp.close_transports()
+
+
+def config(mode, path, speed=0):
+    return {'name': 'binance', 'transport': {'mode': mode, 'path': str(path), 'speed': speed}}
+
+
+def write_recording(path, entries, started_at=1700000000.0):
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps({'format': rp.RECORDING_FORMAT, 'started_at': started_at}) + '\n')
+        for entry in entries:
+            f.write(json.dumps(entry) + '\n')
+
+
+class TestRequestKey:
+    """Tests pour la clé de rejeu"""
+    
+    def test_volatile_params_stripped_and_sorted(self):
+        key = rp.request_key('get', 'https://api.binance.com/api/v3/account?timestamp=1&b=2&signature=x&a=1')
+        assert key == 'GET /api/v3/account?a=1&b=2'
+        assert rp.request_key('GET', 'https://testnet.binance.vision/api/v3/time') == 'GET /api/v3/time'
+
+
+class TestRecordReplay:
+    """Tests pour l'enregistrement puis le rejeu sans réseau"""
+    
+    def test_replay_serves_recorded_responses_in_order(self, server, tmp_path):
+        path = tmp_path / 'rec.jsonl.gz'
+        session = rp.transport_session(config('record', path))
+        recorded = [session.get(f"{server}/api/v3/ticker?symbol={s}&timestamp={i}").json()
+                    for i, s in enumerate(['A', 'B', 'A'])]
+        rp.close_transports()
+        
+        replay = rp.transport_session(config('replay', path))
+        assert replay.get(f"{server}/api/v3/ticker?symbol=B&timestamp=9").json() == recorded[1]
+        first = replay.get(f"{server}/api/v3/ticker?symbol=A")
+        assert first.json() == recorded[0]
+        assert first.headers['x-mbx-used-weight-1m'] == '1'
+        assert 'set-cookie' not in first.headers
+        assert replay.get(f"{server}/api/v3/ticker?symbol=A").json() == recorded[2]
+        
+        adapter = rp.replay_adapter(config('replay', path))
+        assert adapter.remaining() == 0
+        with pytest.raises(rp.ReplayExhausted):
+            replay.get(f"{server}/api/v3/ticker?symbol=A")
+        assert adapter.exhausted
+        assert adapter.stats['served'] == 3
+    
+    def test_appended_segments_keep_absolute_time(self, server, tmp_path):
+        path = tmp_path / 'rec.jsonl.gz'
+        for _ in range(2):
+            rp.transport_session(config('record', path)).get(f"{server}/x")
+            rp.close_transports()
+        started_at, entries = rp.load_recording(path)
+        assert [json.loads(entry['b'])['n'] for entry in entries] == [1, 2]
+        assert entries[0]['at'] >= started_at
+    
+    def test_recorded_transport_error_is_replayed(self, tmp_path):
+        path = tmp_path / 'rec.jsonl.gz'
+        write_recording(path, [{'t': 0.1, 'd': 0.1, 'k': 'GET /x', 'e': 'ReadTimeout: timeout'}])
+        with pytest.raises(requests.ConnectionError, match='ReadTimeout'):
+            rp.transport_session(config('replay', path)).get('https://api.binance.com/x')
+
+
+class TestPacing:
+    """Tests pour la vitesse de rejeu"""
+    
+    ENTRIES = [{'t': t, 'd': 0.0, 'k': 'GET /x', 's': 200, 'h': {}, 'b': '{}'} for t in (0.0, 1.0, 2.0)]
+    
+    def replay_duration(self, tmp_path, speed):
+        path = tmp_path / 'rec.jsonl.gz'
+        write_recording(path, self.ENTRIES)
+        session = rp.transport_session(config('replay', path, speed))
+        start = time.perf_counter()
+        for _ in self.ENTRIES:
+            session.get('https://api.binance.com/x')
+        return time.perf_counter() - start
+    
+    def test_speed_scales_recorded_timing(self, tmp_path):
+        assert 0.19 <= self.replay_duration(tmp_path, 10) < 1.0
+    
+    def test_speed_zero_does_not_wait(self, tmp_path):
+        assert self.replay_duration(tmp_path, 0) < 0.1
+    
+    def test_reloaded_speed_applies_to_shared_adapter(self, tmp_path):
+        path = tmp_path / 'rec.jsonl.gz'
+        write_recording(path, self.ENTRIES)
+        session = rp.transport_session(config('replay', path, 0))
+        session.get('https://api.binance.com/x')
+        assert rp.transport_session(config('replay', path, 100)) is session
+        assert rp.replay_adapter(config('replay', path, 100)).speed == 100
+        start = time.perf_counter()
+        session.get('https://api.binance.com/x')
+        session.get('https://api.binance.com/x')
+        assert 0.01 <= time.perf_counter() - start < 0.5
+    
+    def test_clock_follows_recording(self, tmp_path):
+        path = tmp_path / 'rec.jsonl.gz'
+        write_recording(path, self.ENTRIES)
+        session = rp.transport_session(config('replay', path))
+        adapter = rp.replay_adapter(config('replay', path))
+        session.get('https://api.binance.com/x')
+        session.get('https://api.binance.com/x')
+        assert adapter.clock() == pytest.approx(1700000001.0)
+
+
+class TestCcxtReplay:
+    """Tests pour le rejeu sous ccxt (parsing réel des réponses)"""
+    
+    def test_fetch_ticker_from_recording(self, tmp_path):
+        path = tmp_path / 'rec.jsonl.gz'
+        body = json.dumps({'symbol': 'BTCUSDT', 'lastPrice': '43000.5', 'closeTime': 1700000000000})
+        write_recording(path, [{'t': 0.0, 'd': 0.0, 'k': 'GET /api/v3/ticker/24hr?symbol=BTCUSDT',
+                                's': 200, 'h': {'content-type': 'application/json'}, 'b': body}])
+        exchange = ccxt.binance({'session': rp.transport_session(config('replay', path))})
+        exchange.set_markets({'BTC/USDT': {
+            'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'type': 'spot', 'spot': True,
+        }})
+        ticker = exchange.fetch_ticker('BTC/USDT')
+        assert ticker['last'] == 43000.5
+        assert ticker['timestamp'] == 1700000000000
+
+
+class _FakeBinance(BaseAdapter):
+    """Réponses Binance minimales servies sans réseau (prix en hausse à chaque appel)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+    
+    def body(self, path, params):
+        if path == '/api/v3/exchangeInfo':
+            return {'timezone': 'UTC', 'serverTime': 1, 'symbols': [
+                {'symbol': f"{base}USDT", 'status': 'TRADING', 'baseAsset': base, 'quoteAsset': 'USDT',
+                 'baseAssetPrecision': 8, 'quotePrecision': 8, 'isSpotTradingAllowed': True,
+                 'permissions': ['SPOT'], 'filters': []}
+                for base in ('BTC', 'ETH')
+            ]}
+        if path.endswith('/exchangeInfo'):
+            return {'timezone': 'UTC', 'serverTime': 1, 'symbols': []}
+        if path == '/api/v3/account':
+            return {'updateTime': 1, 'balances': [
+                {'asset': asset, 'free': free, 'locked': '0'} for asset, free in (('BTC', '0.5'), ('ETH', '4'), ('USDT', '100'))
+            ]}
+        if path == '/api/v3/ticker/24hr':
+            self.calls += 1
+            symbols = json.loads(params['symbols']) if 'symbols' in params else [params['symbol']]
+            tickers = [{'symbol': s, 'lastPrice': str(1000.0 * self.calls), 'closeTime': 1700000000000 + self.calls}
+                       for s in symbols]
+            return tickers if 'symbols' in params else tickers[0]
+        return []
+    
+    def send(self, request, *args, **kwargs):
+        parts = urlsplit(request.url)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+        response._content = json.dumps(self.body(parts.path, dict(parse_qsl(parts.query)))).encode()
+        response.url = request.url
+        response.request = request
+        return response
+    
+    def close(self):
+        pass
+
+
+class TestReplayLoad:
+    """Tests pour le rejeu du pipeline complet (benchmarks.replay_load)"""
+    
+    def test_pipeline_replay_is_deterministic(self, tmp_path):
+        from benchmarks.replay_load import replay_load
+        from benchmarks.suite import Environment
+        
+        recording = tmp_path / 'rec.jsonl.gz'
+        config_path = tmp_path / 'settings.yaml'
+        config_path.write_text(yaml.dump({
+            'exchange': {
+                'name': 'binance', 'api_key': 'k', 'api_secret': 's', 'sandbox': False,
+                'rate_limit': {'weight_per_minute': 1000000}, 'ticker_cache': {'enabled': False},
+                'markets_cache': {'enabled': False},
+                'transport': {'mode': 'record', 'path': str(recording)},
+            },
+            'portfolio': {'base_currency': 'USDT'},
+            'rules': {'enabled': True, 'profit_threshold_percent': 20.0, 'loss_threshold_percent': -10.0},
+            'logging': {'level': 'WARNING', 'console': False, 'file': False},
+        }))
+        Environment.reset()
+        session = rp.transport_session(yaml.safe_load(config_path.read_text())['exchange'])
+        session.get_adapter('https://').inner = _FakeBinance()
+        try:
+            manager = ex.ExchangeManager(str(config_path))
+            for _ in range(3):
+                manager.refresh_balances()
+                manager.fetch_tickers(['BTC/USDT', 'ETH/USDT'])
+        finally:
+            Environment.reset()
+            rp.close_transports()
+        
+        first = replay_load(str(recording), str(config_path), speed=0)
+        second = replay_load(str(recording), str(config_path), speed=0)
+        replay = first['results']['replay']
+        assert replay['cycles']['value'] == 3
+        assert replay['errors']['value'] == 0
+        assert replay['decisions']['value'] > 0
+        assert replay['rows_written']['value'] > 0
+        assert first['meta']['checksum'] == second['meta']['checksum']
+    
+    def test_ticker_cache_follows_replay_clock(self, tmp_path):
+        from benchmarks.suite import Environment
+        
+        path = tmp_path / 'rec.jsonl.gz'
+        write_recording(path, TestPacing.ENTRIES)
+        config_path = tmp_path / 'settings.yaml'
+        config_path.write_text(yaml.dump({
+            'exchange': {**config('replay', path), 'lazy_init': True},
+            'logging': {'level': 'WARNING', 'console': False, 'file': False},
+        }))
+        Environment.reset()
+        try:
+            manager = ex.ExchangeManager(str(config_path))
+            manager.ticker_cache.put('BTC/USDT', {'last': 1.0})
+            rp.transport_session(manager.exchange_config).get('https://api.binance.com/x')
+            assert manager.ticker_cache.get('BTC/USDT') is not None
+            rp.transport_session(manager.exchange_config).get('https://api.binance.com/x')
+            rp.transport_session(manager.exchange_config).get('https://api.binance.com/x')
+            assert manager.ticker_cache.get('BTC/USDT') is None
+        finally:
+            Environment.reset()
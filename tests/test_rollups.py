@@ -0,0 +1,125 @@
+"""
+Tests unitaires pour le module storage.rollups
+"""
+
+import pytest
+from storage.rollups import DAY, HOUR, MINUTE, RollupManager
+from storage.snapshots import SnapshotStore, balance_rows
+
+
+def price(timestamp, value, asset='BTC'):
+    """Ligne price_snapshots minimale"""
+    return (timestamp, asset, f"{asset}/USDT", value, None, None, None, 'intraday')
+
+
+class TestRollupManager:
+    """Tests pour RollupManager"""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = SnapshotStore(str(tmp_path / 'portfolio.db'))
+        yield store
+        store.close()
+    
+    @pytest.fixture
+    def rollups(self, store):
+        return RollupManager(store, retention_interval=None)
+    
+    def test_ohlc_aggregated_across_batches(self, store, rollups):
+        """Test des agrégats OHLC fusionnés entre plusieurs lots (y compris hors ordre)"""
+        store.write_batch(prices=[price(60.0, 10.0), price(90.0, 12.0)])
+        store.write_batch(prices=[price(75.0, 8.0), price(110.0, 11.0), price(30.0, 9.0)])
+        
+        rows = store.connection().execute(
+            "SELECT bucket, open, high, low, close, count FROM price_rollups "
+            "WHERE asset = 'BTC' AND resolution = ? ORDER BY bucket", (MINUTE,)
+        ).fetchall()
+        assert rows == [(0.0, 9.0, 9.0, 9.0, 9.0, 1), (60.0, 10.0, 12.0, 8.0, 11.0, 4)]
+        
+        hour = store.connection().execute(
+            "SELECT open, high, low, close, count FROM price_rollups WHERE resolution = ?", (HOUR,)
+        ).fetchone()
+        assert hour == (9.0, 12.0, 8.0, 11.0, 5)
+    
+    def test_balance_rollups_keep_last_total(self, store, rollups):
+        """Test que l'agrégat de balance conserve la dernière valeur du bucket"""
+        store.write_batch(balances=balance_rows({'BTC': {'total': 1.0}}, 10.0))
+        store.write_batch(balances=balance_rows({'BTC': {'total': 2.0}}, 50.0)
+                          + balance_rows({'BTC': {'total': 3.0}}, 20.0))
+        
+        result = rollups.query_balances('BTC', 0.0, 60.0, max_points=10, now=100.0)
+        assert result['resolution'] == 0
+        assert [total for _, total in result['points']] == [1.0, 3.0, 2.0]
+        
+        row = store.connection().execute(
+            "SELECT total, count FROM balance_rollups WHERE resolution = ?", (DAY,)
+        ).fetchone()
+        assert row == (2.0, 3)
+    
+    def test_choose_resolution_budget_and_retention(self, rollups):
+        """Test du choix de résolution selon le budget de points et la rétention"""
+        now = 100 * DAY
+        
+        assert rollups.choose_resolution(now - HOUR, now, 500, now=now) == 0
+        assert rollups.choose_resolution(now - 5 * DAY, now, 500, now=now) == HOUR
+        assert rollups.choose_resolution(now - 30 * DAY, now, 1000, now=now) == HOUR
+        assert rollups.choose_resolution(now - 30 * DAY, now, 100, now=now) == DAY
+        # Bruts expirés (> 48 h): agrégats 1 minute même si le budget le permettrait
+        assert rollups.choose_resolution(now - 3 * DAY - HOUR, now - 3 * DAY, 500, now=now) == MINUTE
+    
+    def test_query_prices_uses_rollups(self, store, rollups):
+        """Test d'une requête longue servie par les agrégats horaires"""
+        store.write_batch(prices=[price(t, float(t)) for t in range(0, 3 * int(HOUR), 300)])
+        
+        result = rollups.query_prices('BTC', 0.0, 3 * HOUR, max_points=5, now=3 * HOUR)
+        assert result['resolution'] == HOUR
+        assert [bucket for bucket, *_ in result['points']] == [0.0, HOUR, 2 * HOUR]
+        assert result['points'][0] == (0.0, 0.0, 3300.0, 0.0, 3300.0)
+    
+    def test_retention_discards_rolled_up_raw_rows(self, store):
+        """Test que la rétention supprime les bruts mais conserve leurs agrégats"""
+        rollups = RollupManager(store, raw_retention=HOUR, retention={MINUTE: DAY},
+                                retention_interval=None)
+        store.write_batch(prices=[price(0.0, 1.0), price(2 * DAY, 2.0)])
+        
+        deleted = rollups.apply_retention(now=2 * DAY + 60)
+        
+        assert deleted['raw'] == 1
+        assert deleted[f"{MINUTE}s"] == 1
+        assert store.count('price_snapshots') == 1
+        day = rollups.query_prices('BTC', 0.0, DAY, max_points=1, now=2 * DAY + 60)
+        assert day == {'resolution': DAY, 'points': [(0.0, 1.0, 1.0, 1.0, 1.0)]}
+    
+    def test_retention_keeps_daily_snapshots(self, store):
+        """Test que la rétention des bruts ne supprime pas les snapshots quotidiens"""
+        rollups = RollupManager(store, raw_retention=HOUR, retention_interval=None)
+        store.write_batch(
+            balances=balance_rows({'BTC': {'total': 1.0}}, 0.0, kind='daily')
+            + balance_rows({'BTC': {'total': 2.0}}, 10.0),
+            prices=[price(0.0, 1.0)[:-1] + ('daily',), price(10.0, 2.0)]
+        )
+        
+        deleted = rollups.apply_retention(now=DAY)
+        
+        assert deleted['raw'] == 2
+        assert store.get_balance_history('BTC', kind='daily') == [(0.0, 1.0)]
+        assert store.get_price_history('BTC', kind='daily') == [(0.0, 1.0)]
+        assert store.count('price_snapshots') == store.count('balance_snapshots') == 1
+    
+    def test_retention_runs_during_writes(self, store):
+        """Test de l'application périodique de la rétention dans write_batch"""
+        RollupManager(store, raw_retention=HOUR, retention_interval=0.0)
+        store.write_batch(prices=[price(0.0, 1.0)])
+        
+        # Horodatage 0 (1970): seul l'agrégat journalier (rétention illimitée) subsiste
+        assert store.count('price_snapshots') == 0
+        rows = store.connection().execute("SELECT resolution, close FROM price_rollups").fetchall()
+        assert rows == [(DAY, 1.0)]
+    
+    def test_from_config(self, store):
+        """Test de la conversion des durées de configuration"""
+        rollups = RollupManager.from_config(store, {'raw_retention_hours': 1, 'day_retention_days': 10})
+        
+        assert rollups.raw_retention == HOUR
+        assert rollups.retention == {MINUTE: 7 * DAY, HOUR: 365 * DAY, DAY: 10 * DAY}
+        assert rollups.retention_interval == HOUR
@@ -0,0 +1,187 @@
+"""
+Tests unitaires pour le module rules
+"""
+
+import os
+import tempfile
+from unittest.mock import MagicMock
+import pytest
+import yaml
+from core.rules import RulesEngine
+from core.ticker_table import TickerTable
+
+
+HOUR = 3600.0
+
+
+class TestRulesEngine:
+    """Tests pour RulesEngine"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_singletons(self):
+        import core.config_loader as cl
+        cl._config_instance = None
+        yield
+        cl._config_instance = None
+    
+    @pytest.fixture
+    def make_engine(self, monkeypatch):
+        """Fabrique de moteurs avec une section 'rules' personnalisée et un logger factice"""
+        paths = []
+        
+        def make(anchor_prices=None, **rules):
+            import core.config_loader as cl
+            cl._config_instance = None
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+                yaml.dump({
+                    'exchange': {}, 'database': {}, 'logging': {},
+                    'portfolio': {'base_currency': 'USDT'},
+                    'rules': {
+                        'enabled': True, 'profit_threshold_percent': 20.0,
+                        'loss_threshold_percent': -10.0, 'cooldown_hours': 1,
+                        'conversion_percent': 50.0, 'rebase_enabled': False, **rules
+                    }
+                }, f)
+                paths.append(f.name)
+            engine = RulesEngine(f.name, anchor_prices=anchor_prices)
+            engine.logger_mock = MagicMock()
+            return engine
+        
+        monkeypatch.setattr(RulesEngine, 'logger', property(lambda self: self.logger_mock))
+        
+        yield make
+        for path in paths:
+            os.unlink(path)
+    
+    def test_profit_threshold_converts_surplus(self, make_engine):
+        """Test de la décision de conversion et du montant converti"""
+        engine = make_engine(anchor_prices={'BTC': 40000.0})
+        balances = {'BTC': {'total': 1.0}}
+        
+        decisions = engine.evaluate({'BTC/USDT': {'last': 50000.0}}, balances, now=0.0)
+        
+        assert len(decisions) == 1
+        decision = decisions[0]
+        assert decision.decision == 'convert_to_stablecoin'
+        assert decision.pnl_percent == pytest.approx(25.0)
+        # Surplus: 1 BTC * (50000 - 40000) / 50000 = 0.2 BTC, 50% converti
+        assert decision.amount == pytest.approx(0.1)
+        engine.logger_mock.log_decision.assert_called_once()
+        assert engine.logger_mock.log_decision.call_args[0][:2] == ('rules', 'convert_to_stablecoin')
+        # Champs structurés (colonnes asset/price de log_events, index des logs)
+        assert engine.logger_mock.log_decision.call_args[1] == {'asset': 'BTC', 'price': 50000.0}
+        assert engine.logger_mock.log_alert.call_args[1]['asset'] == 'BTC'
+    
+    def test_loss_threshold_alert(self, make_engine):
+        """Test de l'alerte de perte"""
+        engine = make_engine(anchor_prices={'ETH': 3000.0})
+        
+        decisions = engine.evaluate({'ETH/USDT': 2600.0}, now=0.0)
+        
+        assert [d.decision for d in decisions] == ['loss_alert']
+        engine.logger_mock.log_alert.assert_called_once()
+        assert engine.logger_mock.log_alert.call_args[0][0] == 'loss_threshold'
+    
+    def test_only_changed_prices_are_evaluated(self, make_engine):
+        """Test que seuls les assets dont le prix a changé sont réévalués"""
+        engine = make_engine()
+        prices = {'BTC/USDT': 40000.0, 'ETH/USDT': 3000.0, 'BTC/EUR': 37000.0}
+        
+        assert engine.update_prices(prices) == 2
+        engine.evaluate(now=0.0)
+        assert engine.anchor_prices == {'BTC': 40000.0, 'ETH': 3000.0}
+        
+        assert engine.update_prices(prices) == 0
+        assert engine.update_prices({'BTC/USDT': 41000.0, 'ETH/USDT': 3000.0}) == 1
+        assert engine._dirty == {'BTC'}
+    
+    def test_cooldown_blocks_then_expires(self, make_engine):
+        """Test du cooldown: décision bloquée puis réévaluation à l'expiration"""
+        engine = make_engine(anchor_prices={'BTC': 40000.0})
+        
+        assert len(engine.evaluate({'BTC/USDT': 50000.0}, now=0.0)) == 1
+        assert engine.in_cooldown('BTC', now=HOUR - 1)
+        assert engine.evaluate({'BTC/USDT': 51000.0}, now=HOUR - 1) == []
+        
+        # Prix inchangé, mais le cooldown expiré remet BTC à évaluer
+        decisions = engine.evaluate(now=HOUR)
+        assert [d.price for d in decisions] == [51000.0]
+        # Nouvelle décision: nouveau cooldown
+        assert engine.in_cooldown('BTC', now=2 * HOUR - 1)
+    
+    def test_rebase_after_conversion(self, make_engine):
+        """Test du rebase du prix d'ancrage après conversion"""
+        engine = make_engine(anchor_prices={'BTC': 40000.0}, rebase_enabled=True, cooldown_hours=0)
+        
+        engine.evaluate({'BTC/USDT': 50000.0}, now=0.0)
+        
+        assert engine.anchor_prices['BTC'] == 50000.0
+        assert engine.evaluate({'BTC/USDT': 55000.0}, now=1.0) == []
+        decisions = engine.logger_mock.log_decision.call_args_list
+        assert [c[0][1] for c in decisions] == ['convert_to_stablecoin', 'rebase_price']
+    
+    def test_disabled_engine_makes_no_decision(self, make_engine):
+        """Test qu'un moteur désactivé n'émet aucune décision"""
+        engine = make_engine(anchor_prices={'BTC': 40000.0}, enabled=False)
+        
+        assert engine.evaluate({'BTC/USDT': 80000.0}, now=0.0) == []
+        engine.logger_mock.log_decision.assert_not_called()
+    
+    def test_ticker_table_input(self, make_engine):
+        """Test de l'alimentation depuis une TickerTable"""
+        engine = make_engine(anchor_prices={'BTC': 40000.0})
+        table = TickerTable.from_rows({
+            'BTC/USDT': {'symbol': 'BTC/USDT', 'last': 30000.0},
+            'ETH/USDT': {'symbol': 'ETH/USDT', 'last': None},
+        })
+        
+        decisions = engine.evaluate(table, now=0.0)
+        
+        assert [(d.asset, d.decision) for d in decisions] == [('BTC', 'loss_alert')]
+        assert 'ETH' not in engine.anchor_prices
+    
+    def test_config_reload_applies_thresholds(self, make_engine):
+        """Test qu'un rechargement de 'rules' change les seuils et réévalue les assets connus"""
+        import core.config_loader as cl
+        engine = make_engine(anchor_prices={'BTC': 40000.0})
+        assert engine.evaluate({'BTC/USDT': 46000.0}, now=0.0) == []
+        
+        config = cl._config_instance
+        data = yaml.safe_load(config.config_path.read_text())
+        data['rules']['profit_threshold_percent'] = 10.0
+        config.config_path.write_text(yaml.dump(data))
+        config.reload()
+        
+        assert engine.profit_threshold == 10.0
+        decisions = engine.evaluate(now=1.0)
+        assert [d.decision for d in decisions] == ['convert_to_stablecoin']
+    
+    def test_config_reload_waits_for_evaluation(self, make_engine):
+        """Test que le rechargement (thread du ConfigLoader) attend la fin d'une évaluation en cours"""
+        import threading
+        import core.config_loader as cl
+        engine = make_engine(anchor_prices={'BTC': 40000.0})
+        engine.evaluate({'BTC/USDT': 46000.0}, now=0.0)
+        
+        snapshot = cl._config_instance.snapshot()
+        reload = threading.Thread(target=engine._on_config_change, args=(snapshot, {'rules'}))
+        with engine._lock:
+            reload.start()
+            reload.join(0.2)
+            assert reload.is_alive()
+            assert engine._dirty == set()
+        reload.join(5)
+        assert engine._dirty == {'BTC'}
+    
+    def test_subscribed_after_initialisation(self, make_engine, monkeypatch):
+        """Test que l'abonnement aux rechargements a lieu une fois l'état du moteur créé"""
+        import core.config_loader as cl
+        state_at_subscribe = []
+        
+        def subscribe(config, callback, sections=None):
+            state_at_subscribe.extend(vars(callback.__self__))
+        monkeypatch.setattr(cl.ConfigLoader, 'subscribe', subscribe)
+        
+        make_engine()
+        
+        assert {'anchor_prices', '_prices', '_dirty', '_cooldown_until'} <= set(state_at_subscribe)
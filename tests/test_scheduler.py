@@ -0,0 +1,108 @@
+"""
+Tests unitaires pour le module scheduler
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+import pytest
+from core.scheduler import Scheduler, next_run
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger(monkeypatch):
+    """Remplace le logger du planificateur par un mock"""
+    monkeypatch.setattr(Scheduler, 'logger', property(lambda self: MagicMock()))
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestNextRun:
+    """Tests pour next_run"""
+    
+    def test_on_time_stays_on_grid(self):
+        """Test qu'une exécution lente mais dans la période ne décale pas la grille"""
+        assert next_run(10.0, 10.7, 1.0) == (11.0, 0)
+    
+    def test_overrun_skips_missed_ticks(self):
+        """Test qu'un débordement saute les échéances manquées"""
+        assert next_run(10.0, 13.5, 1.0) == (14.0, 3)
+        assert next_run(10.0, 11.0, 1.0) == (12.0, 1)
+
+
+class TestScheduler:
+    """Tests pour Scheduler"""
+    
+    def test_fixed_rate_runs_and_metrics(self):
+        """Test d'exécutions répétées et des métriques de durée et de retard"""
+        scheduler = Scheduler()
+        calls = []
+        scheduler.add_job('fast', lambda: calls.append(time.monotonic()), 0.02)
+        scheduler.start()
+        try:
+            assert wait_for(lambda: len(calls) >= 5)
+        finally:
+            scheduler.stop()
+        
+        metrics = scheduler.metrics()['fast']
+        assert metrics['runs'] >= 5
+        assert metrics['errors'] == 0
+        assert metrics['last_duration'] is not None
+        assert metrics['max_lag'] >= 0.0
+        # Cadence fixe: les exécutions ne dérivent pas au-delà d'une période
+        assert calls[4] - calls[0] == pytest.approx(0.08, abs=0.02)
+    
+    def test_overrunning_job_skips_instead_of_piling_up(self):
+        """Test qu'une tâche trop longue saute ses échéances"""
+        scheduler = Scheduler()
+        job = scheduler.add_job('slow', lambda: time.sleep(0.05), 0.02)
+        scheduler.start()
+        try:
+            assert wait_for(lambda: job.runs >= 2)
+        finally:
+            scheduler.stop()
+        
+        assert job.skipped >= 2
+        assert job.max_duration >= 0.05
+    
+    def test_errors_are_counted_and_job_keeps_running(self):
+        """Test qu'une exception n'arrête pas la tâche"""
+        scheduler = Scheduler()
+        job = scheduler.add_job('failing', lambda: 1 / 0, 0.01)
+        scheduler.start()
+        try:
+            assert wait_for(lambda: job.errors >= 2)
+        finally:
+            scheduler.stop()
+        
+        assert job.runs == job.errors
+    
+    def test_stop_interrupts_wait_and_joins(self):
+        """Test que stop n'attend pas l'échéance suivante"""
+        scheduler = Scheduler()
+        started = threading.Event()
+        scheduler.add_job('hourly', started.set, 3600.0)
+        scheduler.start()
+        assert started.wait(1.0)
+        
+        begin = time.monotonic()
+        scheduler.stop()
+        
+        assert time.monotonic() - begin < 1.0
+        assert not scheduler.running
+    
+    def test_jitter_bounded_and_validation(self):
+        """Test du plafonnement du jitter et des validations"""
+        scheduler = Scheduler()
+        job = scheduler.add_job('a', lambda: None, 1.0, jitter=5.0, run_immediately=False)
+        
+        assert job.jitter == 0.5
+        with pytest.raises(ValueError):
+            scheduler.add_job('a', lambda: None, 1.0)
+        with pytest.raises(ValueError):
+            scheduler.add_job('b', lambda: None, 0)
@@ -0,0 +1,164 @@
+"""
+Tests unitaires pour le module storage.snapshots
+"""
+
+import threading
+import pytest
+from storage.snapshots import SnapshotStore, SnapshotWriter, balance_rows, price_rows
+
+
+BALANCES = {
+    'BTC': {'free': 0.5, 'used': 0.1, 'total': 0.6},
+    'ETH': {'free': 2.0, 'used': 0.0, 'total': 2.0},
+}
+TICKERS = {
+    'BTC/USDT': {'symbol': 'BTC/USDT', 'last': 45000.0, 'bid': 44999.0, 'ask': 45001.0, 'volume': 1e6},
+    'ETH/USDT': {'symbol': 'ETH/USDT', 'last': 3000.0, 'bid': 2999.0, 'ask': 3001.0, 'volume': 5e5},
+}
+
+
+class TestSnapshotStore:
+    """Tests pour SnapshotStore"""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = SnapshotStore(str(tmp_path / 'sub' / 'portfolio.db'))
+        yield store
+        store.close()
+    
+    def test_schema_wal_and_index(self, store):
+        """Test de la création du schéma, du mode WAL et des index"""
+        conn = store.connection()
+        
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        indexes = {row[1] for row in conn.execute("SELECT * FROM sqlite_master WHERE type = 'index'")}
+        assert 'idx_balance_snapshots_asset_ts' in indexes
+        assert 'idx_price_snapshots_asset_ts' in indexes
+        
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT timestamp, total FROM balance_snapshots "
+            "WHERE asset = 'BTC' AND timestamp >= 0 ORDER BY timestamp"
+        ).fetchall()
+        assert 'idx_balance_snapshots_asset_ts' in str(plan)
+    
+    def test_write_batch_and_history(self, store):
+        """Test d'écriture groupée et de lecture de l'historique"""
+        written = store.write_batch(
+            balance_rows(BALANCES, 100.0) + balance_rows(BALANCES, 200.0, kind='daily'),
+            price_rows(TICKERS, 100.0)
+        )
+        
+        assert written == 6
+        assert store.get_balance_history('BTC') == [(100.0, 0.6), (200.0, 0.6)]
+        assert store.get_balance_history('BTC', kind='daily') == [(200.0, 0.6)]
+        assert store.get_balance_history('BTC', start=150.0) == [(200.0, 0.6)]
+        assert store.get_price_history('ETH', end=150.0) == [(100.0, 3000.0)]
+        assert store.count('price_snapshots') == 2
+        with pytest.raises(ValueError):
+            store.count('sqlite_master')
+
+
+class TestSnapshotWriter:
+    """Tests pour SnapshotWriter"""
+    
+    def test_flush_writes_pending_snapshots(self, tmp_path):
+        """Test que flush écrit les snapshots en file en une transaction"""
+        store = SnapshotStore(str(tmp_path / 'portfolio.db'))
+        writer = SnapshotWriter(store, batch_size=1000, flush_interval=60.0)
+        try:
+            assert writer.submit_balances(BALANCES, timestamp=1.0)
+            assert writer.submit_prices(TICKERS, timestamp=1.0)
+            assert writer.flush(timeout=5)
+            
+            assert writer.stats['rows_written'] == 4
+            assert writer.stats['batches_written'] == 1
+            assert store.get_price_history('BTC') == [(1.0, 45000.0)]
+        finally:
+            writer.close()
+            store.close()
+    
+    def test_batch_size_and_interval_trigger_writes(self, tmp_path):
+        """Test des déclenchements par taille et par délai"""
+        store = SnapshotStore(str(tmp_path / 'portfolio.db'))
+        writer = SnapshotWriter(store, batch_size=2, flush_interval=0.05)
+        try:
+            writer.submit_balances(BALANCES, timestamp=1.0)  # 2 lignes: écriture immédiate
+            writer.submit_balances({'SOL': {'total': 1.0}}, timestamp=2.0)  # écrit après le délai
+            
+            deadline = threading.Event()
+            for _ in range(100):
+                if writer.stats['rows_written'] == 3:
+                    break
+                deadline.wait(0.01)
+            
+            assert writer.stats['rows_written'] == 3
+            assert writer.stats['batches_written'] == 2
+        finally:
+            writer.close()
+            store.close()
+    
+    def test_close_flushes_and_rejects_new_snapshots(self, tmp_path):
+        """Test que close écrit les lots en attente et refuse ensuite les soumissions"""
+        store = SnapshotStore(str(tmp_path / 'portfolio.db'))
+        writer = SnapshotWriter(store, batch_size=1000, flush_interval=60.0)
+        writer.submit_balances(BALANCES, timestamp=1.0)
+        writer.close()
+        
+        assert store.count('balance_snapshots') == 2
+        assert writer.submit_balances(BALANCES) is False
+        assert writer.stats['dropped'] == 1
+        # Thread arrêté: flush ne met plus rien en file et répond sans attendre
+        assert writer.flush(timeout=1.0) is True
+        store.close()
+    
+    def test_invalid_kind_rejected(self, tmp_path):
+        """Test qu'un type de snapshot inconnu est refusé"""
+        store = SnapshotStore(str(tmp_path / 'portfolio.db'))
+        writer = SnapshotWriter(store)
+        try:
+            with pytest.raises(ValueError):
+                writer.submit_balances(BALANCES, kind='hourly')
+        finally:
+            writer.close()
+            store.close()
+    
+    def test_write_errors_are_counted(self, tmp_path):
+        """Test qu'une erreur SQLite n'arrête pas le thread d'écriture"""
+        store = SnapshotStore(str(tmp_path / 'portfolio.db'))
+        writer = SnapshotWriter(store, batch_size=1000, flush_interval=60.0)
+        try:
+            writer.submit_balances({'BTC': {'total': None}}, timestamp=1.0)  # total NOT NULL
+            writer.flush(timeout=5)
+            writer.submit_balances(BALANCES, timestamp=2.0)
+            writer.flush(timeout=5)
+            
+            assert writer.stats['errors'] == 1
+            assert writer.stats['rows_written'] == 2
+        finally:
+            writer.close()
+            store.close()
+    
+    def test_failing_batch_hook_does_not_stop_writer(self, tmp_path):
+        """Test qu'un hook qui lève une exception annule le lot sans arrêter le thread"""
+        store = SnapshotStore(str(tmp_path / 'portfolio.db'))
+        calls = []
+        
+        def hook(conn, balances, prices):
+            calls.append(len(balances))
+            if len(calls) == 1:
+                raise KeyError('rollup')
+        
+        store.add_batch_hook(hook)
+        writer = SnapshotWriter(store, batch_size=1000, flush_interval=60.0)
+        try:
+            writer.submit_balances(BALANCES, timestamp=1.0)
+            assert writer.flush(timeout=5)
+            writer.submit_balances(BALANCES, timestamp=2.0)
+            assert writer.flush(timeout=5)
+            
+            assert writer.stats['errors'] == 1
+            assert writer.stats['rows_written'] == 2
+            assert store.count('balance_snapshots') == 2
+        finally:
+            writer.close()
+            store.close()
@@ -0,0 +1,133 @@
+"""
+Tests unitaires pour le module ticker_cache
+"""
+
+import threading
+import time
+import pytest
+from core.ticker_cache import TickerCache
+
+
+class FakeClock:
+    """Horloge manuelle pour contrôler l'expiration"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestTickerCache:
+    """Tests pour TickerCache"""
+    
+    def test_ttl_expiration(self):
+        """Test qu'une entrée expire après son TTL"""
+        clock = FakeClock()
+        cache = TickerCache(ttl_seconds=1.0, clock=clock)
+        calls = []
+        
+        def fetcher(symbol):
+            calls.append(symbol)
+            return {'symbol': symbol, 'last': len(calls)}
+        
+        assert cache.get_or_fetch('BTC/USDT', fetcher)['last'] == 1
+        clock.now = 0.5
+        assert cache.get_or_fetch('BTC/USDT', fetcher)['last'] == 1
+        clock.now = 1.0
+        assert cache.get_or_fetch('BTC/USDT', fetcher)['last'] == 2
+        assert calls == ['BTC/USDT', 'BTC/USDT']
+    
+    def test_ttl_override_per_symbol(self):
+        """Test des TTL spécifiques par symbole"""
+        clock = FakeClock()
+        cache = TickerCache(ttl_seconds=10.0, ttl_overrides={'BTC/USDT': 0.1}, clock=clock)
+        cache.put('BTC/USDT', {'last': 1})
+        cache.put('ETH/USDT', {'last': 2})
+        
+        clock.now = 0.2
+        assert cache.get('BTC/USDT') is None
+        assert cache.get('ETH/USDT') == {'last': 2}
+    
+    def test_lru_eviction(self):
+        """Test que le symbole le moins récemment utilisé est évincé"""
+        cache = TickerCache(ttl_seconds=60.0, max_size=2)
+        cache.put('A/USDT', {'last': 1})
+        cache.put('B/USDT', {'last': 2})
+        cache.get('A/USDT')  # A devient le plus récent
+        cache.put('C/USDT', {'last': 3})
+        
+        assert cache.get('B/USDT') is None
+        assert cache.get('A/USDT') is not None
+        assert cache.get('C/USDT') is not None
+        assert cache.stats()['evictions'] == 1
+        assert len(cache) == 2
+    
+    def test_invalid_max_size(self):
+        """Test qu'une taille nulle est refusée"""
+        with pytest.raises(ValueError):
+            TickerCache(max_size=0)
+    
+    def test_concurrent_misses_are_coalesced(self):
+        """Test que des misses simultanés ne déclenchent qu'une requête amont"""
+        cache = TickerCache(ttl_seconds=60.0)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def slow_fetcher(symbol):
+            calls.append(symbol)
+            started.set()
+            release.wait(timeout=5)
+            return {'symbol': symbol, 'last': 42.0}
+        
+        results = []
+        leader = threading.Thread(target=lambda: results.append(cache.get_or_fetch('BTC/USDT', slow_fetcher)))
+        leader.start()
+        started.wait(timeout=5)
+        
+        followers = [
+            threading.Thread(target=lambda: results.append(cache.get_or_fetch('BTC/USDT', slow_fetcher)))
+            for _ in range(5)
+        ]
+        for thread in followers:
+            thread.start()
+        # Laisser les suiveurs se mettre en attente de la requête en cours
+        deadline = time.time() + 5
+        while cache.stats()['coalesced'] < 5 and time.time() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(timeout=5)
+        
+        assert calls == ['BTC/USDT']
+        assert len(results) == 6
+        assert all(r['last'] == 42.0 for r in results)
+        stats = cache.stats()
+        assert stats['misses'] == 1
+        assert stats['coalesced'] == 5
+    
+    def test_fetch_error_is_not_cached(self):
+        """Test qu'une erreur amont est propagée et non mise en cache"""
+        cache = TickerCache(ttl_seconds=60.0)
+        
+        def failing(symbol):
+            raise RuntimeError("réseau indisponible")
+        
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch('BTC/USDT', failing)
+        
+        assert cache.get_or_fetch('BTC/USDT', lambda s: {'last': 1.0}) == {'last': 1.0}
+    
+    def test_invalidate(self):
+        """Test de l'invalidation d'un symbole et du cache complet"""
+        cache = TickerCache(ttl_seconds=60.0)
+        cache.put('A/USDT', {'last': 1})
+        cache.put('B/USDT', {'last': 2})
+        
+        cache.invalidate('A/USDT')
+        assert cache.get('A/USDT') is None
+        assert cache.get('B/USDT') is not None
+        
+        cache.invalidate()
+        assert len(cache) == 0
@@ -0,0 +1,88 @@
+"""
+Tests unitaires pour le module ticker_table
+"""
+
+import numpy as np
+import pytest
+from core.ticker_table import TickerTable
+from core.exchange import format_ticker
+
+
+def make_raw_tickers():
+    """Tickers ccxt bruts: 3 paires USDT et une paire BTC"""
+    return {
+        'BTC/USDT': {'last': 45000.0, 'bid': 44990.0, 'ask': 45010.0, 'high': 46000.0, 'low': 44000.0,
+                     'quoteVolume': 5e8, 'timestamp': 1704067200000, 'percentage': 2.5,
+                     'datetime': '2024-01-01T00:00:00.000Z'},
+        'ETH/USDT': {'last': 3000.0, 'bid': 2999.0, 'ask': 3001.0, 'high': 3100.0, 'low': 2900.0,
+                     'quoteVolume': 2e8, 'timestamp': 1704067200000, 'percentage': -4.0},
+        'SHIB/USDT': {'last': 0.00001, 'bid': None, 'ask': None, 'high': None, 'low': None,
+                      'quoteVolume': 1e3, 'timestamp': None, 'percentage': 12.0},
+        'ETH/BTC': {'last': 0.066, 'bid': 0.0659, 'ask': 0.0661, 'quoteVolume': 100.0,
+                    'timestamp': 1704067200000, 'percentage': 0.1},
+    }
+
+
+class TestTickerTable:
+    """Tests pour TickerTable"""
+    
+    def test_from_ccxt_filters_quote(self):
+        """Test de la construction avec filtrage sur la quote currency"""
+        table = TickerTable.from_ccxt(make_raw_tickers(), quote='USDT')
+        
+        assert len(table) == 3
+        assert 'ETH/BTC' not in table
+        assert table.last.dtype == np.float64
+        assert np.isnan(table.bid[table.index['SHIB/USDT']])
+        
+        all_markets = TickerTable.from_ccxt(make_raw_tickers(), quote=None)
+        assert len(all_markets) == 4
+        assert list(all_markets.by_quote('BTC').symbols) == ['ETH/BTC']
+    
+    def test_vectorised_filters(self):
+        """Test des filtres volume et spread"""
+        table = TickerTable.from_ccxt(make_raw_tickers())
+        
+        assert set(table.with_min_volume(1e8).symbols) == {'BTC/USDT', 'ETH/USDT'}
+        # SHIB n'a pas de bid/ask: exclu du filtre de spread
+        assert set(table.with_max_spread(0.001).symbols) == {'BTC/USDT', 'ETH/USDT'}
+        assert table.spread[table.index['ETH/USDT']] == pytest.approx(2 / 3000)
+    
+    def test_top_movers(self):
+        """Test des plus fortes hausses et baisses"""
+        table = TickerTable.from_ccxt(make_raw_tickers())
+        
+        assert list(table.top_movers(2).symbols) == ['SHIB/USDT', 'BTC/USDT']
+        assert list(table.top_movers(1, ascending=True).symbols) == ['ETH/USDT']
+        assert list(table.top_movers(1, column='volume').symbols) == ['BTC/USDT']
+        assert len(table.top_movers(10)) == 3
+    
+    def test_lazy_dict_view_matches_format_ticker(self):
+        """Test que la vue dict est compatible avec le format historique"""
+        raw = make_raw_tickers()
+        view = TickerTable.from_ccxt(raw).as_dict()
+        
+        assert len(view) == 3
+        assert set(view) == {'BTC/USDT', 'ETH/USDT', 'SHIB/USDT'}
+        assert view['BTC/USDT'] == format_ticker('BTC/USDT', raw['BTC/USDT'])
+        assert view['SHIB/USDT']['bid'] is None
+        assert view['SHIB/USDT']['timestamp'] is None
+        # Date dérivée du timestamp quand l'exchange n'en fournit pas
+        assert view['ETH/USDT']['datetime'].startswith('2024-01-01T00:00:00')
+        with pytest.raises(KeyError):
+            view['ETH/BTC']
+    
+    def test_from_rows_and_take_keeps_alignment(self):
+        """Test de la construction depuis des tickers formatés et de la sélection"""
+        raw = make_raw_tickers()
+        rows = {s: format_ticker(s, t) for s, t in raw.items() if s.endswith('/USDT')}
+        table = TickerTable.from_rows(rows)
+        
+        subset = table.take(np.array([2, 0]))
+        assert list(subset.symbols) == ['SHIB/USDT', 'BTC/USDT']
+        assert subset.row('BTC/USDT')['datetime'] == '2024-01-01T00:00:00.000Z'
+    
+    def test_mismatched_columns_rejected(self):
+        """Test qu'une colonne de mauvaise longueur est refusée"""
+        with pytest.raises(ValueError):
+            TickerTable(['BTC/USDT'], {'last': np.array([1.0, 2.0])})
@@ -0,0 +1,108 @@
+"""
+Tests unitaires pour le module valuation
+"""
+
+import numpy as np
+import pytest
+import tempfile
+import yaml
+import os
+from core.valuation import ValuationEngine
+from core.ticker_table import TickerTable
+
+
+class TestValuationEngine:
+    """Tests pour ValuationEngine"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_singletons(self):
+        import core.config_loader as cl
+        cl._config_instance = None
+        yield
+        cl._config_instance = None
+    
+    @pytest.fixture
+    def engine(self):
+        """Moteur configuré en USDT avec un seuil de 10 USDT"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({
+                'exchange': {}, 'database': {}, 'logging': {},
+                'portfolio': {'base_currency': 'USDT', 'min_balance_threshold': 10.0}
+            }, f)
+            temp_path = f.name
+        
+        yield ValuationEngine(temp_path, anchor_prices={'BTC': 40000.0, 'ETH': 3000.0})
+        os.unlink(temp_path)
+    
+    @pytest.fixture
+    def balances(self):
+        return {
+            'BTC': {'free': 0.5, 'used': 0.0, 'total': 0.5},
+            'ETH': {'free': 2.0, 'used': 0.0, 'total': 2.0},
+            'USDT': {'free': 100.0, 'used': 0.0, 'total': 100.0},
+            'DUST': {'free': 1.0, 'used': 0.0, 'total': 1.0},
+            'NEW': {'free': 5.0, 'used': 0.0, 'total': 5.0},
+        }
+    
+    @pytest.fixture
+    def prices(self):
+        return {
+            'BTC/USDT': {'last': 44000.0},
+            'ETH/USDT': {'last': 2700.0},
+            'DUST/USDT': {'last': 0.5},
+        }
+    
+    def test_value_with_ticker_dicts(self, engine, balances, prices):
+        """Test de la valorisation, du seuil et du PnL"""
+        valuation = engine.value(balances, prices)
+        result = valuation.to_dict()
+        
+        # DUST vaut 0.5 USDT < 10: exclu; NEW n'a pas de prix: conservé et signalé
+        assert valuation.below_threshold == ['DUST']
+        assert valuation.missing_prices == ['NEW']
+        assert set(result) == {'BTC', 'ETH', 'USDT', 'NEW'}
+        
+        assert result['BTC']['value'] == 22000.0
+        assert result['USDT']['price'] == 1.0
+        assert result['BTC']['pnl'] == pytest.approx(2000.0)
+        assert result['ETH']['pnl_percent'] == pytest.approx(-10.0)
+        assert result['USDT']['pnl'] is None
+        assert result['NEW']['value'] is None
+        
+        assert valuation.total_value == pytest.approx(22000.0 + 5400.0 + 100.0)
+        assert valuation.total_pnl == pytest.approx(2000.0 - 600.0)
+        assert valuation.total_pnl_percent == pytest.approx(1400.0 / 26000.0 * 100)
+    
+    def test_value_with_ticker_table_matches_dicts(self, engine, balances, prices):
+        """Test que TickerTable et dicts donnent le même résultat"""
+        table = TickerTable.from_rows({s: {'symbol': s, **t} for s, t in prices.items()})
+        
+        from_table = engine.value(balances, table)
+        from_dicts = engine.value(balances, prices)
+        
+        assert from_table.to_dict() == from_dicts.to_dict()
+        # Un dict {symbole: prix} est aussi accepté
+        plain = engine.value(balances, {s: t['last'] for s, t in prices.items()})
+        assert plain.total_value == from_dicts.total_value
+    
+    def test_rebase(self, engine, balances, prices):
+        """Test du rebase des prix d'ancrage"""
+        valuation = engine.value(balances, prices)
+        engine.rebase(valuation, ['BTC'])
+        
+        assert engine.anchor_prices['BTC'] == 44000.0
+        assert engine.anchor_prices['ETH'] == 3000.0
+        assert engine.value(balances, prices).to_dict()['BTC']['pnl'] == 0.0
+    
+    def test_value_history(self, engine):
+        """Test de la valorisation matricielle d'un historique"""
+        quantities = np.array([0.5, 2.0])
+        history = np.array([
+            [40000.0, 3000.0],
+            [44000.0, np.nan],
+        ])
+        
+        result = engine.value_history(quantities, history, anchors=np.array([40000.0, np.nan]))
+        
+        assert result['total_value'].tolist() == [26000.0, 22000.0]
+        assert result['total_pnl'].tolist() == [0.0, 2000.0]